@@ -0,0 +1,7 @@
+"""
+PlaPrice 성능 측정 스크립트
+
+각 스크립트는 저장소 루트에서 모듈로 실행합니다.
+
+    python -m benchmarks.bench_partial_parse
+"""
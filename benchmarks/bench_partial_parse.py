@@ -0,0 +1,79 @@
+"""
+부분 파싱 벤치마크
+
+픽스처 페이지와 내비게이션/배너/스크립트를 더한 페이지에서
+전체 파싱과 부분 파싱(상품 컨테이너 하위 트리만)의 파싱 시간, 트리 요소 수와 메모리를 비교합니다.
+lxml 트리는 C 메모리에 만들어져 tracemalloc에 잡히지 않으므로 요소 수로 비교합니다.
+
+    python -m benchmarks.bench_partial_parse
+"""
+
+import gc
+import timeit
+import tracemalloc
+
+from bs4 import BeautifulSoup
+
+from benchmarks.pages import load_fixture_pages, load_fixture_shop, make_noisy_page
+from src.crawlers.html_crawler import HtmlCrawler
+from src.crawlers.parser_backends import BeautifulSoupBackend, LxmlBackend
+
+
+def count_elements(document) -> int:
+    """파싱 트리의 요소 수"""
+    if isinstance(document, BeautifulSoup):
+        return len(document.find_all(True))
+    return sum(1 for _ in document.iter())
+
+
+def measure(crawler: HtmlCrawler, html: str, number: int) -> tuple[float, int, int, int]:
+    """
+    parse_html 1회 평균 시간과 파싱 트리 요소 수, 최대 메모리 측정
+
+    Returns:
+        (평균 시간(ms), 요소 수, 최대 메모리(bytes), 추출한 상품 수)
+    """
+    seconds = min(timeit.repeat(lambda: crawler.parse_html(html), number=number, repeat=3))
+
+    gc.collect()
+    tracemalloc.start()
+    document = crawler.backend.parse(html, parse_only=crawler.plan.strainer)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    elements = count_elements(document)
+    del document
+
+    return seconds / number * 1000, elements, peak, len(crawler.parse_html(html))
+
+
+def main() -> None:
+    shop = load_fixture_shop()
+
+    pages = {}
+    for name, html in load_fixture_pages().items():
+        pages[name] = html
+        pages[f"{name} (+nav/banner/script)"] = make_noisy_page(html)
+
+    for backend in (BeautifulSoupBackend(), LxmlBackend()):
+        full = HtmlCrawler(shop, backend=backend)
+        partial = HtmlCrawler(shop.model_copy(update={"partial_parse": True}), backend=backend)
+
+        print(f"\n[{backend.name}]")
+        print(
+            f"{'페이지':<44} {'전체 ms':>9} {'부분 ms':>9} {'전체 요소':>9} {'부분 요소':>9} "
+            f"{'전체 KiB':>10} {'부분 KiB':>10} {'상품':>6}"
+        )
+        for name, html in pages.items():
+            number = 200 if len(html) < 10_000 else 10
+            full_ms, full_elements, full_peak, full_count = measure(full, html, number)
+            partial_ms, partial_elements, partial_peak, partial_count = measure(partial, html, number)
+            assert full_count == partial_count, name
+            print(
+                f"{name:<44} {full_ms:>9.2f} {partial_ms:>9.2f} "
+                f"{full_elements:>9} {partial_elements:>9} "
+                f"{full_peak / 1024:>10.1f} {partial_peak / 1024:>10.1f} {partial_count:>6}"
+            )
+
+
+if __name__ == "__main__":
+    main()
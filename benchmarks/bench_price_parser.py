@@ -0,0 +1,77 @@
+"""
+가격 변환 마이크로 벤치마크
+
+검색 결과 한 페이지 분량의 가격 문자열을 이전 방식(문자열마다 parse_price 호출)과
+일괄 변환(parse_prices 한 번 호출)으로 비교합니다.
+
+    python -m benchmarks.bench_price_parser
+"""
+
+import re
+import timeit
+
+from src.crawlers.price_parser import parse_prices
+
+
+PRICE_PATTERN = re.compile(r"[\d,]+")
+
+# 일반적인 검색 결과 페이지 구성 (대부분 단순 가격, 일부 범위와 문의)
+PLAIN_TEXTS = [
+    "₩25,000",
+    "15,000원",
+    "32,000원",
+    "28,800원",
+    "가격문의",
+    "9,900~12,000원",
+    "45,000원",
+    "6,500원",
+    "128,000원",
+]
+
+# 만 단위/소수점 표기가 섞인 페이지 (이전 방식은 값이 틀림)
+MIXED_TEXTS = PLAIN_TEXTS + ["1.2만원", "3만 5,000원", "25,000.50원"]
+
+
+def parse_price(price_text: str):
+    """이전 방식: 정규식 검색 후 쉼표 제거"""
+    if not price_text:
+        return None
+    match = PRICE_PATTERN.search(price_text)
+    if not match:
+        return None
+    try:
+        return int(match.group().replace(",", ""))
+    except ValueError:
+        return None
+
+
+def per_item_parse(texts: list[str]) -> list:
+    """이전 방식: 문자열마다 parse_price 호출"""
+    return [parse_price(text) for text in texts]
+
+
+def main() -> None:
+    print(f"{'구성':<10} {'문자열 수':>10} {'이전 ns':>10} {'일괄 ns':>10}")
+    for label, samples in (("단순 가격", PLAIN_TEXTS), ("만/소수점", MIXED_TEXTS)):
+        for count in (40, 200, 1000):
+            texts = [samples[i % len(samples)] for i in range(count)]
+            if samples is PLAIN_TEXTS:
+                assert parse_prices(texts).to_list() == per_item_parse(texts)
+            number = max(1, 20000 // count)
+
+            # 두 방식을 번갈아 실행하여 측정 환경 변동의 영향을 줄임
+            timings = {per_item_parse: [], parse_prices: []}
+            for _ in range(15):
+                for func, samples_ns in timings.items():
+                    seconds = timeit.timeit(lambda: func(texts), number=number)
+                    samples_ns.append(seconds / (number * count) * 1e9)
+
+            print(
+                f"{label:<10} {count:>10} "
+                f"{min(timings[per_item_parse]):>10.0f} "
+                f"{min(timings[parse_prices]):>10.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
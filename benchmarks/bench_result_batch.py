@@ -0,0 +1,121 @@
+"""
+ResultBatch 벤치마크
+
+상점 8곳의 검색 결과에서 가격순 정렬, 품절 제외 최저가, 상점당 개수 제한을
+이전 방식(SearchResult 리스트 순회)과 열 단위 묶음(ResultBatch)으로 비교합니다.
+묶음 시간은 리스트에서 묶음을 만드는 시간을 포함합니다.
+
+    python -m benchmarks.bench_result_batch
+"""
+
+import random
+import timeit
+from datetime import datetime
+
+from src.models.result_batch import ResultBatch
+from src.models.search import SearchResult, StockStatus
+
+
+AVAILABLE = (StockStatus.IN_STOCK, StockStatus.PRE_ORDER, StockStatus.UNKNOWN)
+
+
+def make_results(count: int) -> list[SearchResult]:
+    """가격 없음/품절이 섞인 검색 결과"""
+    rng = random.Random(0)
+    statuses = list(StockStatus)
+    crawled_at = datetime.now()
+    return [
+        SearchResult.from_trusted(
+            f"shop-{i % 8}",
+            f"상점{i % 8}",
+            f"상품 {i}",
+            None if i % 13 == 0 else rng.randint(1000, 500000),
+            None,
+            statuses[i % len(statuses)],
+            f"https://example.com/{i}",
+            crawled_at,
+        )
+        for i in range(count)
+    ]
+
+
+def old_sort(results):
+    """이전 방식: 튜플 키 정렬"""
+    return sorted(results, key=lambda r: (1, 0) if r.price is None else (0, r.price))
+
+
+def old_lowest(results):
+    """이전 방식: 후보 리스트를 만든 뒤 min"""
+    candidates = [r for r in results if r.price is not None]
+    candidates = [r for r in candidates if r.stock_status != StockStatus.OUT_OF_STOCK]
+    return min(candidates, key=lambda r: r.price) if candidates else None
+
+
+def old_limit(results, max_per_shop):
+    """이전 방식: 상점 이름별 개수 세기"""
+    counts: dict[str, int] = {}
+    limited = []
+    for result in results:
+        count = counts.get(result.shop_name, 0)
+        if count < max_per_shop:
+            limited.append(result)
+            counts[result.shop_name] = count + 1
+    return limited
+
+
+def old_pipeline(results):
+    """이전 방식: 정렬 -> 상점당 50개 -> 최저가"""
+    limited = old_limit(old_sort(results), 50)
+    return limited, old_lowest(limited)
+
+
+def new_pipeline(results):
+    """묶음: 정렬 -> 상점당 50개 -> 최저가"""
+    batch = ResultBatch.from_results(results).sort_by_price().limit_per_shop(50)
+    return batch, batch.find_lowest(AVAILABLE)
+
+
+def new_sort(results):
+    batch = ResultBatch.from_results(results)
+    return [results[i] for i in batch.argsort_by_price()]
+
+
+def new_lowest(results):
+    batch = ResultBatch.from_results(results)
+    index = batch.find_lowest(AVAILABLE)
+    return batch.row(index) if index >= 0 else None
+
+
+def new_limit(results, max_per_shop):
+    return ResultBatch.from_results(results).limit_per_shop(max_per_shop).to_list()
+
+
+def main() -> None:
+    print(f"{'연산':<16} {'결과 수':>8} {'이전 ms':>10} {'묶음 ms':>10}")
+    for count in (1000, 10000):
+        results = make_results(count)
+        assert new_sort(results) == old_sort(results)
+        assert new_lowest(results) is old_lowest(results)
+        assert new_limit(results, 50) == old_limit(results, 50)
+        limited, lowest = new_pipeline(results)
+        old_limited, old_low = old_pipeline(results)
+        assert limited.to_list() == old_limited and limited.row(lowest) is old_low
+
+        cases = (
+            ("정렬", old_sort, new_sort),
+            ("최저가", old_lowest, new_lowest),
+            ("상점당 50개", lambda r: old_limit(r, 50), lambda r: new_limit(r, 50)),
+            ("정렬+제한+최저가", old_pipeline, new_pipeline),
+        )
+        for label, old, new in cases:
+            number = max(1, 20000 // count)
+            old_seconds = min(timeit.repeat(lambda: old(results), number=number, repeat=5))
+            new_seconds = min(timeit.repeat(lambda: new(results), number=number, repeat=5))
+            print(
+                f"{label:<16} {count:>8} "
+                f"{old_seconds / number * 1000:>10.2f} {new_seconds / number * 1000:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+검색 결과 메모리 벤치마크
+
+상점 8곳의 검색 결과 100,000개를 보관할 때 행당 메모리를 비교합니다.
+SearchResult 리스트는 크롤러가 만든 경우(상점 문자열 공유)와 JSON에서 읽은 경우(행마다 복사)를,
+ResultBatch는 상점 핸들 표(ShopStore.shop_table)를 공유하고 객체를 보관하지 않는 묶음을 측정합니다.
+묶음은 모든 행을 꺼낸 뒤에도 다시 측정하여 꺼낸 행이 남지 않는지 확인합니다.
+
+    python -m benchmarks.bench_result_memory
+"""
+
+import gc
+import json
+import tracemalloc
+from datetime import datetime
+
+from src.models.result_batch import ResultBatch, ShopTable
+from src.models.search import SearchResult, StockStatus
+
+
+COUNT = 100_000
+
+SHOPS = [(f"{index:08x}-5b1c-4f3e-9a70-2c4d8e6f1a3b", f"상점{index}") for index in range(8)]
+
+
+def make_results(count: int) -> list[SearchResult]:
+    """크롤러처럼 상점 문자열과 페이지 시각을 공유하는 검색 결과"""
+    statuses = list(StockStatus)
+    crawled_at = datetime.now()
+    results = []
+    for i in range(count):
+        shop_id, shop_name = SHOPS[i % len(SHOPS)]
+        price = None if i % 13 == 0 else 1000 + i * 7
+        results.append(
+            SearchResult.from_trusted(
+                shop_id,
+                shop_name,
+                f"건프라 HG 1/144 상품 {i}",
+                price,
+                f"{price:,}원" if price is not None else None,
+                statuses[i % len(statuses)],
+                f"https://shop{i % len(SHOPS)}.example.com/product/{i}",
+                crawled_at,
+            )
+        )
+    return results
+
+
+def load_results(text: str) -> list[SearchResult]:
+    """JSON에서 읽은 검색 결과 (행마다 문자열과 시각을 따로 가짐)"""
+    return [SearchResult.model_validate(data) for data in json.loads(text)]
+
+
+def measure(build):
+    """build()가 반환한 값이 보관하는 메모리 (바이트)"""
+    gc.collect()
+    tracemalloc.start()
+    value = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, value
+
+
+def main() -> None:
+    text = json.dumps([result.model_dump(mode="json") for result in make_results(COUNT)])
+    shop_table = ShopTable(SHOPS)
+
+    list_size, _ = measure(lambda: make_results(COUNT))
+    loaded_size, _ = measure(lambda: load_results(text))
+    batch_size, batch = measure(
+        lambda: ResultBatch.from_results(make_results(COUNT), keep_rows=False, shops=shop_table)
+    )
+    loaded_batch_size, _ = measure(
+        lambda: ResultBatch.from_results(load_results(text), keep_rows=False, shops=shop_table)
+    )
+
+    # 모든 행을 꺼낸 뒤에도 묶음이 보관하는 메모리는 늘지 않아야 함
+    exported_size, _ = measure(lambda: sum(1 for _ in batch))
+
+    print(f"{'보관 방식':<28} {'행당 B':>8} {'전체 MB':>9}")
+    for label, size in (
+        ("SearchResult 리스트 (크롤러)", list_size),
+        ("SearchResult 리스트 (JSON)", loaded_size),
+        ("ResultBatch (크롤러)", batch_size),
+        ("ResultBatch (JSON)", loaded_batch_size),
+    ):
+        print(f"{label:<28} {size / COUNT:>8.0f} {size / 2**20:>9.1f}")
+    print(f"\n모든 행을 꺼낸 뒤 늘어난 묶음 메모리: {exported_size / 2**20:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
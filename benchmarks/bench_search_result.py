@@ -0,0 +1,74 @@
+"""
+SearchResult 생성 벤치마크
+
+상품 1,000개 분량의 SearchResult를 pydantic 검증 생성(이전 방식, 상품마다 datetime.now())과
+검증 없는 생성(SearchResult.from_trusted, 페이지 단위 crawled_at 공유)으로 비교합니다.
+
+    python -m benchmarks.bench_search_result
+"""
+
+import timeit
+from datetime import datetime
+
+from src.models.search import SearchResult, StockStatus
+
+
+COUNT = 1000
+
+# 크롤러가 추출하는 값과 비슷한 상품 필드
+ROWS = [
+    (
+        f"MG 1/100 건담 프라모델 {i}",
+        (i + 1) * 1000 if i % 10 else None,
+        f"{(i + 1) * 1000:,}원" if i % 10 else None,
+        StockStatus.OUT_OF_STOCK if i % 7 == 0 else StockStatus.IN_STOCK,
+        f"https://example.com/product/{i}",
+    )
+    for i in range(COUNT)
+]
+
+
+def validated() -> list[SearchResult]:
+    """이전 방식: 필드 검증 후 생성"""
+    return [
+        SearchResult(
+            shop_id="shop",
+            shop_name="벤치마크",
+            product_name=name,
+            price=price,
+            price_text=price_text,
+            stock_status=stock_status,
+            product_url=url,
+        )
+        for name, price, price_text, stock_status, url in ROWS
+    ]
+
+
+def trusted() -> list[SearchResult]:
+    """검증 없이 생성 (페이지 단위 crawled_at)"""
+    crawled_at = datetime.now()
+    return [
+        SearchResult.from_trusted(
+            "shop", "벤치마크", name, price, price_text, stock_status, url, crawled_at
+        )
+        for name, price, price_text, stock_status, url in ROWS
+    ]
+
+
+def main() -> None:
+    old = validated()
+    new = trusted()
+    assert [r.model_dump(exclude={"crawled_at"}) for r in old] == [
+        r.model_dump(exclude={"crawled_at"}) for r in new
+    ]
+
+    number = 20
+    old_seconds = min(timeit.repeat(validated, number=number, repeat=7))
+    new_seconds = min(timeit.repeat(trusted, number=number, repeat=7))
+    print(f"{'방식':<10} {f'{COUNT:,}개 ms':>10}")
+    print(f"{'검증':<10} {old_seconds / number * 1000:>10.2f}")
+    print(f"{'from_trusted':<10} {new_seconds / number * 1000:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+직렬화 벤치마크
+
+1. CLI --json 출력: 행마다 딕셔너리를 만들어 표준 json.dumps(indent=2)한 경우와
+   묶음의 열로 바로 만드는 serialization.dumps_result_batch 비교
+2. ShopStore.save 직렬화: model_dump_json -> json.loads -> json.dump와 model_dump(mode="json") -> dumps 비교
+3. 검색 결과 100,000개 저장/읽기: SearchResult JSON(model_dump/model_validate)과
+   ResultBatch 바이너리 형식(encode_result_batch/decode_result_batch) 비교
+
+    python -m benchmarks.bench_serialization
+"""
+
+import json
+import timeit
+
+from benchmarks.bench_result_memory import make_results
+from src.models.result_batch import ResultBatch
+from src.models.shop import Shop, ShopSelectors
+from src.storage import serialization
+from src.storage.serialization import decode_result_batch, dumps_result_batch, encode_result_batch
+
+
+def make_shops(count: int) -> list[Shop]:
+    selectors = ShopSelectors(
+        product_container=".product",
+        product_name=".name",
+        product_price=".price",
+        stock_status=".stock",
+    )
+    return [
+        Shop(
+            name=f"상점 {i}",
+            base_url=f"https://shop{i}.example.com",
+            search_url_template=f"https://shop{i}.example.com/search?q={{keyword}}",
+            selectors=selectors,
+        )
+        for i in range(count)
+    ]
+
+
+def cli_rows(results):
+    return [
+        {
+            "shop_id": r.shop_id,
+            "shop_name": r.shop_name,
+            "product_name": r.product_name,
+            "price": r.price,
+            "stock_status": r.stock_status.value,
+            "product_url": r.product_url,
+        }
+        for r in results
+    ]
+
+
+def best_ms(func, number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1000
+
+
+def main() -> None:
+    print(f"JSON 라이브러리: {serialization.JSON_BACKEND}\n")
+    print(f"{'작업':<30} {'이전 ms':>10} {'새 ms':>10}")
+
+    cli_batch = ResultBatch.from_results(make_results(1000)).sort_by_price()
+    assert dumps_result_batch(cli_batch) == json.dumps(
+        cli_rows(cli_batch), ensure_ascii=False, indent=2
+    ).encode("utf-8")
+    old = best_ms(lambda: json.dumps(cli_rows(cli_batch), ensure_ascii=False, indent=2), 20)
+    new = best_ms(lambda: dumps_result_batch(cli_batch), 20)
+    print(f"{'CLI --json (1,000개)':<30} {old:>10.2f} {new:>10.2f}")
+
+    shops = make_shops(50)
+    old = best_ms(
+        lambda: json.dumps(
+            {"shops": [json.loads(shop.model_dump_json()) for shop in shops]},
+            ensure_ascii=False,
+            indent=2,
+        ),
+        50,
+    )
+    new = best_ms(
+        lambda: serialization.dumps({"shops": [shop.model_dump(mode="json") for shop in shops]}, indent=True),
+        50,
+    )
+    print(f"{'ShopStore.save (상점 50곳)':<30} {old:>10.2f} {new:>10.2f}")
+
+    results = make_results(100_000)
+    batch = ResultBatch.from_results(results, keep_rows=False)
+    text = serialization.dumps([result.model_dump() for result in results])
+    data = encode_result_batch(batch)
+    old = best_ms(lambda: serialization.dumps([result.model_dump() for result in results]), 1)
+    new = best_ms(lambda: encode_result_batch(batch), 1)
+    print(f"{'결과 100,000개 저장':<30} {old:>10.2f} {new:>10.2f}")
+    old = best_ms(lambda: [type(results[0]).model_validate(row) for row in serialization.loads(text)], 1)
+    new = best_ms(lambda: decode_result_batch(data), 1)
+    print(f"{'결과 100,000개 읽기':<30} {old:>10.2f} {new:>10.2f}")
+    print(f"\n크기: JSON {len(text) / 2**20:.1f} MB, 바이너리 {len(data) / 2**20:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
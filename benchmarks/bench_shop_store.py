@@ -0,0 +1,62 @@
+"""
+ShopStore 일괄 변경 벤치마크
+
+상점 50곳을 모두 비활성화할 때 변경마다 저장하는 경우와
+transaction()/save_delay로 한 번에 저장하는 경우를 비교합니다.
+저장은 임시 파일에 쓰고 fsync한 뒤 교체하므로 디스크 속도에 따라 차이가 커집니다.
+
+    python -m benchmarks.bench_shop_store
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.bench_serialization import make_shops
+from src.storage.shop_store import ShopStore
+
+
+SHOP_COUNT = 50
+
+
+def toggle_all(store: ShopStore, enabled: bool) -> None:
+    for shop in store.list_all():
+        store.set_enabled(shop.id, enabled)
+
+
+def run(label: str, edit) -> None:
+    with tempfile.TemporaryDirectory() as temp:
+        store = ShopStore(config_dir=Path(temp), auto_save=False)
+        for shop in make_shops(SHOP_COUNT):
+            store.add(shop)
+        store.save()
+        store.auto_save = True
+
+        start = time.perf_counter()
+        for enabled in (False, True, False, True):
+            edit(store, enabled)
+        store.close()
+        elapsed = (time.perf_counter() - start) / 4
+        print(f"{label:<24} {elapsed * 1000:>10.2f}")
+
+
+def in_transaction(store: ShopStore, enabled: bool) -> None:
+    with store.transaction():
+        toggle_all(store, enabled)
+
+
+def delayed(store: ShopStore, enabled: bool) -> None:
+    store.save_delay = 60
+    toggle_all(store, enabled)
+    store.flush()
+
+
+def main() -> None:
+    print(f"{'방식 (상점 50곳 변경)':<24} {'ms':>10}")
+    run("변경마다 저장", toggle_all)
+    run("transaction()", in_transaction)
+    run("save_delay + flush", delayed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+형제 가격 선택자 벤치마크
+
+열이 많은 표 형식 페이지에서 행마다 뒤따르는 형제를 모두 모은 뒤 N번째를 고르는 이전 방식과
+컴파일된 형제 단계를 필요한 만큼만 따라가는 방식(find_price_sibling)을 비교합니다.
+
+    python -m benchmarks.bench_sibling_selector
+"""
+
+import timeit
+
+from benchmarks.pages import make_wide_table
+from src.crawlers.extraction_plan import build_extraction_plan
+from src.crawlers.parser_backends import BeautifulSoupBackend, LxmlBackend
+from src.models.shop import Shop, ShopSelectors
+
+
+PRICE_SELECTOR = "+ td + td + td + td"
+
+
+def list_siblings(backend, container):
+    """이전 방식: a의 부모 td 뒤 형제를 모두 모은 뒤 N번째 선택"""
+    base = backend.find_parent(container, "td")
+    if base is None:
+        base = container
+    if isinstance(backend, LxmlBackend):
+        siblings = [sibling for sibling in base.itersiblings() if isinstance(sibling.tag, str)]
+    else:
+        siblings = base.find_next_siblings()
+    count = PRICE_SELECTOR.count("+")
+    return siblings[count - 1] if len(siblings) >= count else None
+
+
+def main() -> None:
+    shop = Shop(
+        name="벤치마크",
+        base_url="https://example.com",
+        search_url_template="https://example.com/search?q={keyword}",
+        selectors=ShopSelectors(
+            product_container="a[href*='poprec/detail.php']",
+            product_name=".",
+            product_price=PRICE_SELECTOR,
+            product_link=".",
+        ),
+    )
+
+    print(f"{'백엔드':<8} {'열 수':>6} {'이전 ms':>10} {'단계 ms':>10}")
+    for backend in (LxmlBackend(), BeautifulSoupBackend()):
+        plan = build_extraction_plan(shop, backend)
+        for columns in (10, 100, 500):
+            document = backend.parse(make_wide_table(rows=200, columns=columns))
+            containers = backend.select_compiled(document, plan.container)
+
+            old = [list_siblings(backend, container) for container in containers]
+            new = [plan.find_price_sibling(container) for container in containers]
+            assert [backend.get_text(n) for n in old] == [backend.get_text(n) for n in new]
+
+            number = 5
+            old_seconds = min(timeit.repeat(
+                lambda: [list_siblings(backend, c) for c in containers], number=number, repeat=5
+            ))
+            new_seconds = min(timeit.repeat(
+                lambda: [plan.find_price_sibling(c) for c in containers], number=number, repeat=5
+            ))
+            print(
+                f"{backend.name:<8} {columns:>6} "
+                f"{old_seconds / number * 1000:>10.2f} {new_seconds / number * 1000:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+재고 상태 판별 마이크로 벤치마크
+
+상품 1개당 재고 상태 판별 비용을 이전 방식(단계별 패턴 검사, 이미지 2회 순회,
+예약 키워드 전체 검사)과 계획에 컴파일된 판별기(펼친 최소 패턴 목록과 문구별 결과 재사용,
+이미지 1회 순회, 최소 예약 키워드)로 비교합니다.
+
+    python -m benchmarks.bench_stock_status
+"""
+
+import timeit
+
+from src.crawlers.extraction_plan import PREORDER_KEYWORDS, build_extraction_plan, is_preorder_name
+from src.crawlers.parser_backends import get_parser_backend
+from src.models.search import StockStatus
+from src.models.shop import Shop, ShopSelectors, StockPatterns
+
+
+STOCK_TEXTS = [
+    "재고 있음",
+    "일시품절",
+    "구매 가능 (잔여 3개)",
+    "입고 예정 상품입니다 - 문의 바랍니다",
+    "SOLD OUT",
+    "판매중",
+    "",
+]
+
+CONTAINER_HTML = "".join(
+    f'<li class="item"><div class="thumb"><img src="/img/p{i}.jpg" alt="상품 {i}">'
+    f'<img src="/img/icon_new.gif"><img src="/img/{"SoldOut" if i % 5 == 0 else "icon_sale"}.gif"></div>'
+    f'<p class="name">{"[예약] " if i % 7 == 0 else ""}HG 건담 {i}</p><p class="price">{i},000원</p></li>'
+    for i in range(100)
+)
+
+
+def linear_stock_status(plan, stock_text: str) -> StockStatus:
+    """이전 방식: 소문자 변환 후 단계별 패턴 선형 검사"""
+    if not stock_text:
+        return StockStatus.UNKNOWN
+    stock_text_lower = stock_text.lower()
+    for patterns, status in plan.stock_tiers:
+        for pattern in patterns:
+            if pattern in stock_text_lower:
+                return status
+    return StockStatus.UNKNOWN
+
+
+def linear_auto_status(plan, container, product_name: str) -> StockStatus:
+    """이전 방식: alt/src 각각 이미지 순회 후 예약 키워드 선형 검사"""
+    backend = plan.backend
+    images = backend.find_all(container, "img")
+    soldout_img = any(
+        "품절" in (backend.get_attr(img, "alt") or "") for img in images
+    ) or any(
+        "soldout" in (backend.get_attr(img, "src") or "").lower() for img in images
+    )
+    if soldout_img:
+        return StockStatus.OUT_OF_STOCK
+    if any(kw in product_name for kw in PREORDER_KEYWORDS):
+        return StockStatus.PRE_ORDER
+    return StockStatus.IN_STOCK
+
+
+def compiled_auto_status(plan, container, product_name: str) -> StockStatus:
+    """컴파일된 판별기: 이미지 1회 순회와 최소 예약 키워드"""
+    if plan.has_soldout_image(container):
+        return StockStatus.OUT_OF_STOCK
+    if is_preorder_name(product_name):
+        return StockStatus.PRE_ORDER
+    return StockStatus.IN_STOCK
+
+
+def per_item_ns(func, items, number: int) -> float:
+    """항목 1개당 평균 시간 (ns)"""
+    def run():
+        for item in items:
+            func(*item)
+    seconds = min(timeit.repeat(run, number=number, repeat=5))
+    return seconds / (number * len(items)) * 1e9
+
+
+def main() -> None:
+    selectors = ShopSelectors(
+        product_container="li.item",
+        product_name=".name",
+        product_price=".price",
+    )
+    shop = Shop(
+        name="벤치마크",
+        base_url="https://example.com",
+        search_url_template="https://example.com/search?q={keyword}",
+        selectors=selectors,
+        stock_patterns=StockPatterns(
+            in_stock=["판매중", "주문 가능", "즉시 출고"],
+            out_of_stock=["sold out", "재입고 알림", "판매 종료"],
+        ),
+    )
+    plan = build_extraction_plan(shop, get_parser_backend(selectors))
+    backend = plan.backend
+
+    for text in STOCK_TEXTS:
+        assert plan.determine_stock_status(text) == linear_stock_status(plan, text), text
+
+    containers = backend.select_compiled(backend.parse(CONTAINER_HTML), plan.container)
+    products = [
+        (plan, container, backend.get_text(backend.select_one_compiled(container, plan.name)))
+        for container in containers
+    ]
+    for product in products:
+        assert compiled_auto_status(*product) == linear_auto_status(*product)
+
+    texts = [(plan, text) for text in STOCK_TEXTS]
+    print(f"백엔드: {backend.name}, 상품 {len(products)}개, 재고 문구 {len(texts)}개")
+    print(f"{'항목':<28} {'이전 ns':>10} {'컴파일 ns':>10}")
+    print(
+        f"{'재고 문구 판별':<28} "
+        f"{per_item_ns(linear_stock_status, texts, 20000):>10.0f} "
+        f"{per_item_ns(lambda p, t: p.determine_stock_status(t), texts, 20000):>10.0f}"
+    )
+    print(
+        f"{'자동 감지 (이미지/예약)':<28} "
+        f"{per_item_ns(linear_auto_status, products, 200):>10.0f} "
+        f"{per_item_ns(compiled_auto_status, products, 200):>10.0f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
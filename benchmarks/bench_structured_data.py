@@ -0,0 +1,86 @@
+"""
+구조화 데이터 벤치마크
+
+상품 목록과 같은 내용의 JSON-LD(ItemList)를 포함한 페이지에서
+선택자 방식(HTML 파싱 + 선택자 순회)과 구조화 데이터 방식(JSON-LD만 읽기)의 추출 시간을 비교합니다.
+
+    python -m benchmarks.bench_structured_data
+"""
+
+import json
+import timeit
+
+from benchmarks.pages import load_fixture_pages, load_fixture_shop, make_noisy_page
+from src.crawlers.html_crawler import HtmlCrawler
+from src.models.search import SearchResult
+from src.models.shop import ExtractionStrategy
+
+
+def add_json_ld(html: str, results: list[SearchResult]) -> str:
+    """
+    추출 결과와 같은 상품 목록을 JSON-LD ItemList로 head에 추가
+
+    Args:
+        html: HTML 문자열
+        results: 선택자 방식 추출 결과
+
+    Returns:
+        HTML 문자열
+    """
+    data = {
+        "@context": "https://schema.org",
+        "@type": "ItemList",
+        "itemListElement": [
+            {
+                "@type": "ListItem",
+                "position": position,
+                "item": {
+                    "@type": "Product",
+                    "name": result.product_name,
+                    "url": result.product_url,
+                    "offers": {"@type": "Offer", "price": result.price, "priceCurrency": "KRW"},
+                },
+            }
+            for position, result in enumerate(results, start=1)
+        ],
+    }
+    script = f'<script type="application/ld+json">{json.dumps(data, ensure_ascii=False)}</script>'
+    return html.replace("</head>", f"{script}</head>", 1)
+
+
+def main() -> None:
+    shop = load_fixture_shop()
+
+    print(f"{'백엔드':<8} {'페이지':<28} {'상품 수':>6} {'선택자 ms':>10} {'JSON-LD ms':>11}")
+    for backend in ("bs4", "lxml"):
+        selector_shop = shop.model_copy(update={"parser_backend": backend})
+        structured_shop = selector_shop.model_copy(
+            update={"extraction_strategy": ExtractionStrategy.STRUCTURED_DATA}
+        )
+        selector_crawler = HtmlCrawler(selector_shop)
+        structured_crawler = HtmlCrawler(structured_shop)
+
+        for name, fixture in load_fixture_pages().items():
+            results = selector_crawler.parse_html(fixture)
+            if not results:
+                continue
+            html = add_json_ld(make_noisy_page(fixture), results)
+
+            structured = structured_crawler.parse_html(html)
+            assert [r.product_name for r in structured] == [r.product_name for r in results]
+
+            number = 20
+            selector_seconds = min(timeit.repeat(
+                lambda: selector_crawler.parse_html(html), number=number, repeat=3
+            ))
+            structured_seconds = min(timeit.repeat(
+                lambda: structured_crawler.parse_html(html), number=number, repeat=3
+            ))
+            print(
+                f"{backend:<8} {name:<28} {len(results):>6} "
+                f"{selector_seconds / number * 1000:>10.2f} {structured_seconds / number * 1000:>11.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
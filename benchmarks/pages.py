@@ -0,0 +1,110 @@
+"""
+벤치마크용 검색 결과 페이지
+
+테스트 픽스처 페이지와, 실제 상점 페이지처럼 내비게이션/배너/스크립트가
+대부분을 차지하도록 픽스처 상품 목록을 감싼 페이지를 제공합니다.
+"""
+
+import json
+from pathlib import Path
+
+from src.models.shop import Shop
+
+
+FIXTURE_DIR = Path(__file__).resolve().parent.parent / "tests" / "fixtures"
+
+
+def load_fixture_shop() -> Shop:
+    """
+    픽스처 상점 (search_results.html 선택자)
+
+    Returns:
+        Shop
+    """
+    data = json.loads((FIXTURE_DIR / "sample_shop.json").read_text(encoding="utf-8"))
+    return Shop.model_validate(data["shops"][0])
+
+
+def load_fixture_pages() -> dict[str, str]:
+    """
+    픽스처 HTML 페이지
+
+    Returns:
+        파일 이름 -> HTML
+    """
+    return {
+        path.name: path.read_text(encoding="utf-8")
+        for path in sorted((FIXTURE_DIR / "sample_html").glob("*.html"))
+    }
+
+
+def make_noisy_page(html: str, menu_items: int = 300, banners: int = 20, scripts: int = 10) -> str:
+    """
+    페이지 본문 앞뒤에 내비게이션, 배너, 스크립트, 푸터 추가
+
+    Args:
+        html: 원본 HTML (body 내용을 사용)
+        menu_items: 카테고리 메뉴 항목 수
+        banners: 배너 수
+        scripts: 인라인 스크립트 수
+
+    Returns:
+        HTML 문자열
+    """
+    start = html.find("<body>")
+    end = html.rfind("</body>")
+    body = html[start + len("<body>"):end] if start != -1 and end != -1 else html
+
+    menu = "".join(
+        f'<li class="cate"><a href="/category/{i}"><span>카테고리 {i}</span></a>'
+        f'<ul class="sub"><li><a href="/category/{i}/1">하위 {i}-1</a></li>'
+        f'<li><a href="/category/{i}/2">하위 {i}-2</a></li></ul></li>'
+        for i in range(menu_items)
+    )
+    banner = "".join(
+        f'<div class="banner"><a href="/event/{i}"><img src="/img/banner{i}.jpg" alt="이벤트 {i}"></a>'
+        f'<p class="desc">기간 한정 이벤트 {i} - 최대 {i % 50}% 할인</p></div>'
+        for i in range(banners)
+    )
+    script = "".join(
+        f"<script>window.dataLayer = window.dataLayer || []; dataLayer.push({{'event': 'view{i}', "
+        f"'items': [{', '.join(str(n) for n in range(50))}]}});</script>"
+        for i in range(scripts)
+    )
+    footer = "".join(f'<p class="info">사업자 정보 {i} | 고객센터 1588-0000</p>' for i in range(30))
+
+    return (
+        '<!DOCTYPE html><html lang="ko"><head><meta charset="UTF-8">'
+        f"<title>검색 결과</title>{script}</head><body>"
+        f'<header><nav><ul class="gnb">{menu}</ul></nav></header>'
+        f'<div class="banners">{banner}</div>'
+        f"<main>{body}</main>"
+        f"<footer>{footer}</footer>{script}</body></html>"
+    )
+
+
+def make_wide_table(rows: int = 200, columns: int = 300, price_column: int = 4) -> str:
+    """
+    상품 링크 뒤에 열이 많이 이어지는 표 형식 검색 결과 페이지
+
+    각 행의 첫 칸에 상품 링크(a)가 있고, price_column번째 다음 칸에 가격이 있습니다.
+    ("+ td" 형제 가격 선택자를 쓰는 상점 형식)
+
+    Args:
+        rows: 행 수
+        columns: 상품 링크 뒤 칸 수
+        price_column: 가격 칸 위치 (1부터)
+
+    Returns:
+        HTML 문자열
+    """
+    body = []
+    for row in range(rows):
+        cells = [
+            f"<td>{(row + 1) * 1000:,}원</td>" if column == price_column else f"<td>옵션 {column}</td>"
+            for column in range(1, columns + 1)
+        ]
+        body.append(
+            f'<tr><td><a href="poprec/detail.php?id={row}">상품 {row}</a></td>{"".join(cells)}</tr>'
+        )
+    return f'<html><body><table>{"".join(body)}</table></body></html>'
@@ -12,11 +12,16 @@ from typing import Optional
 from rich.console import Console
 from rich.table import Table
 
+from src.crawlers.circuit_breaker import CircuitBreaker
 from src.crawlers.html_crawler import CrawlError, HtmlCrawler
 from src.crawlers.multi_crawler import MultiShopCrawler
 from src.display.table_renderer import TableRenderer
-from src.models.shop import Shop, ShopSelectors, StockPatterns
+from src.models.result_batch import ResultBatch
+from src.models.shop import ExtractionStrategy, Shop, ShopSelectors, StockPatterns
+from src.storage import serialization
 from src.storage.shop_store import ShopStore, ShopStoreError
+from src.utils.http_cache import HttpCache
+from src.utils.http_client import HttpClient
 
 
 console = Console()
@@ -65,6 +70,23 @@ def parse_args(args: Optional[list[str]] = None) -> argparse.Namespace:
         action="store_true",
         help="가격순 정렬",
     )
+    search_parser.add_argument(
+        "--limit",
+        "-l",
+        type=int,
+        help="상점당 최대 결과 수 (채우면 나머지 상품은 추출하지 않음)",
+    )
+    cache_group = search_parser.add_mutually_exclusive_group()
+    cache_group.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="응답 캐시를 사용하지 않음",
+    )
+    cache_group.add_argument(
+        "--refresh",
+        action="store_true",
+        help="캐시된 응답을 서버에 재검증",
+    )
 
     # shop 명령어
     shop_parser = subparsers.add_parser("shop", help="상점 관리")
@@ -97,6 +119,27 @@ def parse_args(args: Optional[list[str]] = None) -> argparse.Namespace:
         "--keyword-encoding",
         help="검색 키워드 인코딩 (예: euc-kr). 기본값은 UTF-8",
     )
+    shop_add_parser.add_argument(
+        "--rate-limit",
+        type=float,
+        help="초당 최대 요청 수 (예: 0.5 = 2초에 1회). 기본값은 제한 없음",
+    )
+    shop_add_parser.add_argument(
+        "--rate-burst",
+        type=int,
+        default=1,
+        help="속도 제한 시 연속으로 허용되는 최대 요청 수 (기본: 1)",
+    )
+    shop_add_parser.add_argument(
+        "--partial-parse",
+        action="store_true",
+        help="상품 컨테이너 주변만 파싱하여 속도 향상 (선택자가 컨테이너 밖을 참조하지 않을 때)",
+    )
+    shop_add_parser.add_argument(
+        "--structured-data",
+        action="store_true",
+        help="페이지의 JSON-LD 상품 정보를 먼저 사용 (없으면 선택자 사용)",
+    )
 
     # shop remove
     shop_remove_parser = shop_subparsers.add_parser("remove", help="상점 삭제")
@@ -139,6 +182,9 @@ def run_search(
     store: Optional[ShopStore] = None,
     json_output: bool = False,
     quiet: bool = False,
+    use_cache: bool = True,
+    refresh: bool = False,
+    limit: Optional[int] = None,
 ) -> int:
     """
     검색 실행
@@ -150,10 +196,17 @@ def run_search(
         store: ShopStore 인스턴스
         json_output: JSON 출력
         quiet: 조용한 모드
+        use_cache: 응답 캐시 사용 여부
+        refresh: 캐시된 응답을 TTL과 무관하게 재검증
+        limit: 상점당 최대 결과 수 (None이면 제한 없음)
 
     Returns:
         종료 코드
     """
+    if limit is not None and limit < 1:
+        console.print("[red]오류: --limit은 1 이상이어야 합니다[/red]")
+        return 1
+
     if store is None:
         store = ShopStore()
 
@@ -175,33 +228,36 @@ def run_search(
         console.print(f"[dim]'{keyword}' 검색 중... ({len(shops)}개 상점)[/dim]")
 
     # 검색 실행
-    crawler = MultiShopCrawler(shops)
-    results, errors = crawler.search_with_errors(keyword)
+    # 연속 실패한 상점은 설정 디렉토리의 차단 상태를 공유하여 건너뜀
+    breaker = CircuitBreaker(store.config_dir / CircuitBreaker.STATE_FILENAME)
+    crawler = MultiShopCrawler(shops, circuit_breaker=breaker, max_results=limit)
+
+    # 검색 페이지 응답 캐시 (이 검색 동안만 공용 클라이언트에 적용)
+    if use_cache:
+        HttpClient.set_shared_cache(
+            HttpCache(store.config_dir / HttpCache.DIRNAME, refresh=refresh)
+        )
+    try:
+        results, errors = crawler.search_with_errors(keyword)
+    finally:
+        if use_cache:
+            HttpClient.set_shared_cache(None)
 
+    # 정렬과 최저가 찾기는 열 단위 묶음으로 처리 (상점은 저장소의 핸들 표 공유)
+    batch = ResultBatch.from_results(results, shops=store.shop_table)
     if sort_by_price:
-        results = crawler._sort_by_price(results)
+        batch = batch.sort_by_price()
 
     # 결과 출력
     if json_output:
-        import json
-        output = [
-            {
-                "shop_id": r.shop_id,
-                "shop_name": r.shop_name,
-                "product_name": r.product_name,
-                "price": r.price,
-                "stock_status": r.stock_status.value,
-                "product_url": r.product_url,
-            }
-            for r in results
-        ]
-        print(json.dumps(output, ensure_ascii=False, indent=2))
+        # 행마다 객체를 만들지 않고 묶음의 열로 바로 출력
+        print(serialization.dumps_result_batch(batch).decode("utf-8"))
     else:
         renderer = TableRenderer()
         if len(shops) > 1:
-            renderer.print_comparison(results, keyword)
+            renderer.print_comparison(batch, keyword)
         else:
-            renderer.print_results(results, keyword)
+            renderer.print_results(batch, keyword)
 
     # 오류 표시
     for error in errors:
@@ -230,7 +286,6 @@ def run_shop_list(
     shops = store.list_all()
 
     if json_output:
-        import json
         output = [
             {
                 "id": s.id,
@@ -240,7 +295,7 @@ def run_shop_list(
             }
             for s in shops
         ]
-        print(json.dumps(output, ensure_ascii=False, indent=2))
+        print(serialization.dumps(output, indent=True).decode("utf-8"))
         return 0
 
     if not shops:
@@ -272,6 +327,10 @@ def run_shop_add(
     stock_selector: Optional[str] = None,
     verify_ssl: bool = True,
     keyword_encoding: Optional[str] = None,
+    rate_limit: Optional[float] = None,
+    rate_burst: int = 1,
+    partial_parse: bool = False,
+    structured_data: bool = False,
     store: Optional[ShopStore] = None,
 ) -> int:
     """
@@ -299,6 +358,12 @@ def run_shop_add(
             selectors=selectors,
             verify_ssl=verify_ssl,
             keyword_encoding=keyword_encoding,
+            rate_limit=rate_limit,
+            rate_burst=rate_burst,
+            partial_parse=partial_parse,
+            extraction_strategy=(
+                ExtractionStrategy.STRUCTURED_DATA if structured_data else ExtractionStrategy.SELECTORS
+            ),
         )
 
         store.add(shop)
@@ -362,6 +427,12 @@ def run_shop_show(
     console.print(f"  URL: {shop.base_url}")
     console.print(f"  검색 템플릿: {shop.search_url_template}")
     console.print(f"  상태: {'활성' if shop.enabled else '비활성'}")
+    if shop.rate_limit:
+        console.print(f"  속도 제한: 초당 {shop.rate_limit}회 (버스트 {shop.rate_burst})")
+    if shop.partial_parse:
+        console.print("  부분 파싱: 사용")
+    if shop.extraction_strategy == ExtractionStrategy.STRUCTURED_DATA:
+        console.print("  구조화 데이터(JSON-LD): 사용")
     console.print(f"\n  [dim]선택자:[/dim]")
     console.print(f"    컨테이너: {shop.selectors.product_container}")
     console.print(f"    상품명: {shop.selectors.product_name}")
@@ -477,6 +548,9 @@ def main(args: Optional[list[str]] = None) -> int:
             sort_by_price=getattr(parsed, "sort", False),
             json_output=json_output,
             quiet=quiet,
+            use_cache=not getattr(parsed, "no_cache", False),
+            refresh=getattr(parsed, "refresh", False),
+            limit=getattr(parsed, "limit", None),
         )
 
     elif parsed.command == "shop":
@@ -494,6 +568,10 @@ def main(args: Optional[list[str]] = None) -> int:
                 stock_selector=getattr(parsed, "stock_selector", None),
                 verify_ssl=not getattr(parsed, "no_ssl_verify", False),
                 keyword_encoding=getattr(parsed, "keyword_encoding", None),
+                rate_limit=getattr(parsed, "rate_limit", None),
+                rate_burst=getattr(parsed, "rate_burst", 1),
+                partial_parse=getattr(parsed, "partial_parse", False),
+                structured_data=getattr(parsed, "structured_data", False),
             )
         elif parsed.shop_command == "remove":
             return run_shop_remove(parsed.shop_id)
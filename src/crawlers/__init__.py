@@ -1,7 +1,36 @@
 """크롤링 로직 패키지 - BaseCrawler, HtmlCrawler 등"""
 
-from src.crawlers.base import BaseCrawler
-from src.crawlers.html_crawler import CrawlError, HtmlCrawler
+from src.crawlers.async_html_crawler import AsyncHtmlCrawler
+from src.crawlers.base import AsyncBaseCrawler, BaseCrawler
+from src.crawlers.circuit_breaker import CircuitBreaker, CircuitState
+from src.crawlers.extraction_plan import ExtractionPlan, get_extraction_plan
+from src.crawlers.html_crawler import CrawlError, HtmlCrawler, HtmlPageParser
 from src.crawlers.multi_crawler import MultiShopCrawler
+from src.crawlers.parser_backends import (
+    BeautifulSoupBackend,
+    LxmlBackend,
+    ParserBackend,
+)
+from src.crawlers.price_parser import PriceBatch, parse_prices
+from src.crawlers.result_cache import ResultCache, ResultCacheStats
 
-__all__ = ["BaseCrawler", "CrawlError", "HtmlCrawler", "MultiShopCrawler"]
+__all__ = [
+    "AsyncBaseCrawler",
+    "AsyncHtmlCrawler",
+    "BaseCrawler",
+    "BeautifulSoupBackend",
+    "CircuitBreaker",
+    "CircuitState",
+    "CrawlError",
+    "ExtractionPlan",
+    "HtmlCrawler",
+    "HtmlPageParser",
+    "LxmlBackend",
+    "MultiShopCrawler",
+    "ParserBackend",
+    "PriceBatch",
+    "ResultCache",
+    "ResultCacheStats",
+    "get_extraction_plan",
+    "parse_prices",
+]
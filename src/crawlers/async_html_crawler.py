@@ -0,0 +1,102 @@
+"""
+AsyncHtmlCrawler - 비동기 HTML 정적 크롤러
+
+AsyncHttpClient로 페이지를 받아오고, 파싱은 HtmlCrawler와 같은 HtmlPageParser로
+실행기(executor)에서 수행하여 이벤트 루프를 막지 않습니다.
+"""
+
+import asyncio
+from concurrent.futures import Executor
+from typing import Optional
+
+from src.crawlers.base import AsyncBaseCrawler
+from src.crawlers.html_crawler import CrawlError, HtmlPageParser
+from src.models.search import SearchResult
+from src.models.shop import Shop
+from src.utils.async_http_client import AsyncHttpClient
+from src.utils.http_client import HttpClientError
+
+
+class AsyncHtmlCrawler(AsyncBaseCrawler):
+    """
+    비동기 HTML 정적 크롤러
+
+    하나의 AsyncHttpClient를 여러 크롤러가 공유하면
+    수백 개의 상점×키워드 요청을 하나의 이벤트 루프에서 동시에 처리할 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        shop: Shop,
+        http_client: AsyncHttpClient,
+        executor: Optional[Executor] = None,
+    ):
+        """
+        AsyncHtmlCrawler 초기화
+
+        Args:
+            shop: 상점 설정
+            http_client: 비동기 HTTP 클라이언트
+            executor: 파싱을 실행할 실행기 (없으면 이벤트 루프 기본 실행기)
+        """
+        self.shop = shop
+        self.http_client = http_client
+        self.executor = executor
+        # 동기 HttpClient 없이 추출 계획과 파서 백엔드만 사용
+        self._parser = HtmlPageParser(shop)
+
+        # 상점별 속도 제한 등록 (동기 크롤러와 같은 호스트 버킷 공유)
+        self.http_client.rate_limiter.configure(
+            shop.get_search_host(),
+            shop.rate_limit,
+            shop.rate_burst,
+        )
+
+    async def search(
+        self,
+        keyword: str,
+        deadline: Optional[float] = None,
+        max_results: Optional[int] = None,
+    ) -> list[SearchResult]:
+        """
+        키워드로 상품 비동기 검색
+
+        Args:
+            keyword: 검색 키워드
+            deadline: 재시도를 포함한 검색 마감 시각 (time.monotonic 기준)
+            max_results: 최대 결과 수 (채우면 나머지 상품은 추출하지 않음)
+
+        Returns:
+            검색 결과 리스트
+
+        Raises:
+            CrawlError: 크롤링 실패 시
+        """
+        try:
+            url = self.shop.get_search_url(keyword)
+            html = await self.http_client.get_html(
+                url,
+                encoding=self.shop.keyword_encoding,
+                retry_policy=self.shop.retry_policy,
+                deadline=deadline,
+            )
+        except HttpClientError as e:
+            raise CrawlError(f"크롤링 실패: {self.shop.name} - {e}") from e
+
+        return await self.parse_html(html, max_results)
+
+    async def parse_html(self, html: str, max_results: Optional[int] = None) -> list[SearchResult]:
+        """
+        HTML을 실행기에서 파싱하여 상품 정보 추출
+
+        Args:
+            html: HTML 문자열
+            max_results: 최대 결과 수
+
+        Returns:
+            검색 결과 리스트
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, self._parser.parse_html, html, max_results
+        )
@@ -31,3 +31,24 @@ class BaseCrawler(ABC):
             검색 결과 리스트
         """
         pass
+
+
+class AsyncBaseCrawler(ABC):
+    """
+    비동기 크롤러 기본 추상 클래스
+
+    BaseCrawler와 같은 인터페이스를 코루틴으로 제공합니다.
+    """
+
+    @abstractmethod
+    async def search(self, keyword: str) -> list["SearchResult"]:
+        """
+        키워드로 상품 비동기 검색
+
+        Args:
+            keyword: 검색 키워드
+
+        Returns:
+            검색 결과 리스트
+        """
+        pass
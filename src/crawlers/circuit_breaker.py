@@ -0,0 +1,277 @@
+"""
+CircuitBreaker - 상점별 회로 차단기
+
+연속으로 실패하는 상점을 일정 시간 건너뛰어 검색이 타임아웃을 기다리지 않게 합니다.
+상태는 설정 디렉토리에 저장되어 짧게 실행되는 CLI 호출 간에도 유지됩니다.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from enum import Enum
+from pathlib import Path
+from typing import Optional
+
+
+class CircuitState(str, Enum):
+    """회로 상태"""
+
+    CLOSED = "CLOSED"  # 정상: 요청 허용
+    OPEN = "OPEN"  # 차단: 대기 시간 동안 즉시 실패
+    HALF_OPEN = "HALF_OPEN"  # 시험: 요청 1회만 허용
+
+
+class CircuitBreaker:
+    """
+    상점 ID별 회로 차단기
+
+    failure_threshold번 연속 실패하면 회로를 열고 cooldown초 동안 요청을 막습니다.
+    대기 시간이 지나면 한 번의 시험 요청을 허용하여 성공 시 닫고, 실패 시 다시 엽니다.
+    """
+
+    STATE_FILENAME = "circuit_breaker.json"
+    DEFAULT_FAILURE_THRESHOLD = 3
+    DEFAULT_COOLDOWN = 300.0
+
+    def __init__(
+        self,
+        state_path: Optional[Path] = None,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        cooldown: float = DEFAULT_COOLDOWN,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        CircuitBreaker 초기화
+
+        Args:
+            state_path: 상태 저장 파일 경로 (없으면 메모리에만 유지)
+            failure_threshold: 회로를 여는 연속 실패 횟수
+            cooldown: 회로가 열린 뒤 시험 요청까지 대기 시간 (초)
+            clock: 현재 시각 함수 (프로세스 간 공유되므로 벽시계 시각 사용)
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold는 1 이상이어야 합니다")
+
+        self.state_path = state_path
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._clock = clock
+        self._lock = threading.Lock()
+        # 저장 순서 보장 (나중에 찍은 상태가 나중에 기록됨)
+        self._save_lock = threading.Lock()
+        # shop_id -> {"state", "failures", "opened_at"}
+        self._circuits: dict[str, dict] = {}
+        # 시험 요청이 진행 중인 상점 ID
+        self._trials: set[str] = set()
+
+        self.load()
+
+    def load(self) -> None:
+        """저장된 상태 로드 (파일이 없거나 손상되면 빈 상태)"""
+        if self.state_path is None or not self.state_path.exists():
+            return
+
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+
+            circuits = {}
+            for shop_id, circuit in data.get("shops", {}).items():
+                circuits[shop_id] = {
+                    "state": CircuitState(circuit["state"]),
+                    "failures": int(circuit["failures"]),
+                    "opened_at": float(circuit.get("opened_at") or 0.0),
+                }
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return
+
+        with self._lock:
+            self._circuits = circuits
+
+    def save(self) -> None:
+        """
+        상태를 파일로 저장
+
+        잠금 안에서 찍은 상태를 임시 파일에 쓴 뒤 교체하므로,
+        여러 스레드가 동시에 저장해도 반쯤 쓴 파일이 남지 않습니다.
+        """
+        if self.state_path is None:
+            return
+
+        with self._save_lock:
+            with self._lock:
+                data = {
+                    "shops": {
+                        shop_id: {
+                            "state": circuit["state"].value,
+                            "failures": circuit["failures"],
+                            "opened_at": circuit["opened_at"],
+                        }
+                        for shop_id, circuit in self._circuits.items()
+                    }
+                }
+
+            try:
+                self.state_path.parent.mkdir(parents=True, exist_ok=True)
+                self._write_atomic(
+                    json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+                )
+            except OSError:
+                # 상태 저장 실패는 검색에 영향을 주지 않음
+                pass
+
+    def _write_atomic(self, data: bytes) -> None:
+        """임시 파일에 쓴 뒤 교체 (다른 프로세스가 읽는 중에도 반쯤 쓴 파일이 보이지 않음)"""
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.state_path.parent, prefix=self.state_path.name, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self.state_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def get_state(self, shop_id: str) -> CircuitState:
+        """
+        상점의 회로 상태 조회
+
+        Args:
+            shop_id: 상점 ID
+
+        Returns:
+            CircuitState (대기 시간이 지난 OPEN은 HALF_OPEN으로 보고)
+        """
+        with self._lock:
+            circuit = self._circuits.get(shop_id)
+            if circuit is None:
+                return CircuitState.CLOSED
+            if circuit["state"] == CircuitState.OPEN and self._cooldown_elapsed(circuit):
+                return CircuitState.HALF_OPEN
+            return circuit["state"]
+
+    def get_failures(self, shop_id: str) -> int:
+        """
+        상점의 연속 실패 횟수 조회
+
+        Args:
+            shop_id: 상점 ID
+
+        Returns:
+            연속 실패 횟수
+        """
+        with self._lock:
+            circuit = self._circuits.get(shop_id)
+            return circuit["failures"] if circuit else 0
+
+    def retry_after(self, shop_id: str) -> float:
+        """
+        차단 해제(시험 요청)까지 남은 시간
+
+        Args:
+            shop_id: 상점 ID
+
+        Returns:
+            남은 시간 (초, 차단 중이 아니면 0)
+        """
+        with self._lock:
+            circuit = self._circuits.get(shop_id)
+            if circuit is None or circuit["state"] != CircuitState.OPEN:
+                return 0.0
+            return max(0.0, circuit["opened_at"] + self.cooldown - self._clock())
+
+    def allow(self, shop_id: str) -> bool:
+        """
+        상점에 요청을 보내도 되는지 확인
+
+        대기 시간이 지난 회로는 HALF_OPEN으로 바뀌며 시험 요청 1회만 허용합니다.
+
+        Args:
+            shop_id: 상점 ID
+
+        Returns:
+            요청 허용 여부
+        """
+        with self._lock:
+            circuit = self._circuits.get(shop_id)
+            if circuit is None or circuit["state"] == CircuitState.CLOSED:
+                return True
+
+            if circuit["state"] == CircuitState.OPEN:
+                if not self._cooldown_elapsed(circuit):
+                    return False
+                circuit["state"] = CircuitState.HALF_OPEN
+
+            # HALF_OPEN: 진행 중인 시험 요청이 없을 때만 허용
+            if shop_id in self._trials:
+                return False
+            self._trials.add(shop_id)
+            return True
+
+    def record_success(self, shop_id: str) -> None:
+        """
+        요청 성공 기록 (회로 닫기)
+
+        Args:
+            shop_id: 상점 ID
+        """
+        with self._lock:
+            self._trials.discard(shop_id)
+            changed = self._circuits.pop(shop_id, None) is not None
+
+        if changed:
+            self.save()
+
+    def record_failure(self, shop_id: str) -> None:
+        """
+        요청 실패 기록
+
+        시험 요청이 실패하거나 연속 실패가 임계값에 도달하면 회로를 엽니다.
+
+        Args:
+            shop_id: 상점 ID
+        """
+        with self._lock:
+            self._trials.discard(shop_id)
+            circuit = self._circuits.setdefault(
+                shop_id,
+                {"state": CircuitState.CLOSED, "failures": 0, "opened_at": 0.0},
+            )
+            circuit["failures"] += 1
+
+            if (
+                circuit["state"] == CircuitState.HALF_OPEN
+                or circuit["failures"] >= self.failure_threshold
+            ):
+                circuit["state"] = CircuitState.OPEN
+                circuit["opened_at"] = self._clock()
+
+        self.save()
+
+    def reset(self, shop_id: Optional[str] = None) -> None:
+        """
+        회로 초기화
+
+        Args:
+            shop_id: 초기화할 상점 ID (None이면 전체)
+        """
+        with self._lock:
+            if shop_id is None:
+                self._circuits.clear()
+                self._trials.clear()
+            else:
+                self._circuits.pop(shop_id, None)
+                self._trials.discard(shop_id)
+
+        self.save()
+
+    def _cooldown_elapsed(self, circuit: dict) -> bool:
+        """회로가 열린 뒤 대기 시간이 지났는지 확인 (잠금 보유 상태에서 호출)"""
+        return self._clock() >= circuit["opened_at"] + self.cooldown
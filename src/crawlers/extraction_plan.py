@@ -0,0 +1,482 @@
+"""
+ExtractionPlan - 상점별 상품 정보 추출 계획
+
+상점 선택자를 백엔드에 맞게 미리 컴파일하고, 형제 가격 선택자 단계와
+우선순위 순서로 펼친 소문자 재고 패턴을 함께 보관합니다.
+계획은 상점 버전(설정 값과 updated_at)별로 한 번만 만들어 재사용합니다.
+"""
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from src.crawlers.parser_backends import ParserBackend, get_parser_backend
+from src.models.search import StockStatus
+from src.models.shop import ExtractionStrategy, Shop
+
+
+# 기본 재고 상태 키워드 (상점별 패턴 다음에 확인)
+DEFAULT_OUT_OF_STOCK_KEYWORDS = ("품절", "재고 없음", "일시품절", "sold out")
+DEFAULT_IN_STOCK_KEYWORDS = ("재고 있음", "구매 가능", "바로 구매", "in stock")
+
+# 상품명으로 예약상품 판별
+PREORDER_KEYWORDS = ("예약", "발매예정", "입고예정", "예정")
+
+# 품절 이미지 판별 (alt에 포함된 문구, 소문자 src에 포함된 문구)
+SOLDOUT_IMAGE_ALT = "품절"
+SOLDOUT_IMAGE_SRC = "soldout"
+
+# 계획별로 보관할 재고 문구 판별 결과 수
+STOCK_MEMO_SIZE = 1024
+
+# 형제 선택자 단계: 조합자(+ 또는 ~)와 공백 없는 복합 선택자
+_SIBLING_STEP_PATTERN = re.compile(r"\s*([+~])\s*([^\s+~]+)")
+_TAG_NAME_PATTERN = re.compile(r"[a-zA-Z][\w-]*")
+
+# 형제 선택자 단계: (조합자, 소문자 태그 이름 또는 None, 백엔드 매처 또는 None)
+# 태그 이름만 있으면 태그를 비교하고, 둘 다 None이면 모든 요소와 일치 ("*")
+SiblingStep = tuple[str, Optional[str], Optional[Any]]
+
+
+def minimize_keywords(keywords: tuple[str, ...]) -> tuple[str, ...]:
+    """
+    부분 문자열 검사 결과가 같은 최소 키워드 목록
+
+    다른 키워드를 포함하는 키워드는 그 키워드가 항상 함께 일치하므로 제외합니다.
+    (예: "예정"이 있으면 "발매예정"은 불필요)
+
+    Args:
+        keywords: 키워드 목록
+
+    Returns:
+        중복과 불필요한 키워드를 제외한 목록 (순서 유지)
+    """
+    unique = tuple(dict.fromkeys(keywords))
+    return tuple(
+        keyword
+        for keyword in unique
+        if not any(other != keyword and other in keyword for other in unique)
+    )
+
+
+def compile_stock_matcher(
+    stock_tiers: tuple[tuple[tuple[str, ...], StockStatus], ...],
+) -> tuple[tuple[str, StockStatus], ...]:
+    """
+    재고 패턴 단계를 우선순위 순서의 (패턴, 상태) 목록 하나로 펼침
+
+    앞선 단계의 패턴을 포함하는 뒤 단계 패턴은 결과에 영향이 없으므로 제외하고,
+    같은 단계 안에서는 다른 패턴을 포함하는 패턴을 제외합니다.
+    첫 번째로 포함된 패턴의 상태가 단계 순서로 확인한 결과와 같습니다.
+
+    Args:
+        stock_tiers: 확인 순서대로 (소문자 패턴 목록, 상태)
+
+    Returns:
+        확인 순서대로 (소문자 패턴, 상태)
+    """
+    matcher: list[tuple[str, StockStatus]] = []
+    for patterns, status in stock_tiers:
+        for pattern in minimize_keywords(patterns):
+            if any(earlier in pattern for earlier, _ in matcher):
+                continue
+            matcher.append((pattern, status))
+    return tuple(matcher)
+
+
+def compile_sibling_steps(selector: str, backend: ParserBackend) -> tuple[SiblingStep, ...]:
+    """
+    형제 선택자를 단계별로 컴파일
+
+    예: "+ td + td ~ td.price" -> (('+', 'td', None), ('+', 'td', None), ('~', None, <매처>))
+
+    Args:
+        selector: + 또는 ~ 로 시작하는 형제 선택자
+        backend: 파서 백엔드
+
+    Returns:
+        SiblingStep 목록
+
+    Raises:
+        ValueError: 형제 선택자로 해석할 수 없는 경우
+    """
+    steps: list[SiblingStep] = []
+    position = 0
+    while position < len(selector):
+        match = _SIBLING_STEP_PATTERN.match(selector, position)
+        if match is None:
+            if selector[position:].strip():
+                raise ValueError(f"지원하지 않는 형제 선택자: {selector}")
+            break
+        combinator, compound = match.groups()
+        if compound == "*":
+            steps.append((combinator, None, None))
+        elif _TAG_NAME_PATTERN.fullmatch(compound):
+            steps.append((combinator, compound.lower(), None))
+        else:
+            steps.append((combinator, None, backend.compile_match(compound)))
+        position = match.end()
+
+    if not steps:
+        raise ValueError(f"지원하지 않는 형제 선택자: {selector}")
+    return tuple(steps)
+
+
+# 상품명 예약 키워드 (결과가 같은 최소 목록)
+PREORDER_MATCH_KEYWORDS = minimize_keywords(PREORDER_KEYWORDS)
+
+
+def is_preorder_name(product_name: str) -> bool:
+    """
+    상품명으로 예약상품 판별
+
+    Args:
+        product_name: 상품명
+
+    Returns:
+        예약 키워드 포함 여부
+    """
+    for keyword in PREORDER_MATCH_KEYWORDS:
+        if keyword in product_name:
+            return True
+    return False
+
+
+@dataclass(frozen=True)
+class ExtractionPlan:
+    """
+    상품 정보 추출 계획
+
+    컴파일된 선택자는 backend의 select_compiled에 전달합니다.
+    name/link가 None이고 *_is_self가 True면 컨테이너 자신을 사용합니다.
+    """
+
+    # 상점 버전 키
+    key: tuple
+    backend: ParserBackend
+    container: Any
+    name: Optional[Any]
+    name_is_self: bool
+    # 컨테이너 내부 가격 선택자 (형제 가격이면 None)
+    price: Optional[Any]
+    # 형제 가격 단계 수 ("+ td + td" -> 2, 형제 가격이 아니면 0)
+    price_sibling_offset: int
+    link: Optional[Any]
+    link_is_self: bool
+    stock: Optional[Any]
+    # 확인 순서대로 (소문자 패턴 목록, 상태)
+    stock_tiers: tuple[tuple[tuple[str, ...], StockStatus], ...]
+    # stock_tiers를 compile_stock_matcher로 펼친 (패턴, 상태) 목록
+    stock_matcher: tuple[tuple[str, StockStatus], ...] = ()
+    # 부분 파싱 조건 (backend.parse의 parse_only, None이면 전체 파싱)
+    strainer: Optional[Any] = None
+    # 스트리밍 파싱용 컨테이너 매처 (backend.iter_parse, None이면 스트리밍 불가)
+    container_matcher: Optional[Any] = None
+    # compile_sibling_steps로 컴파일한 형제 가격 선택자
+    price_siblings: tuple[SiblingStep, ...] = ()
+    # JSON-LD 구조화 데이터를 먼저 확인 (없으면 선택자 사용)
+    structured_data: bool = False
+    # 추출 결과에 영향을 주는 설정과 백엔드의 해시 (파싱 결과 재사용 키)
+    fingerprint: str = ""
+    # 재고 문구 -> 상태 (상점의 재고 문구는 몇 가지뿐이라 대부분 재사용됨)
+    _stock_memo: dict[str, StockStatus] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def determine_stock_status(self, stock_text: str) -> StockStatus:
+        """
+        재고 상태 텍스트로 상태 판별
+
+        Args:
+            stock_text: 재고 상태 텍스트
+
+        Returns:
+            StockStatus
+        """
+        if not stock_text:
+            return StockStatus.UNKNOWN
+
+        memo = self._stock_memo
+        status = memo.get(stock_text)
+        if status is not None:
+            return status
+
+        status = StockStatus.UNKNOWN
+        stock_text_lower = stock_text.lower()
+        for pattern, pattern_status in self.stock_matcher:
+            if pattern in stock_text_lower:
+                status = pattern_status
+                break
+
+        if len(memo) >= STOCK_MEMO_SIZE:
+            memo.clear()
+        memo[stock_text] = status
+        return status
+
+    def find_price_sibling(self, container: Any) -> Optional[Any]:
+        """
+        형제 가격 선택자와 일치하는 요소 찾기
+
+        컨테이너가 a 태그이면 부모 td를 기준으로 합니다.
+        '+' 단계는 바로 다음 형제만 확인하고, '~' 단계는 일치하는 형제를 차례로 시도하므로
+        필요한 만큼만 형제를 따라갑니다.
+
+        Args:
+            container: 파서 백엔드 요소
+
+        Returns:
+            요소 또는 None (일치하는 형제가 없는 경우)
+        """
+        backend = self.backend
+        base = container
+        if backend.get_tag(container) == "a":
+            parent_td = backend.find_parent(container, "td")
+            if parent_td is not None:
+                base = parent_td
+        return self._resolve_siblings(base, 0)
+
+    def _resolve_siblings(self, node: Any, index: int) -> Optional[Any]:
+        """
+        index번째 단계부터 형제 선택자 적용
+
+        Args:
+            node: 기준 요소
+            index: 적용할 단계 위치
+
+        Returns:
+            마지막 단계와 일치하는 요소 또는 None
+        """
+        if index == len(self.price_siblings):
+            return node
+
+        backend = self.backend
+        combinator, tag, compiled = self.price_siblings[index]
+        sibling = backend.next_sibling(node)
+        while sibling is not None:
+            if (
+                (tag is None or backend.get_tag(sibling) == tag)
+                and (compiled is None or backend.matches(sibling, compiled))
+            ):
+                found = self._resolve_siblings(sibling, index + 1)
+                if found is not None:
+                    return found
+            if combinator == "+":
+                return None
+            sibling = backend.next_sibling(sibling)
+        return None
+
+    def has_soldout_image(self, container: Any) -> bool:
+        """
+        컨테이너 안에 품절 이미지가 있는지 확인 (이미지 한 번 순회)
+
+        alt에 '품절'이 있거나 src에 'soldout'(대소문자 무시)이 있으면 품절 이미지입니다.
+
+        Args:
+            container: 파서 백엔드 요소
+
+        Returns:
+            품절 이미지 존재 여부
+        """
+        backend = self.backend
+        for img in backend.find_all(container, "img"):
+            if SOLDOUT_IMAGE_ALT in (backend.get_attr(img, "alt") or ""):
+                return True
+            if SOLDOUT_IMAGE_SRC in (backend.get_attr(img, "src") or "").lower():
+                return True
+        return False
+
+
+def get_shop_version_key(shop: Shop) -> tuple:
+    """
+    추출 결과에 영향을 주는 상점 설정으로 구성된 키
+
+    ShopStore.update는 updated_at을 갱신하므로 수정된 상점은 새 키를 가집니다.
+
+    Args:
+        shop: 상점 설정
+
+    Returns:
+        해시 가능한 키
+    """
+    return (shop.id, shop.updated_at, *_get_extraction_settings(shop))
+
+
+def get_selector_fingerprint(shop: Shop, backend: ParserBackend) -> str:
+    """
+    추출 결과에 영향을 주는 상점 설정과 백엔드의 해시
+
+    updated_at을 포함하지 않으므로 선택자와 무관한 설정(활성 여부, 속도 제한 등)을
+    수정해도 같은 값이 유지됩니다.
+
+    Args:
+        shop: 상점 설정
+        backend: 파서 백엔드
+
+    Returns:
+        sha256 16진수 문자열
+    """
+    settings = (shop.id, backend.name, *_get_extraction_settings(shop))
+    return hashlib.sha256(repr(settings).encode("utf-8")).hexdigest()
+
+
+def _get_extraction_settings(shop: Shop) -> tuple:
+    """
+    추출 결과에 영향을 주는 상점 설정 (id, updated_at 제외)
+
+    Args:
+        shop: 상점 설정
+
+    Returns:
+        해시 가능한 튜플
+    """
+    selectors = shop.selectors
+    patterns = shop.stock_patterns
+    return (
+        shop.name,
+        shop.base_url,
+        (
+            selectors.product_container,
+            selectors.product_name,
+            selectors.product_price,
+            selectors.product_link,
+            selectors.stock_status,
+        ),
+        (
+            tuple(patterns.in_stock),
+            tuple(patterns.out_of_stock),
+        ) if patterns else None,
+        shop.partial_parse,
+        shop.extraction_strategy.value,
+    )
+
+
+def build_extraction_plan(
+    shop: Shop,
+    backend: Optional[ParserBackend] = None,
+) -> ExtractionPlan:
+    """
+    상점 추출 계획 생성
+
+    Args:
+        shop: 상점 설정
+        backend: 파서 백엔드 (없으면 상점 선택자에 맞게 자동 선택)
+
+    Returns:
+        ExtractionPlan
+
+    Raises:
+        ValueError: 선택자를 컴파일할 수 없는 경우
+    """
+    selectors = shop.selectors
+    backend = backend or get_parser_backend(selectors)
+
+    name_is_self = selectors.product_name == "."
+    link_is_self = selectors.product_link == "."
+
+    # 형제 셀렉터 (+ 또는 ~ 로 시작): 단계별로 컴파일
+    price_selector = selectors.product_price
+    if price_selector.lstrip().startswith(("+", "~")):
+        price = None
+        price_siblings = compile_sibling_steps(price_selector, backend)
+    else:
+        price = backend.compile(price_selector)
+        price_siblings = ()
+    price_sibling_offset = len(price_siblings)
+
+    stock_tiers = []
+    if shop.stock_patterns:
+        stock_tiers.append((
+            tuple(p.lower() for p in shop.stock_patterns.out_of_stock),
+            StockStatus.OUT_OF_STOCK,
+        ))
+        stock_tiers.append((
+            tuple(p.lower() for p in shop.stock_patterns.in_stock),
+            StockStatus.IN_STOCK,
+        ))
+    stock_tiers.append((DEFAULT_OUT_OF_STOCK_KEYWORDS, StockStatus.OUT_OF_STOCK))
+    stock_tiers.append((DEFAULT_IN_STOCK_KEYWORDS, StockStatus.IN_STOCK))
+    stock_tiers = tuple(stock_tiers)
+
+    # 형제 가격은 컨테이너 밖 요소를 참조하므로 부분/스트리밍 파싱하지 않음
+    # 구조화 데이터는 본문 전체의 스크립트 블록을 읽으므로 부분/스트리밍 파싱하지 않음
+    structured_data = shop.extraction_strategy == ExtractionStrategy.STRUCTURED_DATA
+    strainer = None
+    container_matcher = None
+    if price_sibling_offset == 0 and not structured_data:
+        if shop.partial_parse:
+            strainer = backend.build_strainer(selectors.product_container)
+        container_matcher = backend.compile_matcher(selectors.product_container)
+
+    return ExtractionPlan(
+        key=get_shop_version_key(shop),
+        backend=backend,
+        container=backend.compile(selectors.product_container, include_self=True),
+        name=None if name_is_self else backend.compile(selectors.product_name),
+        name_is_self=name_is_self,
+        price=price,
+        price_sibling_offset=price_sibling_offset,
+        link=(
+            backend.compile(selectors.product_link)
+            if selectors.product_link and not link_is_self
+            else None
+        ),
+        link_is_self=link_is_self,
+        stock=backend.compile(selectors.stock_status) if selectors.stock_status else None,
+        stock_tiers=stock_tiers,
+        stock_matcher=compile_stock_matcher(stock_tiers),
+        strainer=strainer,
+        container_matcher=container_matcher,
+        price_siblings=price_siblings,
+        structured_data=structured_data,
+        fingerprint=get_selector_fingerprint(shop, backend),
+    )
+
+
+# 보관할 추출 계획 수
+PLAN_CACHE_SIZE = 128
+
+# (상점 버전 키, 요청한 백엔드 타입) -> ExtractionPlan (LRU)
+_plans: OrderedDict[tuple, ExtractionPlan] = OrderedDict()
+_plans_lock = threading.Lock()
+
+
+def get_extraction_plan(
+    shop: Shop,
+    backend: Optional[ParserBackend] = None,
+) -> ExtractionPlan:
+    """
+    캐시된 상점 추출 계획 조회 (없으면 생성)
+
+    Args:
+        shop: 상점 설정
+        backend: 파서 백엔드 (없으면 상점 선택자에 맞게 자동 선택)
+
+    Returns:
+        ExtractionPlan
+    """
+    cache_key = (get_shop_version_key(shop), type(backend) if backend else None)
+
+    with _plans_lock:
+        plan = _plans.get(cache_key)
+        if plan is not None:
+            _plans.move_to_end(cache_key)
+            return plan
+
+    plan = build_extraction_plan(shop, backend)
+
+    with _plans_lock:
+        _plans[cache_key] = plan
+        _plans.move_to_end(cache_key)
+        while len(_plans) > PLAN_CACHE_SIZE:
+            _plans.popitem(last=False)
+
+    return plan
+
+
+def clear_extraction_plans() -> None:
+    """캐시된 추출 계획 모두 삭제"""
+    with _plans_lock:
+        _plans.clear()
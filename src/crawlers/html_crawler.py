@@ -1,19 +1,25 @@
 """
 HtmlCrawler - HTML 정적 크롤러
 
-BeautifulSoup을 사용하여 HTML에서 상품 정보를 추출합니다.
+파서 백엔드(lxml 또는 BeautifulSoup)를 사용하여 HTML에서 상품 정보를 추출합니다.
 """
 
-import re
-from typing import Optional
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from datetime import datetime
+from typing import ClassVar, Optional
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
-
 from src.crawlers.base import BaseCrawler
+from src.crawlers.extraction_plan import get_extraction_plan, is_preorder_name
+from src.crawlers.parser_backends import ParserBackend
+from src.crawlers.price_parser import parse_price, parse_prices
+from src.crawlers.structured_data import StructuredProduct, extract_json_ld_products
 from src.models.search import SearchResult, StockStatus
 from src.models.shop import Shop
-from src.utils.http_client import HttpClient, HttpClientError
+from src.utils.http_client import HtmlPage, HttpClient, HttpClientError
 
 
 class CrawlError(Exception):
@@ -22,183 +28,328 @@ class CrawlError(Exception):
     pass
 
 
-class HtmlCrawler(BaseCrawler):
+class HtmlPageParser:
     """
-    HTML 정적 크롤러
+    HTML 페이지 파서
 
-    BeautifulSoup을 사용하여 정적 HTML 페이지에서 상품 정보를 추출합니다.
+    상점의 추출 계획(선택자/파서 백엔드)으로 HTML에서 상품 정보를 추출합니다.
+    HTTP 요청을 하지 않으므로 HtmlCrawler와 AsyncHtmlCrawler가 함께 사용합니다.
     """
 
-    # 가격 추출을 위한 정규식 (숫자만 추출)
-    PRICE_PATTERN = re.compile(r"[\d,]+")
-
-    def __init__(self, shop: Shop, http_client: Optional[HttpClient] = None):
+    def __init__(self, shop: Shop, backend: Optional[ParserBackend] = None):
         """
-        HtmlCrawler 초기화
+        HtmlPageParser 초기화
 
         Args:
             shop: 상점 설정
-            http_client: HTTP 클라이언트 (없으면 새로 생성)
+            backend: 파서 백엔드 (없으면 상점 선택자에 맞게 자동 선택)
         """
         self.shop = shop
-        self.http_client = http_client or HttpClient(verify_ssl=shop.verify_ssl)
+        # 상점 버전별로 컴파일된 추출 계획 (선택자/형제 위치/재고 패턴)
+        self.plan = get_extraction_plan(shop, backend)
+        self.backend = self.plan.backend
 
-    def search(self, keyword: str) -> list[SearchResult]:
+    def parse_html(self, html: str, max_results: Optional[int] = None) -> list[SearchResult]:
         """
-        키워드로 상품 검색
+        HTML을 파싱하여 상품 정보 추출
 
         Args:
-            keyword: 검색 키워드
+            html: HTML 문자열
+            max_results: 최대 결과 수 (채우면 나머지 상품은 추출하지 않음)
 
         Returns:
             검색 결과 리스트
-
-        Raises:
-            CrawlError: 크롤링 실패 시
         """
-        try:
-            url = self.shop.get_search_url(keyword)
-            html = self.http_client.get_html(url, encoding=self.shop.keyword_encoding)
-            return self.parse_html(html)
-        except HttpClientError as e:
-            raise CrawlError(f"크롤링 실패: {self.shop.name} - {e}") from e
+        if self.plan.structured_data:
+            results = self._extract_structured(html, max_results)
+            if results:
+                return results
+
+        # 부분 파싱이 설정되면 컨테이너 후보의 하위 트리만 파싱
+        document = self.backend.parse(html, parse_only=self.plan.strainer)
+        return self._extract(document, max_results)
 
-    def parse_html(self, html: str) -> list[SearchResult]:
+    def _parse_page(self, page: HtmlPage, max_results: Optional[int] = None) -> list[SearchResult]:
         """
-        HTML을 파싱하여 상품 정보 추출
+        응답 본문을 파싱하여 상품 정보 추출
+
+        인코딩이 선언된 본문은 문자열로 변환하지 않고 바이트 그대로 파서에 전달합니다.
 
         Args:
-            html: HTML 문자열
+            page: HTML 응답
+            max_results: 최대 결과 수
 
         Returns:
             검색 결과 리스트
         """
-        soup = BeautifulSoup(html, "lxml")
-        selectors = self.shop.selectors
+        if page.encoding is None or self.plan.structured_data:
+            return self.parse_html(page.text, max_results)
+
+        document = self.backend.parse_bytes(
+            page.content,
+            page.encoding,
+            parse_only=self.plan.strainer,
+        )
+        return self._extract(document, max_results)
+
+    def _extract(self, document, max_results: Optional[int] = None) -> list[SearchResult]:
+        """
+        파싱된 문서에서 상품 정보 추출
+
+        Args:
+            document: 파서 백엔드 문서 객체
+            max_results: 최대 결과 수
 
+        Returns:
+            검색 결과 리스트
+        """
         # 상품 컨테이너 찾기
-        containers = soup.select(selectors.product_container)
-        results = []
+        containers = self.backend.select_compiled(document, self.plan.container)
+        return self._parse_products(containers, max_results)
 
-        for container in containers:
-            result = self._parse_product(container)
-            if result:
-                results.append(result)
+    def _extract_structured(self, html: str, max_results: Optional[int] = None) -> list[SearchResult]:
+        """
+        JSON-LD 구조화 데이터에서 상품 정보 추출 (HTML 파싱 없음)
 
-        return results
+        Args:
+            html: HTML 문자열
+            max_results: 최대 결과 수
+
+        Returns:
+            검색 결과 리스트 (구조화 데이터가 없으면 빈 리스트)
+        """
+        products = extract_json_ld_products(html)
+        if max_results is not None:
+            products = products[:max_results]
+        crawled_at = datetime.now()
+        return [self._build_structured_result(product, crawled_at) for product in products]
+
+    def _build_structured_result(
+        self,
+        product: StructuredProduct,
+        crawled_at: datetime,
+    ) -> SearchResult:
+        """
+        구조화 데이터 상품으로 SearchResult 생성
+
+        availability가 없으면 선택자 방식의 자동 감지처럼 예약상품 여부만 확인합니다.
 
-    def _parse_product(self, container) -> Optional[SearchResult]:
+        Args:
+            product: 구조화 데이터 상품
+            crawled_at: 크롤링 시각 (페이지 단위)
+
+        Returns:
+            SearchResult
+        """
+        stock_status = product.stock_status
+        if stock_status is None:
+            if is_preorder_name(product.name):
+                stock_status = StockStatus.PRE_ORDER
+            else:
+                stock_status = StockStatus.IN_STOCK
+
+        return SearchResult.from_trusted(
+            self.shop.id,
+            self.shop.name,
+            product.name,
+            product.price,
+            product.price_text,
+            stock_status,
+            urljoin(self.shop.base_url, product.url) if product.url else None,
+            crawled_at,
+        )
+
+    def _parse_product(
+        self,
+        container,
+        crawled_at: Optional[datetime] = None,
+    ) -> Optional[SearchResult]:
         """
         개별 상품 컨테이너에서 정보 추출
 
+        스트리밍 파싱에서 컨테이너가 닫히는 대로 쓰므로 가격 후보는 상품 하나씩 변환합니다.
+
         Args:
-            container: BeautifulSoup 요소
+            container: 파서 백엔드 요소
+            crawled_at: 크롤링 시각 (없으면 현재 시각)
 
         Returns:
             SearchResult 또는 None (파싱 실패 시)
         """
-        selectors = self.shop.selectors
+        results = self._parse_products([container], crawled_at=crawled_at)
+        return results[0] if results else None
+
+    def _parse_products(
+        self,
+        containers: list,
+        max_results: Optional[int] = None,
+        crawled_at: Optional[datetime] = None,
+    ) -> list[SearchResult]:
+        """
+        상품 컨테이너들에서 정보 추출
+
+        주어진 컨테이너들의 가격 후보 문자열을 모아 한 번에 변환합니다.
+        본문 전체를 받은 뒤 파싱하면 페이지당 한 번, 스트리밍 파싱은 상품마다 한 번입니다.
+
+        Args:
+            containers: 파서 백엔드 요소 목록
+            max_results: 최대 결과 수 (채우면 남은 컨테이너는 확인하지 않음)
+            crawled_at: 크롤링 시각 (없으면 현재 시각, 같은 페이지의 상품이 공유)
+
+        Returns:
+            검색 결과 리스트 (상품명이 없는 컨테이너 제외)
+        """
+        candidates = []
+        for container in containers:
+            product_name = self._get_product_name(container)
+            if product_name:
+                candidates.append((container, product_name, self._get_price_texts(container)))
+                if max_results is not None and len(candidates) >= max_results:
+                    break
+
+        prices = parse_prices([text for _, _, price_texts in candidates for text in price_texts])
+
+        if crawled_at is None:
+            crawled_at = datetime.now()
+
+        results = []
+        offset = 0
+        for container, product_name, price_texts in candidates:
+            # 가격이 여러 개 있으면 마지막 유효한 가격 = 할인가
+            price = None
+            price_text = None
+            last = prices.find_last(offset, offset + len(price_texts))
+            if last >= 0:
+                price = prices.values[last]
+                price_text = price_texts[last - offset]
+            offset += len(price_texts)
+
+            results.append(
+                self._build_result(container, product_name, price, price_text, crawled_at)
+            )
+
+        return results
+
+    def _get_product_name(self, container) -> Optional[str]:
+        """
+        상품명 추출 (필수)
 
-        # 상품명 추출 (필수)
+        Args:
+            container: 파서 백엔드 요소
+
+        Returns:
+            상품명 또는 None (없거나 빈 경우)
+        """
         # "." 셀렉터는 컨테이너 자체를 참조
-        if selectors.product_name == '.':
+        if self.plan.name_is_self:
             name_elem = container
         else:
-            name_elem = container.select_one(selectors.product_name)
-        if not name_elem:
+            name_elem = self.backend.select_one_compiled(container, self.plan.name)
+        if name_elem is None:
             return None
 
-        product_name = name_elem.get_text(strip=True)
-        if not product_name:
-            return None
+        return self.backend.get_text(name_elem) or None
+
+    def _get_price_texts(self, container) -> list[str]:
+        """
+        가격 후보 문자열 추출 (문서 순서, 빈 문자열 제외)
+
+        Args:
+            container: 파서 백엔드 요소
+
+        Returns:
+            가격 후보 문자열 리스트
+        """
+        plan = self.plan
+        backend = self.backend
 
-        # 가격 추출 (여러 개 있으면 마지막 유효한 가격 = 할인가)
-        price = None
-        price_text = None
-        price_selector = selectors.product_price
-        
         # 형제 셀렉터 지원 (+ 또는 ~ 로 시작하는 경우)
-        if price_selector.startswith('+') or price_selector.startswith('~'):
-            # 컨테이너가 a 태그인 경우, 부모 td의 형제에서 찾기
-            search_base = container
-            if container.name == 'a':
-                parent_td = container.find_parent('td')
-                if parent_td:
-                    search_base = parent_td
-            
-            # 형제 요소에서 찾기
-            # 예: "+ td + td + td" -> 3번째 다음 형제에서 가격
-            siblings = search_base.find_next_siblings()
-            sibling_count = price_selector.count('+') + price_selector.count('~')
-            if len(siblings) >= sibling_count:
-                price_elem = siblings[sibling_count - 1]
-                if price_elem:
-                    text = price_elem.get_text(strip=True)
-                    if text:
-                        parsed = self.parse_price(text)
-                        if parsed is not None:
-                            price = parsed
-                            price_text = text
-        else:
-            # 컨테이너 내부에서 찾기 (기존 방식)
-            price_elems = container.select(price_selector)
-            for price_elem in price_elems:
-                text = price_elem.get_text(strip=True)
-                if text:  # 비어있지 않은 경우만
-                    parsed = self.parse_price(text)
-                    if parsed is not None:
-                        price = parsed
-                        price_text = text
+        # 예: "+ td + td + td" -> 컨테이너(a 태그면 부모 td)의 3번째 다음 td에서 가격
+        if plan.price_sibling_offset:
+            sibling = plan.find_price_sibling(container)
+            if sibling is None:
+                return []
+            text = backend.get_text(sibling)
+            return [text] if text else []
+
+        # 컨테이너 내부에서 찾기 (기존 방식)
+        price_texts = []
+        for price_elem in backend.select_compiled(container, plan.price):
+            text = backend.get_text(price_elem)
+            if text:  # 비어있지 않은 경우만
+                price_texts.append(text)
+        return price_texts
+
+    def _build_result(
+        self,
+        container,
+        product_name: str,
+        price: Optional[int],
+        price_text: Optional[str],
+        crawled_at: datetime,
+    ) -> SearchResult:
+        """
+        재고 상태와 링크를 추출하여 SearchResult 생성
+
+        상품명과 가격은 이미 검증된 값이므로 pydantic 검증 없이 생성합니다.
+
+        Args:
+            container: 파서 백엔드 요소
+            product_name: 상품명
+            price: 가격
+            price_text: 가격 원본 문자열
+            crawled_at: 크롤링 시각
+
+        Returns:
+            SearchResult
+        """
+        plan = self.plan
+        backend = self.backend
 
         # 재고 상태 추출
         stock_status = StockStatus.UNKNOWN
         
         # 1. 명시적 stock_selector가 있으면 사용
-        if selectors.stock_status:
-            stock_elem = container.select_one(selectors.stock_status)
-            if stock_elem:
-                stock_text = stock_elem.get_text(strip=True)
-                stock_status = self._determine_stock_status(stock_text)
+        if plan.stock is not None:
+            stock_elem = backend.select_one_compiled(container, plan.stock)
+            if stock_elem is not None:
+                stock_text = backend.get_text(stock_elem)
+                stock_status = plan.determine_stock_status(stock_text)
         
         # 2. stock_selector가 없으면 자동 감지
         if stock_status == StockStatus.UNKNOWN:
             # 품절 이미지 감지 (alt 속성에 '품절' 포함 또는 src에 soldout 포함)
-            soldout_img = container.find('img', alt=lambda x: x and '품절' in x)
-            if not soldout_img:
-                soldout_img = container.find('img', src=lambda x: x and 'soldout' in x.lower())
-            
-            if soldout_img:
+            if plan.has_soldout_image(container):
                 stock_status = StockStatus.OUT_OF_STOCK
+            # 예약상품 감지 (상품명에 예약/발매예정/입고예정 포함)
+            elif is_preorder_name(product_name):
+                stock_status = StockStatus.PRE_ORDER
             else:
-                # 예약상품 감지 (상품명에 예약/발매예정/입고예정 포함)
-                preorder_keywords = ['예약', '발매예정', '입고예정', '예정']
-                if any(kw in product_name for kw in preorder_keywords):
-                    stock_status = StockStatus.PRE_ORDER
-                else:
-                    # 품절/예약이 아니면 재고 있음으로 간주
-                    stock_status = StockStatus.IN_STOCK
+                # 품절/예약이 아니면 재고 있음으로 간주
+                stock_status = StockStatus.IN_STOCK
 
         # 상품 링크 추출
         product_url = None
-        if selectors.product_link:
+        if plan.link_is_self or plan.link is not None:
             # "." 셀렉터는 컨테이너 자체를 참조
-            if selectors.product_link == '.':
+            if plan.link_is_self:
                 link_elem = container
             else:
-                link_elem = container.select_one(selectors.product_link)
-            if link_elem:
-                href = link_elem.get("href")
+                link_elem = backend.select_one_compiled(container, plan.link)
+            if link_elem is not None:
+                href = backend.get_attr(link_elem, "href")
                 if href:
                     product_url = urljoin(self.shop.base_url, href)
 
-        return SearchResult(
-            shop_id=self.shop.id,
-            shop_name=self.shop.name,
-            product_name=product_name,
-            price=price,
-            price_text=price_text,
-            stock_status=stock_status,
-            product_url=product_url,
+        return SearchResult.from_trusted(
+            self.shop.id,
+            self.shop.name,
+            product_name,
+            price,
+            price_text,
+            stock_status,
+            product_url,
+            crawled_at,
         )
 
     def parse_price(self, price_text: str) -> Optional[int]:
@@ -206,25 +357,12 @@ class HtmlCrawler(BaseCrawler):
         가격 문자열에서 숫자 추출
 
         Args:
-            price_text: 가격 문자열 (예: "₩25,000", "15,000원")
+            price_text: 가격 문자열 (예: "₩25,000", "15,000원", "1.2만원")
 
         Returns:
             정수 가격 또는 None
         """
-        if not price_text:
-            return None
-
-        # 숫자와 쉼표만 추출
-        match = self.PRICE_PATTERN.search(price_text)
-        if not match:
-            return None
-
-        # 쉼표 제거 후 정수 변환
-        try:
-            price_str = match.group().replace(",", "")
-            return int(price_str)
-        except ValueError:
-            return None
+        return parse_price(price_text)
 
     def _determine_stock_status(self, stock_text: str) -> StockStatus:
         """
@@ -236,31 +374,230 @@ class HtmlCrawler(BaseCrawler):
         Returns:
             StockStatus
         """
-        if not stock_text:
-            return StockStatus.UNKNOWN
+        return self.plan.determine_stock_status(stock_text)
+
+
+class HtmlCrawler(HtmlPageParser, BaseCrawler):
+    """
+    HTML 정적 크롤러
+
+    정적 HTML 페이지에서 상품 정보를 추출합니다.
+    선택자는 가능하면 lxml 백엔드로, 그렇지 않으면 BeautifulSoup으로 실행합니다.
+    lxml 백엔드는 응답을 받는 동안 스트리밍으로 파싱합니다.
+    """
+
+    # 본문별 파싱 결과 보관 개수
+    PARSE_MEMO_SIZE = 64
+    # (본문 sha256, 선택자 fingerprint) -> 검색 결과 (LRU)
+    _parse_memo: ClassVar[OrderedDict[tuple, list[SearchResult]]] = OrderedDict()
+    _parse_memo_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self,
+        shop: Shop,
+        http_client: Optional[HttpClient] = None,
+        backend: Optional[ParserBackend] = None,
+    ):
+        """
+        HtmlCrawler 초기화
+
+        Args:
+            shop: 상점 설정
+            http_client: HTTP 클라이언트 (없으면 공용 클라이언트 사용)
+            backend: 파서 백엔드 (없으면 상점 선택자에 맞게 자동 선택)
+        """
+        super().__init__(shop, backend)
+        self.http_client = http_client or HttpClient.shared(verify_ssl=shop.verify_ssl)
+
+        # 상점별 속도 제한 등록 (같은 호스트는 스레드/태스크 간 공유)
+        self.http_client.rate_limiter.configure(
+            shop.get_search_host(),
+            shop.rate_limit,
+            shop.rate_burst,
+        )
+
+    def search(
+        self,
+        keyword: str,
+        deadline: Optional[float] = None,
+        max_results: Optional[int] = None,
+    ) -> list[SearchResult]:
+        """
+        키워드로 상품 검색
 
-        stock_text_lower = stock_text.lower()
+        Args:
+            keyword: 검색 키워드
+            deadline: 재시도를 포함한 검색 마감 시각 (time.monotonic 기준)
+            max_results: 최대 결과 수 (채우면 나머지 상품은 추출하지 않음)
 
-        # 상점별 패턴 사용
-        if self.shop.stock_patterns:
-            for pattern in self.shop.stock_patterns.out_of_stock:
-                if pattern.lower() in stock_text_lower:
-                    return StockStatus.OUT_OF_STOCK
+        Returns:
+            검색 결과 리스트
 
-            for pattern in self.shop.stock_patterns.in_stock:
-                if pattern.lower() in stock_text_lower:
-                    return StockStatus.IN_STOCK
+        Raises:
+            CrawlError: 크롤링 실패 시
+        """
+        return list(self.iter_search(keyword, deadline=deadline, max_results=max_results))
+
+    def iter_search(
+        self,
+        keyword: str,
+        deadline: Optional[float] = None,
+        max_results: Optional[int] = None,
+    ) -> Iterator[SearchResult]:
+        """
+        키워드로 상품 검색하여 찾는 대로 반환
 
-        # 기본 한국어 패턴
-        out_of_stock_keywords = ["품절", "재고 없음", "일시품절", "sold out"]
-        in_stock_keywords = ["재고 있음", "구매 가능", "바로 구매", "in stock"]
+        스트리밍 파싱이 가능한 백엔드(lxml)는 응답을 받는 동안 상품 컨테이너가
+        닫히는 대로 결과를 반환하고, 그 외에는 본문을 모두 받은 뒤 파싱합니다.
+        캐시 응답처럼 본문 해시를 처음부터 알면 같은 선택자로 파싱해 둔 결과를
+        재사용하고, 네트워크 응답은 받는 대로 파싱한 뒤 본문 전체를 파싱했을 때만
+        결과를 보관합니다. 스트리밍 파싱은 결과를 바로 내기 위해 가격을 상품마다
+        변환합니다.
 
-        for keyword in out_of_stock_keywords:
-            if keyword.lower() in stock_text_lower:
-                return StockStatus.OUT_OF_STOCK
+        Args:
+            keyword: 검색 키워드
+            deadline: 재시도를 포함한 검색 마감 시각 (time.monotonic 기준)
+            max_results: 최대 결과 수 (채우면 남은 본문을 받지 않고 중단)
+
+        Yields:
+            SearchResult
+
+        Raises:
+            CrawlError: 크롤링 실패 시
+        """
+        if max_results is not None and max_results < 1:
+            raise ValueError("max_results는 1 이상이어야 합니다")
 
-        for keyword in in_stock_keywords:
-            if keyword.lower() in stock_text_lower:
-                return StockStatus.IN_STOCK
+        if self.plan.container_matcher is None:
+            yield from self._search_page(keyword, deadline, max_results)
+            return
 
-        return StockStatus.UNKNOWN
+        try:
+            url = self.shop.get_search_url(keyword)
+            stream = self.http_client.stream_html(
+                url,
+                encoding=self.shop.keyword_encoding,
+                retry_policy=self.shop.retry_policy,
+                deadline=deadline,
+            )
+        except HttpClientError as e:
+            raise CrawlError(f"크롤링 실패: {self.shop.name} - {e}") from e
+
+        try:
+            # 캐시 응답만 digest를 처음부터 앎 (네트워크 응답은 끝까지 받아야 정해짐)
+            if stream.digest is not None:
+                memo = self._get_parse_memo(self._get_parse_key(stream.digest))
+                if memo is not None:
+                    yield from memo if max_results is None else memo[:max_results]
+                    return
+
+            results = []
+            crawled_at = datetime.now()
+            containers = self.backend.iter_parse(
+                stream.chunks, self.plan.container_matcher, stream.encoding, self.plan.strainer
+            )
+            for container in containers:
+                result = self._parse_product(container, crawled_at)
+                if result:
+                    results.append(result)
+                    yield result
+                    if max_results is not None and len(results) >= max_results:
+                        return
+
+            # 본문 전체를 파싱한 결과만 재사용 (digest는 본문을 끝까지 받으면 설정됨)
+            if stream.digest is not None:
+                self._put_parse_memo(self._get_parse_key(stream.digest), results)
+        except HttpClientError as e:
+            raise CrawlError(f"크롤링 실패: {self.shop.name} - {e}") from e
+        finally:
+            stream.close()
+
+    def _search_page(
+        self,
+        keyword: str,
+        deadline: Optional[float] = None,
+        max_results: Optional[int] = None,
+    ) -> list[SearchResult]:
+        """
+        본문 전체를 받은 뒤 파싱하여 검색
+
+        Args:
+            keyword: 검색 키워드
+            deadline: 재시도를 포함한 검색 마감 시각 (time.monotonic 기준)
+            max_results: 최대 결과 수 (채우면 나머지 상품은 추출하지 않음)
+
+        Returns:
+            검색 결과 리스트
+
+        Raises:
+            CrawlError: 크롤링 실패 시
+        """
+        try:
+            url = self.shop.get_search_url(keyword)
+            page = self.http_client.fetch_html(
+                url,
+                encoding=self.shop.keyword_encoding,
+                retry_policy=self.shop.retry_policy,
+                deadline=deadline,
+            )
+        except HttpClientError as e:
+            raise CrawlError(f"크롤링 실패: {self.shop.name} - {e}") from e
+
+        # 본문이 같으면 캐시 여부(검증자가 없는 서버 포함)와 관계없이 이전 파싱 결과를 재사용
+        digest = page.digest or hashlib.sha256(page.content).hexdigest()
+        memo_key = self._get_parse_key(digest)
+        memo = self._get_parse_memo(memo_key)
+        if memo is not None:
+            return memo if max_results is None else memo[:max_results]
+
+        results = self._parse_page(page, max_results)
+        # 중간에 멈춘 결과는 본문 전체의 결과가 아니므로 보관하지 않음
+        if max_results is None or len(results) < max_results:
+            self._put_parse_memo(memo_key, results)
+        return results
+
+    def _get_parse_memo(self, memo_key: tuple) -> Optional[list[SearchResult]]:
+        """
+        보관된 파싱 결과의 사본 조회
+
+        사본의 크롤링 시각은 조회한 시각으로 바꿉니다.
+
+        Args:
+            memo_key: _get_parse_key로 만든 키
+
+        Returns:
+            검색 결과 사본 리스트 또는 None
+        """
+        with self._parse_memo_lock:
+            memo = self._parse_memo.get(memo_key)
+            if memo is None:
+                return None
+            self._parse_memo.move_to_end(memo_key)
+        crawled_at = datetime.now()
+        return [result.model_copy(update={"crawled_at": crawled_at}) for result in memo]
+
+    def _put_parse_memo(self, memo_key: tuple, results: list[SearchResult]) -> None:
+        """
+        파싱 결과의 사본 보관 (LRU)
+
+        Args:
+            memo_key: _get_parse_key로 만든 키
+            results: 검색 결과 리스트
+        """
+        with self._parse_memo_lock:
+            self._parse_memo[memo_key] = [result.model_copy() for result in results]
+            self._parse_memo.move_to_end(memo_key)
+            while len(self._parse_memo) > self.PARSE_MEMO_SIZE:
+                self._parse_memo.popitem(last=False)
+
+    def _get_parse_key(self, digest: str) -> tuple:
+        """
+        파싱 결과 재사용 키 생성
+
+        Args:
+            digest: 응답 본문 sha256
+
+        Returns:
+            본문과 선택자 fingerprint로 구성된 키
+        """
+        return (digest, self.plan.fingerprint)
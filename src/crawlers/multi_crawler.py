@@ -4,28 +4,69 @@ MultiShopCrawler - 다중 상점 크롤러
 여러 상점에서 동시에 검색하고 결과를 통합합니다.
 """
 
+import asyncio
+import time
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional
 
+from src.crawlers.circuit_breaker import CircuitBreaker
 from src.crawlers.html_crawler import CrawlError, HtmlCrawler
+from src.crawlers.result_cache import ResultCache
+from src.models.result_batch import ResultBatch
 from src.models.search import SearchResult
 from src.models.shop import Shop
+from src.utils.http_client import HttpClient
+
+
+# 상점별 검색 결과: (상점, 결과 리스트 또는 CrawlError, 소요 시간(초))
+ShopOutcome = tuple[Shop, list[SearchResult] | CrawlError, float]
 
 
 class MultiShopCrawler:
     """
     다중 상점 크롤러
 
-    여러 상점에서 순차적으로 검색하고 결과를 통합합니다.
+    여러 상점에서 스레드 풀로 동시에 검색하고 결과를 통합합니다.
+    결과와 오류는 항상 상점 목록 순서대로 정렬됩니다.
     """
 
-    def __init__(self, shops: list[Shop]):
+    # 기본 동시 실행 스레드 수
+    DEFAULT_MAX_WORKERS = 8
+    # 재시도를 포함한 검색 1회의 기본 제한 시간 (초)
+    DEFAULT_SEARCH_TIMEOUT = 60.0
+
+    def __init__(
+        self,
+        shops: list[Shop],
+        max_workers: Optional[int] = None,
+        search_timeout: Optional[float] = DEFAULT_SEARCH_TIMEOUT,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        result_cache: Optional[ResultCache] = None,
+        max_results: Optional[int] = None,
+    ):
         """
         MultiShopCrawler 초기화
 
         Args:
             shops: 검색 대상 상점 목록
+            max_workers: 동시 실행 스레드 수 (None이면 기본값, 1이면 순차 실행)
+            search_timeout: 검색 1회 전체 제한 시간 (초, None이면 제한 없음)
+            circuit_breaker: 상점별 회로 차단기 (None이면 사용 안 함)
+            result_cache: 검색 결과 캐시 (None이면 사용 안 함)
+            max_results: 상점당 최대 결과 수 (None이면 제한 없음)
         """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers는 1 이상이어야 합니다")
+        if max_results is not None and max_results < 1:
+            raise ValueError("max_results는 1 이상이어야 합니다")
+
         self.shops = shops
+        self.max_workers = max_workers or self.DEFAULT_MAX_WORKERS
+        self.search_timeout = search_timeout
+        self.circuit_breaker = circuit_breaker
+        self.result_cache = result_cache
+        self.max_results = max_results
 
     def search(
         self,
@@ -58,6 +99,9 @@ class MultiShopCrawler:
         """
         모든 상점에서 검색하고 오류 정보도 반환
 
+        상점별 검색은 최대 max_workers개까지 동시에 실행되며,
+        한 상점의 실패는 다른 상점의 결과에 영향을 주지 않습니다.
+
         Args:
             keyword: 검색 키워드
 
@@ -67,16 +111,223 @@ class MultiShopCrawler:
         all_results: list[SearchResult] = []
         errors: list[CrawlError] = []
 
-        for shop in self.shops:
-            try:
-                crawler = HtmlCrawler(shop)
-                results = crawler.search(keyword)
-                all_results.extend(results)
-            except CrawlError as e:
-                errors.append(e)
+        # 완료 순서와 무관하게 상점 목록 순서로 재정렬
+        outcomes: list[Optional[list[SearchResult] | CrawlError]] = [None] * len(self.shops)
+        for index, (_, outcome, _) in self._iter_indexed(keyword):
+            outcomes[index] = outcome
+
+        for outcome in outcomes:
+            if isinstance(outcome, CrawlError):
+                errors.append(outcome)
+            elif outcome:
+                all_results.extend(outcome)
 
         return all_results, errors
 
+    def iter_search(self, keyword: str) -> Iterator[ShopOutcome]:
+        """
+        상점별 검색 결과를 완료되는 순서대로 반환
+
+        가장 빠른 상점의 결과를 전체 검색이 끝나기 전에 받아볼 수 있습니다.
+        순회를 중간에 멈추면 아직 시작하지 않은 상점 검색은 취소됩니다.
+
+        Args:
+            keyword: 검색 키워드
+
+        Yields:
+            (상점, 결과 리스트 또는 CrawlError, 소요 시간(초))
+        """
+        for _, outcome in self._iter_indexed(keyword):
+            yield outcome
+
+    async def aiter_search(self, keyword: str) -> AsyncIterator[ShopOutcome]:
+        """
+        iter_search의 비동기 버전
+
+        상점 검색은 스레드에서 실행되며, 동시 실행 수는 max_workers로 제한됩니다.
+
+        Args:
+            keyword: 검색 키워드
+
+        Yields:
+            (상점, 결과 리스트 또는 CrawlError, 소요 시간(초))
+        """
+        if not self.shops:
+            return
+
+        semaphore = asyncio.Semaphore(self.max_workers)
+        deadline = self._get_deadline()
+
+        async def run(shop: Shop) -> ShopOutcome:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self._timed_search_shop, shop, keyword, deadline
+                )
+
+        tasks = [asyncio.ensure_future(run(shop)) for shop in self.shops]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _iter_indexed(self, keyword: str) -> Iterator[tuple[int, ShopOutcome]]:
+        """
+        상점 목록 인덱스와 함께 완료 순서대로 검색 결과 반환
+
+        Args:
+            keyword: 검색 키워드
+
+        Yields:
+            (상점 인덱스, 상점별 검색 결과)
+        """
+        if not self.shops:
+            return
+
+        workers = min(self.max_workers, len(self.shops))
+        deadline = self._get_deadline()
+
+        # 공용 클라이언트의 커넥션 풀을 동시 실행 수에 맞춤
+        for verify_ssl in {shop.verify_ssl for shop in self.shops}:
+            HttpClient.shared(verify_ssl=verify_ssl, pool_maxsize=workers)
+
+        if workers == 1:
+            for index, shop in enumerate(self.shops):
+                yield index, self._timed_search_shop(shop, keyword, deadline)
+            return
+
+        executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="plaprice-crawl",
+        )
+        try:
+            futures = {
+                executor.submit(self._timed_search_shop, shop, keyword, deadline): index
+                for index, shop in enumerate(self.shops)
+            }
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            # 순회가 중단되면 대기 중인 상점 검색은 취소
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _get_deadline(self) -> Optional[float]:
+        """
+        지금 시작하는 검색의 마감 시각 계산
+
+        Returns:
+            time.monotonic 기준 마감 시각 또는 None (제한 없음)
+        """
+        if self.search_timeout is None:
+            return None
+        return time.monotonic() + self.search_timeout
+
+    def _timed_search_shop(
+        self,
+        shop: Shop,
+        keyword: str,
+        deadline: Optional[float] = None,
+    ) -> ShopOutcome:
+        """
+        단일 상점 검색 및 소요 시간 측정
+
+        Args:
+            shop: 검색 대상 상점
+            keyword: 검색 키워드
+            deadline: 검색 마감 시각 (time.monotonic 기준)
+
+        Returns:
+            (상점, 결과 리스트 또는 CrawlError, 소요 시간(초))
+        """
+        started = time.perf_counter()
+        outcome = self._search_shop(shop, keyword, deadline)
+        return shop, outcome, time.perf_counter() - started
+
+    def _search_shop(
+        self,
+        shop: Shop,
+        keyword: str,
+        deadline: Optional[float] = None,
+    ) -> list[SearchResult] | CrawlError:
+        """
+        단일 상점 검색 (오류는 예외 대신 값으로 반환)
+
+        결과 캐시에 있으면 요청 없이 반환하고, 신선도가 지난 결과는 백그라운드에서 갱신합니다.
+        회로 차단기가 열린 상점은 요청 없이 즉시 CrawlError를 반환합니다.
+
+        Args:
+            shop: 검색 대상 상점
+            keyword: 검색 키워드
+            deadline: 검색 마감 시각 (time.monotonic 기준)
+
+        Returns:
+            검색 결과 리스트 또는 CrawlError
+        """
+        cache = self.result_cache
+        if cache is None:
+            return self._fetch_shop(shop, keyword, deadline)
+
+        def refresh() -> list[SearchResult]:
+            outcome = self._fetch_shop(shop, keyword, self._get_deadline())
+            if isinstance(outcome, CrawlError):
+                raise outcome
+            return outcome
+
+        # 결과 수 제한이 다른 검색의 결과는 서로 재사용하지 않음
+        cached = cache.get(shop, keyword, refresh=refresh, max_results=self.max_results)
+        if cached is not None:
+            return cached
+
+        outcome = self._fetch_shop(shop, keyword, deadline)
+        if not isinstance(outcome, CrawlError):
+            cache.put(shop, keyword, outcome, max_results=self.max_results)
+        return outcome
+
+    def _fetch_shop(
+        self,
+        shop: Shop,
+        keyword: str,
+        deadline: Optional[float] = None,
+    ) -> list[SearchResult] | CrawlError:
+        """
+        단일 상점 크롤링 (회로 차단기 확인 및 결과 기록 포함)
+
+        Args:
+            shop: 검색 대상 상점
+            keyword: 검색 키워드
+            deadline: 검색 마감 시각 (time.monotonic 기준)
+
+        Returns:
+            검색 결과 리스트 또는 CrawlError
+        """
+        breaker = self.circuit_breaker
+        if breaker is not None and not breaker.allow(shop.id):
+            return CrawlError(
+                f"크롤링 건너뜀: {shop.name} - 연속 {breaker.get_failures(shop.id)}회 실패로 차단됨 "
+                f"({breaker.retry_after(shop.id):.0f}초 후 재시도)"
+            )
+
+        try:
+            crawler = HtmlCrawler(shop)
+            results = crawler.search(keyword, deadline=deadline, max_results=self.max_results)
+        except CrawlError as e:
+            outcome: list[SearchResult] | CrawlError = e
+        except Exception as e:
+            # 예상치 못한 오류도 해당 상점의 오류로 격리
+            outcome = CrawlError(f"크롤링 실패: {shop.name} - {e}")
+            outcome.__cause__ = e
+        else:
+            outcome = results
+
+        if breaker is not None:
+            if isinstance(outcome, CrawlError):
+                breaker.record_failure(shop.id)
+            else:
+                breaker.record_success(shop.id)
+
+        return outcome
+
     def _sort_by_price(
         self,
         results: list[SearchResult],
@@ -84,7 +335,7 @@ class MultiShopCrawler:
         """
         결과를 가격순으로 정렬
 
-        가격이 None인 항목은 맨 뒤로 배치합니다.
+        가격이 None인 항목은 맨 뒤로 배치합니다 (같은 가격은 원래 순서).
 
         Args:
             results: 검색 결과 리스트
@@ -92,10 +343,6 @@ class MultiShopCrawler:
         Returns:
             정렬된 리스트
         """
-
-        def price_key(result: SearchResult) -> tuple[int, int]:
-            if result.price is None:
-                return (1, 0)  # None은 맨 뒤로
-            return (0, result.price)
-
-        return sorted(results, key=price_key)
+        # 가격 열만 만들어 정렬하고 객체는 순서대로 꺼냄
+        order = ResultBatch.from_results(results).argsort_by_price()
+        return [results[index] for index in order]
@@ -0,0 +1,905 @@
+"""
+파서 백엔드 - HTML 트리 생성과 CSS 선택자 실행
+
+HtmlCrawler가 사용하는 트리 연산을 백엔드별로 구현합니다.
+- BeautifulSoupBackend: BeautifulSoup + soupsieve (모든 선택자 지원, 기본 폴백)
+- LxmlBackend: lxml.html 트리에서 XPath로 컴파일한 CSS 선택자 실행 (cssselect 필요)
+
+두 백엔드는 같은 ShopSelectors에 대해 같은 요소와 텍스트를 반환합니다.
+"""
+
+import codecs
+import re
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from typing import Any, ClassVar, Optional
+
+import lxml.html
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+from lxml import etree
+
+try:
+    import cssselect
+    from cssselect.xpath import HTMLTranslator, XPathExpr
+except ImportError:  # pragma: no cover - cssselect가 없으면 BeautifulSoup만 사용
+    cssselect = None
+    HTMLTranslator = object
+    XPathExpr = Any
+
+from src.models.shop import ShopSelectors
+
+
+class ParserBackend(ABC):
+    """
+    파서 백엔드 추상 클래스
+
+    요소(node)의 타입은 백엔드마다 다르며, HtmlCrawler는 이 인터페이스로만 다룹니다.
+    """
+
+    name: ClassVar[str]
+
+    @abstractmethod
+    def parse(self, html: str, parse_only: Optional[Any] = None) -> Any:
+        """
+        HTML 문서 파싱
+
+        Args:
+            html: HTML 문자열
+            parse_only: build_strainer가 반환한 부분 파싱 조건 (없으면 전체 파싱)
+
+        Returns:
+            문서 객체 (select의 기준으로 사용)
+        """
+        pass
+
+    def parse_bytes(
+        self,
+        content: bytes,
+        encoding: str,
+        parse_only: Optional[Any] = None,
+    ) -> Any:
+        """
+        인코딩을 알고 있는 HTML 바이트 파싱
+
+        Args:
+            content: HTML 바이트
+            encoding: 본문 인코딩 (코덱 이름)
+            parse_only: build_strainer가 반환한 부분 파싱 조건 (없으면 전체 파싱)
+
+        Returns:
+            문서 객체 (select의 기준으로 사용)
+        """
+        return self.parse(str(content, encoding, errors="replace"), parse_only=parse_only)
+
+    def compile_matcher(self, selector: str) -> Optional[Any]:
+        """
+        스트리밍 파싱에서 닫힌 요소가 선택자와 일치하는지 확인할 매처 컴파일
+
+        Args:
+            selector: 상품 컨테이너 CSS 선택자
+
+        Returns:
+            iter_parse에 전달할 매처 또는 None (스트리밍 파싱 불가)
+        """
+        return None
+
+    def iter_parse(
+        self,
+        chunks: Iterable[bytes],
+        matcher: Any,
+        encoding: Optional[str] = None,
+        parse_only: Optional[Any] = None,
+    ) -> Iterator[Any]:
+        """
+        HTML 조각을 순서대로 파싱하며 매처와 일치하는 요소를 닫히는 대로 반환
+
+        반환된 요소의 하위 트리와 상위/이전 형제 요소는 완성되어 있습니다.
+        (parse_only를 지정하면 이전 형제 중 조건 밖의 요소는 제거됩니다)
+
+        Args:
+            chunks: HTML 바이트 조각 (예: HtmlStream.chunks)
+            matcher: compile_matcher가 반환한 매처
+            encoding: 본문 인코딩 (코덱 이름, 없으면 파서가 판별)
+            parse_only: build_strainer가 반환한 부분 파싱 조건 (없으면 전체 트리 유지)
+
+        Yields:
+            일치하는 요소 (닫히는 순서)
+        """
+        raise NotImplementedError(f"{self.name} 백엔드는 스트리밍 파싱을 지원하지 않습니다")
+
+    def build_strainer(self, container_selector: str) -> Optional[Any]:
+        """
+        컨테이너 선택자로 부분 파싱 조건 생성
+
+        Args:
+            container_selector: 상품 컨테이너 CSS 선택자
+
+        Returns:
+            parse의 parse_only에 전달할 조건 또는 None (부분 파싱 불가/불필요)
+        """
+        return None
+
+    @abstractmethod
+    def select(self, node: Any, selector: str) -> list[Any]:
+        """
+        CSS 선택자와 일치하는 하위 요소 목록 (문서 순서)
+
+        Args:
+            node: 기준 요소 또는 문서
+            selector: CSS 선택자
+
+        Returns:
+            요소 리스트
+        """
+        pass
+
+    def select_one(self, node: Any, selector: str) -> Optional[Any]:
+        """
+        CSS 선택자와 일치하는 첫 번째 하위 요소
+
+        Args:
+            node: 기준 요소
+            selector: CSS 선택자
+
+        Returns:
+            요소 또는 None
+        """
+        elems = self.select(node, selector)
+        return elems[0] if elems else None
+
+    @abstractmethod
+    def compile(self, selector: str, include_self: bool = False) -> Any:
+        """
+        CSS 선택자를 미리 컴파일
+
+        Args:
+            selector: CSS 선택자
+            include_self: 기준 요소 자신도 대상에 포함 (문서 기준 선택)
+
+        Returns:
+            select_compiled에 전달할 컴파일된 선택자
+
+        Raises:
+            ValueError: 선택자를 해석할 수 없는 경우
+        """
+        pass
+
+    @abstractmethod
+    def select_compiled(self, node: Any, compiled: Any) -> list[Any]:
+        """
+        컴파일된 선택자와 일치하는 하위 요소 목록 (문서 순서)
+
+        Args:
+            node: 기준 요소 또는 문서
+            compiled: compile이 반환한 선택자
+
+        Returns:
+            요소 리스트
+        """
+        pass
+
+    def select_one_compiled(self, node: Any, compiled: Any) -> Optional[Any]:
+        """
+        컴파일된 선택자와 일치하는 첫 번째 하위 요소
+
+        Args:
+            node: 기준 요소
+            compiled: compile이 반환한 선택자
+
+        Returns:
+            요소 또는 None
+        """
+        elems = self.select_compiled(node, compiled)
+        return elems[0] if elems else None
+
+    @abstractmethod
+    def get_text(self, node: Any) -> str:
+        """
+        요소의 텍스트 (BeautifulSoup get_text(strip=True)와 같은 결과)
+
+        Args:
+            node: 요소
+
+        Returns:
+            각 문자열을 공백 제거 후 이어붙인 텍스트
+        """
+        pass
+
+    @abstractmethod
+    def get_attr(self, node: Any, name: str) -> Optional[str]:
+        """
+        요소 속성 값
+
+        Args:
+            node: 요소
+            name: 속성 이름
+
+        Returns:
+            속성 값 또는 None
+        """
+        pass
+
+    @abstractmethod
+    def get_tag(self, node: Any) -> str:
+        """
+        요소 태그 이름 (소문자)
+
+        Args:
+            node: 요소
+
+        Returns:
+            태그 이름
+        """
+        pass
+
+    @abstractmethod
+    def find_parent(self, node: Any, tag: str) -> Optional[Any]:
+        """
+        가장 가까운 상위 요소 중 태그 이름이 일치하는 요소
+
+        Args:
+            node: 요소
+            tag: 태그 이름
+
+        Returns:
+            요소 또는 None
+        """
+        pass
+
+    @abstractmethod
+    def next_sibling(self, node: Any) -> Optional[Any]:
+        """
+        바로 다음 형제 요소 (텍스트/주석 제외)
+
+        Args:
+            node: 요소
+
+        Returns:
+            요소 또는 None (마지막 요소)
+        """
+        pass
+
+    @abstractmethod
+    def compile_match(self, selector: str) -> Any:
+        """
+        요소 자신이 복합 선택자와 일치하는지 확인할 매처 컴파일
+
+        Args:
+            selector: 복합 CSS 선택자 (예: 'td.price')
+
+        Returns:
+            matches에 전달할 매처
+
+        Raises:
+            ValueError: 선택자를 해석할 수 없는 경우
+        """
+        pass
+
+    @abstractmethod
+    def matches(self, node: Any, compiled: Any) -> bool:
+        """
+        요소 자신이 컴파일된 매처와 일치하는지 확인
+
+        Args:
+            node: 요소
+            compiled: compile_match가 반환한 매처
+
+        Returns:
+            일치 여부
+        """
+        pass
+
+    @abstractmethod
+    def find_all(self, node: Any, tag: str) -> list[Any]:
+        """
+        태그 이름이 일치하는 하위 요소 목록 (자기 자신 제외)
+
+        Args:
+            node: 요소
+            tag: 태그 이름
+
+        Returns:
+            요소 리스트
+        """
+        pass
+
+    def supports(self, selectors: ShopSelectors) -> bool:
+        """
+        상점 선택자를 이 백엔드로 실행할 수 있는지 확인
+
+        Args:
+            selectors: 상점 선택자 설정
+
+        Returns:
+            지원 여부
+        """
+        return True
+
+
+class BeautifulSoupBackend(ParserBackend):
+    """BeautifulSoup + soupsieve 백엔드"""
+
+    name = "bs4"
+
+    def parse(self, html: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        return BeautifulSoup(html, "lxml", parse_only=parse_only)
+
+    def build_strainer(self, container_selector: str) -> Optional[SoupStrainer]:
+        """
+        컨테이너 선택자의 첫 번째 복합 선택자와 일치하는 요소의 하위 트리만 남기는 SoupStrainer
+
+        첫 번째 복합 선택자의 태그와 첫 클래스/ID/속성 존재 여부로 거르므로
+        실제 일치 요소의 상위 집합이 남고, 컨테이너 선택은 그 안에서 그대로 실행됩니다.
+        그룹(,), 형제 조합자, 첫 복합 선택자의 가상 클래스처럼 하위 트리 밖의
+        정보가 필요한 선택자는 None을 반환합니다.
+        """
+        compound = _get_first_compound(container_selector)
+        if compound is None:
+            return None
+
+        tag, simple_selectors = compound
+        attrs: dict[str, Any] = {}
+        for kind, value in simple_selectors:
+            if kind == "." and "class" not in attrs:
+                attrs["class"] = re.compile(
+                    rf"(?:^|\s){re.escape(value)}(?:\s|$)", re.IGNORECASE
+                )
+            elif kind == "#" and "id" not in attrs:
+                attrs["id"] = re.compile(rf"^{re.escape(value)}$", re.IGNORECASE)
+            elif kind == "[":
+                # 속성 값 비교는 대소문자 규칙이 속성마다 달라 존재 여부만 확인
+                attrs[value] = True
+
+        if tag is None and not attrs:
+            return None
+        return SoupStrainer(tag, attrs=attrs)
+
+    def select(self, node, selector: str) -> list:
+        return node.select(selector)
+
+    def select_one(self, node, selector: str):
+        return node.select_one(selector)
+
+    def compile(self, selector: str, include_self: bool = False) -> soupsieve.SoupSieve:
+        # soupsieve의 select는 문서 기준일 때 최상위 요소도 포함하므로 include_self 불필요
+        try:
+            return soupsieve.compile(selector)
+        except soupsieve.SelectorSyntaxError as e:
+            raise ValueError(f"잘못된 CSS 선택자: {selector} - {e}") from e
+
+    def select_compiled(self, node, compiled: soupsieve.SoupSieve) -> list:
+        return compiled.select(node)
+
+    def select_one_compiled(self, node, compiled: soupsieve.SoupSieve):
+        return compiled.select_one(node)
+
+    def get_text(self, node) -> str:
+        return node.get_text(strip=True)
+
+    def get_attr(self, node, name: str) -> Optional[str]:
+        return node.get(name)
+
+    def get_tag(self, node) -> str:
+        return node.name
+
+    def find_parent(self, node, tag: str):
+        return node.find_parent(tag)
+
+    def next_sibling(self, node):
+        # find_next_sibling보다 가벼운 직접 순회 (텍스트/주석 건너뜀)
+        sibling = node.next_sibling
+        while sibling is not None and not isinstance(sibling, Tag):
+            sibling = sibling.next_sibling
+        return sibling
+
+    def compile_match(self, selector: str) -> soupsieve.SoupSieve:
+        return self.compile(selector)
+
+    def matches(self, node, compiled: soupsieve.SoupSieve) -> bool:
+        return compiled.match(node)
+
+    def find_all(self, node, tag: str) -> list:
+        return node.find_all(tag)
+
+
+class _ScopedTranslator(HTMLTranslator):
+    """
+    기준 요소의 하위 요소만 반환하되, 조합자는 기준 요소 밖의 상위/형제 요소와도
+    일치할 수 있도록 역방향 축으로 변환하는 번역기 (soupsieve의 select와 같은 의미)
+
+    예: "div > .name" -> *[@class ~= name][parent::div]
+    """
+
+    @staticmethod
+    def _step(expr: XPathExpr) -> str:
+        if expr.path:
+            raise cssselect.ExpressionError("지원하지 않는 선택자 구조입니다")
+        return str(expr)
+
+    def xpath_descendant_combinator(self, left: XPathExpr, right: XPathExpr) -> XPathExpr:
+        return right.add_condition(f"ancestor::{self._step(left)}")
+
+    def xpath_child_combinator(self, left: XPathExpr, right: XPathExpr) -> XPathExpr:
+        return right.add_condition(f"parent::{self._step(left)}")
+
+    def xpath_direct_adjacent_combinator(self, left: XPathExpr, right: XPathExpr) -> XPathExpr:
+        return right.add_condition(f"preceding-sibling::*[1]/self::{self._step(left)}")
+
+    def xpath_indirect_adjacent_combinator(self, left: XPathExpr, right: XPathExpr) -> XPathExpr:
+        return right.add_condition(f"preceding-sibling::{self._step(left)}")
+
+
+class LxmlBackend(ParserBackend):
+    """
+    lxml.html 백엔드
+
+    BeautifulSoup 트리 생성과 soupsieve 매칭을 거치지 않고
+    lxml 트리에서 컴파일된 XPath로 바로 선택합니다.
+    """
+
+    name = "lxml"
+
+    # 자체 문자열 종류를 갖는 태그 (BeautifulSoup의 string_containers와 같음)
+    # 이 태그 안의 문자열은 해당 태그 자신의 get_text에만 포함됨
+    STRING_CONTAINER_TAGS = frozenset({"script", "style", "template", "rt", "rp"})
+
+    # 뒤따르는 형제를 봐야 하는 가상 클래스 (스트리밍 파싱에서 판별 불가)
+    _FORWARD_PSEUDO_PATTERN = re.compile(
+        r":(?:last-child|last-of-type|only-child|only-of-type|nth-last-child|nth-last-of-type)\b",
+        re.IGNORECASE,
+    )
+
+    # 부분 파싱에서 한 번에 파서에 전달하는 크기 (이 단위마다 조건 밖의 요소를 제거)
+    PRUNE_FEED_SIZE = 64 * 1024
+
+    def __init__(self):
+        """
+        LxmlBackend 초기화
+
+        Raises:
+            ImportError: cssselect가 설치되지 않은 경우
+        """
+        if cssselect is None:
+            raise ImportError(
+                "lxml 파서 백엔드를 사용하려면 cssselect가 필요합니다: pip install cssselect"
+            )
+        self._translator = _ScopedTranslator()
+        self._utf8_parser = lxml.html.HTMLParser(encoding="utf-8")
+        # (선택자, 문서 기준 여부) -> 컴파일된 XPath
+        self._compiled: dict[tuple[str, bool], etree.XPath] = {}
+        self._lock = threading.Lock()
+
+    def compile(self, selector: str, include_self: bool = False) -> etree.XPath:
+        """
+        CSS 선택자를 XPath로 컴파일 (결과는 캐시)
+
+        Args:
+            selector: CSS 선택자
+            include_self: 기준 요소 자신도 대상에 포함 (문서 기준 선택)
+
+        Returns:
+            컴파일된 XPath
+
+        Raises:
+            ValueError: 선택자를 XPath로 변환할 수 없는 경우
+        """
+        key = (selector, include_self)
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            prefix = "descendant-or-self::" if include_self else "descendant::"
+            try:
+                compiled = etree.XPath(self._translator.css_to_xpath(selector, prefix=prefix))
+            except (cssselect.SelectorError, etree.XPathError) as e:
+                raise ValueError(f"XPath로 변환할 수 없는 선택자: {selector} - {e}") from e
+            with self._lock:
+                self._compiled[key] = compiled
+        return compiled
+
+    def compile_matcher(self, selector: str) -> Optional[etree.XPath]:
+        """
+        요소 자신이 선택자와 일치하는지 확인하는 XPath 컴파일
+
+        요소가 닫히는 시점에는 뒤따르는 형제가 아직 없으므로
+        :last-child 같은 가상 클래스가 있으면 None을 반환합니다.
+        """
+        if self._FORWARD_PSEUDO_PATTERN.search(selector):
+            return None
+        try:
+            return etree.XPath(self._translator.css_to_xpath(selector, prefix="self::"))
+        except (cssselect.SelectorError, etree.XPathError):
+            return None
+
+    def iter_parse(
+        self,
+        chunks: Iterable[bytes],
+        matcher: etree.XPath,
+        encoding: Optional[str] = None,
+        parse_only: Optional["_LxmlStrainer"] = None,
+    ) -> Iterator[Any]:
+        # UTF-8은 바이트 그대로 libxml2에 전달 (다른 인코딩은 parse_bytes와 같이
+        # iconv가 잘못된 바이트에서 문서를 잘라내므로 Python에서 대체 문자로 디코딩)
+        if encoding is not None and codecs.lookup(encoding).name != "utf-8":
+            chunks = _decode_chunks(chunks, encoding)
+            encoding = None
+        parser = self._create_pull_parser(encoding, parse_only)
+        pruner = _Pruner(parse_only) if parse_only is not None else None
+
+        for chunk in chunks:
+            parser.feed(chunk)
+            for elem in self._read_ended(parser, pruner):
+                if matcher(elem):
+                    yield elem
+
+        try:
+            parser.close()
+        except etree.XMLSyntaxError:
+            # 빈 문서
+            return
+        for elem in self._read_ended(parser, pruner):
+            if matcher(elem):
+                yield elem
+
+    @staticmethod
+    def _read_ended(parser: etree.HTMLPullParser, pruner: Optional["_Pruner"]) -> Iterable[Any]:
+        """파서에 쌓인 이벤트 중 닫힌 요소 (부분 파싱이면 조건 밖의 요소를 제거한 뒤)"""
+        if pruner is not None:
+            return pruner.prune(parser.read_events())
+        return (elem for _, elem in parser.read_events())
+
+    def build_strainer(self, container_selector: str) -> Optional["_LxmlStrainer"]:
+        """
+        컨테이너 선택자의 첫 번째 복합 선택자와 일치하는 요소의 하위 트리만 남기는 조건
+
+        BeautifulSoupBackend.build_strainer와 같은 선택자에 대해 부분 파싱하며,
+        파싱 중 닫힌 요소 중 일치하는 요소를 포함하지 않는 요소를 트리에서 떼어 냅니다.
+        """
+        compound = _get_first_compound(container_selector)
+        if compound is None:
+            return None
+        tag, simple_selectors = compound
+        return _LxmlStrainer(tag, simple_selectors)
+
+    @staticmethod
+    def _create_pull_parser(
+        encoding: Optional[str],
+        parse_only: Optional["_LxmlStrainer"],
+    ) -> etree.HTMLPullParser:
+        """HtmlElement 트리를 만드는 HTMLPullParser (부분 파싱이면 start 이벤트도 받음)"""
+        events = ("start", "end") if parse_only is not None else ("end",)
+        parser = etree.HTMLPullParser(events=events, encoding=encoding)
+        parser.set_element_class_lookup(lxml.html.HtmlElementClassLookup())
+        return parser
+
+    def _parse_pruned(
+        self,
+        content: str | bytes,
+        parse_only: "_LxmlStrainer",
+        encoding: Optional[str] = None,
+    ) -> etree._ElementTree:
+        """
+        부분 파싱 조건 밖의 요소를 제거하며 파싱
+
+        트리 전체가 만들어지기 전에 제거하도록 PRUNE_FEED_SIZE씩 나누어 전달합니다.
+
+        Args:
+            content: HTML 문자열 또는 encoding으로 인코딩된 바이트
+            parse_only: build_strainer가 반환한 조건
+            encoding: 바이트의 인코딩 (문자열이면 None)
+
+        Returns:
+            조건과 일치하는 요소와 그 상위 요소만 남은 트리
+        """
+        parser = self._create_pull_parser(encoding, parse_only)
+        pruner = _Pruner(parse_only)
+        for start in range(0, len(content), self.PRUNE_FEED_SIZE):
+            parser.feed(content[start:start + self.PRUNE_FEED_SIZE])
+            pruner.prune(parser.read_events())
+        try:
+            root = parser.close()
+        except etree.XMLSyntaxError:
+            # 빈 문서
+            return lxml.html.Element("html").getroottree()
+        pruner.prune(parser.read_events())
+        return root.getroottree()
+
+    def select_compiled(self, node, compiled: etree.XPath) -> list:
+        if isinstance(node, etree._ElementTree):
+            node = node.getroot()
+        return compiled(node)
+
+    def supports(self, selectors: ShopSelectors) -> bool:
+        try:
+            for selector in self._iter_css_selectors(selectors):
+                self.compile(selector)
+        except ValueError:
+            return False
+        return True
+
+    @staticmethod
+    def _iter_css_selectors(selectors: ShopSelectors) -> list[str]:
+        """select로 실행되는 선택자 목록 ("."와 형제 가격 선택자 제외)"""
+        candidates = [
+            selectors.product_container,
+            selectors.product_name,
+            selectors.product_price,
+            selectors.product_link,
+            selectors.stock_status,
+        ]
+        return [
+            selector
+            for selector in candidates
+            if selector and selector != "." and not selector.startswith(("+", "~"))
+        ]
+
+    def parse(self, html: str, parse_only: Optional["_LxmlStrainer"] = None) -> etree._ElementTree:
+        if parse_only is not None:
+            return self._parse_pruned(html, parse_only)
+        try:
+            root = lxml.html.document_fromstring(html)
+        except ValueError:
+            # 인코딩 선언이 포함된 문자열은 UTF-8 바이트로 파싱
+            try:
+                root = lxml.html.document_fromstring(
+                    html.encode("utf-8"), parser=self._utf8_parser
+                )
+            except etree.ParserError:
+                root = lxml.html.Element("html")
+        except etree.ParserError:
+            # 빈 문서
+            root = lxml.html.Element("html")
+        return root.getroottree()
+
+    def parse_bytes(
+        self,
+        content: bytes,
+        encoding: str,
+        parse_only: Optional[Any] = None,
+    ) -> etree._ElementTree:
+        # UTF-8은 디코딩 없이 libxml2에 전달 (다른 인코딩은 iconv가 잘못된 바이트에서
+        # 문서를 잘라내므로 Python에서 대체 문자로 디코딩)
+        if codecs.lookup(encoding).name != "utf-8":
+            return super().parse_bytes(content, encoding, parse_only)
+        if parse_only is not None:
+            return self._parse_pruned(content, parse_only, "utf-8")
+        try:
+            root = lxml.html.document_fromstring(content, parser=self._utf8_parser)
+        except etree.ParserError:
+            root = lxml.html.Element("html")
+        return root.getroottree()
+
+    def select(self, node, selector: str) -> list:
+        if isinstance(node, etree._ElementTree):
+            return self.compile(selector, include_self=True)(node.getroot())
+        return self.compile(selector)(node)
+
+    def get_text(self, node) -> str:
+        # 문자열 종류: 가장 가까운 string_container 태그 (없으면 일반 문자열)
+        kind = None
+        for elem in node.iterancestors():
+            if elem.tag in self.STRING_CONTAINER_TAGS:
+                kind = elem.tag
+                break
+        target = None
+        if node.tag in self.STRING_CONTAINER_TAGS:
+            kind = target = node.tag
+
+        parts: list[str] = []
+        self._collect_text(node, kind, target, parts)
+        return "".join(parts)
+
+    def _collect_text(self, elem, kind: Optional[str], target: Optional[str], parts: list[str]) -> None:
+        """target 종류의 문자열만 문서 순서대로 수집 (주석 제외)"""
+        if kind == target and elem.text:
+            text = elem.text.strip()
+            if text:
+                parts.append(text)
+
+        for child in elem:
+            if isinstance(child.tag, str):
+                child_kind = child.tag if child.tag in self.STRING_CONTAINER_TAGS else kind
+                self._collect_text(child, child_kind, target, parts)
+            if kind == target and child.tail:
+                text = child.tail.strip()
+                if text:
+                    parts.append(text)
+
+    def get_attr(self, node, name: str) -> Optional[str]:
+        return node.get(name)
+
+    def get_tag(self, node) -> str:
+        return node.tag
+
+    def find_parent(self, node, tag: str):
+        return next(node.iterancestors(tag), None)
+
+    def next_sibling(self, node):
+        sibling = node.getnext()
+        # 주석/처리 명령은 tag가 문자열이 아님
+        while sibling is not None and not isinstance(sibling.tag, str):
+            sibling = sibling.getnext()
+        return sibling
+
+    def compile_match(self, selector: str) -> etree.XPath:
+        try:
+            return etree.XPath(self._translator.css_to_xpath(selector, prefix="self::"))
+        except (cssselect.SelectorError, etree.XPathError) as e:
+            raise ValueError(f"XPath로 변환할 수 없는 선택자: {selector} - {e}") from e
+
+    def matches(self, node, compiled: etree.XPath) -> bool:
+        return bool(compiled(node))
+
+    def find_all(self, node, tag: str) -> list:
+        return list(node.iterdescendants(tag))
+
+
+# 첫 번째 복합 선택자: 태그, 클래스/ID/속성 선택자, 그 뒤의 공백
+_FIRST_COMPOUND_PATTERN = re.compile(
+    r"\s*(?P<tag>[a-zA-Z][\w-]*)?(?P<simple>(?:[.#][\w-]+|\[[^\]]*\])*)"
+)
+_SIMPLE_SELECTOR_PATTERN = re.compile(r"([.#])([\w-]+)|\[\s*([\w-]+)[^\]]*\]")
+
+
+def _get_first_compound(selector: str) -> Optional[tuple[Optional[str], list[tuple[str, str]]]]:
+    """
+    선택자의 첫 번째 복합 선택자 해석
+
+    Args:
+        selector: CSS 선택자
+
+    Returns:
+        (태그 이름 또는 None, [(종류 ".", "#", "[", 값)]) 또는 None (부분 파싱 불가)
+    """
+    if "," in selector:
+        return None
+
+    match = _FIRST_COMPOUND_PATTERN.match(selector)
+    if not match or not (match.group("tag") or match.group("simple")):
+        return None
+
+    # 첫 복합 선택자 뒤에는 끝, 공백(하위) 또는 > (자식) 조합자만 허용
+    rest = selector[match.end():]
+    if rest and not rest[0].isspace() and rest[0] != ">":
+        return None
+    if rest.strip().startswith(("+", "~")):
+        return None
+
+    tag = match.group("tag")
+    simple_selectors = []
+    for simple in _SIMPLE_SELECTOR_PATTERN.finditer(match.group("simple")):
+        if simple.group(1):
+            simple_selectors.append((simple.group(1), simple.group(2)))
+        else:
+            simple_selectors.append(("[", simple.group(3).lower()))
+
+    return (tag.lower() if tag else None), simple_selectors
+
+
+class _LxmlStrainer:
+    """
+    LxmlBackend 부분 파싱 조건
+
+    첫 번째 복합 선택자의 태그, 모든 클래스/ID, 속성 존재 여부로 요소를 확인합니다.
+    (속성 값은 비교하지 않으므로 실제 일치 요소의 상위 집합)
+    """
+
+    __slots__ = ("tag", "classes", "ids", "attrs")
+
+    def __init__(self, tag: Optional[str], simple_selectors: list[tuple[str, str]]):
+        self.tag = tag
+        self.classes = [value for kind, value in simple_selectors if kind == "."]
+        self.ids = [value for kind, value in simple_selectors if kind == "#"]
+        self.attrs = [value for kind, value in simple_selectors if kind == "["]
+
+    def __call__(self, elem: Any) -> bool:
+        if self.tag is not None and elem.tag != self.tag:
+            return False
+        if self.classes:
+            tokens = (elem.get("class") or "").split()
+            for name in self.classes:
+                if name not in tokens:
+                    return False
+        for element_id in self.ids:
+            if elem.get("id") != element_id:
+                return False
+        for name in self.attrs:
+            if elem.get(name) is None:
+                return False
+        return True
+
+
+class _Pruner:
+    """
+    HTMLPullParser의 start/end 이벤트로 부분 파싱 조건 밖의 요소를 제거
+
+    조건과 일치하는 요소의 하위 트리와 그 상위 요소만 남깁니다.
+    닫힌 요소가 일치 요소 안에 있지 않고 남은 자식이 없으면 (일치 요소를 포함하지 않으면)
+    부모에서 떼어 내므로 트리는 남길 요소 크기로 유지됩니다.
+    """
+
+    def __init__(self, strainer: _LxmlStrainer):
+        self._strainer = strainer
+        # 열려 있는 일치 요소 (중첩 가능)
+        self._open: list[Any] = []
+
+    def prune(self, events: Iterable[tuple[str, Any]]) -> list[Any]:
+        """
+        파서 이벤트를 처리하고 트리에 남은 닫힌 요소 반환
+
+        Args:
+            events: HTMLPullParser.read_events()
+
+        Returns:
+            닫힌 순서의 요소 리스트 (제거한 요소 제외)
+        """
+        strainer = self._strainer
+        opened = self._open
+        ended = []
+        for event, elem in events:
+            if event == "start":
+                if strainer(elem):
+                    opened.append(elem)
+                continue
+
+            if opened:
+                if opened[-1] is elem:
+                    opened.pop()
+            elif len(elem) == 0:
+                parent = elem.getparent()
+                if parent is not None:
+                    parent.remove(elem)
+                    continue
+            ended.append(elem)
+        return ended
+
+
+def _decode_chunks(chunks: Iterable[bytes], encoding: str) -> Iterator[str]:
+    """
+    바이트 조각을 이어서 디코딩 (조각 경계에서 잘린 글자는 다음 조각과 합침)
+
+    Args:
+        chunks: 바이트 조각
+        encoding: 코덱 이름
+
+    Yields:
+        디코딩된 문자열 조각 (잘못된 바이트는 대체 문자)
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    for chunk in chunks:
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    text = decoder.decode(b"", final=True)
+    if text:
+        yield text
+
+
+_bs4_backend = BeautifulSoupBackend()
+_lxml_backend: Optional[LxmlBackend] = None
+
+
+def get_parser_backend(selectors: ShopSelectors) -> ParserBackend:
+    """
+    상점 선택자에 맞는 파서 백엔드 선택
+
+    cssselect가 있고 모든 선택자를 XPath로 변환할 수 있으면 LxmlBackend,
+    그렇지 않으면 BeautifulSoupBackend를 반환합니다.
+
+    Args:
+        selectors: 상점 선택자 설정
+
+    Returns:
+        공용 ParserBackend 인스턴스
+    """
+    global _lxml_backend
+
+    if cssselect is None:
+        return _bs4_backend
+
+    if _lxml_backend is None:
+        _lxml_backend = LxmlBackend()
+
+    if _lxml_backend.supports(selectors):
+        return _lxml_backend
+    return _bs4_backend
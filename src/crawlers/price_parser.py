@@ -0,0 +1,205 @@
+"""
+가격 파서 - 가격 문자열 일괄 변환
+
+페이지의 가격 후보 문자열을 한 번에 정수 가격으로 변환합니다.
+숫자를 찾은 뒤 쉼표 제거와 정수 변환을 이어 붙인 문자열과 map으로 목록 전체에 적용하므로
+일반적인 가격 표기는 문자열마다 함수 호출과 분기를 거치지 않습니다.
+소수점과 만 단위 표기가 있는 문자열만 개별로 변환합니다.
+
+지원 형식: "₩25,000", "15,000원", "25,000.50원", "10,000~15,000원"(첫 가격), "1.2만원", "3만 5,000원"
+"""
+
+import operator
+import re
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Optional
+
+
+# 숫자 목록을 이어 붙일 구분자
+_SEPARATOR = "\x00"
+
+# 첫 번째 숫자
+_NUMBER_PATTERN = re.compile(r"\d[\d,]*(?:\.\d+)?")
+
+# 개별 변환용 첫 번째 가격 (만 단위 표기 우선)
+# "3만 5천원"의 천 단위 숫자는 더하지 않음
+_PRICE_PATTERN = re.compile(
+    r"(?P<man>\d[\d,]*(?:\.\d+)?)\s*만\s*(?:(?P<rest>\d[\d,]*)(?![\d,]*\s*천))?"
+    r"|(?P<number>\d[\d,]*(?:\.\d+)?)"
+)
+
+# array('q')에 담을 수 있는 최대 가격
+MAX_PRICE = 2**63 - 1
+
+
+@dataclass
+class PriceBatch:
+    """
+    가격 일괄 변환 결과
+
+    values[i]는 i번째 문자열의 가격이며, mask[i]가 1이면 가격이 없는 것(null)입니다.
+    """
+
+    # 정수 가격 (null 위치는 0)
+    values: array
+    # null 표시 (1 = 가격 없음)
+    mask: bytearray
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def get(self, index: int) -> Optional[int]:
+        """
+        i번째 가격 조회
+
+        Args:
+            index: 문자열 위치
+
+        Returns:
+            가격 또는 None
+        """
+        if self.mask[index]:
+            return None
+        return self.values[index]
+
+    def find_last(self, start: int = 0, stop: Optional[int] = None) -> int:
+        """
+        범위 안에서 마지막으로 가격이 있는 위치 찾기
+
+        Args:
+            start: 시작 위치
+            stop: 끝 위치 (포함하지 않음, 없으면 끝까지)
+
+        Returns:
+            위치 또는 -1 (가격이 없는 경우)
+        """
+        if stop is None:
+            stop = len(self.mask)
+        # mask는 가격이 있으면 0이므로 마지막 0 바이트를 찾음
+        return self.mask.rfind(0, start, stop)
+
+    def to_list(self) -> list[Optional[int]]:
+        """
+        가격 리스트로 변환
+
+        Returns:
+            가격 또는 None 리스트
+        """
+        return [None if null else value for value, null in zip(self.values, self.mask)]
+
+
+def parse_prices(texts: Sequence[str]) -> PriceBatch:
+    """
+    가격 문자열 일괄 변환
+
+    문자열마다 첫 번째 가격 표기를 사용합니다 (범위는 시작 가격).
+    소수점은 반올림하고, "만"은 10,000을 곱한 뒤 뒤따르는 숫자를 더합니다.
+
+    Args:
+        texts: 가격 문자열 목록
+
+    Returns:
+        PriceBatch
+    """
+    count = len(texts)
+    if not count:
+        return PriceBatch(array("q"), bytearray())
+
+    # 문자열마다 첫 숫자 (없으면 "")
+    numbers = [match.group() if match else "" for match in map(_NUMBER_PATTERN.search, texts)]
+    mask = bytearray(map(operator.not_, numbers))
+
+    # 숫자 앞에 "0"을 붙여 빈 문자열도 0으로 변환되게 함
+    digits = ("0" + (_SEPARATOR + "0").join(numbers)).replace(",", "")
+    parts = digits.split(_SEPARATOR)
+
+    # 소수점과 만 단위 표기는 개별 변환
+    slow = set()
+    if "." in digits:
+        slow.update(index for index, part in enumerate(parts) if "." in part)
+        for index in slow:
+            parts[index] = "0"
+    if "만" in "".join(texts):
+        slow.update(index for index, text in enumerate(texts) if "만" in text)
+
+    try:
+        values = array("q", list(map(int, parts)))
+    except OverflowError:
+        # 범위를 넘는 가격이 있으면 모두 개별 변환
+        values = array("q", bytes(8 * count))
+        slow = range(count)
+
+    for index in slow:
+        price = _parse_one(texts[index])
+        if price is None:
+            values[index] = 0
+            mask[index] = 1
+        else:
+            values[index] = price
+            mask[index] = 0
+
+    return PriceBatch(values, mask)
+
+
+def parse_price(text: str) -> Optional[int]:
+    """
+    가격 문자열 하나 변환
+
+    Args:
+        text: 가격 문자열 (예: "₩25,000", "15,000원", "1.2만원")
+
+    Returns:
+        정수 가격 또는 None
+    """
+    if not text:
+        return None
+    return _parse_one(text)
+
+
+def _parse_one(text: str) -> Optional[int]:
+    """
+    첫 번째 가격 표기를 정수로 변환
+
+    Args:
+        text: 가격 문자열
+
+    Returns:
+        정수 가격 또는 None (가격이 없거나 범위를 넘는 경우)
+    """
+    match = _PRICE_PATTERN.search(text)
+    if match is None:
+        return None
+
+    number = match.group("number")
+    if number is not None:
+        price = _to_int(number)
+    else:
+        price = _to_int(match.group("man"), 10000)
+        rest = match.group("rest")
+        if rest:
+            price += _to_int(rest)
+
+    return price if price <= MAX_PRICE else None
+
+
+def _to_int(number: str, unit: int = 1) -> int:
+    """
+    쉼표가 포함된 숫자를 정수로 변환 (소수점은 반올림)
+
+    Args:
+        number: 숫자 문자열 (예: "25,000", "1.2")
+        unit: 곱할 단위
+
+    Returns:
+        정수
+    """
+    whole, _, fraction = number.replace(",", "").partition(".")
+    if not fraction:
+        return int(whole) * unit
+
+    # 소수 자릿수만큼 나눈 뒤 반올림 (0.5는 올림)
+    divisor = 10 ** len(fraction)
+    quotient, remainder = divmod(int(whole + fraction) * unit, divisor)
+    return quotient + (remainder * 2 >= divisor)
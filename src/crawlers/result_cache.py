@@ -0,0 +1,239 @@
+"""
+ResultCache - 검색 결과 메모리 캐시
+
+(상점 ID, 키워드, 결과 수 제한)별 파싱된 검색 결과를 TTL과 LRU로 보관합니다.
+신선도가 지난 결과는 즉시 반환하면서 백그라운드에서 갱신합니다 (stale-while-revalidate).
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from src.models.search import SearchResult
+from src.models.shop import Shop
+
+
+@dataclass
+class ResultCacheStats:
+    """캐시 사용 통계"""
+
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    refreshes: int = 0
+    size: int = 0
+
+
+@dataclass
+class _CachedResults:
+    """캐시 항목"""
+
+    results: list[SearchResult]
+    stored_at: float
+    # 상점 설정이 수정되면 무효화
+    shop_updated_at: datetime
+
+
+class ResultCache:
+    """
+    검색 결과 TTL+LRU 캐시
+
+    ttl 이내의 결과는 그대로 반환하고, ttl이 지났지만 stale_ttl 이내인 결과는
+    반환과 동시에 백그라운드 갱신을 예약합니다. 같은 키의 갱신은 한 번만 실행됩니다.
+    반환되는 SearchResult 객체는 캐시와 공유되므로 수정하지 않아야 합니다.
+    """
+
+    DEFAULT_TTL = 60.0
+    DEFAULT_STALE_TTL = 600.0
+    DEFAULT_MAX_ENTRIES = 256
+    # 동시에 실행되는 백그라운드 갱신 수
+    REFRESH_WORKERS = 4
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_TTL,
+        stale_ttl: float = DEFAULT_STALE_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        ResultCache 초기화
+
+        Args:
+            ttl: 갱신 없이 사용하는 기간 (초)
+            stale_ttl: ttl 이후 백그라운드 갱신과 함께 사용하는 기간 (초)
+            max_entries: 최대 항목 수 (넘으면 가장 오래 사용하지 않은 항목 삭제)
+            clock: 현재 시각 함수
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries는 1 이상이어야 합니다")
+
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, str, Optional[int]], _CachedResults] = OrderedDict()
+        self._refreshing: set[tuple[str, str, Optional[int]]] = set()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # close 이후에는 갱신을 예약하지 않음
+        self._closed = False
+        self._stats = ResultCacheStats()
+
+    def get(
+        self,
+        shop: Shop,
+        keyword: str,
+        refresh: Optional[Callable[[], list[SearchResult]]] = None,
+        max_results: Optional[int] = None,
+    ) -> Optional[list[SearchResult]]:
+        """
+        캐시된 검색 결과 조회
+
+        Args:
+            shop: 상점
+            keyword: 검색 키워드
+            refresh: 신선도가 지난 결과를 갱신할 검색 함수 (없으면 갱신 안 함)
+            max_results: 검색 시 사용한 상점당 최대 결과 수
+
+        Returns:
+            검색 결과 리스트 또는 None (캐시 미스)
+        """
+        key = (shop.id, keyword, max_results)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.shop_updated_at != shop.updated_at:
+                self._stats.misses += 1
+                return None
+
+            age = self._clock() - entry.stored_at
+            if age >= self.ttl + self.stale_ttl:
+                del self._entries[key]
+                self._stats.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            if age < self.ttl:
+                self._stats.hits += 1
+                return list(entry.results)
+
+            self._stats.stale_hits += 1
+            results = list(entry.results)
+
+        if refresh is not None:
+            self._schedule_refresh(shop, keyword, refresh, max_results)
+        return results
+
+    def put(
+        self,
+        shop: Shop,
+        keyword: str,
+        results: list[SearchResult],
+        max_results: Optional[int] = None,
+    ) -> None:
+        """
+        검색 결과 저장
+
+        Args:
+            shop: 상점
+            keyword: 검색 키워드
+            results: 검색 결과 리스트
+            max_results: 검색 시 사용한 상점당 최대 결과 수
+        """
+        key = (shop.id, keyword, max_results)
+        entry = _CachedResults(
+            results=list(results),
+            stored_at=self._clock(),
+            shop_updated_at=shop.updated_at,
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, shop_id: Optional[str] = None) -> None:
+        """
+        캐시 삭제
+
+        Args:
+            shop_id: 삭제할 상점 ID (None이면 전체)
+        """
+        with self._lock:
+            if shop_id is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0] == shop_id]:
+                del self._entries[key]
+
+    def get_stats(self) -> ResultCacheStats:
+        """
+        캐시 사용 통계 조회
+
+        Returns:
+            ResultCacheStats 복사본
+        """
+        with self._lock:
+            return ResultCacheStats(
+                hits=self._stats.hits,
+                stale_hits=self._stats.stale_hits,
+                misses=self._stats.misses,
+                refreshes=self._stats.refreshes,
+                size=len(self._entries),
+            )
+
+    def close(self) -> None:
+        """
+        백그라운드 갱신 실행기 종료 (진행 중인 갱신은 기다리지 않음)
+
+        이후 조회는 캐시된 결과만 반환하고 갱신을 예약하지 않습니다.
+        """
+        with self._lock:
+            self._closed = True
+            executor = self._executor
+            self._executor = None
+            # 취소된 갱신은 finally에 도달하지 않으므로 진행 중 표시를 직접 정리
+            self._refreshing.clear()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _schedule_refresh(
+        self,
+        shop: Shop,
+        keyword: str,
+        refresh: Callable[[], list[SearchResult]],
+        max_results: Optional[int] = None,
+    ) -> None:
+        """같은 키의 갱신이 진행 중이 아니면 백그라운드 갱신 예약 (close 이후에는 무시)"""
+        key = (shop.id, keyword, max_results)
+
+        def run() -> None:
+            try:
+                results = refresh()
+            except Exception:
+                # 갱신 실패 시 기존 결과 유지
+                results = None
+
+            if results is not None:
+                self.put(shop, keyword, results, max_results)
+            with self._lock:
+                if results is not None:
+                    self._stats.refreshes += 1
+                self._refreshing.discard(key)
+
+        # close와 같은 잠금 안에서 submit하여 종료된 실행기에 예약하지 않음 (RuntimeError 방지)
+        with self._lock:
+            if self._closed or key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.REFRESH_WORKERS,
+                    thread_name_prefix="plaprice-refresh",
+                )
+            self._executor.submit(run)
@@ -0,0 +1,236 @@
+"""
+구조화 데이터 추출 - JSON-LD 상품 정보
+
+검색 결과 페이지에 포함된 <script type="application/ld+json"> 블록을
+정규식으로 찾아 JSON으로 읽으므로 HTML을 파싱하거나 선택자로 순회하지 않습니다.
+schema.org Product와 ItemList(ListItem.item), @graph 구조를 지원합니다.
+"""
+
+import html
+import json
+import math
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any, Optional
+
+from src.crawlers.price_parser import MAX_PRICE, parse_price
+from src.models.search import StockStatus
+
+
+# JSON-LD 스크립트 블록 (내용은 그룹 1)
+_JSON_LD_PATTERN = re.compile(
+    r"""<script\b[^>]*\btype\s*=\s*["']?application/ld\+json["']?[^>]*>(.*?)</script\s*>""",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# 블록을 감싼 HTML 주석/CDATA 표시
+_WRAPPER_PATTERN = re.compile(r"^\s*(?:<!--|//\s*<!\[CDATA\[)|(?:-->|//\s*\]\]>)\s*$")
+
+# schema.org ItemAvailability -> 재고 상태 (소문자, URL 접두사 제외)
+AVAILABILITY_STATUS = {
+    "instock": StockStatus.IN_STOCK,
+    "limitedavailability": StockStatus.IN_STOCK,
+    "instoreonly": StockStatus.IN_STOCK,
+    "onlineonly": StockStatus.IN_STOCK,
+    "outofstock": StockStatus.OUT_OF_STOCK,
+    "soldout": StockStatus.OUT_OF_STOCK,
+    "discontinued": StockStatus.OUT_OF_STOCK,
+    "preorder": StockStatus.PRE_ORDER,
+    "presale": StockStatus.PRE_ORDER,
+    "backorder": StockStatus.PRE_ORDER,
+}
+
+
+@dataclass
+class StructuredProduct:
+    """구조화 데이터에서 읽은 상품 정보"""
+
+    name: str
+    price: Optional[int] = None
+    # 원본 가격 값 (문자열로 변환)
+    price_text: Optional[str] = None
+    # availability가 없으면 None
+    stock_status: Optional[StockStatus] = None
+    url: Optional[str] = None
+
+
+def extract_json_ld_products(page: str) -> list[StructuredProduct]:
+    """
+    페이지의 JSON-LD 블록에서 상품 목록 추출
+
+    잘못된 JSON 블록은 건너뛰고, 이름이 없는 상품은 제외합니다.
+
+    Args:
+        page: HTML 문자열
+
+    Returns:
+        StructuredProduct 리스트 (문서 순서)
+    """
+    products = []
+    for match in _JSON_LD_PATTERN.finditer(page):
+        data = _load_block(match.group(1))
+        if data is None:
+            continue
+        for item in _iter_product_items(data):
+            product = _read_product(item)
+            if product is not None:
+                products.append(product)
+    return products
+
+
+def parse_availability(value: Any) -> Optional[StockStatus]:
+    """
+    schema.org availability 값을 재고 상태로 변환
+
+    Args:
+        value: availability 값 (예: 'https://schema.org/InStock', 'OutOfStock')
+
+    Returns:
+        StockStatus 또는 None (알 수 없는 값)
+    """
+    if not isinstance(value, str):
+        return None
+    key = value.rstrip("/").rsplit("/", 1)[-1].strip().lower()
+    return AVAILABILITY_STATUS.get(key)
+
+
+def _load_block(text: str) -> Optional[Any]:
+    """
+    JSON-LD 블록 내용을 JSON으로 읽기
+
+    Args:
+        text: 스크립트 내용
+
+    Returns:
+        JSON 값 또는 None (잘못된 JSON)
+    """
+    text = _WRAPPER_PATTERN.sub("", text.strip())
+    if not text:
+        return None
+    try:
+        # 제어 문자가 그대로 들어간 블록도 허용
+        return json.loads(text, strict=False)
+    except ValueError:
+        return None
+
+
+def _has_type(item: dict, type_name: str) -> bool:
+    """@type이 type_name이거나 type_name을 포함하는 목록인지 확인"""
+    types = item.get("@type")
+    if isinstance(types, str):
+        return types == type_name
+    if isinstance(types, list):
+        return type_name in types
+    return False
+
+
+def _iter_product_items(data: Any) -> Iterator[dict]:
+    """
+    JSON-LD 값에서 Product 항목을 문서 순서대로 찾기
+
+    Args:
+        data: JSON 값
+
+    Yields:
+        Product 딕셔너리
+    """
+    if isinstance(data, list):
+        for value in data:
+            yield from _iter_product_items(value)
+        return
+    if not isinstance(data, dict):
+        return
+
+    if "@graph" in data:
+        yield from _iter_product_items(data["@graph"])
+    if _has_type(data, "Product"):
+        yield data
+    elif _has_type(data, "ItemList"):
+        for element in data.get("itemListElement") or ():
+            # ListItem은 item에 상품을 담음
+            if isinstance(element, dict) and "item" in element:
+                element = element["item"]
+            yield from _iter_product_items(element)
+
+
+def _first(value: Any) -> Any:
+    """목록이면 첫 번째 값"""
+    if isinstance(value, list):
+        return value[0] if value else None
+    return value
+
+
+def _convert_number_price(value: int | float) -> Optional[int]:
+    """
+    JSON 숫자 가격을 정수로 변환 (소수점은 반올림)
+
+    문자열 가격 파싱은 지수 표기(1.5E4)를 해석하지 않으므로 숫자는 직접 변환합니다.
+
+    Args:
+        value: JSON 숫자
+
+    Returns:
+        정수 가격 또는 None (음수, NaN/Infinity, MAX_PRICE 초과)
+    """
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    if value < 0:
+        return None
+    if isinstance(value, int):
+        price = value
+    else:
+        price = int(Decimal(str(value)).to_integral_value(ROUND_HALF_UP))
+    return price if price <= MAX_PRICE else None
+
+
+def _read_product(item: dict) -> Optional[StructuredProduct]:
+    """
+    Product 항목에서 상품 정보 읽기
+
+    offers가 여러 개이면 첫 번째를 사용하고, AggregateOffer는 최저가를 사용합니다.
+
+    Args:
+        item: Product 딕셔너리
+
+    Returns:
+        StructuredProduct 또는 None (이름이 없는 경우)
+    """
+    name = _first(item.get("name"))
+    if not isinstance(name, str):
+        return None
+    name = html.unescape(name).strip()
+    if not name:
+        return None
+
+    offer = _first(item.get("offers"))
+    if not isinstance(offer, dict):
+        offer = {}
+
+    price_value = offer.get("price")
+    if price_value is None:
+        price_value = offer.get("lowPrice")
+    if price_value is None:
+        specification = _first(offer.get("priceSpecification"))
+        if isinstance(specification, dict):
+            price_value = specification.get("price")
+
+    price_text = None
+    price = None
+    if isinstance(price_value, str):
+        price_text = price_value
+        price = parse_price(price_text)
+    elif isinstance(price_value, (int, float)) and not isinstance(price_value, bool):
+        price_text = str(price_value)
+        price = _convert_number_price(price_value)
+
+    url = _first(item.get("url")) or offer.get("url")
+
+    return StructuredProduct(
+        name=name,
+        price=price,
+        price_text=price_text,
+        stock_status=parse_availability(_first(offer.get("availability"))),
+        url=url if isinstance(url, str) and url else None,
+    )
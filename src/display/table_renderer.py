@@ -4,14 +4,20 @@ TableRenderer - 검색 결과 테이블 렌더러
 rich 라이브러리를 사용하여 검색 결과를 테이블로 표시합니다.
 """
 
+from collections.abc import Sequence
 from typing import Optional
 
 from rich.console import Console
 from rich.table import Table
 
+from src.models.result_batch import ResultBatch, as_result_batch
 from src.models.search import SearchResult, StockStatus
 
 
+# 검색 결과 리스트 또는 열 단위 묶음 (묶음은 출력하는 행만 SearchResult로 변환)
+Results = Sequence[SearchResult] | ResultBatch
+
+
 class TableRenderer:
     """
     검색 결과 테이블 렌더러
@@ -27,6 +33,9 @@ class TableRenderer:
         StockStatus.UNKNOWN: ("? 알 수 없음", "yellow"),
     }
 
+    # 품절 제외 시 최저가 후보 재고 상태
+    IN_STOCK_STATUSES = tuple(status for status in StockStatus if status != StockStatus.OUT_OF_STOCK)
+
     def format_price(self, price: Optional[int]) -> str:
         """
         가격을 한국 원화 형식으로 포맷팅
@@ -56,14 +65,14 @@ class TableRenderer:
 
     def render_results(
         self,
-        results: list[SearchResult],
+        results: Results,
         keyword: str,
     ) -> str:
         """
         검색 결과를 테이블 문자열로 렌더링
 
         Args:
-            results: 검색 결과 리스트
+            results: 검색 결과 리스트 또는 ResultBatch
             keyword: 검색 키워드
 
         Returns:
@@ -87,7 +96,7 @@ class TableRenderer:
 
     def print_results(
         self,
-        results: list[SearchResult],
+        results: Results,
         keyword: str,
         console: Optional[Console] = None,
     ) -> None:
@@ -95,7 +104,7 @@ class TableRenderer:
         검색 결과를 콘솔에 출력
 
         Args:
-            results: 검색 결과 리스트
+            results: 검색 결과 리스트 또는 ResultBatch
             keyword: 검색 키워드
             console: Rich Console (없으면 기본 콘솔 사용)
         """
@@ -164,14 +173,14 @@ class TableRenderer:
 
     def render_comparison(
         self,
-        results: list[SearchResult],
+        results: Results,
         keyword: str,
     ) -> str:
         """
         다중 상점 비교 결과를 테이블 문자열로 렌더링
 
         Args:
-            results: 검색 결과 리스트
+            results: 검색 결과 리스트 또는 ResultBatch
             keyword: 검색 키워드
 
         Returns:
@@ -183,9 +192,10 @@ class TableRenderer:
             return f"'{keyword}'에 대한 검색 결과가 없습니다."
 
         table = self._create_comparison_table(keyword)
-        lowest = self.find_lowest_price(results, exclude_out_of_stock=True)
+        batch = as_result_batch(results)
+        lowest = self.find_lowest_price(batch, exclude_out_of_stock=True)
 
-        for result in results:
+        for result in batch:
             is_lowest = (
                 lowest is not None
                 and result.shop_id == lowest.shop_id
@@ -204,7 +214,7 @@ class TableRenderer:
 
     def print_comparison(
         self,
-        results: list[SearchResult],
+        results: Results,
         keyword: str,
         console: Optional[Console] = None,
     ) -> None:
@@ -212,7 +222,7 @@ class TableRenderer:
         다중 상점 비교 결과를 콘솔에 출력
 
         Args:
-            results: 검색 결과 리스트
+            results: 검색 결과 리스트 또는 ResultBatch
             keyword: 검색 키워드
             console: Rich Console
         """
@@ -224,9 +234,10 @@ class TableRenderer:
             return
 
         table = self._create_comparison_table(keyword)
-        lowest = self.find_lowest_price(results, exclude_out_of_stock=True)
+        batch = as_result_batch(results)
+        lowest = self.find_lowest_price(batch, exclude_out_of_stock=True)
 
-        for result in results:
+        for result in batch:
             is_lowest = (
                 lowest is not None
                 and result.shop_id == lowest.shop_id
@@ -267,27 +278,20 @@ class TableRenderer:
 
     def find_lowest_price(
         self,
-        results: list[SearchResult],
+        results: Results,
         exclude_out_of_stock: bool = False,
     ) -> Optional[SearchResult]:
         """
         최저가 상품 찾기
 
         Args:
-            results: 검색 결과 리스트
+            results: 검색 결과 리스트 또는 ResultBatch
             exclude_out_of_stock: 품절 상품 제외 여부
 
         Returns:
             최저가 SearchResult 또는 None
         """
-        candidates = [r for r in results if r.price is not None]
-
-        if exclude_out_of_stock:
-            candidates = [
-                r for r in candidates if r.stock_status != StockStatus.OUT_OF_STOCK
-            ]
-
-        if not candidates:
-            return None
-
-        return min(candidates, key=lambda r: r.price)
+        batch = as_result_batch(results)
+        stock_statuses = self.IN_STOCK_STATUSES if exclude_out_of_stock else None
+        index = batch.find_lowest(stock_statuses)
+        return batch.row(index) if index >= 0 else None
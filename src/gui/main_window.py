@@ -17,6 +17,8 @@ from PySide6.QtWidgets import (
     QMessageBox,
 )
 
+from src.crawlers.circuit_breaker import CircuitBreaker
+from src.crawlers.result_cache import ResultCache
 from src.gui.settings import GuiSettings
 from src.gui.shop_panel import ShopListView
 from src.gui.search_panel import SearchPanel
@@ -48,6 +50,14 @@ class MainWindow(QMainWindow):
         # 상점 저장소
         self.shop_store = shop_store or ShopStore()
         
+        # 상점별 회로 차단기 (CLI와 상태 파일 공유)
+        self.circuit_breaker = CircuitBreaker(
+            self.shop_store.config_dir / CircuitBreaker.STATE_FILENAME
+        )
+        
+        # 같은 검색 반복 시 즉시 표시하기 위한 결과 캐시
+        self.result_cache = ResultCache()
+        
         # 검색 워커
         self._search_worker: SearchWorker | None = None
         
@@ -83,7 +93,7 @@ class MainWindow(QMainWindow):
         right_layout.addWidget(self.search_panel)
         
         # 결과 테이블
-        self.results_table = ResultsTable()
+        self.results_table = ResultsTable(shop_store=self.shop_store)
         right_layout.addWidget(self.results_table)
         
         self.splitter.addWidget(right_panel)
@@ -127,13 +137,19 @@ class MainWindow(QMainWindow):
             self._search_worker.wait()
         
         # 결과 초기화
-        self.results_table.clear_results()
+        self.results_table.clear()
         
         # 검색 상태로 전환
         self.search_panel.set_searching(True)
         
         # 워커 생성 및 시작
-        self._search_worker = SearchWorker(keyword, selected_shops)
+        self._search_worker = SearchWorker(
+            keyword,
+            selected_shops,
+            circuit_breaker=self.circuit_breaker,
+            result_cache=self.result_cache,
+            max_results=self.search_panel.get_max_results(),
+        )
         self._search_worker.progress.connect(self._on_search_progress)
         self._search_worker.shop_completed.connect(self._on_shop_completed)
         self._search_worker.finished_with_results.connect(self._on_search_finished)
@@ -157,15 +173,15 @@ class MainWindow(QMainWindow):
         """
         self.search_panel.update_progress(current, total)
     
-    def _on_shop_completed(self, shop_name: str, result_count: int) -> None:
+    def _on_shop_completed(self, shop_name: str, results: list) -> None:
         """
         상점 검색 완료 처리
         
         Args:
             shop_name: 상점 이름
-            result_count: 결과 수
+            results: 해당 상점의 검색 결과
         """
-        self.search_panel.set_status(f"{shop_name}: {result_count}개 결과")
+        self.search_panel.set_status(f"{shop_name}: {len(results)}개 결과")
     
     def _on_search_finished(self, results: list) -> None:
         """
@@ -175,7 +191,10 @@ class MainWindow(QMainWindow):
             results: 검색 결과 목록
         """
         self.search_panel.set_searching(False)
-        self.results_table.display_results(results)
+        self.results_table.set_results(
+            results,
+            max_per_shop=self.search_panel.get_max_results(),
+        )
         self.search_panel.set_status(f"검색 완료: 총 {len(results)}개 결과")
     
     def _on_search_error(self, error_message: str) -> None:
@@ -207,6 +226,9 @@ class MainWindow(QMainWindow):
         """설정에서 창 상태 복원"""
         geometry = self.settings.window
         
+        # 상점당 결과 수 복원
+        self.search_panel.set_max_results(self.settings.max_results_per_shop)
+        
         if geometry.is_maximized:
             self.showMaximized()
         else:
@@ -232,10 +254,15 @@ class MainWindow(QMainWindow):
         # 스플리터 크기 저장
         self.settings.splitter.sizes = self.splitter.sizes()
         
+        # 상점당 결과 수 저장
+        self.settings.max_results_per_shop = self.search_panel.get_max_results()
+        
         # 파일에 저장
         self.settings.save()
     
     def closeEvent(self, event) -> None:
         """창 닫기 이벤트 처리"""
         self._save_settings()
+        self.result_cache.close()
+        self.shop_store.close()
         super().closeEvent(event)
@@ -4,6 +4,7 @@
 
 검색 결과를 표시하는 테이블 위젯.
 최저가 강조, URL 열기, CSV 내보내기 기능.
+결과는 열 단위 묶음으로 보관하고 (상점은 ShopStore 핸들), 표시/내보내는 행만 꺼냅니다.
 """
 
 import csv
@@ -26,9 +27,14 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtGui import QColor, QBrush
 
+from src.models.result_batch import ResultBatch
 from src.models.search import SearchResult, StockStatus
+from src.storage.shop_store import ShopStore
 
 
+# 구매 가능한 재고 상태 (최저가 후보)
+AVAILABLE_STATUSES = (StockStatus.IN_STOCK, StockStatus.PRE_ORDER)
+
 # 최저가 강조 색상 (녹색)
 LOWEST_PRICE_COLOR = QColor(144, 238, 144)  # LightGreen
 
@@ -39,11 +45,18 @@ class ResultsTable(QWidget):
     # 시그널
     url_open_requested = Signal(str)  # url
     
-    def __init__(self, parent=None):
-        """ResultsTable 초기화"""
+    def __init__(self, parent=None, shop_store: Optional[ShopStore] = None):
+        """
+        ResultsTable 초기화
+        
+        Args:
+            parent: 부모 위젯
+            shop_store: 상점 핸들 표를 공유할 상점 저장소 (없으면 결과마다 새 표)
+        """
         super().__init__(parent)
         
-        self._results: list[SearchResult] = []
+        self._shop_table = shop_store.shop_table if shop_store is not None else None
+        self._results = ResultBatch.from_results([], keep_rows=False)
         
         self._setup_ui()
         self._connect_signals()
@@ -106,63 +119,60 @@ class ResultsTable(QWidget):
     
     def set_results(
         self,
-        results: list[SearchResult],
+        results: list[SearchResult] | ResultBatch,
         max_per_shop: Optional[int] = None
     ) -> None:
         """
         검색 결과 설정
         
         Args:
-            results: 검색 결과 목록
+            results: 검색 결과 목록 또는 ResultBatch
             max_per_shop: 상점당 최대 표시 개수
         """
-        self._results = results
+        # SearchResult 객체 대신 열 단위 묶음만 보관
+        batch = self._results = self._compact(results)
         
         # 상점당 개수 제한
         if max_per_shop:
-            results = self._limit_per_shop(results, max_per_shop)
+            batch = self._limit_per_shop(batch, max_per_shop)
         
         # 테이블 초기화
         self.table.setSortingEnabled(False)
         self.table.setRowCount(0)
         
         # 최저가 찾기
-        lowest_price = self._find_lowest_price(results)
+        lowest_price = self._find_lowest_price(batch)
         
-        # 결과 추가
-        for result in results:
+        # 결과 추가 (표시하는 행만 SearchResult로 꺼냄)
+        for result in batch:
             self._add_result_row(result, lowest_price)
         
         # 정렬 활성화
         self.table.setSortingEnabled(True)
         
         # 상태 업데이트
-        self._update_status(len(results))
+        self._update_status(len(batch))
+    
+    def _compact(self, results: list[SearchResult] | ResultBatch) -> ResultBatch:
+        """객체를 보관하지 않는 묶음으로 변환 (이미 그런 묶음이면 그대로)"""
+        if isinstance(results, ResultBatch):
+            return results.compact()
+        return ResultBatch.from_results(results, keep_rows=False, shops=self._shop_table)
     
     def _limit_per_shop(
         self,
-        results: list[SearchResult],
+        batch: ResultBatch,
         max_per_shop: int
-    ) -> list[SearchResult]:
+    ) -> ResultBatch:
         """상점당 최대 개수 제한"""
-        shop_counts: dict[str, int] = {}
-        limited: list[SearchResult] = []
-        
-        for result in results:
-            count = shop_counts.get(result.shop_name, 0)
-            if count < max_per_shop:
-                limited.append(result)
-                shop_counts[result.shop_name] = count + 1
-        
-        return limited
+        return batch.limit_per_shop(max_per_shop)
     
-    def _find_lowest_price(self, results: list[SearchResult]) -> Optional[int]:
+    def _find_lowest_price(self, batch: ResultBatch) -> Optional[int]:
         """재고 있는 상품 또는 예약상품 중 최저가 찾기"""
-        available_prices = [
-            r.price for r in results 
-            if r.stock_status in (StockStatus.IN_STOCK, StockStatus.PRE_ORDER) and r.price is not None
-        ]
-        return min(available_prices) if available_prices else None
+        index = batch.find_lowest(AVAILABLE_STATUSES)
+        if index < 0:
+            return None
+        return batch.get_price(index)
     
     def _add_result_row(
         self,
@@ -174,7 +184,7 @@ class ResultsTable(QWidget):
         self.table.insertRow(row)
         
         # 재고 상태 확인 (재고있음 또는 예약상품은 구매 가능)
-        is_available = result.stock_status in (StockStatus.IN_STOCK, StockStatus.PRE_ORDER)
+        is_available = result.stock_status in AVAILABLE_STATUSES
         
         # 최저가 여부
         is_lowest = (
@@ -233,13 +243,13 @@ class ResultsTable(QWidget):
     
     def clear(self) -> None:
         """결과 초기화"""
-        self._results = []
+        self._results = ResultBatch.from_results([], keep_rows=False)
         self.table.setRowCount(0)
         self._update_status(0)
     
     def get_results(self) -> list[SearchResult]:
         """현재 결과 목록 반환"""
-        return self._results
+        return self._results.to_list()
     
     def _on_cell_double_clicked(self, row: int, col: int) -> None:
         """셀 더블클릭 처리 - URL 열기"""
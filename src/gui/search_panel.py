@@ -2,9 +2,11 @@
 """
 검색 패널
 
-키워드 입력, 검색/취소 버튼, 진행률 바를 포함하는 검색 패널.
+키워드 입력, 상점당 결과 수, 검색/취소 버튼, 진행률 바를 포함하는 검색 패널.
 """
 
+from typing import Optional
+
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import (
     QWidget,
@@ -15,12 +17,16 @@ from PySide6.QtWidgets import (
     QProgressBar,
     QLabel,
     QMessageBox,
+    QSpinBox,
 )
 
 
 class SearchPanel(QWidget):
     """검색 패널"""
     
+    # 상점당 결과 수 선택 최대값
+    MAX_RESULTS_LIMIT = 1000
+    
     # 시그널
     search_requested = Signal(str)  # keyword
     cancel_requested = Signal()
@@ -45,6 +51,15 @@ class SearchPanel(QWidget):
         self.search_input.setPlaceholderText("검색어를 입력하세요...")
         search_layout.addWidget(self.search_input)
         
+        # 상점당 최대 결과 수 (0 = 제한 없음)
+        self.max_results_spin = QSpinBox()
+        self.max_results_spin.setRange(0, self.MAX_RESULTS_LIMIT)
+        self.max_results_spin.setSpecialValueText("제한 없음")
+        self.max_results_spin.setPrefix("상점당 ")
+        self.max_results_spin.setSuffix("개")
+        self.max_results_spin.setToolTip("상점별로 가져올 최대 상품 수")
+        search_layout.addWidget(self.max_results_spin)
+        
         # 검색 버튼
         self.search_button = QPushButton("검색")
         self.search_button.setMinimumWidth(80)
@@ -102,6 +117,24 @@ class SearchPanel(QWidget):
         """
         return self.search_input.text().strip()
     
+    def get_max_results(self) -> Optional[int]:
+        """
+        상점당 최대 결과 수 가져오기
+        
+        Returns:
+            최대 결과 수 또는 None (제한 없음)
+        """
+        return self.max_results_spin.value() or None
+    
+    def set_max_results(self, max_results: Optional[int]) -> None:
+        """
+        상점당 최대 결과 수 설정
+        
+        Args:
+            max_results: 최대 결과 수 (None이면 제한 없음)
+        """
+        self.max_results_spin.setValue(max_results or 0)
+    
     def set_searching(self, searching: bool) -> None:
         """
         검색 중 상태 설정
@@ -111,6 +144,7 @@ class SearchPanel(QWidget):
         """
         self.search_button.setEnabled(not searching)
         self.search_input.setEnabled(not searching)
+        self.max_results_spin.setEnabled(not searching)
         self.cancel_button.setEnabled(searching)
         self.progress_bar.setVisible(searching)
         
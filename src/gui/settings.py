@@ -35,6 +35,8 @@ class GuiSettings(BaseModel):
     splitter: SplitterState = SplitterState()
     last_search_keyword: str = ""
     selected_shop_ids: list[str] = []
+    # 상점당 최대 결과 수 (None이면 제한 없음)
+    max_results_per_shop: int | None = None
     
     # 기본 저장 경로
     DEFAULT_PATH: ClassVar[Path] = Path.home() / ".plaprice" / "gui_settings.json"
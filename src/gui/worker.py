@@ -6,11 +6,15 @@ QThread 기반 백그라운드 검색 워커.
 메인 UI 블로킹 없이 크롤링 수행.
 """
 
+from typing import Optional
+
 from PySide6.QtCore import QThread, Signal
 
 from src.models.shop import Shop
 from src.models.search import SearchResult
+from src.crawlers.circuit_breaker import CircuitBreaker
 from src.crawlers.multi_crawler import MultiShopCrawler
+from src.crawlers.result_cache import ResultCache
 
 
 class SearchWorker(QThread):
@@ -22,7 +26,15 @@ class SearchWorker(QThread):
     finished_with_results = Signal(list)  # all results
     error_occurred = Signal(str)  # error message
     
-    def __init__(self, keyword: str, shops: list[Shop], parent=None):
+    def __init__(
+        self,
+        keyword: str,
+        shops: list[Shop],
+        parent=None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        result_cache: Optional[ResultCache] = None,
+        max_results: Optional[int] = None,
+    ):
         """
         SearchWorker 초기화
         
@@ -30,11 +42,17 @@ class SearchWorker(QThread):
             keyword: 검색 키워드
             shops: 검색할 상점 목록
             parent: 부모 QObject
+            circuit_breaker: 상점별 회로 차단기 (None이면 사용 안 함)
+            result_cache: 검색 결과 캐시 (None이면 사용 안 함)
+            max_results: 상점당 최대 결과 수 (None이면 제한 없음)
         """
         super().__init__(parent)
         
         self._keyword = keyword
         self._shops = shops
+        self._circuit_breaker = circuit_breaker
+        self._result_cache = result_cache
+        self._max_results = max_results
         self._cancelled = False
     
     @property
@@ -69,19 +87,33 @@ class SearchWorker(QThread):
             self.progress.emit(0, total_shops)
             
             # MultiShopCrawler 사용
-            crawler = MultiShopCrawler(self._shops)
+            crawler = MultiShopCrawler(
+                self._shops,
+                circuit_breaker=self._circuit_breaker,
+                result_cache=self._result_cache,
+                max_results=self._max_results,
+            )
             
-            # 전체 검색 수행
-            all_results = crawler.search_all(self._keyword)
+            # 상점별로 완료되는 대로 결과 전달
+            completed = 0
+            for shop, outcome, _ in crawler.iter_search(self._keyword):
+                # 취소 확인
+                if self._cancelled:
+                    self.finished_with_results.emit([])
+                    return
+                
+                results = outcome if isinstance(outcome, list) else []
+                all_results.extend(results)
+                completed += 1
+                
+                self.shop_completed.emit(shop.name, results)
+                self.progress.emit(completed, total_shops)
             
             # 취소 확인
             if self._cancelled:
                 self.finished_with_results.emit([])
                 return
             
-            # 완료 진행률
-            self.progress.emit(total_shops, total_shops)
-            
             # 결과 반환
             self.finished_with_results.emit(all_results)
             
@@ -1,13 +1,19 @@
 """데이터 모델 패키지 - Shop, SearchResult, SearchQuery 등"""
 
-from src.models.shop import Shop, ShopSelectors, StockPatterns
+from src.models.shop import ExtractionStrategy, RetryPolicy, Shop, ShopSelectors, StockPatterns
+from src.models.result_batch import ResultBatch, ShopTable, as_result_batch
 from src.models.search import SearchQuery, SearchResult, StockStatus
 
 __all__ = [
+    "ExtractionStrategy",
+    "ResultBatch",
+    "RetryPolicy",
     "Shop",
     "ShopSelectors",
+    "ShopTable",
     "StockPatterns",
     "SearchQuery",
     "SearchResult",
     "StockStatus",
+    "as_result_batch",
 ]
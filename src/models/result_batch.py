@@ -0,0 +1,559 @@
+"""
+ResultBatch - 열 단위 검색 결과 묶음
+
+가격, 상점 번호, 재고 코드를 array/bytearray 열로 보관합니다.
+정렬, 필터, 상점별 최저가, 상위 k개는 열만 사용하므로 SearchResult 객체를 순회하지 않습니다.
+SearchResult 목록으로 만든 묶음은 필요한 열만 처음 쓸 때 만들고,
+객체를 보관하지 않는 묶음은 상품명/가격 문자열/URL을 중복 없는 표로 보관하여
+실제로 꺼내는 행만 SearchResult로 만듭니다 (꺼낸 행은 보관하지 않음).
+상점은 ShopTable 핸들(작은 정수)로, 재고 상태는 StockStatus.code로 보관하므로
+행마다 상점 ID/이름과 재고 상태 객체를 들고 있지 않습니다.
+"""
+
+import heapq
+import operator
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime
+from itertools import compress
+from typing import Any, Optional
+
+from src.models.search import STOCK_STATUS_CODES, STOCK_STATUSES, SearchResult, StockStatus
+
+# null 표시 반전 (1 = 가격 없음 -> 1 = 가격 있음)
+_INVERT = bytes.maketrans(b"\x00\x01", b"\x01\x00")
+
+
+def _intern(values: Iterable, table: list) -> array:
+    """
+    값을 표 번호로 변환 (처음 나온 값은 표에 추가)
+
+    Args:
+        values: 값 목록
+        table: 중복 없는 값 표 (변경됨)
+
+    Returns:
+        번호 배열
+    """
+    index = {value: number for number, value in enumerate(table)}
+    setdefault = index.setdefault
+    numbers = array("I", [setdefault(value, len(index)) for value in values])
+    table.extend(list(index)[len(table):])
+    return numbers
+
+
+class ShopTable:
+    """
+    상점 핸들 표
+
+    상점 ID마다 작은 정수 핸들을 부여하고 (상점 ID, 상점 이름)을 한 번만 보관합니다.
+    핸들은 표의 수명 동안 바뀌거나 재사용되지 않으므로 여러 묶음이 같은 표를 공유할 수 있습니다.
+    """
+
+    def __init__(self, entries: Iterable[tuple[str, str]] = ()):
+        """
+        ShopTable 초기화
+
+        Args:
+            entries: 미리 등록할 (상점 ID, 상점 이름) 목록
+        """
+        self._entries: list[tuple[str, str]] = []
+        self._handles: dict[str, int] = {}
+        for shop_id, shop_name in entries:
+            self.get_handle(shop_id, shop_name)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getitem__(self, handle: int) -> tuple[str, str]:
+        return self._entries[handle]
+
+    def find(self, shop_id: str) -> Optional[int]:
+        """
+        상점 ID의 핸들 조회
+
+        Args:
+            shop_id: 상점 ID
+
+        Returns:
+            핸들 또는 None (등록되지 않은 상점)
+        """
+        return self._handles.get(shop_id)
+
+    def get_handle(self, shop_id: str, shop_name: str) -> int:
+        """
+        상점 ID의 핸들 (처음 나온 상점은 등록)
+
+        Args:
+            shop_id: 상점 ID
+            shop_name: 상점 이름 (등록할 때만 사용)
+
+        Returns:
+            핸들
+        """
+        handle = self._handles.get(shop_id)
+        if handle is None:
+            handle = self._handles[shop_id] = len(self._entries)
+            self._entries.append((shop_id, shop_name))
+        return handle
+
+    def rename(self, shop_id: str, shop_name: str) -> None:
+        """
+        등록된 상점의 이름 변경 (등록되지 않은 상점은 무시)
+
+        Args:
+            shop_id: 상점 ID
+            shop_name: 새 상점 이름
+        """
+        handle = self._handles.get(shop_id)
+        if handle is not None:
+            self._entries[handle] = (shop_id, shop_name)
+
+    def get_handles(self, results: Sequence[SearchResult]) -> array:
+        """
+        검색 결과의 상점 핸들 열 (처음 나온 상점은 등록)
+
+        Args:
+            results: 검색 결과 리스트
+
+        Returns:
+            핸들 배열
+        """
+        shop_ids = [result.shop_id for result in results]
+        for shop_id in dict.fromkeys(shop_ids):
+            if shop_id not in self._handles:
+                self.get_handle(shop_id, results[shop_ids.index(shop_id)].shop_name)
+        return array("I", map(self._handles.__getitem__, shop_ids))
+
+
+class ResultBatch:
+    """
+    열 단위 검색 결과 묶음
+
+    행 i의 가격은 prices[i]이며 price_mask[i]가 1이면 가격이 없습니다 (PriceBatch와 같은 방식).
+    행 i의 상점은 shops[shop_index[i]], 재고 상태는 StockStatus.from_code(stock_codes[i])입니다.
+    take/sort_by_price 등은 행을 고른 새 묶음을 반환하고, 값 표는 원래 묶음과 공유합니다.
+    """
+
+    def __init__(
+        self,
+        length: int,
+        columns: dict[str, Any],
+        shops: Optional[ShopTable] = None,
+        rows: Optional[list[SearchResult]] = None,
+        strings: Optional[list[Optional[str]]] = None,
+        timestamps: Optional[list[datetime]] = None,
+    ):
+        """
+        ResultBatch 초기화 (from_results 사용)
+
+        Args:
+            length: 행 수
+            columns: 열 이름 -> 열 (rows가 있으면 없는 열은 처음 쓸 때 생성)
+            shops: 상점 핸들 표 (없으면 새 표)
+            rows: 행별 SearchResult (None이면 모든 열과 strings/timestamps 표로 생성)
+            strings: 상품명/가격 문자열/URL 표 (None 포함)
+            timestamps: 크롤링 시각 표
+        """
+        self._length = length
+        self._columns = columns
+        self.shops = shops if shops is not None else ShopTable()
+        self.strings = strings
+        self.timestamps = timestamps
+        self._rows = rows
+
+    @classmethod
+    def from_results(
+        cls,
+        results: Sequence[SearchResult],
+        keep_rows: bool = True,
+        shops: Optional[ShopTable] = None,
+    ) -> "ResultBatch":
+        """
+        SearchResult 목록으로 묶음 생성
+
+        keep_rows가 True면 전달한 객체를 보관하므로 row/to_list는 같은 객체를 반환합니다.
+        False면 모든 열을 만들고 상품명/가격 문자열/URL을 중복 없는 표로 옮겨 보관하며,
+        SearchResult는 꺼낼 때마다 다시 만듭니다.
+
+        Args:
+            results: 검색 결과 리스트
+            keep_rows: 전달한 객체 보관 여부
+            shops: 공유할 상점 핸들 표 (예: ShopStore.shop_table, 없으면 묶음마다 새 표)
+
+        Returns:
+            ResultBatch
+        """
+        batch = cls(len(results), {}, shops, rows=list(results))
+        if keep_rows:
+            return batch
+
+        strings: list[Optional[str]] = []
+        timestamps: list[datetime] = []
+        columns = {
+            "prices": batch.prices,
+            "price_mask": batch.price_mask,
+            "shop_index": batch.shop_index,
+            "stock_codes": batch.stock_codes,
+            "name_index": _intern([r.product_name for r in results], strings),
+            "price_text_index": _intern([r.price_text for r in results], strings),
+            "url_index": _intern([r.product_url for r in results], strings),
+            "crawled_at_index": _intern([r.crawled_at for r in results], timestamps),
+        }
+        return cls(len(results), columns, batch.shops, strings=strings, timestamps=timestamps)
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def keeps_rows(self) -> bool:
+        """SearchResult 객체를 보관하는 묶음인지 (False면 열과 값 표만 보관)"""
+        return self._rows is not None
+
+    @property
+    def columns(self) -> dict[str, Any]:
+        """지금까지 만든 열 (열 이름 -> array/bytearray, 수정하지 않아야 함)"""
+        return self._columns
+
+    def compact(self) -> "ResultBatch":
+        """
+        객체를 보관하지 않는 묶음으로 변환 (이미 그런 묶음이면 그대로)
+
+        Returns:
+            ResultBatch (상점 핸들 표 공유)
+        """
+        if self._rows is None:
+            return self
+        return ResultBatch.from_results(self._rows, keep_rows=False, shops=self.shops)
+
+    def __iter__(self) -> Iterator[SearchResult]:
+        return (self.row(index) for index in range(self._length))
+
+    def _build_price_columns(self) -> None:
+        """보관한 객체로 가격 열 생성"""
+        raw_prices = [result.price for result in self._rows]
+        self._columns["prices"] = array("q", [price or 0 for price in raw_prices])
+        self._columns["price_mask"] = bytearray([price is None for price in raw_prices])
+
+    @property
+    def prices(self) -> array:
+        """정수 가격 열 (null 위치는 0)"""
+        if "prices" not in self._columns:
+            self._build_price_columns()
+        return self._columns["prices"]
+
+    @property
+    def price_mask(self) -> bytearray:
+        """가격 null 표시 열 (1 = 가격 없음)"""
+        if "price_mask" not in self._columns:
+            self._build_price_columns()
+        return self._columns["price_mask"]
+
+    @property
+    def shop_index(self) -> array:
+        """상점 핸들 열 (shops 표 번호)"""
+        column = self._columns.get("shop_index")
+        if column is None:
+            column = self._columns["shop_index"] = self.shops.get_handles(self._rows)
+        return column
+
+    @property
+    def stock_codes(self) -> bytearray:
+        """재고 코드 열 (StockStatus.code)"""
+        column = self._columns.get("stock_codes")
+        if column is None:
+            codes = [STOCK_STATUS_CODES[result.stock_status] for result in self._rows]
+            column = self._columns["stock_codes"] = bytearray(codes)
+        return column
+
+    def row(self, index: int) -> SearchResult:
+        """
+        i번째 행의 SearchResult (객체를 보관하지 않은 묶음은 꺼낼 때마다 생성)
+
+        Args:
+            index: 행 위치
+
+        Returns:
+            SearchResult
+        """
+        if self._rows is not None:
+            return self._rows[index]
+
+        columns = self._columns
+        strings = self.strings
+        shop_id, shop_name = self.shops[columns["shop_index"][index]]
+        return SearchResult.from_trusted(
+            shop_id,
+            shop_name,
+            strings[columns["name_index"][index]],
+            self.get_price(index),
+            strings[columns["price_text_index"][index]],
+            STOCK_STATUSES[columns["stock_codes"][index]],
+            strings[columns["url_index"][index]],
+            self.timestamps[columns["crawled_at_index"][index]],
+        )
+
+    def to_list(self) -> list[SearchResult]:
+        """
+        SearchResult 리스트로 변환
+
+        Returns:
+            검색 결과 리스트
+        """
+        if self._rows is not None:
+            return list(self._rows)
+        return list(self)
+
+    def get_price(self, index: int) -> Optional[int]:
+        """
+        i번째 행의 가격
+
+        Args:
+            index: 행 위치
+
+        Returns:
+            가격 또는 None
+        """
+        if self.price_mask[index]:
+            return None
+        return self.prices[index]
+
+    def get_shop_id(self, index: int) -> str:
+        """
+        i번째 행의 상점 ID
+
+        Args:
+            index: 행 위치
+
+        Returns:
+            상점 ID
+        """
+        return self.shops[self.shop_index[index]][0]
+
+    def get_shop_name(self, index: int) -> str:
+        """
+        i번째 행의 상점 이름
+
+        Args:
+            index: 행 위치
+
+        Returns:
+            상점 이름
+        """
+        return self.shops[self.shop_index[index]][1]
+
+    def get_stock_status(self, index: int) -> StockStatus:
+        """
+        i번째 행의 재고 상태
+
+        Args:
+            index: 행 위치
+
+        Returns:
+            재고 상태
+        """
+        return STOCK_STATUSES[self.stock_codes[index]]
+
+    def take(self, indices: Sequence[int]) -> "ResultBatch":
+        """
+        지정한 행만 순서대로 고른 묶음 (만들어진 열만 고름)
+
+        Args:
+            indices: 행 위치 목록
+
+        Returns:
+            ResultBatch (값 표 공유)
+        """
+        if len(indices) > 1:
+            # itemgetter는 여러 위치를 한 번에 꺼냄 (1개 이하면 튜플을 반환하지 않음)
+            pick = operator.itemgetter(*indices)
+        else:
+            def pick(column):
+                return tuple(column[index] for index in indices)
+
+        columns = {
+            name: array(column.typecode, pick(column))
+            if isinstance(column, array)
+            else bytearray(pick(column))
+            for name, column in self._columns.items()
+        }
+        return ResultBatch(
+            len(indices),
+            columns,
+            self.shops,
+            rows=list(pick(self._rows)) if self._rows is not None else None,
+            strings=self.strings,
+            timestamps=self.timestamps,
+        )
+
+    def select(
+        self,
+        stock_statuses: Optional[Iterable[StockStatus]] = None,
+        has_price: bool = False,
+    ) -> bytes:
+        """
+        조건에 맞는 행 표시
+
+        Args:
+            stock_statuses: 허용할 재고 상태 (None이면 모두)
+            has_price: 가격이 있는 행만
+
+        Returns:
+            행마다 1(일치) 또는 0인 바이트열
+        """
+        count = self._length
+        if stock_statuses is None:
+            selected = b"\x01" * count
+        else:
+            table = bytearray(256)
+            for status in stock_statuses:
+                table[STOCK_STATUS_CODES[status]] = 1
+            selected = self.stock_codes.translate(table)
+
+        if has_price:
+            priced = self.price_mask.translate(_INVERT)
+            if stock_statuses is None:
+                selected = priced
+            else:
+                # 바이트마다 0/1이므로 정수 AND가 행별 AND와 같음
+                selected = (
+                    int.from_bytes(selected, "little") & int.from_bytes(priced, "little")
+                ).to_bytes(count, "little")
+        return bytes(selected)
+
+    def filter(
+        self,
+        stock_statuses: Optional[Iterable[StockStatus]] = None,
+        has_price: bool = False,
+    ) -> "ResultBatch":
+        """
+        조건에 맞는 행만 고른 묶음 (순서 유지)
+
+        Args:
+            stock_statuses: 허용할 재고 상태 (None이면 모두)
+            has_price: 가격이 있는 행만
+
+        Returns:
+            ResultBatch
+        """
+        selected = self.select(stock_statuses, has_price)
+        return self.take(list(compress(range(self._length), selected)))
+
+    def argsort_by_price(self) -> list[int]:
+        """
+        가격순 행 위치 (같은 가격은 원래 순서, 가격이 없는 행은 맨 뒤)
+
+        Returns:
+            행 위치 리스트
+        """
+        rows = range(self._length)
+        mask = self.price_mask
+        order = sorted(compress(rows, mask.translate(_INVERT)), key=self.prices.__getitem__)
+        order.extend(compress(rows, mask))
+        return order
+
+    def sort_by_price(self) -> "ResultBatch":
+        """
+        가격순으로 정렬한 묶음
+
+        Returns:
+            ResultBatch
+        """
+        return self.take(self.argsort_by_price())
+
+    def top_k(self, k: int, stock_statuses: Optional[Iterable[StockStatus]] = None) -> "ResultBatch":
+        """
+        가격이 낮은 k개 행 (가격이 있는 행만, 가격순)
+
+        Args:
+            k: 행 수
+            stock_statuses: 허용할 재고 상태 (None이면 모두)
+
+        Returns:
+            ResultBatch
+        """
+        selected = compress(range(self._length), self.select(stock_statuses, has_price=True))
+        return self.take(heapq.nsmallest(k, selected, key=self.prices.__getitem__))
+
+    def find_lowest(self, stock_statuses: Optional[Iterable[StockStatus]] = None) -> int:
+        """
+        최저가 행 위치 (같은 가격이면 먼저 나온 행)
+
+        Args:
+            stock_statuses: 허용할 재고 상태 (None이면 모두)
+
+        Returns:
+            행 위치 또는 -1 (가격이 있는 행이 없는 경우)
+        """
+        selected = compress(range(self._length), self.select(stock_statuses, has_price=True))
+        return min(selected, key=self.prices.__getitem__, default=-1)
+
+    def find_lowest_by_shop(
+        self,
+        stock_statuses: Optional[Iterable[StockStatus]] = None,
+    ) -> dict[str, int]:
+        """
+        상점별 최저가 행 위치 (같은 가격이면 먼저 나온 행)
+
+        Args:
+            stock_statuses: 허용할 재고 상태 (None이면 모두)
+
+        Returns:
+            상점 ID -> 행 위치 (가격이 있는 행이 없는 상점은 제외)
+        """
+        prices = self.prices
+        shop_index = self.shop_index
+        best: dict[int, int] = {}
+        for index in compress(range(self._length), self.select(stock_statuses, has_price=True)):
+            shop = shop_index[index]
+            current = best.get(shop)
+            if current is None or prices[index] < prices[current]:
+                best[shop] = index
+        return {self.shops[shop][0]: index for shop, index in best.items()}
+
+    def limit_per_shop(self, max_per_shop: int) -> "ResultBatch":
+        """
+        상점마다 앞에서부터 max_per_shop개만 남긴 묶음 (순서 유지)
+
+        Args:
+            max_per_shop: 상점당 최대 행 수
+
+        Returns:
+            ResultBatch
+        """
+        shop_index = self.shop_index
+        shop_count = len(self.shops)
+        kept = []
+        if shop_count <= 256:
+            # 상점 번호를 바이트열로 바꾸어 상점마다 앞에서부터 find로 찾음
+            codes = bytes(shop_index.tolist())
+            for shop in range(shop_count):
+                position = -1
+                for _ in range(max_per_shop):
+                    position = codes.find(shop, position + 1)
+                    if position < 0:
+                        break
+                    kept.append(position)
+            kept.sort()
+        else:
+            counts = [0] * shop_count
+            for index, shop in enumerate(shop_index):
+                if counts[shop] < max_per_shop:
+                    counts[shop] += 1
+                    kept.append(index)
+        return self.take(kept)
+
+
+def as_result_batch(results: Sequence[SearchResult] | ResultBatch) -> ResultBatch:
+    """
+    검색 결과를 ResultBatch로 변환 (이미 묶음이면 그대로)
+
+    Args:
+        results: 검색 결과 리스트 또는 ResultBatch
+
+    Returns:
+        ResultBatch
+    """
+    if isinstance(results, ResultBatch):
+        return results
+    return ResultBatch.from_results(results)
@@ -19,6 +19,34 @@ class StockStatus(str, Enum):
     PRE_ORDER = "PRE_ORDER"
     UNKNOWN = "UNKNOWN"
 
+    @property
+    def code(self) -> int:
+        """재고 코드 (열 단위 보관용 1바이트 정수)"""
+        return STOCK_STATUS_CODES[self]
+
+    @classmethod
+    def from_code(cls, code: int) -> "StockStatus":
+        """
+        재고 코드를 재고 상태로 변환
+
+        Args:
+            code: 재고 코드
+
+        Returns:
+            StockStatus
+
+        Raises:
+            IndexError: 알 수 없는 코드
+        """
+        return STOCK_STATUSES[code]
+
+
+# 재고 상태 <-> 재고 코드 (선언 순서, bytearray 열에 저장)
+STOCK_STATUSES: tuple[StockStatus, ...] = tuple(StockStatus)
+STOCK_STATUS_CODES: dict[StockStatus, int] = {
+    status: code for code, status in enumerate(STOCK_STATUSES)
+}
+
 
 class SearchResult(BaseModel):
     """
@@ -62,6 +90,58 @@ class SearchResult(BaseModel):
         description="크롤링 시각",
     )
 
+    @classmethod
+    def from_trusted(
+        cls,
+        shop_id: str,
+        shop_name: str,
+        product_name: str,
+        price: Optional[int],
+        price_text: Optional[str],
+        stock_status: StockStatus,
+        product_url: Optional[str],
+        crawled_at: datetime,
+    ) -> "SearchResult":
+        """
+        검증 없이 SearchResult 생성
+
+        크롤러처럼 필드 제약(빈 상품명 없음, 0 이상 가격, StockStatus 값)을 이미 보장하는
+        코드에서만 사용합니다. 같은 페이지의 상품은 crawled_at을 공유합니다.
+
+        Args:
+            shop_id: 상점 ID
+            shop_name: 상점 이름
+            product_name: 상품명 (비어있지 않음)
+            price: 가격 (0 이상 또는 None)
+            price_text: 원본 가격 문자열
+            stock_status: 재고 상태
+            product_url: 상품 URL
+            crawled_at: 크롤링 시각
+
+        Returns:
+            SearchResult
+        """
+        # model_construct는 기본값 처리 때문에 검증보다도 느리므로 필드를 직접 설정
+        result = cls.__new__(cls)
+        _object_setattr(result, "__dict__", {
+            "shop_id": shop_id,
+            "shop_name": shop_name,
+            "product_name": product_name,
+            "price": price,
+            "price_text": price_text,
+            "stock_status": stock_status,
+            "product_url": product_url,
+            "crawled_at": crawled_at,
+        })
+        _object_setattr(result, "__pydantic_fields_set__", set(_SEARCH_RESULT_FIELDS))
+        _object_setattr(result, "__pydantic_extra__", None)
+        _object_setattr(result, "__pydantic_private__", None)
+        return result
+
+
+_object_setattr = object.__setattr__
+_SEARCH_RESULT_FIELDS = frozenset(SearchResult.model_fields)
+
 
 class SearchQuery(BaseModel):
     """
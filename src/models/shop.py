@@ -4,9 +4,11 @@ Shop 모델 - 크롤링 대상 웹사이트 설정 정보
 상점의 기본 URL, 검색 URL 템플릿, CSS 선택자 등을 정의합니다.
 """
 
+import random
 from datetime import datetime
+from enum import Enum
 from typing import Optional
-from urllib.parse import quote
+from urllib.parse import quote, urlsplit
 from uuid import uuid4
 
 from pydantic import BaseModel, Field, field_validator, model_validator
@@ -44,6 +46,15 @@ class ShopSelectors(BaseModel):
     )
 
 
+class ExtractionStrategy(str, Enum):
+    """상품 정보 추출 방식"""
+
+    # CSS 선택자로 추출
+    SELECTORS = "selectors"
+    # 페이지의 JSON-LD 구조화 데이터로 추출 (없으면 선택자 사용)
+    STRUCTURED_DATA = "structured_data"
+
+
 class StockPatterns(BaseModel):
     """
     재고 상태 판별 패턴
@@ -61,6 +72,83 @@ class StockPatterns(BaseModel):
     )
 
 
+class RetryPolicy(BaseModel):
+    """
+    HTTP 요청 재시도 정책
+
+    일시적인 오류(타임아웃, 연결 오류, 일부 5xx/429 응답)를
+    지수 백오프와 지터로 재시도하기 위한 설정을 정의합니다.
+    """
+
+    max_attempts: int = Field(
+        default=3,
+        ge=1,
+        description="최대 시도 횟수 (1이면 재시도 없음)",
+    )
+    backoff_base: float = Field(
+        default=0.25,
+        ge=0,
+        description="첫 재시도 대기 시간 (초), 이후 시도마다 2배",
+    )
+    backoff_max: float = Field(
+        default=10.0,
+        ge=0,
+        description="재시도 대기 시간 상한 (초)",
+    )
+    jitter: bool = Field(
+        default=True,
+        description="대기 시간 무작위화 여부 (0 ~ 백오프 사이 균등 분포)",
+    )
+    retry_statuses: list[int] = Field(
+        default_factory=lambda: [429, 500, 502, 503, 504],
+        description="재시도할 HTTP 상태 코드",
+    )
+    idempotent_methods: list[str] = Field(
+        default_factory=lambda: ["GET", "HEAD", "OPTIONS"],
+        description="재시도해도 안전한 HTTP 메서드",
+    )
+    respect_retry_after: bool = Field(
+        default=True,
+        description="Retry-After 헤더 준수 여부",
+    )
+    max_retry_after: float = Field(
+        default=30.0,
+        ge=0,
+        description="따를 Retry-After의 최대값 (초, 초과 시 재시도 포기)",
+    )
+
+    def is_retryable_status(self, method: str, status_code: int) -> bool:
+        """
+        상태 코드가 재시도 대상인지 판별
+
+        Args:
+            method: HTTP 메서드
+            status_code: 응답 상태 코드
+
+        Returns:
+            재시도 대상 여부
+        """
+        return (
+            method.upper() in self.idempotent_methods
+            and status_code in self.retry_statuses
+        )
+
+    def get_backoff(self, attempt: int) -> float:
+        """
+        attempt번째 시도 실패 후 대기 시간 계산
+
+        Args:
+            attempt: 실패한 시도 번호 (1부터 시작)
+
+        Returns:
+            대기 시간 (초)
+        """
+        delay = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+
 class Shop(BaseModel):
     """
     상점 설정 모델
@@ -106,6 +194,28 @@ class Shop(BaseModel):
         default=None,
         description="검색 키워드 인코딩 (예: euc-kr). None이면 UTF-8 URL 인코딩 사용",
     )
+    retry_policy: RetryPolicy = Field(
+        default_factory=RetryPolicy,
+        description="HTTP 요청 재시도 정책",
+    )
+    rate_limit: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="호스트별 초당 최대 요청 수 (None이면 제한 없음)",
+    )
+    rate_burst: int = Field(
+        default=1,
+        ge=1,
+        description="속도 제한 시 연속으로 허용되는 최대 요청 수",
+    )
+    partial_parse: bool = Field(
+        default=False,
+        description="상품 컨테이너 주변만 파싱 (상품 선택자가 컨테이너 밖 요소를 참조하지 않을 때)",
+    )
+    extraction_strategy: ExtractionStrategy = Field(
+        default=ExtractionStrategy.SELECTORS,
+        description="상품 정보 추출 방식",
+    )
     created_at: datetime = Field(
         default_factory=datetime.now,
         description="생성 시각",
@@ -148,3 +258,12 @@ class Shop(BaseModel):
             # 기본 UTF-8 URL 인코딩
             encoded_keyword = quote(keyword)
         return self.search_url_template.replace("{keyword}", encoded_keyword)
+
+    def get_search_host(self) -> str:
+        """
+        검색 요청 대상 호스트 이름
+
+        Returns:
+            검색 URL의 호스트 이름 (속도 제한 키로 사용)
+        """
+        return urlsplit(self.search_url_template).hostname or ""
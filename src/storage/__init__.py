@@ -1,5 +1,18 @@
-"""데이터 저장 패키지 - ShopStore (JSON 파일 기반)"""
+"""데이터 저장 패키지 - ShopStore (JSON 파일 기반), 직렬화"""
 
+from src.storage.serialization import (
+    SerializationError,
+    decode_result_batch,
+    dumps_result_batch,
+    encode_result_batch,
+)
 from src.storage.shop_store import ShopStore, ShopStoreError
 
-__all__ = ["ShopStore", "ShopStoreError"]
+__all__ = [
+    "SerializationError",
+    "ShopStore",
+    "ShopStoreError",
+    "decode_result_batch",
+    "dumps_result_batch",
+    "encode_result_batch",
+]
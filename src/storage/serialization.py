@@ -0,0 +1,263 @@
+"""
+직렬화 - JSON 입출력과 검색 결과 묶음의 바이너리 형식
+
+JSON은 설치된 가장 빠른 라이브러리(orjson, msgspec, 표준 json 순)로 bytes를 만들고 읽습니다.
+출력은 라이브러리와 관계없이 ASCII 이스케이프 없는 UTF-8이며, datetime은 ISO 8601 문자열,
+Enum은 값으로 변환합니다.
+
+검색 결과 묶음의 JSON 출력(CLI --json)과 바이너리 형식은 행마다 딕셔너리나 객체를 만들지 않고
+열에서 바로 만듭니다. 바이너리 형식은 열(array/bytearray)을 메모리 그대로 쓰고,
+상점/문자열/시각 표만 JSON 헤더에 담습니다.
+
+    MAGIC(4) | 버전(1) | 헤더 길이(4, little-endian) | 헤더 JSON | 열 바이트...
+"""
+
+import json
+import struct
+import sys
+from array import array
+from datetime import datetime
+from enum import Enum
+from typing import Any, Optional
+
+from src.models.result_batch import ResultBatch, ShopTable
+from src.models.search import STOCK_STATUSES
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson이 없으면 msgspec 또는 표준 json 사용
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - msgspec이 없으면 표준 json 사용
+    msgspec = None
+
+
+# 사용할 JSON 라이브러리 ("orjson", "msgspec", "json")
+JSON_BACKEND = "orjson" if orjson is not None else "msgspec" if msgspec is not None else "json"
+
+# ResultBatch 바이너리 형식
+BATCH_MAGIC = b"PLRB"
+BATCH_VERSION = 1
+_BATCH_HEADER = struct.Struct("<4sBI")
+
+# dumps_result_batch의 행 형식 (dumps(rows, indent=True)와 같은 2칸 들여쓰기)
+_RESULT_ROW_JSON = (
+    b'  {\n'
+    b'    "shop_id": %s,\n'
+    b'    "shop_name": %s,\n'
+    b'    "product_name": %s,\n'
+    b'    "price": %s,\n'
+    b'    "stock_status": %s,\n'
+    b'    "product_url": %s\n'
+    b'  }'
+)
+
+
+class SerializationError(Exception):
+    """직렬화 오류 (잘못된 데이터 또는 지원하지 않는 형식)"""
+
+    pass
+
+
+def _default(value: Any) -> Any:
+    """JSON 기본 타입이 아닌 값 변환 (datetime, Enum)"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"JSON으로 변환할 수 없는 타입: {type(value).__name__}")
+
+
+def dumps(data: Any, indent: bool = False) -> bytes:
+    """
+    값을 JSON bytes로 변환
+
+    Args:
+        data: 딕셔너리/리스트 등 JSON으로 표현할 값
+        indent: 2칸 들여쓰기 여부 (False면 공백 없는 형식)
+
+    Returns:
+        UTF-8 JSON bytes
+
+    Raises:
+        TypeError: JSON으로 변환할 수 없는 값 (orjson은 64비트를 넘는 정수 포함)
+    """
+    if JSON_BACKEND == "orjson":
+        # orjson.JSONEncodeError는 TypeError의 하위 클래스
+        return orjson.dumps(data, default=_default, option=orjson.OPT_INDENT_2 if indent else 0)
+    if JSON_BACKEND == "msgspec":
+        encoded = msgspec.json.encode(data, enc_hook=_default)
+        return msgspec.json.format(encoded, indent=2) if indent else encoded
+
+    if indent:
+        text = json.dumps(data, ensure_ascii=False, indent=2, default=_default)
+    else:
+        text = json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=_default)
+    return text.encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    JSON 읽기
+
+    Args:
+        data: JSON bytes 또는 문자열
+
+    Returns:
+        JSON 값
+
+    Raises:
+        ValueError: 잘못된 JSON
+    """
+    if JSON_BACKEND == "orjson":
+        return orjson.loads(data)
+    if JSON_BACKEND == "msgspec":
+        try:
+            return msgspec.json.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+    return json.loads(data)
+
+
+def dumps_result_batch(batch: ResultBatch) -> bytes:
+    """
+    검색 결과 묶음을 JSON 배열로 변환 (CLI --json 출력)
+
+    행마다 shop_id, shop_name, product_name, price, stock_status, product_url을 가진
+    객체를 2칸 들여쓰기로 출력합니다 (같은 딕셔너리 목록을 dumps(indent=True)한 결과와 같음).
+    SearchResult나 딕셔너리를 만들지 않고, 상점/문자열 표의 값은 한 번씩만 변환한 뒤 열로 조립합니다.
+
+    Args:
+        batch: 검색 결과 묶음 (객체를 보관하는 묶음은 먼저 열 단위로 변환)
+
+    Returns:
+        UTF-8 JSON bytes
+    """
+    batch = batch.compact()
+    if not len(batch):
+        return b"[]"
+
+    columns = batch.columns
+    shops = [
+        (dumps(shop_id), dumps(shop_name))
+        for shop_id, shop_name in (batch.shops[handle] for handle in range(len(batch.shops)))
+    ]
+    strings = [dumps(value) for value in batch.strings]
+    statuses = [dumps(status.value) for status in STOCK_STATUSES]
+    prices = [
+        b"null" if missing else b"%d" % price
+        for price, missing in zip(columns["prices"], columns["price_mask"])
+    ]
+
+    rows = [
+        _RESULT_ROW_JSON % (
+            shops[shop][0],
+            shops[shop][1],
+            strings[name],
+            price,
+            statuses[code],
+            strings[url],
+        )
+        for shop, name, price, code, url in zip(
+            columns["shop_index"],
+            columns["name_index"],
+            prices,
+            columns["stock_codes"],
+            columns["url_index"],
+        )
+    ]
+    return b"[\n" + b",\n".join(rows) + b"\n]"
+
+
+def encode_result_batch(batch: ResultBatch) -> bytes:
+    """
+    ResultBatch를 바이너리 형식으로 변환
+
+    객체를 보관하는 묶음은 먼저 열 단위로 변환합니다 (ResultBatch.compact).
+
+    Args:
+        batch: 검색 결과 묶음
+
+    Returns:
+        바이너리 데이터
+    """
+    batch = batch.compact()
+    columns = []
+    chunks = []
+    for name, column in batch.columns.items():
+        raw = column.tobytes() if isinstance(column, array) else bytes(column)
+        typecode = column.typecode if isinstance(column, array) else ""
+        itemsize = column.itemsize if isinstance(column, array) else 1
+        columns.append([name, typecode, itemsize, len(raw)])
+        chunks.append(raw)
+
+    header = dumps({
+        "length": len(batch),
+        "byteorder": sys.byteorder,
+        "columns": columns,
+        "shops": [list(batch.shops[handle]) for handle in range(len(batch.shops))],
+        "strings": batch.strings,
+        "timestamps": [timestamp.isoformat() for timestamp in batch.timestamps],
+    })
+    return b"".join([_BATCH_HEADER.pack(BATCH_MAGIC, BATCH_VERSION, len(header)), header, *chunks])
+
+
+def decode_result_batch(data: bytes, shops: Optional[ShopTable] = None) -> ResultBatch:
+    """
+    바이너리 형식에서 ResultBatch 읽기
+
+    Args:
+        data: encode_result_batch로 만든 데이터
+        shops: 상점을 등록할 상점 핸들 표 (예: ShopStore.shop_table, 없으면 새 표)
+
+    Returns:
+        객체를 보관하지 않는 ResultBatch
+
+    Raises:
+        SerializationError: 형식이 다르거나 데이터가 잘린 경우
+    """
+    view = memoryview(data)
+    if len(view) < _BATCH_HEADER.size:
+        raise SerializationError("데이터가 너무 짧습니다")
+    magic, version, header_size = _BATCH_HEADER.unpack_from(view)
+    if magic != BATCH_MAGIC:
+        raise SerializationError("ResultBatch 데이터가 아닙니다")
+    if version != BATCH_VERSION:
+        raise SerializationError(f"지원하지 않는 버전: {version}")
+
+    offset = _BATCH_HEADER.size
+    try:
+        header = loads(bytes(view[offset:offset + header_size]))
+    except ValueError as e:
+        raise SerializationError(f"잘못된 헤더: {e}") from e
+    offset += header_size
+
+    length = header["length"]
+    swap = header["byteorder"] != sys.byteorder
+    columns: dict[str, Any] = {}
+    for name, typecode, itemsize, size in header["columns"]:
+        raw = view[offset:offset + size]
+        if len(raw) != size:
+            raise SerializationError(f"열 데이터가 잘렸습니다: {name}")
+        offset += size
+        if not typecode:
+            columns[name] = bytearray(raw)
+            continue
+        column = array(typecode)
+        if column.itemsize != itemsize:
+            raise SerializationError(f"열 타입 크기가 다릅니다: {name}")
+        column.frombytes(raw)
+        if swap:
+            column.byteswap()
+        columns[name] = column
+
+    # 상점 번호를 전달받은 표의 핸들로 바꿈
+    table = shops if shops is not None else ShopTable()
+    handles = [table.get_handle(shop_id, shop_name) for shop_id, shop_name in header["shops"]]
+    if "shop_index" in columns and handles != list(range(len(handles))):
+        columns["shop_index"] = array("I", map(handles.__getitem__, columns["shop_index"]))
+
+    timestamps = list(map(datetime.fromisoformat, header["timestamps"]))
+    return ResultBatch(length, columns, table, strings=header["strings"], timestamps=timestamps)
@@ -2,14 +2,23 @@
 ShopStore - 상점 저장소
 
 상점 설정을 JSON 파일로 저장하고 관리합니다.
+저장은 임시 파일에 쓴 뒤 교체하므로 쓰는 도중 중단되어도 이전 파일이 남습니다.
+검색 결과 묶음이 상점을 작은 정수 핸들로 보관할 수 있도록 상점 핸들 표를 함께 관리합니다.
 """
 
-import json
+import os
+import tempfile
+import threading
+import warnings
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from src.models.result_batch import ShopTable
 from src.models.shop import Shop
+from src.storage import serialization
 
 
 class ShopStoreError(Exception):
@@ -23,15 +32,20 @@ class ShopStore:
     상점 저장소
 
     상점 설정을 JSON 파일로 저장하고 CRUD 기능을 제공합니다.
+    auto_save면 변경마다 저장하고, save_delay를 지정하면 그 시간 동안의 변경을 모아 한 번에 저장합니다.
+    transaction() 안의 변경은 블록이 끝날 때 한 번만 저장합니다.
     """
 
     DEFAULT_CONFIG_DIR = Path.home() / ".plaprice"
     SHOPS_FILENAME = "shops.json"
+    # 읽을 수 없는 파일을 옮겨 두는 이름 (다음 저장이 덮어쓰지 않도록)
+    CORRUPT_SUFFIX = ".corrupt"
 
     def __init__(
         self,
         config_dir: Optional[Path] = None,
         auto_save: bool = True,
+        save_delay: Optional[float] = None,
     ):
         """
         ShopStore 초기화
@@ -39,10 +53,22 @@ class ShopStore:
         Args:
             config_dir: 설정 디렉토리 경로 (없으면 기본 경로 사용)
             auto_save: 변경 시 자동 저장 여부
+            save_delay: 자동 저장을 미루고 변경을 모을 시간 (초, None이면 즉시 저장)
         """
         self.config_dir = config_dir or self.DEFAULT_CONFIG_DIR
         self.auto_save = auto_save
+        self.save_delay = save_delay
         self._shops: dict[str, Shop] = {}
+        # 상점 핸들 표 (삭제한 상점도 남겨 두므로 핸들은 재사용되지 않음)
+        self.shop_table = ShopTable()
+        # 손상되어 옮겨 둔 상점 파일 (없으면 None)
+        self.corrupt_file: Optional[Path] = None
+
+        # 저장하지 않은 변경, 예약된 저장, 중첩된 transaction 수
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
+        self._transaction_depth = 0
 
         # 설정 디렉토리 생성
         self.config_dir.mkdir(parents=True, exist_ok=True)
@@ -56,35 +82,176 @@ class ShopStore:
         return self.config_dir / self.SHOPS_FILENAME
 
     def load(self) -> None:
-        """JSON 파일에서 상점 목록 로드"""
+        """
+        JSON 파일에서 상점 목록 로드
+
+        내용이 손상된 파일은 시각을 붙인 이름으로 옮겨 두고 빈 상태로 시작하며,
+        옮긴 경로는 corrupt_file에 남기고 경고로 알립니다.
+
+        Raises:
+            ShopStoreError: 파일을 읽거나 손상된 파일을 옮길 수 없는 경우 (파일은 그대로 둠)
+        """
         if not self._shops_file.exists():
             self._shops = {}
             return
 
         try:
-            with open(self._shops_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            content = self._shops_file.read_bytes()
+        except OSError as e:
+            raise ShopStoreError(f"상점 파일을 읽을 수 없습니다: {self._shops_file} - {e}") from e
+
+        try:
+            data = serialization.loads(content)
+            if not isinstance(data, dict):
+                raise ValueError("최상위 값이 객체가 아닙니다")
 
             self._shops = {}
             for shop_data in data.get("shops", []):
                 shop = Shop.model_validate(shop_data)
                 self._shops[shop.id] = shop
+                self._register(shop)
 
-        except (json.JSONDecodeError, Exception) as e:
-            # 파일이 손상된 경우 빈 상태로 시작
-            self._shops = {}
+        except ValueError as e:
+            # JSON 오류와 검증 오류(ValidationError)만 손상으로 처리
+            self._quarantine(e)
+
+    def _quarantine(self, error: ValueError) -> None:
+        """
+        손상된 파일을 옮겨 두고 빈 상태로 시작 (다음 저장이 덮어쓰지 않도록)
+
+        Args:
+            error: 파일을 읽지 못한 원인
+
+        Raises:
+            ShopStoreError: 파일을 옮길 수 없는 경우
+        """
+        self._shops = {}
+        self.shop_table = ShopTable()
+
+        # 이전에 옮긴 파일을 덮어쓰지 않도록 시각을 붙임
+        corrupt_file = self._shops_file.with_name(
+            f"{self.SHOPS_FILENAME}{self.CORRUPT_SUFFIX}-{datetime.now():%Y%m%d-%H%M%S-%f}"
+        )
+        try:
+            os.replace(self._shops_file, corrupt_file)
+        except OSError as e:
+            raise ShopStoreError(
+                f"손상된 상점 파일을 옮길 수 없습니다: {self._shops_file} - {e}"
+            ) from e
+
+        self.corrupt_file = corrupt_file
+        warnings.warn(
+            f"상점 파일이 손상되어 {corrupt_file}(으)로 옮기고 빈 목록으로 시작합니다: {error}",
+            stacklevel=3,
+        )
 
     def save(self) -> None:
-        """상점 목록을 JSON 파일로 저장"""
-        data = {
-            "shops": [
-                json.loads(shop.model_dump_json())
-                for shop in self._shops.values()
-            ]
-        }
+        """상점 목록을 JSON 파일로 저장 (예약된 저장은 취소)"""
+        with self._lock:
+            self._cancel_flush()
+            # JSON 문자열을 다시 읽지 않고 JSON 호환 딕셔너리를 바로 직렬화
+            data = {
+                "shops": [
+                    shop.model_dump(mode="json")
+                    for shop in self._shops.values()
+                ]
+            }
+            self._write_atomic(serialization.dumps(data, indent=True))
+            self._dirty = False
+
+    def _write_atomic(self, data: bytes) -> None:
+        """임시 파일에 쓰고 디스크에 기록한 뒤 교체 (중단되어도 이전 파일 유지)"""
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.config_dir, prefix=self.SHOPS_FILENAME, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self._shops_file)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def flush(self) -> None:
+        """저장하지 않은 변경이 있으면 바로 저장"""
+        with self._lock:
+            if self._dirty:
+                self.save()
+
+    def close(self) -> None:
+        """예약된 저장을 마치고 종료 (지연 저장 사용 시 호출)"""
+        with self._lock:
+            self._cancel_flush()
+            self.flush()
+
+    @contextmanager
+    def transaction(self) -> Iterator["ShopStore"]:
+        """
+        여러 변경을 한 번에 저장
+
+        블록 안의 변경은 블록이 끝날 때 한 번만 저장합니다 (auto_save인 경우).
+        예외가 발생하면 블록 안의 변경을 되돌리고 저장하지 않습니다 (기존 상점 객체에 값을 복원).
+        중첩하면 가장 바깥 블록이 끝날 때 저장합니다.
 
-        with open(self._shops_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        Yields:
+            ShopStore
+
+        Example:
+            with store.transaction():
+                for shop_id in shop_ids:
+                    store.set_enabled(shop_id, False)
+        """
+        with self._lock:
+            # 상점 객체는 목록/GUI가 계속 참조하므로 되돌릴 때 같은 객체에 필드 값을 복원
+            snapshot = {
+                shop_id: (shop, shop.model_copy(deep=True))
+                for shop_id, shop in self._shops.items()
+            }
+            dirty = self._dirty
+            self._transaction_depth += 1
+        try:
+            yield self
+        except BaseException:
+            with self._lock:
+                self._transaction_depth -= 1
+                self._shops = {}
+                for shop_id, (shop, saved) in snapshot.items():
+                    for name in type(shop).model_fields:
+                        setattr(shop, name, getattr(saved, name))
+                    self._shops[shop_id] = shop
+                    self._register(shop)
+                self._dirty = dirty
+            raise
+        with self._lock:
+            self._transaction_depth -= 1
+            if not self._transaction_depth and self._dirty and self.auto_save:
+                self.save()
+
+    def _changed(self) -> None:
+        """변경 표시 후 저장 (transaction 중이면 블록이 끝날 때, save_delay면 모아서)"""
+        with self._lock:
+            self._dirty = True
+            if self._transaction_depth or not self.auto_save:
+                return
+            if not self.save_delay:
+                self.save()
+            elif self._flush_timer is None:
+                # 처음 변경 후 save_delay가 지나면 그 사이의 변경을 함께 저장
+                # 종료를 막지 않도록 데몬 스레드로 실행 (남은 변경은 close에서 저장)
+                self._flush_timer = threading.Timer(self.save_delay, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def _cancel_flush(self) -> None:
+        """예약된 저장 취소"""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
 
     def add(self, shop: Shop) -> None:
         """
@@ -96,13 +263,13 @@ class ShopStore:
         Raises:
             ShopStoreError: 동일 ID가 이미 존재하는 경우
         """
-        if shop.id in self._shops:
-            raise ShopStoreError(f"이미 존재하는 상점 ID: {shop.id}")
+        with self._lock:
+            if shop.id in self._shops:
+                raise ShopStoreError(f"이미 존재하는 상점 ID: {shop.id}")
 
-        self._shops[shop.id] = shop
-
-        if self.auto_save:
-            self.save()
+            self._shops[shop.id] = shop
+            self._register(shop)
+            self._changed()
 
     def get(self, shop_id: str) -> Optional[Shop]:
         """
@@ -126,13 +293,12 @@ class ShopStore:
         Returns:
             삭제 성공 여부
         """
-        if shop_id not in self._shops:
-            return False
-
-        del self._shops[shop_id]
+        with self._lock:
+            if shop_id not in self._shops:
+                return False
 
-        if self.auto_save:
-            self.save()
+            del self._shops[shop_id]
+            self._changed()
 
         return True
 
@@ -143,14 +309,51 @@ class ShopStore:
         Args:
             shop: 업데이트할 상점
         """
-        if shop.id not in self._shops:
-            raise ShopStoreError(f"존재하지 않는 상점 ID: {shop.id}")
+        with self._lock:
+            if shop.id not in self._shops:
+                raise ShopStoreError(f"존재하지 않는 상점 ID: {shop.id}")
+
+            shop.updated_at = datetime.now()
+            self._shops[shop.id] = shop
+            self.shop_table.rename(shop.id, shop.name)
+            self._changed()
+
+    def _register(self, shop: Shop) -> None:
+        """상점 핸들 표에 등록 (이미 있으면 이름만 갱신)"""
+        self.shop_table.get_handle(shop.id, shop.name)
+        self.shop_table.rename(shop.id, shop.name)
+
+    def get_handle(self, shop_id: str) -> int:
+        """
+        상점 ID의 핸들 (검색 결과 묶음의 상점 번호)
+
+        Args:
+            shop_id: 상점 ID
+
+        Returns:
+            핸들
+
+        Raises:
+            ShopStoreError: 존재하지 않는 상점 ID
+        """
+        if shop_id not in self._shops:
+            raise ShopStoreError(f"존재하지 않는 상점 ID: {shop_id}")
+        return self.shop_table.find(shop_id)
+
+    def resolve_handle(self, handle: int) -> Optional[Shop]:
+        """
+        핸들로 상점 조회
 
-        shop.updated_at = datetime.now()
-        self._shops[shop.id] = shop
+        Args:
+            handle: 상점 핸들
 
-        if self.auto_save:
-            self.save()
+        Returns:
+            Shop 또는 None (알 수 없는 핸들 또는 삭제된 상점)
+        """
+        if not 0 <= handle < len(self.shop_table):
+            return None
+        shop_id, _ = self.shop_table[handle]
+        return self._shops.get(shop_id)
 
     def list_all(self) -> list[Shop]:
         """
@@ -181,14 +384,13 @@ class ShopStore:
         Returns:
             성공 여부
         """
-        shop = self.get(shop_id)
-        if not shop:
-            return False
-
-        shop.enabled = enabled
-        shop.updated_at = datetime.now()
-
-        if self.auto_save:
-            self.save()
+        with self._lock:
+            shop = self.get(shop_id)
+            if not shop:
+                return False
+
+            shop.enabled = enabled
+            shop.updated_at = datetime.now()
+            self._changed()
 
         return True
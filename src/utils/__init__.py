@@ -1,5 +1,24 @@
 """공통 유틸리티 패키지 - HTTP 클라이언트 등"""
 
-from src.utils.http_client import HttpClient, HttpClientError
+from src.utils.async_http_client import AsyncHttpClient
+from src.utils.http_cache import CacheEntry, HttpCache
+from src.utils.http_client import (
+    HtmlPage,
+    HtmlStream,
+    HttpClient,
+    HttpClientError,
+    RateLimiter,
+    RateLimitStats,
+)
 
-__all__ = ["HttpClient", "HttpClientError"]
+__all__ = [
+    "AsyncHttpClient",
+    "CacheEntry",
+    "HtmlPage",
+    "HtmlStream",
+    "HttpCache",
+    "HttpClient",
+    "HttpClientError",
+    "RateLimiter",
+    "RateLimitStats",
+]
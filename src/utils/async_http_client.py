@@ -0,0 +1,204 @@
+"""
+AsyncHttpClient - httpx 기반 비동기 HTTP 클라이언트
+
+하나의 이벤트 루프에서 다수의 요청을 스레드 없이 동시에 처리합니다.
+httpx가 설치되어 있어야 합니다 (pip install plaprice[async]).
+"""
+
+import asyncio
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Optional
+from urllib.parse import urlsplit
+
+from src.models.shop import RetryPolicy
+from src.utils.charset import normalize_encoding, sniff_encoding
+from src.utils.http_client import (
+    HtmlPage,
+    HttpClient,
+    HttpClientError,
+    RateLimiter,
+    default_rate_limiter,
+    get_attempt_timeout,
+    get_retry_delay,
+    parse_retry_after,
+)
+
+if TYPE_CHECKING:
+    import httpx
+
+
+class AsyncHttpClient:
+    """
+    비동기 HTTP 클라이언트
+
+    HttpClient와 같은 헤더/오류 규칙을 따르는 비동기 GET 클라이언트입니다.
+    연결 풀은 클라이언트 인스턴스 단위로 유지되므로 여러 검색에 재사용하는 것이 좋습니다.
+    """
+
+    DEFAULT_TIMEOUT = HttpClient.DEFAULT_TIMEOUT
+    # 동시에 열 수 있는 최대 연결 수 (전체 호스트 합계)
+    DEFAULT_MAX_CONNECTIONS = 100
+
+    def __init__(
+        self,
+        timeout: int = DEFAULT_TIMEOUT,
+        verify_ssl: bool = True,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        transport: Optional[Any] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ):
+        """
+        비동기 HTTP 클라이언트 초기화
+
+        Args:
+            timeout: 요청 타임아웃 (초)
+            verify_ssl: SSL 인증서 검증 여부 (기본: True)
+            max_connections: 최대 동시 연결 수
+            transport: httpx 전송 계층 (테스트용 MockTransport 등)
+            rate_limiter: 호스트별 속도 제한기 (없으면 동기 클라이언트와 같은 공용 제한기)
+            retry_policy: 기본 재시도 정책 (없으면 RetryPolicy 기본값)
+
+        Raises:
+            ImportError: httpx가 설치되지 않은 경우
+        """
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError(
+                "비동기 크롤링에는 httpx가 필요합니다: pip install httpx"
+            ) from e
+
+        self.timeout = timeout
+        self.verify_ssl = verify_ssl
+        self.rate_limiter = rate_limiter or default_rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy()
+        self._httpx = httpx
+        self._client = httpx.AsyncClient(
+            headers=HttpClient.DEFAULT_HEADERS,
+            timeout=timeout,
+            verify=verify_ssl,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            transport=transport,
+        )
+
+    async def __aenter__(self) -> "AsyncHttpClient":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """연결 풀 닫기"""
+        await self._client.aclose()
+
+    async def get(
+        self,
+        url: str,
+        headers: Optional[dict[str, str]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        deadline: Optional[float] = None,
+    ) -> "httpx.Response":
+        """
+        비동기 GET 요청 수행
+
+        재시도 규칙은 HttpClient.get과 같습니다.
+
+        Args:
+            url: 요청 URL
+            headers: 추가 헤더
+            retry_policy: 재시도 정책 (없으면 클라이언트 기본 정책)
+            deadline: 전체 검색 마감 시각 (time.monotonic 기준, 없으면 제한 없음)
+
+        Returns:
+            응답 객체
+
+        Raises:
+            HttpClientError: 요청 실패 시 (재시도 소진 포함)
+        """
+        httpx = self._httpx
+        policy = retry_policy or self.retry_policy
+        host = urlsplit(url).hostname or ""
+
+        attempt = 0
+        while True:
+            attempt += 1
+            timeout = get_attempt_timeout(self.timeout, url, deadline)
+
+            # 호스트별 속도 제한 차례 대기
+            await self.rate_limiter.acquire_async(host)
+
+            retry_after = None
+            try:
+                response = await self._client.get(url, headers=headers, timeout=timeout)
+                response.raise_for_status()
+                return response
+
+            except httpx.TimeoutException as e:
+                cause = e
+                error = HttpClientError(f"요청 타임아웃: {url} - {e}")
+
+            except httpx.NetworkError as e:
+                cause = e
+                error = HttpClientError(f"연결 오류: {url} - {e}")
+
+            except httpx.HTTPStatusError as e:
+                status_code = e.response.status_code
+                error = HttpClientError(f"HTTP 오류 {status_code}: {url}")
+                if not policy.is_retryable_status("GET", status_code):
+                    raise error from e
+                cause = e
+                retry_after = parse_retry_after(e.response.headers.get("Retry-After"))
+
+            except httpx.HTTPError as e:
+                raise HttpClientError(f"요청 실패: {url} - {e}") from e
+
+            delay = get_retry_delay(policy, attempt, retry_after, deadline)
+            if delay is None:
+                raise error from cause
+            await asyncio.sleep(delay)
+
+    async def get_html(
+        self,
+        url: str,
+        headers: Optional[dict[str, str]] = None,
+        encoding: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        deadline: Optional[float] = None,
+    ) -> str:
+        """
+        HTML 컨텐츠 비동기로 가져오기
+
+        인코딩을 지정하지 않으면 동기 클라이언트와 같이 Content-Type 헤더와
+        <meta charset> 선언으로 판별하고, 선언이 없으면 본문으로 추정합니다.
+
+        Args:
+            url: 요청 URL
+            headers: 추가 헤더
+            encoding: 응답 인코딩 (예: 'euc-kr')
+            retry_policy: 재시도 정책 (없으면 클라이언트 기본 정책)
+            deadline: 전체 검색 마감 시각 (time.monotonic 기준)
+
+        Returns:
+            HTML 문자열
+
+        Raises:
+            HttpClientError: 요청 실패 시
+        """
+        response = await self.get(url, headers, retry_policy=retry_policy, deadline=deadline)
+        content = response.content
+        page = HtmlPage(
+            content=content,
+            encoding=normalize_encoding(encoding)
+            or sniff_encoding(content, response.headers.get("Content-Type")),
+        )
+        return page.text
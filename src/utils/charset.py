@@ -0,0 +1,121 @@
+"""
+문자 인코딩 판별
+
+응답 전체를 분석하는 인코딩 추정 대신 BOM, Content-Type 헤더,
+문서 앞부분의 <meta charset> 선언만 확인하여 인코딩을 결정합니다.
+"""
+
+import codecs
+import re
+from typing import Optional
+
+
+# <meta charset>를 찾을 문서 앞부분 크기 (바이트)
+SNIFF_SIZE = 4096
+
+# EUC-KR로 선언된 페이지도 확장 완성형 글자를 포함하므로 CP949로 디코딩
+# (WHATWG Encoding 표준의 euc-kr 레이블과 같음)
+KOREAN_ENCODING_LABELS = frozenset({
+    "euc-kr",
+    "euc_kr",
+    "euckr",
+    "cp949",
+    "ms949",
+    "uhc",
+    "windows-949",
+    "x-windows-949",
+    "ks_c_5601-1987",
+    "ks_c_5601",
+    "ksc5601",
+    "ksc_5601",
+    "korean",
+    "csksc56011987",
+})
+
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+_HEADER_CHARSET_PATTERN = re.compile(r"""charset\s*=\s*["']?([^\s;"']+)""", re.IGNORECASE)
+# <meta charset="..."> 와 <meta http-equiv="Content-Type" content="...; charset=...">
+_META_CHARSET_PATTERN = re.compile(
+    rb"""<meta\s[^>]*?charset\s*=\s*["']?\s*([a-zA-Z0-9_.:-]+)""",
+    re.IGNORECASE,
+)
+
+
+def normalize_encoding(label: Optional[str]) -> Optional[str]:
+    """
+    인코딩 이름을 Python 코덱 이름으로 변환
+
+    Args:
+        label: 인코딩 이름 (예: 'EUC-KR', 'utf8')
+
+    Returns:
+        코덱 이름 (예: 'cp949', 'utf-8') 또는 None (알 수 없는 인코딩)
+    """
+    if not label:
+        return None
+
+    label = label.strip().lower()
+    if label in KOREAN_ENCODING_LABELS:
+        return "cp949"
+
+    try:
+        return codecs.lookup(label).name
+    except LookupError:
+        return None
+
+
+def sniff_encoding(content: bytes, content_type: Optional[str] = None) -> Optional[str]:
+    """
+    BOM, Content-Type 헤더, <meta charset> 순서로 본문 인코딩 판별
+
+    Args:
+        content: 응답 본문 (앞부분만 있어도 됨)
+        content_type: Content-Type 헤더 값
+
+    Returns:
+        코덱 이름 또는 None (선언이 없는 경우)
+    """
+    for bom, encoding in _BOMS:
+        if content.startswith(bom):
+            return encoding
+
+    if content_type:
+        match = _HEADER_CHARSET_PATTERN.search(content_type)
+        if match:
+            encoding = normalize_encoding(match.group(1))
+            if encoding:
+                return encoding
+
+    match = _META_CHARSET_PATTERN.search(content, 0, SNIFF_SIZE)
+    if match:
+        encoding = normalize_encoding(match.group(1).decode("ascii"))
+        # 바이트로 전달된 문서의 UTF-16 선언은 잘못된 것이므로 UTF-8로 처리
+        if encoding and encoding.startswith("utf-16"):
+            return "utf-8"
+        return encoding
+
+    return None
+
+
+def is_utf8_prefix(content: bytes) -> bool:
+    """
+    본문 앞부분이 올바른 UTF-8인지 확인
+
+    조각 끝에서 잘린 글자는 다음 조각에 이어지므로 허용합니다.
+
+    Args:
+        content: 본문 앞부분
+
+    Returns:
+        UTF-8로 디코딩할 수 있으면 True (ASCII만 있는 경우 포함)
+    """
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(content, final=False)
+    except UnicodeDecodeError:
+        return False
+    return True
@@ -0,0 +1,333 @@
+"""
+HttpCache - 디스크 HTTP 응답 캐시
+
+검색 페이지 응답 본문과 검증자(ETag/Last-Modified)를 디스크에 저장하고,
+재요청 시 조건부 요청(If-None-Match/If-Modified-Since)으로 재검증합니다.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+
+@dataclass
+class CacheEntry:
+    """캐시된 응답"""
+
+    url: str
+    body: bytes
+    encoding: Optional[str]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+    digest: str  # 본문 sha256 (본문이 같으면 파싱 결과도 같음)
+
+    def get_validators(self) -> dict[str, str]:
+        """
+        조건부 요청 헤더 생성
+
+        Returns:
+            If-None-Match / If-Modified-Since 헤더
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def decode(self, encoding: Optional[str] = None) -> str:
+        """
+        본문을 문자열로 변환 (requests의 Response.text와 같은 방식)
+
+        Args:
+            encoding: 강제 인코딩 (없으면 저장된 인코딩)
+
+        Returns:
+            본문 문자열
+        """
+        try:
+            return str(self.body, encoding or self.encoding or "utf-8", errors="replace")
+        except LookupError:
+            return str(self.body, "utf-8", errors="replace")
+
+
+class HttpCache:
+    """
+    디스크 HTTP 응답 캐시
+
+    URL의 sha256을 키로 본문(.body)과 메타데이터(.json)를 저장합니다.
+    두 파일은 따로 교체되므로, 읽을 때 본문 해시가 메타데이터의 digest와 다르면
+    (저장 도중 읽은 경우) 없는 항목으로 처리합니다.
+    TTL 안의 응답은 요청 없이 사용하고, 지난 응답은 조건부 요청으로 재검증합니다.
+    전체 크기가 max_size를 넘으면 가장 오래 사용하지 않은 항목부터 삭제합니다.
+    """
+
+    DIRNAME = "cache"
+    # 요청 없이 캐시를 사용하는 기간 (초)
+    DEFAULT_TTL = 300.0
+    # 캐시 디렉토리 최대 크기 (바이트)
+    DEFAULT_MAX_SIZE = 50 * 1024 * 1024
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        ttl: float = DEFAULT_TTL,
+        max_size: int = DEFAULT_MAX_SIZE,
+        refresh: bool = False,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        HttpCache 초기화
+
+        Args:
+            cache_dir: 캐시 디렉토리 경로
+            ttl: 요청 없이 캐시를 사용하는 기간 (초)
+            max_size: 캐시 디렉토리 최대 크기 (바이트)
+            refresh: True면 TTL과 무관하게 항상 서버에 재검증
+            clock: 현재 시각 함수
+        """
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_size = max_size
+        self.refresh = refresh
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_key(url: str) -> str:
+        """
+        URL의 캐시 키 생성
+
+        Args:
+            url: 요청 URL
+
+        Returns:
+            sha256 16진 문자열
+        """
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """
+        요청 없이 사용할 수 있는 응답인지 확인
+
+        Args:
+            entry: 캐시 항목
+
+        Returns:
+            TTL 이내이고 강제 재검증 모드가 아니면 True
+        """
+        if self.refresh:
+            return False
+        return self._clock() - entry.stored_at < self.ttl
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """
+        캐시된 응답 조회 (조회한 항목은 최근 사용으로 갱신)
+
+        Args:
+            url: 요청 URL
+
+        Returns:
+            CacheEntry 또는 None (없거나 손상된 경우, 저장 중이라 본문과 메타데이터가 다른 경우)
+        """
+        body_path, meta_path = self._get_paths(url)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            body = body_path.read_bytes()
+            entry = CacheEntry(
+                url=meta["url"],
+                body=body,
+                encoding=meta.get("encoding"),
+                etag=meta.get("etag"),
+                last_modified=meta.get("last_modified"),
+                stored_at=float(meta["stored_at"]),
+                digest=meta["digest"],
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        # 해시 충돌이나 다른 URL의 항목이면 무시
+        if entry.url != url:
+            return None
+
+        # 다른 put이 본문만 교체한 시점에 읽으면 새 본문과 이전 digest가 짝지어지므로
+        # 본문 해시로 확인 (digest로 파싱 결과를 재사용하므로 다른 페이지의 결과를 막음)
+        if hashlib.sha256(body).hexdigest() != entry.digest:
+            return None
+
+        # LRU: 본문 파일의 수정 시각을 마지막 사용 시각으로 사용
+        try:
+            os.utime(body_path)
+        except OSError:
+            pass
+
+        return entry
+
+    def put(
+        self,
+        url: str,
+        body: bytes,
+        encoding: Optional[str] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> CacheEntry:
+        """
+        응답 저장
+
+        Args:
+            url: 요청 URL
+            body: 응답 본문
+            encoding: 응답 인코딩
+            etag: ETag 헤더 값
+            last_modified: Last-Modified 헤더 값
+
+        Returns:
+            저장된 CacheEntry (저장 실패 시에도 반환)
+        """
+        entry = CacheEntry(
+            url=url,
+            body=body,
+            encoding=encoding,
+            etag=etag,
+            last_modified=last_modified,
+            stored_at=self._clock(),
+            digest=hashlib.sha256(body).hexdigest(),
+        )
+
+        body_path, meta_path = self._get_paths(url)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._write_atomic(body_path, body)
+            self._write_meta(meta_path, entry)
+        except OSError:
+            # 캐시 저장 실패는 요청 결과에 영향을 주지 않음
+            return entry
+
+        self._evict()
+        return entry
+
+    def revalidate(self, entry: CacheEntry) -> CacheEntry:
+        """
+        304 응답으로 확인된 항목의 저장 시각 갱신
+
+        Args:
+            entry: 재검증된 캐시 항목
+
+        Returns:
+            저장 시각이 갱신된 CacheEntry
+        """
+        entry.stored_at = self._clock()
+        _, meta_path = self._get_paths(entry.url)
+        try:
+            self._write_meta(meta_path, entry)
+        except OSError:
+            pass
+        return entry
+
+    def clear(self) -> None:
+        """캐시 전체 삭제"""
+        with self._lock:
+            for path in self._iter_files():
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def get_size(self) -> int:
+        """
+        캐시 디렉토리 전체 크기
+
+        Returns:
+            바이트 수
+        """
+        total = 0
+        for path in self._iter_files():
+            try:
+                total += path.stat().st_size
+            except OSError:
+                pass
+        return total
+
+    def _get_paths(self, url: str) -> tuple[Path, Path]:
+        """URL의 (본문 경로, 메타데이터 경로)"""
+        key = self.get_key(url)
+        return self.cache_dir / f"{key}.body", self.cache_dir / f"{key}.json"
+
+    def _iter_files(self) -> list[Path]:
+        """캐시 파일 목록"""
+        if not self.cache_dir.exists():
+            return []
+        return [
+            path
+            for path in self.cache_dir.iterdir()
+            if path.suffix in (".body", ".json")
+        ]
+
+    def _write_meta(self, meta_path: Path, entry: CacheEntry) -> None:
+        """메타데이터 파일 저장"""
+        meta = {
+            "url": entry.url,
+            "encoding": entry.encoding,
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+            "stored_at": entry.stored_at,
+            "digest": entry.digest,
+        }
+        self._write_atomic(
+            meta_path,
+            json.dumps(meta, ensure_ascii=False).encode("utf-8"),
+        )
+
+    def _write_atomic(self, path: Path, data: bytes) -> None:
+        """임시 파일에 쓴 뒤 교체 (동시 읽기 중에도 반쯤 쓴 파일이 보이지 않음)"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def _evict(self) -> None:
+        """최대 크기를 넘으면 가장 오래 사용하지 않은 항목부터 삭제"""
+        with self._lock:
+            entries = []
+            total = 0
+            for body_path in self.cache_dir.glob("*.body"):
+                meta_path = body_path.with_suffix(".json")
+                try:
+                    body_stat = body_path.stat()
+                    size = body_stat.st_size
+                    if meta_path.exists():
+                        size += meta_path.stat().st_size
+                except OSError:
+                    continue
+                entries.append((body_stat.st_mtime, size, body_path, meta_path))
+                total += size
+
+            if total <= self.max_size:
+                return
+
+            entries.sort(key=lambda item: item[0])
+            for _, size, body_path, meta_path in entries:
+                if total <= self.max_size:
+                    break
+                for path in (meta_path, body_path):
+                    try:
+                        path.unlink()
+                    except OSError:
+                        pass
+                total -= size
@@ -4,12 +4,28 @@ HTTP 클라이언트 - requests 기반 HTTP 요청 처리
 크롤링을 위한 HTTP 요청을 담당합니다.
 """
 
+import asyncio
+import hashlib
+import threading
+import time
 import warnings
-from typing import Optional
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import cached_property
+from typing import ClassVar, Optional
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
+from requests.compat import chardet
 from requests.exceptions import ConnectionError, HTTPError, Timeout
 
+from src.models.shop import RetryPolicy
+from src.utils.charset import is_utf8_prefix, normalize_encoding, sniff_encoding
+from src.utils.http_cache import CacheEntry, HttpCache
+
 
 class HttpClientError(Exception):
     """HTTP 클라이언트 오류"""
@@ -17,86 +33,521 @@ class HttpClientError(Exception):
     pass
 
 
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Retry-After 헤더 값을 대기 시간(초)으로 변환
+
+    Args:
+        value: 헤더 값 (초 단위 정수 또는 HTTP 날짜)
+
+    Returns:
+        대기 시간 (초) 또는 None (해석 불가 시)
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def get_retry_delay(
+    policy: RetryPolicy,
+    attempt: int,
+    retry_after: Optional[float] = None,
+    deadline: Optional[float] = None,
+) -> Optional[float]:
+    """
+    재시도 전 대기 시간 계산
+
+    Args:
+        policy: 재시도 정책
+        attempt: 실패한 시도 번호 (1부터 시작)
+        retry_after: 서버가 지정한 Retry-After (초)
+        deadline: 전체 검색 마감 시각 (time.monotonic 기준)
+
+    Returns:
+        대기 시간 (초) 또는 None (재시도하지 않아야 하는 경우)
+    """
+    if attempt >= policy.max_attempts:
+        return None
+
+    delay = policy.get_backoff(attempt)
+    if retry_after is not None and policy.respect_retry_after:
+        if retry_after > policy.max_retry_after:
+            return None
+        delay = max(delay, retry_after)
+
+    # 대기 후 마감 시각을 넘기면 재시도 의미 없음
+    if deadline is not None and time.monotonic() + delay >= deadline:
+        return None
+
+    return delay
+
+
+def get_attempt_timeout(
+    timeout: float,
+    url: str,
+    deadline: Optional[float] = None,
+) -> float:
+    """
+    마감 시각을 고려한 이번 시도의 타임아웃 계산
+
+    Args:
+        timeout: 클라이언트 기본 타임아웃 (초)
+        url: 요청 URL (오류 메시지용)
+        deadline: 전체 검색 마감 시각 (time.monotonic 기준)
+
+    Returns:
+        이번 시도의 타임아웃 (초)
+
+    Raises:
+        HttpClientError: 이미 마감 시각이 지난 경우
+    """
+    if deadline is None:
+        return timeout
+
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise HttpClientError(f"검색 제한 시간 초과: {url}")
+    return min(timeout, remaining)
+
+
+@dataclass
+class RateLimitStats:
+    """호스트별 속도 제한 대기 통계"""
+
+    requests: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+
+@dataclass
+class HtmlPage:
+    """HTML 응답"""
+
+    content: bytes
+    # 본문 인코딩 (지정값, Content-Type 또는 <meta charset>, 선언이 없으면 None)
+    encoding: Optional[str] = None
+    # 본문 sha256 (캐시를 사용할 때만 계산, 없으면 크롤러가 계산)
+    digest: Optional[str] = None
+    # 캐시된 본문 사용 여부 (TTL 이내 또는 304 재검증)
+    from_cache: bool = False
+
+    @cached_property
+    def text(self) -> str:
+        """본문 문자열 (인코딩 선언이 없으면 본문으로 추정)"""
+        encoding = self.encoding or normalize_encoding(chardet.detect(self.content)["encoding"])
+        return str(self.content, encoding or "utf-8", errors="replace")
+
+
+@dataclass
+class HtmlStream:
+    """
+    조각 단위로 받는 HTML 응답
+
+    chunks는 디코딩하지 않은 본문 바이트이며, 파서가 encoding으로 직접 디코딩합니다.
+    chunks를 끝까지 읽거나 close를 호출하면 연결이 정리됩니다.
+    """
+
+    chunks: Iterator[bytes]
+    # 본문 인코딩 (지정값, 선언, 첫 조각 순으로 판별)
+    encoding: Optional[str] = None
+    # 본문 sha256 (캐시된 본문은 처음부터, 네트워크 응답은 끝까지 받은 뒤 설정)
+    digest: Optional[str] = None
+    # 캐시된 본문 사용 여부 (TTL 이내 또는 304 재검증)
+    from_cache: bool = False
+
+    def close(self) -> None:
+        """남은 본문을 받지 않고 응답 닫기"""
+        close = getattr(self.chunks, "close", None)
+        if close is not None:
+            close()
+
+
+class _TokenBucket:
+    """토큰 버킷 (잠금은 RateLimiter가 담당)"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def reserve(self, now: float) -> float:
+        """
+        토큰 1개 예약 후 대기해야 할 시간 반환
+
+        토큰이 부족하면 음수로 빌려 쓰므로 대기 순서대로 차례가 돌아옵니다.
+        """
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+
+class RateLimiter:
+    """
+    호스트별 토큰 버킷 속도 제한기
+
+    스레드와 asyncio 태스크가 같은 인스턴스를 공유할 수 있으며,
+    제한이 설정되지 않은 호스트는 대기 없이 통과합니다.
+    """
+
+    def __init__(self):
+        """RateLimiter 초기화"""
+        self._lock = threading.Lock()
+        self._buckets: dict[str, _TokenBucket] = {}
+        self._stats: dict[str, RateLimitStats] = {}
+
+    def configure(self, host: str, rate: Optional[float], burst: int = 1) -> None:
+        """
+        호스트의 속도 제한 설정
+
+        설정이 같으면 현재 버킷 상태를 유지합니다.
+
+        Args:
+            host: 호스트 이름
+            rate: 초당 요청 수 (None이면 제한 해제)
+            burst: 연속으로 허용되는 최대 요청 수
+        """
+        with self._lock:
+            if rate is None:
+                self._buckets.pop(host, None)
+                return
+
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                self._buckets[host] = _TokenBucket(rate, burst)
+            elif bucket.rate != rate or bucket.burst != burst:
+                bucket.rate = rate
+                bucket.burst = burst
+                bucket.tokens = min(bucket.tokens, float(burst))
+
+    def reserve(self, host: str) -> float:
+        """
+        요청 1회분을 예약하고 대기 시간 반환 (대기는 호출자가 수행)
+
+        Args:
+            host: 호스트 이름
+
+        Returns:
+            대기해야 할 시간 (초)
+        """
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                return 0.0
+
+            delay = bucket.reserve(time.monotonic())
+
+            stats = self._stats.setdefault(host, RateLimitStats())
+            stats.requests += 1
+            stats.total_wait += delay
+            stats.max_wait = max(stats.max_wait, delay)
+            return delay
+
+    def acquire(self, host: str) -> float:
+        """
+        차례가 올 때까지 현재 스레드에서 대기
+
+        Args:
+            host: 호스트 이름
+
+        Returns:
+            대기한 시간 (초)
+        """
+        delay = self.reserve(host)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self, host: str) -> float:
+        """
+        차례가 올 때까지 이벤트 루프를 막지 않고 대기
+
+        Args:
+            host: 호스트 이름
+
+        Returns:
+            대기한 시간 (초)
+        """
+        delay = self.reserve(host)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def get_stats(self, host: str) -> RateLimitStats:
+        """
+        호스트의 대기 통계 조회
+
+        Args:
+            host: 호스트 이름
+
+        Returns:
+            RateLimitStats 사본
+        """
+        with self._lock:
+            stats = self._stats.get(host, RateLimitStats())
+            return RateLimitStats(stats.requests, stats.total_wait, stats.max_wait)
+
+
+# 프로세스 공용 속도 제한기 (동기/비동기 클라이언트 공유)
+default_rate_limiter = RateLimiter()
+
+
 class HttpClient:
     """
     HTTP 클라이언트
 
     크롤링을 위한 HTTP GET 요청을 수행합니다.
+    연결은 호스트별 커넥션 풀에 유지되어 keep-alive로 재사용됩니다.
     """
 
     DEFAULT_TIMEOUT = 30
+    # 스트리밍 응답을 읽는 단위 (바이트)
+    DEFAULT_CHUNK_SIZE = 16 * 1024
+    # 호스트별 풀 개수 (상점 수 이상이면 풀이 교체되지 않음)
+    DEFAULT_POOL_CONNECTIONS = 32
+    # 호스트당 최대 연결 수 (동시 요청 수 이상 권장)
+    DEFAULT_POOL_MAXSIZE = 10
     DEFAULT_USER_AGENT = (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
         "AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/120.0.0.0 Safari/537.36"
     )
+    DEFAULT_HEADERS: ClassVar[dict[str, str]] = {
+        "User-Agent": DEFAULT_USER_AGENT,
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+    }
+
+    # 프로세스 공용 클라이언트 레지스트리: (verify_ssl, timeout) -> HttpClient
+    _shared_clients: ClassVar[dict[tuple[bool, int], "HttpClient"]] = {}
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+    # 공용 클라이언트가 사용할 응답 캐시 (기본: 사용 안 함)
+    _shared_cache: ClassVar[Optional[HttpCache]] = None
 
-    def __init__(self, timeout: int = DEFAULT_TIMEOUT, verify_ssl: bool = True):
+    def __init__(
+        self,
+        timeout: int = DEFAULT_TIMEOUT,
+        verify_ssl: bool = True,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional[HttpCache] = None,
+    ):
         """
         HTTP 클라이언트 초기화
 
         Args:
             timeout: 요청 타임아웃 (초)
             verify_ssl: SSL 인증서 검증 여부 (기본: True)
+            pool_maxsize: 호스트당 최대 연결 수
+            rate_limiter: 호스트별 속도 제한기 (없으면 공용 제한기)
+            retry_policy: 기본 재시도 정책 (없으면 RetryPolicy 기본값)
+            cache: HTML 응답 디스크 캐시 (없으면 사용 안 함)
         """
         self.timeout = timeout
         self.verify_ssl = verify_ssl
+        self.rate_limiter = rate_limiter or default_rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.cache = cache
         self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": self.DEFAULT_USER_AGENT,
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
-        })
+        self.session.headers.update(self.DEFAULT_HEADERS)
+        self.pool_maxsize = 0
+        self._mount_adapter(pool_maxsize)
+
+    @classmethod
+    def shared(
+        cls,
+        verify_ssl: bool = True,
+        timeout: int = DEFAULT_TIMEOUT,
+        pool_maxsize: Optional[int] = None,
+    ) -> "HttpClient":
+        """
+        프로세스 공용 HTTP 클라이언트 반환
+
+        같은 설정의 크롤러와 검색이 하나의 세션을 공유하므로
+        반복 검색 시 TCP/TLS 연결을 다시 맺지 않습니다.
+        커넥션 풀은 urllib3에 의해 호스트별로 분리됩니다.
+
+        Args:
+            verify_ssl: SSL 인증서 검증 여부
+            timeout: 요청 타임아웃 (초)
+            pool_maxsize: 필요한 호스트당 최대 연결 수 (기존보다 크면 풀 확장)
+
+        Returns:
+            공용 HttpClient
+        """
+        key = (verify_ssl, timeout)
+        with cls._shared_lock:
+            client = cls._shared_clients.get(key)
+            if client is None:
+                client = cls(
+                    timeout=timeout,
+                    verify_ssl=verify_ssl,
+                    pool_maxsize=max(pool_maxsize or 0, cls.DEFAULT_POOL_MAXSIZE),
+                    cache=cls._shared_cache,
+                )
+                cls._shared_clients[key] = client
+            elif pool_maxsize and pool_maxsize > client.pool_maxsize:
+                client._mount_adapter(pool_maxsize)
+            return client
+
+    @classmethod
+    def set_shared_cache(cls, cache: Optional[HttpCache]) -> None:
+        """
+        공용 클라이언트의 응답 캐시 설정
+
+        이미 생성된 공용 클라이언트에도 적용됩니다.
+
+        Args:
+            cache: 응답 캐시 (None이면 캐시 사용 안 함)
+        """
+        with cls._shared_lock:
+            cls._shared_cache = cache
+            for client in cls._shared_clients.values():
+                client.cache = cache
+
+    @classmethod
+    def close_shared(cls) -> None:
+        """공용 클라이언트를 모두 닫고 레지스트리 초기화"""
+        with cls._shared_lock:
+            clients = list(cls._shared_clients.values())
+            cls._shared_clients.clear()
+
+        for client in clients:
+            client.close()
+
+    def close(self) -> None:
+        """세션과 커넥션 풀 닫기"""
+        self.session.close()
+
+    def _mount_adapter(self, pool_maxsize: int) -> None:
+        """
+        커넥션 풀 크기를 지정한 HTTPAdapter 장착
+
+        기존 어댑터는 교체 후 닫아 풀을 정리합니다. 대기 중인 keep-alive 연결은 닫히고,
+        사용 중인 연결은 요청이 끝나 풀에 반환될 때 닫히므로 진행 중인 요청에는 영향이 없습니다.
+
+        Args:
+            pool_maxsize: 호스트당 최대 연결 수
+        """
+        # 세션 기본 어댑터는 http/https에 따로, 이전 확장 어댑터는 함께 장착되어 있음
+        previous = {
+            id(old): old
+            for old in (self.session.adapters.get("http://"), self.session.adapters.get("https://"))
+            if old is not None
+        }
+        adapter = HTTPAdapter(
+            pool_connections=self.DEFAULT_POOL_CONNECTIONS,
+            pool_maxsize=pool_maxsize,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.pool_maxsize = pool_maxsize
+        for old in previous.values():
+            old.close()
 
     def get(
         self,
         url: str,
         headers: Optional[dict[str, str]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        deadline: Optional[float] = None,
+        stream: bool = False,
     ) -> requests.Response:
         """
         GET 요청 수행
 
+        일시적인 오류는 재시도 정책에 따라 재시도하며,
+        모든 시도와 대기는 deadline 안에서만 이루어집니다.
+
         Args:
             url: 요청 URL
             headers: 추가 헤더
+            retry_policy: 재시도 정책 (없으면 클라이언트 기본 정책)
+            deadline: 전체 검색 마감 시각 (time.monotonic 기준, 없으면 제한 없음)
+            stream: 본문을 미리 받지 않음 (호출자가 iter_content로 읽고 닫아야 함)
 
         Returns:
             응답 객체
 
         Raises:
-            HttpClientError: 요청 실패 시
+            HttpClientError: 요청 실패 시 (재시도 소진 포함)
         """
-        try:
-            # SSL 검증 비활성화 시 경고 억제
-            if not self.verify_ssl:
-                warnings.filterwarnings('ignore', category=requests.packages.urllib3.exceptions.InsecureRequestWarning)
-            
-            response = self.session.get(
-                url,
-                headers=headers,
-                timeout=self.timeout,
-                verify=self.verify_ssl,
-            )
-            response.raise_for_status()
-            return response
+        policy = retry_policy or self.retry_policy
+        host = urlsplit(url).hostname or ""
 
-        except Timeout as e:
-            raise HttpClientError(f"요청 타임아웃: {url} - {e}") from e
+        # SSL 검증 비활성화 시 경고 억제
+        if not self.verify_ssl:
+            warnings.filterwarnings('ignore', category=requests.packages.urllib3.exceptions.InsecureRequestWarning)
 
-        except ConnectionError as e:
-            raise HttpClientError(f"연결 오류: {url} - {e}") from e
+        attempt = 0
+        while True:
+            attempt += 1
+            timeout = get_attempt_timeout(self.timeout, url, deadline)
 
-        except HTTPError as e:
-            raise HttpClientError(f"HTTP 오류 {e.response.status_code}: {url}") from e
+            # 호스트별 속도 제한 차례 대기
+            self.rate_limiter.acquire(host)
 
-        except requests.RequestException as e:
-            raise HttpClientError(f"요청 실패: {url} - {e}") from e
+            retry_after = None
+            try:
+                response = self.session.get(
+                    url,
+                    headers=headers,
+                    timeout=timeout,
+                    verify=self.verify_ssl,
+                    stream=stream,
+                )
+                response.raise_for_status()
+                return response
+
+            except Timeout as e:
+                cause = e
+                error = HttpClientError(f"요청 타임아웃: {url} - {e}")
+
+            except ConnectionError as e:
+                cause = e
+                error = HttpClientError(f"연결 오류: {url} - {e}")
+
+            except HTTPError as e:
+                # 오류 응답 본문은 읽지 않으므로 연결을 풀에 돌려줌 (stream=True이면 열려 있음)
+                e.response.close()
+                status_code = e.response.status_code
+                error = HttpClientError(f"HTTP 오류 {status_code}: {url}")
+                if not policy.is_retryable_status("GET", status_code):
+                    raise error from e
+                cause = e
+                retry_after = parse_retry_after(e.response.headers.get("Retry-After"))
+
+            except requests.RequestException as e:
+                raise HttpClientError(f"요청 실패: {url} - {e}") from e
+
+            delay = get_retry_delay(policy, attempt, retry_after, deadline)
+            if delay is None:
+                raise error from cause
+            time.sleep(delay)
 
     def get_html(
         self,
         url: str,
         headers: Optional[dict[str, str]] = None,
         encoding: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        deadline: Optional[float] = None,
     ) -> str:
         """
         HTML 컨텐츠 가져오기
@@ -105,6 +556,8 @@ class HttpClient:
             url: 요청 URL
             headers: 추가 헤더
             encoding: 응답 인코딩 (예: 'euc-kr')
+            retry_policy: 재시도 정책 (없으면 클라이언트 기본 정책)
+            deadline: 전체 검색 마감 시각 (time.monotonic 기준)
 
         Returns:
             HTML 문자열
@@ -112,7 +565,314 @@ class HttpClient:
         Raises:
             HttpClientError: 요청 실패 시
         """
-        response = self.get(url, headers)
-        if encoding:
-            response.encoding = encoding
-        return response.text
+        return self.fetch_html(
+            url,
+            headers,
+            encoding=encoding,
+            retry_policy=retry_policy,
+            deadline=deadline,
+        ).text
+
+    def get_bytes(
+        self,
+        url: str,
+        headers: Optional[dict[str, str]] = None,
+        encoding: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        deadline: Optional[float] = None,
+    ) -> tuple[bytes, Optional[str]]:
+        """
+        HTML 본문을 디코딩하지 않고 가져오기
+
+        인코딩은 본문 전체를 분석하지 않고 Content-Type 헤더와
+        <meta charset> 선언으로만 판별합니다.
+
+        Args:
+            url: 요청 URL
+            headers: 추가 헤더
+            encoding: 응답 인코딩 (예: 'euc-kr')
+            retry_policy: 재시도 정책 (없으면 클라이언트 기본 정책)
+            deadline: 전체 검색 마감 시각 (time.monotonic 기준)
+
+        Returns:
+            (본문 바이트, 인코딩 또는 None)
+
+        Raises:
+            HttpClientError: 요청 실패 시
+        """
+        page = self.fetch_html(
+            url,
+            headers,
+            encoding=encoding,
+            retry_policy=retry_policy,
+            deadline=deadline,
+        )
+        return page.content, page.encoding
+
+    def fetch_html(
+        self,
+        url: str,
+        headers: Optional[dict[str, str]] = None,
+        encoding: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        deadline: Optional[float] = None,
+    ) -> HtmlPage:
+        """
+        HTML 컨텐츠와 캐시 정보 가져오기
+
+        캐시가 설정되어 있으면 TTL 이내의 응답은 요청 없이 반환하고,
+        지난 응답은 조건부 요청으로 재검증하여 304면 저장된 본문을 사용합니다.
+
+        Args:
+            url: 요청 URL
+            headers: 추가 헤더
+            encoding: 응답 인코딩 (예: 'euc-kr')
+            retry_policy: 재시도 정책 (없으면 클라이언트 기본 정책)
+            deadline: 전체 검색 마감 시각 (time.monotonic 기준)
+
+        Returns:
+            HtmlPage
+
+        Raises:
+            HttpClientError: 요청 실패 시
+        """
+        encoding = normalize_encoding(encoding)
+
+        cache = self.cache
+        if cache is None:
+            response = self.get(url, headers, retry_policy=retry_policy, deadline=deadline)
+            return HtmlPage(
+                content=response.content,
+                encoding=encoding or self._sniff_encoding(response, response.content),
+            )
+
+        entry = cache.get(url)
+        if entry is not None and cache.is_fresh(entry):
+            return self._get_cached_page(entry, encoding)
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            request_headers.update(entry.get_validators())
+
+        response = self.get(url, request_headers, retry_policy=retry_policy, deadline=deadline)
+
+        if entry is not None and response.status_code == 304:
+            return self._get_cached_page(cache.revalidate(entry), encoding)
+
+        content = response.content
+        encoding = encoding or self._sniff_encoding(response, content)
+
+        if "no-store" in response.headers.get("Cache-Control", "").lower():
+            return HtmlPage(content=content, encoding=encoding)
+
+        entry = cache.put(
+            url,
+            content,
+            encoding=encoding,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        return HtmlPage(content=content, encoding=encoding, digest=entry.digest)
+
+    @staticmethod
+    def _sniff_encoding(response: requests.Response, content: bytes) -> Optional[str]:
+        """
+        Content-Type 헤더와 본문 앞부분으로 인코딩 판별
+
+        Args:
+            response: 응답 객체
+            content: 본문 (앞부분만 있어도 됨)
+
+        Returns:
+            코덱 이름 또는 None
+        """
+        return sniff_encoding(content, response.headers.get("Content-Type"))
+
+    @staticmethod
+    def _get_cached_page(entry: CacheEntry, encoding: Optional[str]) -> HtmlPage:
+        """
+        캐시 항목으로 HtmlPage 생성
+
+        Args:
+            entry: 캐시 항목
+            encoding: 지정 인코딩 (없으면 저장된 인코딩)
+
+        Returns:
+            HtmlPage
+        """
+        return HtmlPage(
+            content=entry.body,
+            encoding=encoding or normalize_encoding(entry.encoding),
+            digest=entry.digest,
+            from_cache=True,
+        )
+
+    def stream_html(
+        self,
+        url: str,
+        headers: Optional[dict[str, str]] = None,
+        encoding: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        deadline: Optional[float] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> HtmlStream:
+        """
+        HTML 컨텐츠를 받는 대로 조각 단위 바이트로 가져오기
+
+        본문은 디코딩하지 않고, 판별한 인코딩을 HtmlStream.encoding으로 함께 반환합니다.
+        인코딩은 지정값, Content-Type/<meta charset>/BOM, 첫 조각이 올바른 UTF-8인지 순으로 판별하며
+        그래도 정할 수 없을 때만 첫 조각으로 추정합니다 (chardet).
+        캐시 처리는 fetch_html과 같습니다. 캐시된 본문은 한 조각으로 반환하고,
+        네트워크 응답은 끝까지 받았을 때만 캐시에 저장합니다.
+
+        Args:
+            url: 요청 URL
+            headers: 추가 헤더
+            encoding: 응답 인코딩 (예: 'euc-kr')
+            retry_policy: 재시도 정책 (없으면 클라이언트 기본 정책)
+            deadline: 전체 검색 마감 시각 (time.monotonic 기준, 본문 수신에도 적용)
+            chunk_size: 한 번에 읽을 바이트 수
+
+        Returns:
+            HtmlStream
+
+        Raises:
+            HttpClientError: 요청 또는 첫 조각 수신 실패 시 (이후 조각의 오류는 chunks 순회 중 발생)
+        """
+        encoding = normalize_encoding(encoding)
+
+        cache = self.cache
+        entry = cache.get(url) if cache is not None else None
+        if entry is not None and cache.is_fresh(entry):
+            return self._get_cached_stream(entry, encoding)
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            request_headers.update(entry.get_validators())
+
+        response = self.get(
+            url,
+            request_headers,
+            retry_policy=retry_policy,
+            deadline=deadline,
+            stream=True,
+        )
+
+        if entry is not None and response.status_code == 304:
+            response.close()
+            return self._get_cached_stream(cache.revalidate(entry), encoding)
+
+        if "no-store" in response.headers.get("Cache-Control", "").lower():
+            cache = None
+
+        stream = HtmlStream(iter(()))
+        body = self._iter_body(url, response, chunk_size, deadline, cache, stream)
+        # 파서를 만들기 전에 인코딩을 정해야 하므로 첫 조각을 미리 받음
+        first = next(body, b"")
+        stream.encoding = (
+            encoding
+            or self._sniff_encoding(response, first)
+            or self._detect_encoding(first)
+        )
+        stream.chunks = self._prepend(first, body)
+        return stream
+
+    def _get_cached_stream(self, entry: CacheEntry, encoding: Optional[str]) -> HtmlStream:
+        """
+        캐시 항목으로 한 조각짜리 HtmlStream 생성
+
+        Args:
+            entry: 캐시 항목
+            encoding: 지정 인코딩 (없으면 저장된 인코딩)
+
+        Returns:
+            HtmlStream
+        """
+        page = self._get_cached_page(entry, encoding)
+        return HtmlStream(
+            iter([page.content]),
+            encoding=page.encoding or self._detect_encoding(page.content),
+            digest=page.digest,
+            from_cache=True,
+        )
+
+    @staticmethod
+    def _detect_encoding(content: bytes) -> str:
+        """
+        선언이 없는 본문의 인코딩 추정
+
+        올바른 UTF-8이면 chardet을 실행하지 않습니다.
+
+        Args:
+            content: 본문 (앞부분만 있어도 됨)
+
+        Returns:
+            코덱 이름
+        """
+        if is_utf8_prefix(content):
+            return "utf-8"
+        return normalize_encoding(chardet.detect(content)["encoding"]) or "utf-8"
+
+    @staticmethod
+    def _prepend(first: bytes, rest: Iterator[bytes]) -> Iterator[bytes]:
+        """미리 받은 첫 조각을 앞에 붙이기 (닫으면 남은 본문도 닫음)"""
+        try:
+            if first:
+                yield first
+            yield from rest
+        finally:
+            rest.close()
+
+    def _iter_body(
+        self,
+        url: str,
+        response: requests.Response,
+        chunk_size: int,
+        deadline: Optional[float],
+        cache: Optional[HttpCache],
+        stream: HtmlStream,
+    ) -> Iterator[bytes]:
+        """
+        응답 본문을 받는 대로 반환
+
+        Args:
+            url: 요청 URL (오류 메시지용)
+            response: stream=True로 받은 응답
+            chunk_size: 한 번에 읽을 바이트 수
+            deadline: 전체 검색 마감 시각 (time.monotonic 기준)
+            cache: 끝까지 받은 본문을 저장할 캐시 (None이면 저장 안 함)
+            stream: 끝까지 받은 뒤 digest를 설정할 HtmlStream (encoding은 캐시에 함께 저장)
+
+        Yields:
+            본문 조각
+
+        Raises:
+            HttpClientError: 본문 수신 실패 또는 마감 시각 초과
+        """
+        body = bytearray()
+        # 캐시 여부와 관계없이 받는 대로 해시하여 본문 전체의 digest를 만듦
+        hasher = hashlib.sha256()
+        try:
+            for chunk in response.iter_content(chunk_size):
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise HttpClientError(f"검색 제한 시간 초과: {url}")
+                if not chunk:
+                    continue
+                hasher.update(chunk)
+                if cache is not None:
+                    body += chunk
+                yield chunk
+        except requests.RequestException as e:
+            raise HttpClientError(f"응답 수신 실패: {url} - {e}") from e
+        finally:
+            response.close()
+
+        if cache is not None:
+            cache.put(
+                url,
+                bytes(body),
+                encoding=stream.encoding,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+        stream.digest = hasher.hexdigest()
@@ -209,6 +209,38 @@ class TestResultsTable:
         # 최대 5개만 표시
         assert table.table.rowCount() == 5
 
+    def test_result_batch_입력(self, qtbot, sample_results):
+        """ResultBatch도 결과 목록처럼 표시"""
+        from src.gui.results_table import ResultsTable
+        from src.models.result_batch import ResultBatch
+
+        table = ResultsTable()
+        qtbot.addWidget(table)
+
+        table.set_results(ResultBatch.from_results(sample_results, keep_rows=False))
+
+        assert table.table.rowCount() == 3
+        assert table.table.item(1, 1).background().color() == QColor(144, 238, 144)
+        assert [r.shop_id for r in table.get_results()] == ["shop-a", "shop-b", "shop-c"]
+
+    def test_상점_저장소_핸들_공유(self, qtbot, sample_results, tmp_path):
+        """결과는 객체 없이 보관하고 상점은 저장소의 핸들 표를 사용"""
+        from src.gui.results_table import ResultsTable
+        from src.storage.shop_store import ShopStore
+
+        store = ShopStore(config_dir=tmp_path)
+        store.shop_table.get_handle("shop-c", "상점C")
+        table = ResultsTable(shop_store=store)
+        qtbot.addWidget(table)
+
+        table.set_results(sample_results)
+
+        assert not table._results.keeps_rows
+        assert list(table._results.shop_index) == [1, 2, 0]
+        assert [r.model_dump() for r in table.get_results()] == [
+            r.model_dump() for r in sample_results
+        ]
+
     def test_sorting_by_price(self, qtbot, sample_results):
         """가격순 정렬 테스트"""
         from src.gui.results_table import ResultsTable
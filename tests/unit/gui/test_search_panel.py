@@ -125,6 +125,21 @@ class TestSearchPanel:
         
         assert panel.get_keyword() == "테스트 키워드"
 
+    def test_max_results(self, qtbot):
+        """상점당 결과 수 (0은 제한 없음)"""
+        from src.gui.search_panel import SearchPanel
+        
+        panel = SearchPanel()
+        qtbot.addWidget(panel)
+        
+        assert panel.get_max_results() is None
+        
+        panel.set_max_results(30)
+        assert panel.get_max_results() == 30
+        
+        panel.set_max_results(None)
+        assert panel.get_max_results() is None
+
     def test_set_searching_state(self, qtbot):
         """검색 중 상태 설정"""
         from src.gui.search_panel import SearchPanel
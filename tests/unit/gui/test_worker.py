@@ -108,7 +108,7 @@ class TestSearchWorker:
         
         # Mock 설정
         mock_crawler = MagicMock()
-        mock_crawler.search_all.return_value = []
+        mock_crawler.iter_search.return_value = iter([])
         mock_crawler_class.return_value = mock_crawler
         
         worker = SearchWorker("테스트", sample_shops)
@@ -116,7 +116,21 @@ class TestSearchWorker:
         # 동기적으로 run 호출 (테스트 목적)
         worker.run()
         
-        mock_crawler.search_all.assert_called_once_with("테스트")
+        mock_crawler.iter_search.assert_called_once_with("테스트")
+
+    @patch('src.gui.worker.MultiShopCrawler')
+    def test_max_results_전달(self, mock_crawler_class, qtbot, sample_shops):
+        """상점당 최대 결과 수를 크롤러에 전달"""
+        from src.gui.worker import SearchWorker
+        
+        mock_crawler = MagicMock()
+        mock_crawler.iter_search.return_value = iter([])
+        mock_crawler_class.return_value = mock_crawler
+        
+        worker = SearchWorker("테스트", sample_shops, max_results=20)
+        worker.run()
+        
+        assert mock_crawler_class.call_args.kwargs["max_results"] == 20
 
     @patch('src.gui.worker.MultiShopCrawler')
     def test_progress_emitted(self, mock_crawler_class, qtbot, sample_shops):
@@ -124,7 +138,7 @@ class TestSearchWorker:
         from src.gui.worker import SearchWorker
         
         mock_crawler = MagicMock()
-        mock_crawler.search_all.return_value = []
+        mock_crawler.iter_search.return_value = iter([])
         mock_crawler_class.return_value = mock_crawler
         
         worker = SearchWorker("테스트", sample_shops)
@@ -155,7 +169,9 @@ class TestSearchWorker:
         ]
         
         mock_crawler = MagicMock()
-        mock_crawler.search_all.return_value = mock_results
+        mock_crawler.iter_search.return_value = iter([
+            (sample_shops[0], mock_results, 0.1),
+        ])
         mock_crawler_class.return_value = mock_crawler
         
         worker = SearchWorker("테스트", sample_shops)
@@ -174,7 +190,7 @@ class TestSearchWorker:
         from src.gui.worker import SearchWorker
         
         mock_crawler = MagicMock()
-        mock_crawler.search_all.side_effect = Exception("네트워크 오류")
+        mock_crawler.iter_search.side_effect = Exception("네트워크 오류")
         mock_crawler_class.return_value = mock_crawler
         
         worker = SearchWorker("테스트", sample_shops)
@@ -187,6 +203,43 @@ class TestSearchWorker:
         assert len(errors) == 1
         assert "네트워크 오류" in errors[0]
 
+    @patch('src.gui.worker.MultiShopCrawler')
+    def test_shop_completed_상점별_발생(self, mock_crawler_class, qtbot, sample_shops):
+        """상점 검색이 끝날 때마다 shop_completed와 진행률 시그널 발생"""
+        from src.gui.worker import SearchWorker
+        from src.crawlers.html_crawler import CrawlError
+        from src.models.search import SearchResult, StockStatus
+        
+        result = SearchResult(
+            shop_id=sample_shops[1].id,
+            shop_name="상점B",
+            product_name="상품1",
+            price=10000,
+            stock_status=StockStatus.IN_STOCK,
+        )
+        
+        mock_crawler = MagicMock()
+        mock_crawler.iter_search.return_value = iter([
+            (sample_shops[1], [result], 0.1),
+            (sample_shops[0], CrawlError("상점A 실패"), 0.2),
+        ])
+        mock_crawler_class.return_value = mock_crawler
+        
+        worker = SearchWorker("테스트", sample_shops)
+        
+        completed = []
+        progress_values = []
+        finished = []
+        worker.shop_completed.connect(lambda name, r: completed.append((name, len(r))))
+        worker.progress.connect(lambda cur, total: progress_values.append((cur, total)))
+        worker.finished_with_results.connect(lambda r: finished.append(r))
+        
+        worker.run()
+        
+        assert completed == [("상점B", 1), ("상점A", 0)]
+        assert progress_values == [(0, 2), (1, 2), (2, 2)]
+        assert finished == [[result]]
+
     def test_keyword_property(self, qtbot):
         """키워드 속성 확인"""
         from src.gui.worker import SearchWorker
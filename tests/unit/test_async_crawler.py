@@ -0,0 +1,239 @@
+"""
+테스트: 비동기 크롤링 엔진 (AsyncHttpClient, AsyncHtmlCrawler)
+"""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+
+# 테스트 픽스처 경로
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "sample_html"
+
+
+def make_shop(**kwargs):
+    """테스트용 상점 생성"""
+    from src.models.shop import Shop, ShopSelectors
+
+    return Shop(
+        name=kwargs.pop("name", "테스트 상점"),
+        base_url="https://example.com",
+        search_url_template="https://example.com/search?q={keyword}",
+        selectors=ShopSelectors(
+            product_container=".product-item",
+            product_name=".product-title",
+            product_price=".product-price",
+            stock_status=".stock-status",
+        ),
+        **kwargs,
+    )
+
+
+class TestAsyncHttpClient:
+    """AsyncHttpClient 테스트"""
+
+    def test_get_html_성공(self):
+        """HTML을 비동기로 가져오고 기본 헤더를 전송"""
+        from src.utils.async_http_client import AsyncHttpClient
+
+        seen_headers = {}
+
+        def handler(request):
+            seen_headers.update(request.headers)
+            return httpx.Response(200, text="<html>상품1</html>")
+
+        async def run():
+            async with AsyncHttpClient(transport=httpx.MockTransport(handler)) as client:
+                return await client.get_html("https://example.com/products")
+
+        assert asyncio.run(run()) == "<html>상품1</html>"
+        assert "Mozilla" in seen_headers["user-agent"]
+
+    def test_http_오류(self):
+        """HTTP 오류 응답은 HttpClientError로 변환"""
+        from src.utils.async_http_client import AsyncHttpClient
+        from src.utils.http_client import HttpClientError
+
+        async def run():
+            transport = httpx.MockTransport(lambda request: httpx.Response(404))
+            async with AsyncHttpClient(transport=transport) as client:
+                await client.get("https://example.com/notfound")
+
+        with pytest.raises(HttpClientError) as exc_info:
+            asyncio.run(run())
+
+        assert "404" in str(exc_info.value)
+
+    def test_타임아웃(self):
+        """타임아웃은 HttpClientError로 변환"""
+        from src.utils.async_http_client import AsyncHttpClient
+        from src.utils.http_client import HttpClientError
+
+        def handler(request):
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        async def run():
+            async with AsyncHttpClient(transport=httpx.MockTransport(handler)) as client:
+                await client.get("https://example.com/slow")
+
+        with pytest.raises(HttpClientError) as exc_info:
+            asyncio.run(run())
+
+        assert "타임아웃" in str(exc_info.value)
+
+    def test_응답_인코딩_지정(self):
+        """encoding 지정 시 해당 인코딩으로 디코딩"""
+        from src.utils.async_http_client import AsyncHttpClient
+
+        body = "<html>건담</html>".encode("euc-kr")
+
+        async def run():
+            transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body))
+            async with AsyncHttpClient(transport=transport) as client:
+                return await client.get_html("https://example.com/", encoding="euc-kr")
+
+        assert asyncio.run(run()) == "<html>건담</html>"
+
+    def test_meta_charset_인코딩(self):
+        """헤더에 charset이 없으면 동기 클라이언트처럼 <meta charset>으로 디코딩"""
+        from src.utils.async_http_client import AsyncHttpClient
+
+        html = '<html><head><meta charset="euc-kr"></head><body>건담 마크2</body></html>'
+        body = html.encode("euc-kr")
+
+        async def run():
+            transport = httpx.MockTransport(
+                lambda request: httpx.Response(
+                    200, content=body, headers={"Content-Type": "text/html"}
+                )
+            )
+            async with AsyncHttpClient(transport=transport) as client:
+                return await client.get_html("https://example.com/")
+
+        assert asyncio.run(run()) == html
+
+
+class TestAsyncHtmlCrawler:
+    """AsyncHtmlCrawler 테스트"""
+
+    def test_base_crawler_인터페이스(self):
+        """AsyncBaseCrawler를 구현"""
+        from src.crawlers.async_html_crawler import AsyncHtmlCrawler
+        from src.crawlers.base import AsyncBaseCrawler
+
+        assert issubclass(AsyncHtmlCrawler, AsyncBaseCrawler)
+
+    def test_search_결과가_동기_크롤러와_동일(self):
+        """비동기 검색 결과가 HtmlCrawler 파싱 결과와 같음"""
+        from src.crawlers.async_html_crawler import AsyncHtmlCrawler
+        from src.crawlers.html_crawler import HtmlCrawler
+        from src.utils.async_http_client import AsyncHttpClient
+
+        html = (FIXTURES_DIR / "search_results.html").read_text(encoding="utf-8")
+        shop = make_shop()
+
+        async def run():
+            transport = httpx.MockTransport(lambda request: httpx.Response(200, text=html))
+            async with AsyncHttpClient(transport=transport) as client:
+                return await AsyncHtmlCrawler(shop, client).search("마우스")
+
+        results = asyncio.run(run())
+        expected = HtmlCrawler(shop).parse_html(html)
+
+        assert len(results) == 3
+        assert [r.model_dump(exclude={"crawled_at"}) for r in results] == [
+            r.model_dump(exclude={"crawled_at"}) for r in expected
+        ]
+
+    def test_동기_http_클라이언트를_만들지_않음(self):
+        """파싱에 필요한 추출 계획만 사용하고 공용 HttpClient는 만들지 않음"""
+        from unittest.mock import patch
+        from src.crawlers.async_html_crawler import AsyncHtmlCrawler
+        from src.utils.async_http_client import AsyncHttpClient
+        from src.utils.http_client import HttpClient
+
+        async def run():
+            async with AsyncHttpClient() as client:
+                return AsyncHtmlCrawler(make_shop(), client)
+
+        with patch.object(HttpClient, "shared") as mock_shared, \
+                patch.object(HttpClient, "__init__", side_effect=AssertionError) as mock_init:
+            asyncio.run(run())
+
+        mock_shared.assert_not_called()
+        mock_init.assert_not_called()
+
+    def test_다수_상점_동시_검색(self):
+        """여러 상점×키워드 요청이 하나의 이벤트 루프에서 동시에 진행"""
+        from src.crawlers.async_html_crawler import AsyncHtmlCrawler
+        from src.utils.async_http_client import AsyncHttpClient
+
+        html = (FIXTURES_DIR / "search_results.html").read_text(encoding="utf-8")
+        in_flight = 0
+        max_in_flight = 0
+
+        async def handler(request):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, text=html)
+
+        async def run():
+            async with AsyncHttpClient(transport=httpx.MockTransport(handler)) as client:
+                crawlers = [AsyncHtmlCrawler(make_shop(name=f"상점{i}"), client) for i in range(5)]
+                return await asyncio.gather(*(
+                    crawler.search(keyword)
+                    for crawler in crawlers
+                    for keyword in ("마우스", "키보드")
+                ))
+
+        all_results = asyncio.run(run())
+
+        assert len(all_results) == 10
+        assert all(len(results) == 3 for results in all_results)
+        assert max_in_flight == 10
+
+    def test_요청_실패_시_crawl_error(self):
+        """HTTP 오류는 CrawlError로 변환"""
+        from src.crawlers.async_html_crawler import AsyncHtmlCrawler
+        from src.crawlers.html_crawler import CrawlError
+        from src.utils.async_http_client import AsyncHttpClient
+
+        async def run():
+            transport = httpx.MockTransport(lambda request: httpx.Response(500))
+            async with AsyncHttpClient(transport=transport) as client:
+                await AsyncHtmlCrawler(make_shop(), client).search("마우스")
+
+        with pytest.raises(CrawlError) as exc_info:
+            asyncio.run(run())
+
+        assert "테스트 상점" in str(exc_info.value)
+
+
+class TestAsyncRetry:
+    """AsyncHttpClient 재시도 테스트"""
+
+    def test_일시적_5xx_재시도_후_성공(self):
+        """503 응답 후 재시도하여 성공"""
+        from src.models.shop import RetryPolicy
+        from src.utils.async_http_client import AsyncHttpClient
+
+        statuses = [503, 200]
+
+        def handler(request):
+            return httpx.Response(statuses.pop(0), text="OK")
+
+        async def run():
+            async with AsyncHttpClient(
+                transport=httpx.MockTransport(handler),
+                retry_policy=RetryPolicy(backoff_base=0),
+            ) as client:
+                return await client.get_html("https://example.com/flaky")
+
+        assert asyncio.run(run()) == "OK"
+        assert statuses == []
@@ -0,0 +1,78 @@
+"""
+테스트: 문자 인코딩 판별 (sniff_encoding)
+"""
+
+import pytest
+
+
+class TestNormalizeEncoding:
+    """인코딩 이름 정규화 테스트"""
+
+    @pytest.mark.parametrize("label", ["euc-kr", "EUC-KR", "ks_c_5601-1987", "x-windows-949", "cp949"])
+    def test_한국어_인코딩은_cp949(self, label):
+        """EUC-KR 계열은 확장 완성형을 포함하는 CP949로 디코딩"""
+        from src.utils.charset import normalize_encoding
+
+        assert normalize_encoding(label) == "cp949"
+
+    def test_코덱_이름으로_변환(self):
+        """별칭은 Python 코덱 이름으로"""
+        from src.utils.charset import normalize_encoding
+
+        assert normalize_encoding("UTF8") == "utf-8"
+        assert normalize_encoding(" Shift_JIS ") == "shift_jis"
+
+    def test_알_수_없는_인코딩(self):
+        """없는 인코딩과 빈 값은 None"""
+        from src.utils.charset import normalize_encoding
+
+        assert normalize_encoding("bogus") is None
+        assert normalize_encoding("") is None
+        assert normalize_encoding(None) is None
+
+
+class TestSniffEncoding:
+    """BOM/헤더/meta 인코딩 판별 테스트"""
+
+    def test_content_type_헤더(self):
+        """헤더의 charset이 meta 선언보다 우선"""
+        from src.utils.charset import sniff_encoding
+
+        content = b'<html><head><meta charset="utf-8"></head></html>'
+
+        assert sniff_encoding(content, "text/html; charset=EUC-KR") == "cp949"
+
+    @pytest.mark.parametrize("content", [
+        b'<html><head><meta charset="euc-kr"></head>',
+        b"<html><head><META CHARSET=euc-kr></head>",
+        b'<html><head><meta http-equiv="Content-Type" content="text/html; charset=euc-kr"></head>',
+    ])
+    def test_meta_선언(self, content):
+        """헤더에 charset이 없으면 <meta> 선언 사용"""
+        from src.utils.charset import sniff_encoding
+
+        assert sniff_encoding(content, "text/html") == "cp949"
+
+    def test_bom_우선(self):
+        """BOM이 있으면 헤더보다 우선"""
+        import codecs
+        from src.utils.charset import sniff_encoding
+
+        assert sniff_encoding(codecs.BOM_UTF8 + b"<html>", "text/html; charset=euc-kr") == "utf-8"
+
+    def test_앞부분_밖의_meta는_무시(self):
+        """문서 앞부분에 선언이 없으면 None"""
+        from src.utils.charset import SNIFF_SIZE, sniff_encoding
+
+        content = b"<html><head>" + b" " * SNIFF_SIZE + b'<meta charset="euc-kr">'
+
+        assert sniff_encoding(content) is None
+        assert sniff_encoding(b"<html><body>plain</body></html>") is None
+
+    def test_잘못된_선언은_무시(self):
+        """알 수 없는 헤더 charset은 건너뛰고 meta 사용"""
+        from src.utils.charset import sniff_encoding
+
+        content = b'<meta charset="utf-8">'
+
+        assert sniff_encoding(content, "text/html; charset=bogus") == "utf-8"
@@ -0,0 +1,253 @@
+"""
+테스트: 상점별 회로 차단기 (CircuitBreaker)
+"""
+
+import json
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+
+class FakeClock:
+    """수동으로 진행하는 시계"""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCircuitBreaker:
+    """CircuitBreaker 상태 전이 테스트"""
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def breaker(self, clock):
+        from src.crawlers.circuit_breaker import CircuitBreaker
+
+        return CircuitBreaker(failure_threshold=3, cooldown=60, clock=clock)
+
+    def test_초기_상태_닫힘(self, breaker):
+        """기록이 없는 상점은 CLOSED이며 요청 허용"""
+        from src.crawlers.circuit_breaker import CircuitState
+
+        assert breaker.get_state("shop-1") == CircuitState.CLOSED
+        assert breaker.allow("shop-1") is True
+
+    def test_연속_실패_시_열림(self, breaker):
+        """임계값만큼 연속 실패하면 OPEN"""
+        from src.crawlers.circuit_breaker import CircuitState
+
+        breaker.record_failure("shop-1")
+        breaker.record_failure("shop-1")
+        assert breaker.get_state("shop-1") == CircuitState.CLOSED
+
+        breaker.record_failure("shop-1")
+        assert breaker.get_state("shop-1") == CircuitState.OPEN
+        assert breaker.allow("shop-1") is False
+        assert breaker.retry_after("shop-1") == 60
+
+    def test_성공하면_실패_횟수_초기화(self, breaker):
+        """중간에 성공하면 연속 실패 횟수가 초기화됨"""
+        from src.crawlers.circuit_breaker import CircuitState
+
+        breaker.record_failure("shop-1")
+        breaker.record_failure("shop-1")
+        breaker.record_success("shop-1")
+        breaker.record_failure("shop-1")
+
+        assert breaker.get_failures("shop-1") == 1
+        assert breaker.get_state("shop-1") == CircuitState.CLOSED
+
+    def test_대기_시간_후_시험_요청_1회_허용(self, breaker, clock):
+        """대기 시간이 지나면 HALF_OPEN으로 시험 요청 1회만 허용"""
+        from src.crawlers.circuit_breaker import CircuitState
+
+        for _ in range(3):
+            breaker.record_failure("shop-1")
+
+        clock.now += 60
+        assert breaker.get_state("shop-1") == CircuitState.HALF_OPEN
+        assert breaker.allow("shop-1") is True
+        assert breaker.allow("shop-1") is False
+
+    def test_시험_요청_성공_시_닫힘(self, breaker, clock):
+        """시험 요청이 성공하면 CLOSED"""
+        from src.crawlers.circuit_breaker import CircuitState
+
+        for _ in range(3):
+            breaker.record_failure("shop-1")
+        clock.now += 60
+        breaker.allow("shop-1")
+
+        breaker.record_success("shop-1")
+
+        assert breaker.get_state("shop-1") == CircuitState.CLOSED
+        assert breaker.get_failures("shop-1") == 0
+
+    def test_시험_요청_실패_시_다시_열림(self, breaker, clock):
+        """시험 요청이 실패하면 대기 시간을 새로 시작"""
+        from src.crawlers.circuit_breaker import CircuitState
+
+        for _ in range(3):
+            breaker.record_failure("shop-1")
+        clock.now += 60
+        breaker.allow("shop-1")
+
+        breaker.record_failure("shop-1")
+
+        assert breaker.get_state("shop-1") == CircuitState.OPEN
+        assert breaker.retry_after("shop-1") == 60
+
+    def test_상점별_독립(self, breaker):
+        """한 상점의 차단이 다른 상점에 영향 없음"""
+        for _ in range(3):
+            breaker.record_failure("shop-1")
+
+        assert breaker.allow("shop-1") is False
+        assert breaker.allow("shop-2") is True
+
+    def test_초기화(self, breaker):
+        """reset으로 차단 해제"""
+        for _ in range(3):
+            breaker.record_failure("shop-1")
+
+        breaker.reset("shop-1")
+
+        assert breaker.allow("shop-1") is True
+
+    def test_임계값_유효성_검사(self):
+        """failure_threshold가 1 미만이면 ValueError"""
+        from src.crawlers.circuit_breaker import CircuitBreaker
+
+        with pytest.raises(ValueError):
+            CircuitBreaker(failure_threshold=0)
+
+
+class TestCircuitBreakerPersistence:
+    """CircuitBreaker 상태 저장 테스트"""
+
+    def test_프로세스_간_상태_유지(self, tmp_path):
+        """저장된 차단 상태를 새 인스턴스가 이어받음"""
+        from src.crawlers.circuit_breaker import CircuitBreaker, CircuitState
+
+        state_path = tmp_path / CircuitBreaker.STATE_FILENAME
+        clock = FakeClock()
+
+        first = CircuitBreaker(state_path, failure_threshold=2, cooldown=60, clock=clock)
+        first.record_failure("shop-1")
+        first.record_failure("shop-1")
+
+        second = CircuitBreaker(state_path, failure_threshold=2, cooldown=60, clock=clock)
+
+        assert second.get_state("shop-1") == CircuitState.OPEN
+        assert second.get_failures("shop-1") == 2
+        assert second.allow("shop-1") is False
+
+    def test_성공하면_저장된_상태_제거(self, tmp_path):
+        """닫힌 회로는 파일에서 제거됨"""
+        from src.crawlers.circuit_breaker import CircuitBreaker
+
+        state_path = tmp_path / CircuitBreaker.STATE_FILENAME
+        breaker = CircuitBreaker(state_path)
+        breaker.record_failure("shop-1")
+        breaker.record_success("shop-1")
+
+        data = json.loads(state_path.read_text(encoding="utf-8"))
+        assert data["shops"] == {}
+
+    def test_동시_저장(self, tmp_path):
+        """여러 스레드가 동시에 실패를 기록해도 파일은 마지막 상태로 남음"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from src.crawlers.circuit_breaker import CircuitBreaker
+
+        state_path = tmp_path / CircuitBreaker.STATE_FILENAME
+        breaker = CircuitBreaker(state_path, failure_threshold=1000)
+        shop_ids = [f"shop-{index % 8}" for index in range(400)]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(breaker.record_failure, shop_ids))
+
+        data = json.loads(state_path.read_text(encoding="utf-8"))
+        assert {shop_id: circuit["failures"] for shop_id, circuit in data["shops"].items()} == {
+            f"shop-{index}": 50 for index in range(8)
+        }
+        reloaded = CircuitBreaker(state_path, failure_threshold=1000)
+        assert reloaded.get_failures("shop-3") == 50
+        assert [path.name for path in tmp_path.iterdir()] == [CircuitBreaker.STATE_FILENAME]
+
+    def test_손상된_파일은_무시(self, tmp_path):
+        """손상된 상태 파일은 빈 상태로 시작"""
+        from src.crawlers.circuit_breaker import CircuitBreaker, CircuitState
+
+        state_path = tmp_path / CircuitBreaker.STATE_FILENAME
+        state_path.write_text("{ invalid json", encoding="utf-8")
+
+        breaker = CircuitBreaker(state_path)
+
+        assert breaker.get_state("shop-1") == CircuitState.CLOSED
+
+
+class TestMultiShopCrawlerCircuitBreaker:
+    """MultiShopCrawler 회로 차단기 연동 테스트"""
+
+    @pytest.fixture
+    def sample_shop(self):
+        """테스트용 상점"""
+        from src.models.shop import Shop, ShopSelectors
+
+        return Shop(
+            id="shop-1",
+            name="상점1",
+            base_url="https://shop1.example.com",
+            search_url_template="https://shop1.example.com/search?q={keyword}",
+            selectors=ShopSelectors(
+                product_container=".product",
+                product_name=".name",
+                product_price=".price",
+            ),
+        )
+
+    def test_차단된_상점은_요청없이_실패(self, sample_shop):
+        """연속 실패로 열린 상점은 크롤러를 호출하지 않음"""
+        from src.crawlers.circuit_breaker import CircuitBreaker
+        from src.crawlers.html_crawler import CrawlError
+        from src.crawlers.multi_crawler import MultiShopCrawler
+
+        breaker = CircuitBreaker(failure_threshold=2, cooldown=60)
+
+        with patch("src.crawlers.multi_crawler.HtmlCrawler") as MockHtmlCrawler:
+            mock_crawler = MagicMock()
+            mock_crawler.search.side_effect = CrawlError("연결 오류")
+            MockHtmlCrawler.return_value = mock_crawler
+
+            crawler = MultiShopCrawler([sample_shop], circuit_breaker=breaker)
+            crawler.search_with_errors("마우스")
+            crawler.search_with_errors("마우스")
+            _, errors = crawler.search_with_errors("마우스")
+
+        assert mock_crawler.search.call_count == 2
+        assert len(errors) == 1
+        assert "차단" in str(errors[0])
+
+    def test_성공하면_차단기에_기록(self, sample_shop):
+        """검색 성공 시 연속 실패 횟수 초기화"""
+        from src.crawlers.circuit_breaker import CircuitBreaker
+        from src.crawlers.multi_crawler import MultiShopCrawler
+
+        breaker = CircuitBreaker(failure_threshold=3)
+        breaker.record_failure("shop-1")
+
+        with patch("src.crawlers.multi_crawler.HtmlCrawler") as MockHtmlCrawler:
+            mock_crawler = MagicMock()
+            mock_crawler.search.return_value = []
+            MockHtmlCrawler.return_value = mock_crawler
+
+            MultiShopCrawler([sample_shop], circuit_breaker=breaker).search("마우스")
+
+        assert breaker.get_failures("shop-1") == 0
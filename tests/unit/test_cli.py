@@ -32,6 +32,13 @@ class TestCLIParsing:
         assert args.keyword == "키보드"
         assert args.shop == "shop-1"
 
+    def test_search_결과_수_제한(self):
+        """search 명령어에 상점당 결과 수 지정"""
+        from src.cli.main import parse_args
+
+        assert parse_args(["search", "건담", "--limit", "20"]).limit == 20
+        assert parse_args(["search", "건담"]).limit is None
+
     def test_shop_list_명령어(self):
         """shop list 명령어 파싱"""
         from src.cli.main import parse_args
@@ -191,6 +198,39 @@ class TestCLIExecution:
             assert result == 0 or result is None
             assert len(store.list_all()) == 1
 
+    def test_shop_add_구조화_데이터(self, tmp_path):
+        """--structured-data는 JSON-LD 추출 방식으로 저장"""
+        from src.cli.main import parse_args, run_shop_add
+        from src.models.shop import ExtractionStrategy
+        from src.storage.shop_store import ShopStore
+
+        args = parse_args([
+            "shop", "add",
+            "--name", "테스트상점",
+            "--url", "https://example.com",
+            "--search-template", "https://example.com/search?q={keyword}",
+            "--container", ".product",
+            "--name-selector", ".title",
+            "--price-selector", ".price",
+            "--structured-data",
+        ])
+        assert args.structured_data is True
+
+        store = ShopStore(config_dir=tmp_path)
+        result = run_shop_add(
+            name="새상점",
+            url="https://newshop.com",
+            search_template="https://newshop.com/search?q={keyword}",
+            container=".item",
+            name_selector=".title",
+            price_selector=".cost",
+            structured_data=True,
+            store=store,
+        )
+
+        assert result == 0
+        assert store.list_all()[0].extraction_strategy == ExtractionStrategy.STRUCTURED_DATA
+
     def test_shop_remove_실행(self):
         """shop remove 실행"""
         from src.cli.main import run_shop_remove
@@ -5,6 +5,7 @@ TDD에 따라 구현 전 테스트 먼저 작성.
 """
 
 import pytest
+import responses
 from pathlib import Path
 
 
@@ -233,3 +234,193 @@ class TestHtmlCrawler:
         assert crawler.parse_price("10000") == 10000
         assert crawler.parse_price("가격문의") is None
         assert crawler.parse_price("") is None
+        assert crawler.parse_price("1.2만원") == 12000
+
+    def test_최대_결과_수(self):
+        """max_results개를 채우면 나머지 컨테이너는 추출하지 않음"""
+        from unittest.mock import patch
+        from src.crawlers.html_crawler import HtmlCrawler
+        from src.models.shop import Shop, ShopSelectors
+
+        html_content = (FIXTURES_DIR / "search_results.html").read_text(encoding="utf-8")
+        shop = Shop(
+            name="테스트 상점",
+            base_url="https://example.com",
+            search_url_template="https://example.com/search?q={keyword}",
+            selectors=ShopSelectors(
+                product_container=".product-item",
+                product_name=".product-title",
+                product_price=".product-price",
+            ),
+        )
+        crawler = HtmlCrawler(shop)
+        all_results = crawler.parse_html(html_content)
+
+        with patch.object(crawler, "_get_price_texts", wraps=crawler._get_price_texts) as price_texts:
+            results = crawler.parse_html(html_content, max_results=2)
+
+        assert [r.product_name for r in results] == [r.product_name for r in all_results[:2]]
+        assert price_texts.call_count == 2
+
+    def test_페이지_단위_crawled_at(self):
+        """같은 페이지의 상품은 crawled_at 하나를 공유"""
+        from src.crawlers.html_crawler import HtmlCrawler
+        from src.models.shop import Shop, ShopSelectors
+
+        html_content = (FIXTURES_DIR / "search_results.html").read_text(encoding="utf-8")
+        shop = Shop(
+            name="테스트 상점",
+            base_url="https://example.com",
+            search_url_template="https://example.com/search?q={keyword}",
+            selectors=ShopSelectors(
+                product_container=".product-item",
+                product_name=".product-title",
+                product_price=".product-price",
+            ),
+        )
+
+        results = HtmlCrawler(shop).parse_html(html_content)
+
+        assert len(results) > 1
+        assert len({id(r.crawled_at) for r in results}) == 1
+
+
+class TestParseMemo:
+    """본문 해시 기반 파싱 결과 재사용 테스트"""
+
+    URL = "https://example.com/search?q=%EB%A7%88%EC%9A%B0%EC%8A%A4"
+
+    def make_crawler(self, **selector_overrides):
+        """캐시 없는 HTTP 클라이언트와 BeautifulSoup 백엔드(본문 전체 파싱)를 쓰는 크롤러"""
+        from src.crawlers.html_crawler import HtmlCrawler
+        from src.crawlers.parser_backends import BeautifulSoupBackend
+        from src.models.shop import Shop, ShopSelectors
+        from src.utils.http_client import HttpClient
+
+        selectors = {
+            "product_container": ".product-item",
+            "product_name": ".product-title",
+            "product_price": ".product-price",
+        }
+        selectors.update(selector_overrides)
+        shop = Shop(
+            id="memo-shop",
+            name="테스트 상점",
+            base_url="https://example.com",
+            search_url_template="https://example.com/search?q={keyword}",
+            selectors=ShopSelectors(**selectors),
+        )
+        return HtmlCrawler(shop, http_client=HttpClient(), backend=BeautifulSoupBackend())
+
+    @pytest.fixture(autouse=True)
+    def clear_memo(self):
+        from src.crawlers.html_crawler import HtmlCrawler
+
+        HtmlCrawler._parse_memo.clear()
+        yield
+        HtmlCrawler._parse_memo.clear()
+
+    @responses.activate
+    def test_같은_본문은_파싱_생략(self):
+        """HTTP 캐시가 없어도 본문이 같으면 이전 결과 사용"""
+        from unittest.mock import patch
+        from src.crawlers.html_crawler import HtmlCrawler
+
+        html_content = (FIXTURES_DIR / "search_results.html").read_text(encoding="utf-8")
+        responses.add(responses.GET, self.URL, body=html_content, status=200)
+        crawler = self.make_crawler()
+        first = crawler.search("마우스")
+
+        with patch.object(HtmlCrawler, "_parse_page") as mock_parse:
+            second = self.make_crawler().search("마우스")
+
+        mock_parse.assert_not_called()
+        assert [r.product_name for r in second] == [r.product_name for r in first]
+        assert second[0] is not first[0]
+
+    @responses.activate
+    def test_재사용한_결과는_크롤링_시각_갱신(self):
+        """보관된 결과를 재사용해도 crawled_at은 이번 검색 시각"""
+        from datetime import datetime
+
+        html_content = (FIXTURES_DIR / "search_results.html").read_text(encoding="utf-8")
+        responses.add(responses.GET, self.URL, body=html_content, status=200)
+        crawler = self.make_crawler()
+        first = crawler.search("마우스")
+
+        before = datetime.now()
+        second = crawler.search("마우스")
+
+        assert first and second
+        assert all(result.crawled_at >= before for result in second)
+        assert all(result.crawled_at <= before for result in first)
+
+    @responses.activate
+    def test_본문이나_선택자가_다르면_다시_파싱(self):
+        """본문 해시나 선택자 fingerprint가 다르면 새로 파싱"""
+        from unittest.mock import patch
+        from src.crawlers.html_crawler import HtmlCrawler
+
+        html_content = (FIXTURES_DIR / "search_results.html").read_text(encoding="utf-8")
+        responses.add(responses.GET, self.URL, body=html_content, status=200)
+        responses.add(responses.GET, self.URL, body=html_content + "<!-- v2 -->", status=200)
+        responses.add(responses.GET, self.URL, body=html_content, status=200)
+        self.make_crawler().search("마우스")
+
+        with patch.object(HtmlCrawler, "_parse_page", return_value=[]) as mock_parse:
+            self.make_crawler().search("마우스")
+            self.make_crawler(product_name="h3").search("마우스")
+
+        assert mock_parse.call_count == 2
+
+    @responses.activate
+    def test_스트리밍_네트워크_응답은_받는_대로_파싱(self):
+        """네트워크 응답은 본문을 모아 두지 않고 파싱하며, 끝까지 파싱한 결과는 보관"""
+        import hashlib
+        from unittest.mock import patch
+        from src.crawlers.html_crawler import HtmlCrawler
+        from src.crawlers.parser_backends import LxmlBackend
+        from src.utils.http_client import HttpClient
+
+        html_content = (FIXTURES_DIR / "search_results.html").read_text(encoding="utf-8")
+        responses.add(responses.GET, self.URL, body=html_content, status=200)
+        crawler = self.make_crawler()
+        crawler = HtmlCrawler(crawler.shop, http_client=HttpClient(), backend=LxmlBackend())
+        assert crawler.plan.container_matcher is not None
+        first = list(crawler.iter_search("마우스"))
+
+        with patch.object(LxmlBackend, "iter_parse", wraps=crawler.backend.iter_parse) as mock_parse:
+            second = list(crawler.iter_search("마우스"))
+
+        mock_parse.assert_called_once()
+        assert first
+        assert [r.product_name for r in second] == [r.product_name for r in first]
+        digest = hashlib.sha256(html_content.encode("utf-8")).hexdigest()
+        memo = crawler._get_parse_memo(crawler._get_parse_key(digest))
+        assert [r.product_name for r in memo] == [r.product_name for r in first]
+
+    @responses.activate
+    def test_중간에_멈춘_결과는_보관_안함(self):
+        """max_results로 멈춘 결과는 재사용하지 않음"""
+        html_content = (FIXTURES_DIR / "search_results.html").read_text(encoding="utf-8")
+        responses.add(responses.GET, self.URL, body=html_content, status=200)
+
+        crawler = self.make_crawler()
+        assert len(crawler.search("마우스", max_results=1)) == 1
+        assert len(crawler.search("마우스")) > 1
+
+    def test_fingerprint는_선택자와_무관한_수정에_유지(self):
+        """활성 여부 등 추출과 무관한 설정은 fingerprint를 바꾸지 않음"""
+        from src.crawlers.extraction_plan import get_selector_fingerprint
+        from src.crawlers.parser_backends import BeautifulSoupBackend, LxmlBackend
+
+        shop = self.make_crawler().shop
+        backend = BeautifulSoupBackend()
+        fingerprint = get_selector_fingerprint(shop, backend)
+
+        assert get_selector_fingerprint(shop.model_copy(update={"enabled": False}), backend) == fingerprint
+        assert get_selector_fingerprint(shop, LxmlBackend()) != fingerprint
+        changed = shop.model_copy(
+            update={"selectors": shop.selectors.model_copy(update={"product_price": ".price"})}
+        )
+        assert get_selector_fingerprint(changed, backend) != fingerprint
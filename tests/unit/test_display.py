@@ -199,3 +199,32 @@ class TestComparisonTable:
 
         assert lowest is not None
         assert lowest.price == 30000  # 품절 제외 시 최저가
+
+    def test_result_batch_비교_출력(self):
+        """ResultBatch도 리스트와 같은 비교 결과 출력"""
+        from src.display.table_renderer import TableRenderer
+        from src.models.result_batch import ResultBatch
+        from src.models.search import SearchResult, StockStatus
+
+        results = [
+            SearchResult(
+                shop_id="shop-1",
+                shop_name="상점A",
+                product_name="상품1",
+                price=10000,
+                stock_status=StockStatus.OUT_OF_STOCK,
+            ),
+            SearchResult(
+                shop_id="shop-2",
+                shop_name="상점B",
+                product_name="상품2",
+                price=20000,
+                stock_status=StockStatus.IN_STOCK,
+            ),
+        ]
+        batch = ResultBatch.from_results(results, keep_rows=False)
+
+        renderer = TableRenderer()
+
+        assert renderer.find_lowest_price(batch, exclude_out_of_stock=True).shop_id == "shop-2"
+        assert renderer.render_comparison(batch, "상품") == renderer.render_comparison(results, "상품")
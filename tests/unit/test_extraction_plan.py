@@ -0,0 +1,366 @@
+"""
+테스트: 상점별 추출 계획 (ExtractionPlan)
+"""
+
+import pytest
+from unittest.mock import patch
+
+
+def make_shop(**overrides):
+    """테스트용 상점"""
+    from src.models.shop import Shop, ShopSelectors
+
+    selectors = {
+        "product_container": ".product",
+        "product_name": ".name",
+        "product_price": ".price",
+        "product_link": "a",
+    }
+    selectors.update(overrides.pop("selectors", {}))
+    return Shop(
+        name="테스트",
+        base_url="https://example.com",
+        search_url_template="https://example.com/search?q={keyword}",
+        selectors=ShopSelectors(**selectors),
+        **overrides,
+    )
+
+
+PAGE_HTML = """
+<div class="product"><a href="/p/1"><span class="name">상품1</span></a><span class="price">1,000원</span></div>
+<div class="product"><a href="/p/2"><span class="name">상품2</span></a><span class="price">2,000원</span></div>
+"""
+
+
+class TestExtractionPlan:
+    """ExtractionPlan 생성/캐시 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def clear_plans(self):
+        from src.crawlers.extraction_plan import clear_extraction_plans
+
+        clear_extraction_plans()
+        yield
+        clear_extraction_plans()
+
+    def test_같은_상점_버전은_계획_재사용(self):
+        """같은 상점으로 만든 크롤러는 같은 계획 공유"""
+        from src.crawlers.html_crawler import HtmlCrawler
+
+        shop = make_shop()
+
+        assert HtmlCrawler(shop).plan is HtmlCrawler(shop).plan
+
+    def test_상점_수정_시_새_계획(self, tmp_path):
+        """ShopStore.update로 updated_at이 바뀌면 계획을 새로 생성"""
+        from src.crawlers.extraction_plan import get_extraction_plan
+        from src.storage.shop_store import ShopStore
+
+        store = ShopStore(config_dir=tmp_path)
+        shop = make_shop()
+        store.add(shop)
+        before = get_extraction_plan(store.get(shop.id))
+
+        updated = store.get(shop.id)
+        updated.selectors.product_name = ".title"
+        store.update(updated)
+        after = get_extraction_plan(store.get(shop.id))
+
+        assert after is not before
+        assert after.key != before.key
+
+    def test_형제_가격_위치_해석(self):
+        """'+ td + td + td'는 세 번째 형제"""
+        from src.crawlers.extraction_plan import build_extraction_plan
+
+        plan = build_extraction_plan(
+            make_shop(selectors={"product_name": ".", "product_price": "+ td + td + td"})
+        )
+
+        assert plan.name_is_self is True
+        assert plan.price is None
+        assert plan.price_sibling_offset == 3
+
+    def test_재고_패턴_소문자_변환_및_우선순위(self):
+        """상점 패턴을 기본 패턴보다 먼저, 대소문자 구분 없이 확인"""
+        from src.crawlers.extraction_plan import build_extraction_plan
+        from src.models.search import StockStatus
+        from src.models.shop import StockPatterns
+
+        plan = build_extraction_plan(
+            make_shop(stock_patterns=StockPatterns(in_stock=["Available"], out_of_stock=["SOLD"]))
+        )
+
+        assert plan.stock_tiers[0] == (("sold",), StockStatus.OUT_OF_STOCK)
+        assert plan.determine_stock_status("Sold Out") == StockStatus.OUT_OF_STOCK
+        assert plan.determine_stock_status("AVAILABLE now") == StockStatus.IN_STOCK
+        assert plan.determine_stock_status("재고 있음") == StockStatus.IN_STOCK
+        assert plan.determine_stock_status("문의") == StockStatus.UNKNOWN
+
+    @pytest.mark.parametrize("text, expected", [
+        # 낮은 단계 패턴이 먼저 나와도 앞선 단계가 우선
+        ("재고 있음 (일부 품절)", "OUT_OF_STOCK"),
+        # 뒤 단계 패턴 안에 겹친 앞 단계 패턴
+        ("Sold Out", "OUT_OF_STOCK"),
+        ("sold", "IN_STOCK"),
+        ("in stock", "IN_STOCK"),
+        ("", "UNKNOWN"),
+        ("문의", "UNKNOWN"),
+    ])
+    def test_재고_단계_우선순위(self, text, expected):
+        """텍스트 속 위치와 무관하게 단계 순서로 판별"""
+        from src.crawlers.extraction_plan import build_extraction_plan
+        from src.models.search import StockStatus
+        from src.models.shop import StockPatterns
+
+        plan = build_extraction_plan(
+            make_shop(stock_patterns=StockPatterns(in_stock=["sold"], out_of_stock=["out"]))
+        )
+
+        assert plan.determine_stock_status(text) == StockStatus(expected)
+
+    def test_펼친_패턴은_단계별_검사와_동일(self):
+        """부분 문자열이 겹치는 패턴도 단계 순서대로 검사한 결과와 같음"""
+        import random
+        from src.crawlers.extraction_plan import build_extraction_plan
+        from src.models.search import StockStatus
+        from src.models.shop import StockPatterns
+
+        rng = random.Random(0)
+        alphabet = "ab품절"
+
+        def word():
+            return "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 3)))
+
+        for _ in range(200):
+            plan = build_extraction_plan(make_shop(stock_patterns=StockPatterns(
+                in_stock=[word() for _ in range(3)],
+                out_of_stock=[word() for _ in range(3)],
+            )))
+            for _ in range(10):
+                text = "".join(rng.choice(alphabet + "A ") for _ in range(6))
+                expected = StockStatus.UNKNOWN
+                for patterns, status in plan.stock_tiers:
+                    if any(pattern in text.lower() for pattern in patterns):
+                        expected = status
+                        break
+                assert plan.determine_stock_status(text) == expected
+
+    def test_예약_상품명(self):
+        """예약/예정 키워드가 들어간 상품명"""
+        from src.crawlers.extraction_plan import PREORDER_MATCH_KEYWORDS, is_preorder_name
+
+        assert PREORDER_MATCH_KEYWORDS == ("예약", "예정")
+        assert is_preorder_name("[발매예정] HG 건담")
+        assert not is_preorder_name("HG 건담")
+
+    def test_품절_이미지_감지(self):
+        """alt의 '품절' 또는 대소문자 무시 src의 'soldout'"""
+        from src.crawlers.extraction_plan import build_extraction_plan
+        from src.crawlers.parser_backends import BeautifulSoupBackend, LxmlBackend, cssselect
+
+        html = (
+            '<div class="product"><img src="/a.jpg" alt="상품"></div>'
+            '<div class="product"><img src="/a.jpg"><img src="/icon/SoldOut.gif"></div>'
+            '<div class="product"><img alt="품절 상품"></div>'
+        )
+        backend_classes = [BeautifulSoupBackend]
+        if cssselect is not None:
+            backend_classes.append(LxmlBackend)
+
+        for backend_class in backend_classes:
+            plan = build_extraction_plan(make_shop(), backend=backend_class())
+            containers = plan.backend.select_compiled(plan.backend.parse(html), plan.container)
+
+            assert [plan.has_soldout_image(c) for c in containers] == [False, True, True]
+
+    def test_잘못된_선택자(self):
+        """컴파일할 수 없는 선택자는 ValueError"""
+        from src.crawlers.extraction_plan import build_extraction_plan
+        from src.crawlers.parser_backends import BeautifulSoupBackend
+
+        with pytest.raises(ValueError):
+            build_extraction_plan(
+                make_shop(selectors={"product_name": "div[["}),
+                backend=BeautifulSoupBackend(),
+            )
+
+    def test_파싱_중_선택자_재컴파일_없음(self):
+        """상품마다 선택자를 다시 해석하지 않음"""
+        from src.crawlers.html_crawler import HtmlCrawler
+        from src.crawlers.parser_backends import BeautifulSoupBackend, LxmlBackend, cssselect
+
+        backend_classes = [BeautifulSoupBackend]
+        if cssselect is not None:
+            backend_classes.append(LxmlBackend)
+
+        for backend_class in backend_classes:
+            crawler = HtmlCrawler(make_shop(), backend=backend_class())
+
+            with patch.object(backend_class, "compile") as mock_compile, \
+                    patch.object(backend_class, "select") as mock_select:
+                results = crawler.parse_html(PAGE_HTML)
+
+            assert [r.price for r in results] == [1000, 2000]
+            mock_compile.assert_not_called()
+            mock_select.assert_not_called()
+
+
+class TestPartialParse:
+    """컨테이너 하위 트리만 파싱하는 부분 파싱 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def clear_plans(self):
+        from src.crawlers.extraction_plan import clear_extraction_plans
+
+        clear_extraction_plans()
+        yield
+        clear_extraction_plans()
+
+    @pytest.mark.parametrize("selector, expected", [
+        ("ul.prdList li.xans-record-", ("ul", [(".", "prdList")])),
+        ("td[width='240px'][valign='top']", ("td", [("[", "width"), ("[", "valign")])),
+        ("DIV#Main > .item", ("div", [("#", "Main")])),
+        (".product", (None, [(".", "product")])),
+        (".a, .b", None),
+        ("li:first-child span", None),
+        ("div + .item", None),
+        ("*", None),
+    ])
+    def test_첫_복합_선택자_해석(self, selector, expected):
+        """그룹/형제 조합자/가상 클래스가 있으면 부분 파싱 불가"""
+        from src.crawlers.parser_backends import _get_first_compound
+
+        assert _get_first_compound(selector) == expected
+
+    def test_컨테이너_밖_요소_제외(self):
+        """내비게이션/스크립트는 파싱하지 않고 상품 결과는 동일"""
+        from src.crawlers.html_crawler import HtmlCrawler
+        from src.crawlers.parser_backends import BeautifulSoupBackend
+
+        html = (
+            "<nav><a href='/'>홈</a></nav><script>var x = 1;</script>"
+            f"<main class='list'>{PAGE_HTML}</main><footer>회사 정보</footer>"
+        )
+        backend = BeautifulSoupBackend()
+        full = HtmlCrawler(make_shop(), backend=backend)
+        partial = HtmlCrawler(make_shop(partial_parse=True), backend=backend)
+
+        document = backend.parse(html, parse_only=partial.plan.strainer)
+
+        assert partial.plan.strainer is not None
+        assert document.find("nav") is None
+        assert document.find("script") is None
+        assert [(r.product_name, r.price, r.product_url) for r in partial.parse_html(html)] == \
+            [(r.product_name, r.price, r.product_url) for r in full.parse_html(html)]
+
+    def test_여러_클래스_중_일치(self):
+        """class 속성에 여러 클래스가 있어도 후보 유지"""
+        from src.crawlers.html_crawler import HtmlCrawler
+        from src.crawlers.parser_backends import BeautifulSoupBackend
+
+        html = PAGE_HTML.replace('class="product"', 'class="new product item"')
+        crawler = HtmlCrawler(make_shop(partial_parse=True), backend=BeautifulSoupBackend())
+
+        assert [r.price for r in crawler.parse_html(html)] == [1000, 2000]
+
+    def test_형제_가격은_전체_파싱(self):
+        """형제 가격 선택자는 컨테이너 밖을 참조하므로 부분 파싱 안 함"""
+        from src.crawlers.extraction_plan import build_extraction_plan
+        from src.crawlers.parser_backends import BeautifulSoupBackend
+
+        plan = build_extraction_plan(
+            make_shop(
+                partial_parse=True,
+                selectors={"product_name": ".", "product_price": "+ td"},
+            ),
+            backend=BeautifulSoupBackend(),
+        )
+
+        assert plan.strainer is None
+
+    def test_부분_파싱_설정_변경_시_새_계획(self):
+        """partial_parse가 다르면 다른 계획"""
+        from src.crawlers.extraction_plan import get_extraction_plan
+
+        shop = make_shop()
+        before = get_extraction_plan(shop)
+        after = get_extraction_plan(shop.model_copy(update={"partial_parse": True}))
+
+        assert before.strainer is None
+        assert after is not before
+
+
+ROW_HTML = """
+<table>
+  <tr><td><a href="/p/1">상품1</a></td><td>a</td><!-- c --><td class="cat">b</td><th>c</th><td class="price">1,000원</td></tr>
+  <tr><td><a href="/p/2">상품2</a></td><th>a</th><td>b</td><td>c</td><td>d</td></tr>
+</table>
+"""
+
+
+class TestSiblingSelector:
+    """형제 가격 선택자 테스트"""
+
+    @pytest.fixture(params=["bs4", "lxml"])
+    def backend(self, request):
+        from src.crawlers.parser_backends import BeautifulSoupBackend, LxmlBackend
+
+        return BeautifulSoupBackend() if request.param == "bs4" else LxmlBackend()
+
+    def find_prices(self, backend, price_selector):
+        """행마다 형제 가격 요소의 텍스트 (없으면 None)"""
+        from src.crawlers.extraction_plan import build_extraction_plan
+
+        plan = build_extraction_plan(
+            make_shop(selectors={
+                "product_container": "a",
+                "product_name": ".",
+                "product_price": price_selector,
+            }),
+            backend=backend,
+        )
+        document = backend.parse(ROW_HTML)
+        found = [plan.find_price_sibling(a) for a in backend.select_compiled(document, plan.container)]
+        return [backend.get_text(node) if node is not None else None for node in found]
+
+    def test_단계_컴파일(self, backend):
+        """태그만 있는 단계는 태그 비교, 그 외에는 매처"""
+        from src.crawlers.extraction_plan import compile_sibling_steps
+
+        steps = compile_sibling_steps("+ td +TD ~ td.price ~ *", backend)
+
+        assert [step[:2] for step in steps] == [("+", "td"), ("+", "td"), ("~", None), ("~", None)]
+        assert steps[2][2] is not None
+        assert steps[3][2] is None
+
+    @pytest.mark.parametrize("selector", ["+", "+ td > b", "+ td span"])
+    def test_지원하지_않는_선택자(self, backend, selector):
+        """형제 단계가 아닌 부분이 있으면 ValueError"""
+        from src.crawlers.extraction_plan import compile_sibling_steps
+
+        with pytest.raises(ValueError):
+            compile_sibling_steps(selector, backend)
+
+    def test_인접_형제는_태그가_일치해야_함(self, backend):
+        """'+ td'는 바로 다음 형제가 td일 때만 일치 (주석 제외)"""
+        assert self.find_prices(backend, "+ td + td") == ["b", None]
+        assert self.find_prices(backend, "+ * + * + *") == ["c", "c"]
+
+    def test_일반_형제는_일치하는_형제를_찾음(self, backend):
+        """'~'는 사이의 다른 형제를 건너뜀"""
+        assert self.find_prices(backend, "~ td.price") == ["1,000원", None]
+        assert self.find_prices(backend, "~ th") == ["c", "a"]
+
+    def test_일반_형제_뒤_인접_형제(self, backend):
+        """'~ td + td'는 첫 td에서 실패하면 다음 td로 다시 시도"""
+        assert self.find_prices(backend, "~ th + td") == ["1,000원", "b"]
+        assert self.find_prices(backend, "~ td + th") == ["c", None]
+
+    def test_필요한_형제만_확인(self, backend):
+        """'+' 단계는 단계 수만큼만 다음 형제를 확인"""
+        with patch.object(backend, "next_sibling", wraps=backend.next_sibling) as next_sibling:
+            self.find_prices(backend, "+ td + td")
+
+        # 1행: td, td / 2행: th에서 중단
+        assert next_sibling.call_count == 3
@@ -0,0 +1,252 @@
+"""
+테스트: 디스크 HTTP 응답 캐시 (HttpCache)
+"""
+
+import pytest
+import responses
+from unittest.mock import patch
+
+
+class FakeClock:
+    """수동으로 진행하는 시계"""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+PAGE_HTML = """
+<html><body>
+    <div class="product"><span class="name">무선 마우스</span><span class="price">25,000원</span></div>
+</body></html>
+"""
+
+
+class TestHttpCache:
+    """HttpCache 저장/조회 테스트"""
+
+    def test_저장_후_조회(self, tmp_path):
+        """저장한 본문과 검증자를 그대로 조회"""
+        from src.utils.http_cache import HttpCache
+
+        cache = HttpCache(tmp_path)
+        cache.put("https://example.com/a", b"<html>A</html>", "utf-8", etag='"v1"')
+
+        entry = cache.get("https://example.com/a")
+
+        assert entry.body == b"<html>A</html>"
+        assert entry.decode() == "<html>A</html>"
+        assert entry.get_validators() == {"If-None-Match": '"v1"'}
+
+    def test_없는_항목(self, tmp_path):
+        """저장되지 않은 URL은 None"""
+        from src.utils.http_cache import HttpCache
+
+        assert HttpCache(tmp_path).get("https://example.com/none") is None
+
+    def test_ttl_경과_판정(self, tmp_path):
+        """TTL이 지나면 신선하지 않음"""
+        from src.utils.http_cache import HttpCache
+
+        clock = FakeClock()
+        cache = HttpCache(tmp_path, ttl=60, clock=clock)
+        entry = cache.put("https://example.com/a", b"A")
+
+        assert cache.is_fresh(entry) is True
+        clock.now += 60
+        assert cache.is_fresh(entry) is False
+
+    def test_refresh_모드는_항상_재검증(self, tmp_path):
+        """refresh=True면 TTL 이내여도 신선하지 않음"""
+        from src.utils.http_cache import HttpCache
+
+        cache = HttpCache(tmp_path, refresh=True)
+        entry = cache.put("https://example.com/a", b"A")
+
+        assert cache.is_fresh(entry) is False
+
+    def test_최대_크기_초과_시_lru_삭제(self, tmp_path):
+        """크기를 넘으면 가장 오래 사용하지 않은 항목부터 삭제"""
+        import os
+        from src.utils.http_cache import HttpCache
+
+        cache = HttpCache(tmp_path, max_size=2500)
+        cache.put("https://example.com/a", b"a" * 1000)
+        cache.put("https://example.com/b", b"b" * 1000)
+
+        # a를 최근 사용으로 만들고 b는 오래된 것으로 설정
+        body_b, _ = cache._get_paths("https://example.com/b")
+        os.utime(body_b, (0, 0))
+        cache.get("https://example.com/a")
+
+        cache.put("https://example.com/c", b"c" * 1000)
+
+        assert cache.get("https://example.com/b") is None
+        assert cache.get("https://example.com/a") is not None
+        assert cache.get("https://example.com/c") is not None
+        assert cache.get_size() <= 2500
+
+    def test_손상된_항목은_무시(self, tmp_path):
+        """메타데이터가 손상되면 캐시 미스"""
+        from src.utils.http_cache import HttpCache
+
+        cache = HttpCache(tmp_path)
+        cache.put("https://example.com/a", b"A")
+        _, meta_path = cache._get_paths("https://example.com/a")
+        meta_path.write_text("{ invalid", encoding="utf-8")
+
+        assert cache.get("https://example.com/a") is None
+
+    def test_저장_중인_항목은_무시(self, tmp_path):
+        """본문만 교체된 시점에 읽으면 이전 digest와 짝짓지 않고 캐시 미스"""
+        import hashlib
+        from src.utils.http_cache import HttpCache
+
+        url = "https://example.com/a"
+        cache = HttpCache(tmp_path)
+        cache.put(url, b"<html>old</html>")
+        body_path, _ = cache._get_paths(url)
+        # put은 본문을 먼저 교체한 뒤 메타데이터를 교체
+        body_path.write_bytes(b"<html>new</html>")
+
+        assert cache.get(url) is None
+
+        entry = cache.put(url, b"<html>new</html>")
+        assert cache.get(url).digest == entry.digest == hashlib.sha256(b"<html>new</html>").hexdigest()
+
+
+class TestHttpClientCache:
+    """HttpClient 캐시 연동 테스트"""
+
+    @responses.activate
+    def test_ttl_이내_요청_생략(self, tmp_path):
+        """TTL 이내 재요청은 네트워크 없이 캐시 사용"""
+        from src.utils.http_cache import HttpCache
+        from src.utils.http_client import HttpClient
+
+        url = "https://example.com/search"
+        responses.add(responses.GET, url, body="<html>OK</html>", status=200)
+
+        client = HttpClient(cache=HttpCache(tmp_path, ttl=60))
+        client.get_html(url)
+        page = client.fetch_html(url)
+
+        assert page.text == "<html>OK</html>"
+        assert page.from_cache is True
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_조건부_요청_304(self, tmp_path):
+        """TTL이 지나면 검증자를 보내고 304면 저장된 본문 사용"""
+        from src.utils.http_cache import HttpCache
+        from src.utils.http_client import HttpClient
+
+        url = "https://example.com/search"
+        responses.add(
+            responses.GET,
+            url,
+            body="<html>OK</html>",
+            status=200,
+            headers={"ETag": '"v1"', "Last-Modified": "Wed, 21 Oct 2026 07:28:00 GMT"},
+        )
+        responses.add(responses.GET, url, status=304)
+
+        client = HttpClient(cache=HttpCache(tmp_path, ttl=0))
+        client.get_html(url)
+        page = client.fetch_html(url)
+
+        assert page.text == "<html>OK</html>"
+        assert page.from_cache is True
+        request_headers = responses.calls[1].request.headers
+        assert request_headers["If-None-Match"] == '"v1"'
+        assert request_headers["If-Modified-Since"] == "Wed, 21 Oct 2026 07:28:00 GMT"
+
+    @responses.activate
+    def test_변경된_응답은_갱신(self, tmp_path):
+        """재검증 결과 200이면 새 본문으로 교체"""
+        from src.utils.http_cache import HttpCache
+        from src.utils.http_client import HttpClient
+
+        url = "https://example.com/search"
+        responses.add(responses.GET, url, body="old", status=200, headers={"ETag": '"v1"'})
+        responses.add(responses.GET, url, body="new", status=200, headers={"ETag": '"v2"'})
+
+        cache = HttpCache(tmp_path, ttl=0)
+        client = HttpClient(cache=cache)
+        client.get_html(url)
+        page = client.fetch_html(url)
+
+        assert page.text == "new"
+        assert page.from_cache is False
+        assert cache.get(url).etag == '"v2"'
+
+    @responses.activate
+    def test_no_store_응답은_저장_안함(self, tmp_path):
+        """Cache-Control: no-store 응답은 캐시하지 않음"""
+        from src.utils.http_cache import HttpCache
+        from src.utils.http_client import HttpClient
+
+        url = "https://example.com/search"
+        responses.add(
+            responses.GET, url, body="OK", status=200,
+            headers={"Cache-Control": "no-store"},
+        )
+
+        cache = HttpCache(tmp_path)
+        HttpClient(cache=cache).get_html(url)
+
+        assert cache.get(url) is None
+
+    @responses.activate
+    def test_304면_파싱_생략(self, tmp_path):
+        """304로 재검증된 본문은 다시 파싱하지 않음"""
+        from src.crawlers.html_crawler import HtmlCrawler
+        from src.models.shop import Shop, ShopSelectors
+        from src.utils.http_cache import HttpCache
+        from src.utils.http_client import HttpClient
+
+        url = "https://example.com/search?q=%EB%A7%88%EC%9A%B0%EC%8A%A4"
+        responses.add(responses.GET, url, body=PAGE_HTML, status=200, headers={"ETag": '"v1"'})
+        responses.add(responses.GET, url, status=304)
+
+        shop = Shop(
+            name="테스트",
+            base_url="https://example.com",
+            search_url_template="https://example.com/search?q={keyword}",
+            selectors=ShopSelectors(
+                product_container=".product",
+                product_name=".name",
+                product_price=".price",
+            ),
+        )
+        crawler = HtmlCrawler(shop, http_client=HttpClient(cache=HttpCache(tmp_path, ttl=0)))
+        first = crawler.search("마우스")
+
+        with patch.object(HtmlCrawler, "parse_html") as mock_parse, \
+                patch.object(type(crawler.backend), "iter_parse") as mock_iter_parse:
+            second = crawler.search("마우스")
+
+        mock_parse.assert_not_called()
+        mock_iter_parse.assert_not_called()
+        assert [r.product_name for r in second] == [r.product_name for r in first]
+        assert second[0].price == 25000
+
+
+class TestCLICacheOptions:
+    """search 명령 캐시 옵션 테스트"""
+
+    def test_캐시_옵션_파싱(self):
+        """--no-cache / --refresh 옵션"""
+        from src.cli.main import parse_args
+
+        assert parse_args(["search", "마우스", "--no-cache"]).no_cache is True
+        assert parse_args(["search", "마우스", "--refresh"]).refresh is True
+
+    def test_캐시_옵션_동시_사용_불가(self):
+        """--no-cache와 --refresh는 함께 쓸 수 없음"""
+        from src.cli.main import parse_args
+
+        with pytest.raises(SystemExit):
+            parse_args(["search", "마우스", "--no-cache", "--refresh"])
@@ -164,3 +164,627 @@ class TestHttpClient:
 
         assert "상품1" in html
         assert "<!DOCTYPE html>" in html
+
+
+class TestSharedHttpClient:
+    """공용 HttpClient 레지스트리 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def reset_shared(self):
+        """테스트 간 공용 클라이언트 초기화"""
+        from src.utils.http_client import HttpClient
+
+        HttpClient.close_shared()
+        yield
+        HttpClient.close_shared()
+
+    def test_같은_설정이면_같은_클라이언트(self):
+        """verify_ssl이 같으면 동일한 클라이언트 반환"""
+        from src.utils.http_client import HttpClient
+
+        assert HttpClient.shared() is HttpClient.shared()
+        assert HttpClient.shared(verify_ssl=False) is HttpClient.shared(verify_ssl=False)
+        assert HttpClient.shared() is not HttpClient.shared(verify_ssl=False)
+
+    def test_풀_크기_확장(self):
+        """더 큰 풀이 요청되면 어댑터 풀 확장"""
+        from src.utils.http_client import HttpClient
+
+        client = HttpClient.shared()
+        assert client.pool_maxsize == HttpClient.DEFAULT_POOL_MAXSIZE
+
+        HttpClient.shared(pool_maxsize=64)
+        assert client.pool_maxsize == 64
+        assert client.session.get_adapter("https://example.com")._pool_maxsize == 64
+
+        # 더 작은 요청은 풀을 줄이지 않음
+        HttpClient.shared(pool_maxsize=2)
+        assert client.pool_maxsize == 64
+
+    @responses.activate
+    def test_풀_확장_시_이전_어댑터_닫기(self):
+        """교체한 어댑터의 풀은 닫고, 진행 중인 응답은 끝까지 읽을 수 있음"""
+        from unittest.mock import patch
+        from requests.adapters import HTTPAdapter
+        from src.utils.http_client import HttpClient
+
+        url = "https://example.com/search"
+        responses.add(responses.GET, url, body="<html>" + "x" * 100 + "</html>", status=200)
+
+        client = HttpClient(pool_maxsize=4)
+        old = client.session.get_adapter(url)
+        stream = client.stream_html(url, chunk_size=10)
+
+        with patch.object(HTTPAdapter, "close", autospec=True, side_effect=HTTPAdapter.close) as mock_close:
+            client._mount_adapter(64)
+
+        assert [call.args[0] for call in mock_close.call_args_list] == [old]
+        assert client.session.get_adapter(url) is not old
+        assert b"".join(stream.chunks).endswith(b"</html>")
+        client.close()
+
+    def test_html_crawler_공용_클라이언트_사용(self):
+        """클라이언트 미지정 시 HtmlCrawler들이 공용 클라이언트 공유"""
+        from src.crawlers.html_crawler import HtmlCrawler
+        from src.models.shop import Shop, ShopSelectors
+        from src.utils.http_client import HttpClient
+
+        def make_shop(verify_ssl):
+            return Shop(
+                name="테스트",
+                base_url="https://example.com",
+                search_url_template="https://example.com/search?q={keyword}",
+                selectors=ShopSelectors(
+                    product_container=".product",
+                    product_name=".name",
+                    product_price=".price",
+                ),
+                verify_ssl=verify_ssl,
+            )
+
+        first = HtmlCrawler(make_shop(True))
+        second = HtmlCrawler(make_shop(True))
+        insecure = HtmlCrawler(make_shop(False))
+
+        assert first.http_client is second.http_client
+        assert first.http_client is HttpClient.shared(verify_ssl=True)
+        assert insecure.http_client is HttpClient.shared(verify_ssl=False)
+
+    def test_반복_요청_시_연결_재사용(self):
+        """keep-alive로 같은 TCP 연결을 재사용"""
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        from src.utils.http_client import HttpClient
+
+        client_ports = []
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                client_ports.append(self.client_address[1])
+                body = b"<html>OK</html>"
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/search"
+            for _ in range(3):
+                assert HttpClient.shared().get_html(url) == "<html>OK</html>"
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert len(client_ports) == 3
+        assert len(set(client_ports)) == 1
+
+
+class TestRateLimiter:
+    """호스트별 속도 제한기 테스트"""
+
+    def test_제한_없는_호스트는_대기_없음(self):
+        """설정되지 않은 호스트는 바로 통과"""
+        from src.utils.http_client import RateLimiter
+
+        limiter = RateLimiter()
+        assert all(limiter.reserve("example.com") == 0.0 for _ in range(10))
+
+    def test_버스트_이후_대기(self):
+        """버스트만큼은 즉시, 이후에는 1/rate 간격으로 대기"""
+        from src.utils.http_client import RateLimiter
+
+        limiter = RateLimiter()
+        limiter.configure("shop.example.com", rate=10.0, burst=2)
+
+        delays = [limiter.reserve("shop.example.com") for _ in range(4)]
+
+        assert delays[0] == 0.0
+        assert delays[1] == 0.0
+        assert delays[2] == pytest.approx(0.1, abs=0.01)
+        assert delays[3] == pytest.approx(0.2, abs=0.01)
+
+    def test_호스트별_독립_버킷(self):
+        """다른 호스트의 요청은 서로 영향을 주지 않음"""
+        from src.utils.http_client import RateLimiter
+
+        limiter = RateLimiter()
+        limiter.configure("a.example.com", rate=1.0)
+        limiter.configure("b.example.com", rate=1.0)
+
+        assert limiter.reserve("a.example.com") == 0.0
+        assert limiter.reserve("b.example.com") == 0.0
+        assert limiter.reserve("a.example.com") > 0.5
+
+    def test_제한_해제(self):
+        """rate=None으로 설정하면 제한 해제"""
+        from src.utils.http_client import RateLimiter
+
+        limiter = RateLimiter()
+        limiter.configure("shop.example.com", rate=1.0)
+        limiter.reserve("shop.example.com")
+
+        limiter.configure("shop.example.com", rate=None)
+        assert limiter.reserve("shop.example.com") == 0.0
+
+    def test_스레드_간_공유(self):
+        """여러 스레드의 요청이 같은 버킷 순서를 따름"""
+        import threading
+        import time
+        from src.utils.http_client import RateLimiter
+
+        limiter = RateLimiter()
+        limiter.configure("shop.example.com", rate=50.0, burst=1)
+
+        started = time.monotonic()
+        threads = [
+            threading.Thread(target=limiter.acquire, args=("shop.example.com",))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # 첫 요청 이후 4회는 각각 20ms 간격
+        assert time.monotonic() - started >= 0.08 - 0.01
+
+    def test_비동기_대기_및_통계(self):
+        """비동기 태스크도 같은 버킷을 쓰고 대기 시간이 통계에 기록됨"""
+        import asyncio
+        from src.utils.http_client import RateLimiter
+
+        limiter = RateLimiter()
+        limiter.configure("shop.example.com", rate=100.0, burst=1)
+
+        async def run():
+            return await asyncio.gather(*(
+                limiter.acquire_async("shop.example.com") for _ in range(3)
+            ))
+
+        waits = asyncio.run(run())
+        stats = limiter.get_stats("shop.example.com")
+
+        assert sorted(waits)[0] == 0.0
+        assert stats.requests == 3
+        assert stats.total_wait == pytest.approx(sum(waits))
+        assert stats.max_wait == pytest.approx(max(waits))
+
+    @responses.activate
+    def test_get_요청_시_속도_제한_적용(self):
+        """HttpClient.get이 요청 호스트로 속도 제한기를 거침"""
+        from unittest.mock import MagicMock
+        from src.utils.http_client import HttpClient
+
+        responses.add(responses.GET, "https://shop.example.com/search", body="OK")
+
+        limiter = MagicMock()
+        client = HttpClient(rate_limiter=limiter)
+        client.get("https://shop.example.com/search")
+
+        limiter.acquire.assert_called_once_with("shop.example.com")
+
+    def test_상점_설정으로_속도_제한_등록(self):
+        """HtmlCrawler 생성 시 상점의 rate_limit이 검색 호스트에 등록됨"""
+        from src.crawlers.html_crawler import HtmlCrawler
+        from src.models.shop import Shop, ShopSelectors
+        from src.utils.http_client import HttpClient, RateLimiter
+
+        shop = Shop(
+            name="테스트",
+            base_url="https://example.com",
+            search_url_template="https://search.example.com/find?q={keyword}",
+            selectors=ShopSelectors(
+                product_container=".product",
+                product_name=".name",
+                product_price=".price",
+            ),
+            rate_limit=1.0,
+            rate_burst=1,
+        )
+
+        limiter = RateLimiter()
+        HtmlCrawler(shop, http_client=HttpClient(rate_limiter=limiter))
+
+        assert limiter.reserve("search.example.com") == 0.0
+        assert limiter.reserve("search.example.com") > 0.5
+
+
+class TestRetryPolicy:
+    """재시도 정책 테스트"""
+
+    @staticmethod
+    def fast_policy(**kwargs):
+        """대기 없이 재시도하는 정책"""
+        from src.models.shop import RetryPolicy
+
+        return RetryPolicy(backoff_base=0, **kwargs)
+
+    @responses.activate
+    def test_일시적_5xx_재시도_후_성공(self):
+        """503 응답 후 재시도하여 성공"""
+        from src.utils.http_client import HttpClient
+
+        url = "https://example.com/flaky"
+        responses.add(responses.GET, url, status=503)
+        responses.add(responses.GET, url, body="OK", status=200)
+
+        client = HttpClient(retry_policy=self.fast_policy())
+        response = client.get(url)
+
+        assert response.text == "OK"
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_재시도_전_오류_응답_닫기(self):
+        """stream=True로 받은 재시도 대상 응답은 재시도 전에 닫음"""
+        from unittest.mock import patch
+        import requests
+        from src.utils.http_client import HttpClient
+
+        url = "https://example.com/flaky"
+        responses.add(responses.GET, url, status=503)
+        responses.add(responses.GET, url, body="OK", status=200)
+
+        client = HttpClient(retry_policy=self.fast_policy())
+        with patch.object(requests.Response, "close", autospec=True) as mock_close:
+            response = client.get(url, stream=True)
+
+        assert [call.args[0].status_code for call in mock_close.call_args_list] == [503]
+        assert response.status_code == 200
+
+    @responses.activate
+    def test_타임아웃_재시도_후_성공(self):
+        """타임아웃 후 재시도하여 성공"""
+        from requests.exceptions import Timeout
+        from src.utils.http_client import HttpClient
+
+        url = "https://example.com/slow"
+        responses.add(responses.GET, url, body=Timeout("timed out"))
+        responses.add(responses.GET, url, body="OK", status=200)
+
+        client = HttpClient(retry_policy=self.fast_policy())
+
+        assert client.get(url).text == "OK"
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_재시도_소진(self):
+        """최대 시도 횟수를 넘기면 마지막 오류 발생"""
+        from src.utils.http_client import HttpClient, HttpClientError
+
+        url = "https://example.com/down"
+        responses.add(responses.GET, url, status=502)
+
+        client = HttpClient(retry_policy=self.fast_policy(max_attempts=3))
+
+        with pytest.raises(HttpClientError) as exc_info:
+            client.get(url)
+
+        assert "502" in str(exc_info.value)
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_재시도_대상_아닌_상태_코드(self):
+        """4xx 응답은 재시도하지 않음"""
+        from src.utils.http_client import HttpClient, HttpClientError
+
+        url = "https://example.com/missing"
+        responses.add(responses.GET, url, status=404)
+
+        client = HttpClient(retry_policy=self.fast_policy())
+
+        with pytest.raises(HttpClientError):
+            client.get(url)
+
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_retry_after_준수(self):
+        """429 응답의 Retry-After만큼 대기 후 재시도"""
+        from unittest.mock import patch
+        from src.utils.http_client import HttpClient
+
+        url = "https://example.com/busy"
+        responses.add(responses.GET, url, status=429, headers={"Retry-After": "2"})
+        responses.add(responses.GET, url, body="OK", status=200)
+
+        client = HttpClient(retry_policy=self.fast_policy())
+
+        with patch("src.utils.http_client.time.sleep") as mock_sleep:
+            assert client.get(url).text == "OK"
+
+        mock_sleep.assert_called_once_with(2.0)
+
+    @responses.activate
+    def test_retry_after_상한_초과시_포기(self):
+        """Retry-After가 상한보다 길면 재시도하지 않음"""
+        from src.utils.http_client import HttpClient, HttpClientError
+
+        url = "https://example.com/busy"
+        responses.add(responses.GET, url, status=503, headers={"Retry-After": "3600"})
+
+        client = HttpClient(retry_policy=self.fast_policy(max_retry_after=30))
+
+        with pytest.raises(HttpClientError):
+            client.get(url)
+
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_마감_시각_초과_시_재시도_중단(self):
+        """백오프 대기가 마감 시각을 넘기면 재시도하지 않음"""
+        import time
+        from src.models.shop import RetryPolicy
+        from src.utils.http_client import HttpClient, HttpClientError
+
+        url = "https://example.com/down"
+        responses.add(responses.GET, url, status=503)
+
+        client = HttpClient(retry_policy=RetryPolicy(backoff_base=5, jitter=False))
+
+        with pytest.raises(HttpClientError):
+            client.get(url, deadline=time.monotonic() + 1)
+
+        assert len(responses.calls) == 1
+
+    def test_마감_시각_지난_요청(self):
+        """마감 시각이 이미 지났으면 요청하지 않음"""
+        import time
+        from src.utils.http_client import HttpClient, HttpClientError
+
+        client = HttpClient()
+
+        with pytest.raises(HttpClientError) as exc_info:
+            client.get("https://example.com/", deadline=time.monotonic() - 1)
+
+        assert "제한 시간" in str(exc_info.value)
+
+    def test_시도별_타임아웃은_남은_시간으로_제한(self):
+        """남은 시간이 타임아웃보다 짧으면 남은 시간만큼만 대기"""
+        import time
+        from src.utils.http_client import get_attempt_timeout
+
+        assert get_attempt_timeout(30, "https://example.com/") == 30
+        timeout = get_attempt_timeout(30, "https://example.com/", time.monotonic() + 5)
+        assert 4 < timeout <= 5
+
+    def test_retry_after_파싱(self):
+        """Retry-After 초/HTTP 날짜 형식 파싱"""
+        from datetime import datetime, timedelta, timezone
+        from email.utils import format_datetime
+        from src.utils.http_client import parse_retry_after
+
+        assert parse_retry_after("120") == 120.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("나중에") is None
+
+        future = datetime.now(timezone.utc) + timedelta(seconds=60)
+        parsed = parse_retry_after(format_datetime(future, usegmt=True))
+        assert 55 <= parsed <= 60
+
+        past = datetime.now(timezone.utc) - timedelta(seconds=60)
+        assert parse_retry_after(format_datetime(past, usegmt=True)) == 0.0
+
+    def test_백오프_계산(self):
+        """지수 백오프와 지터"""
+        from src.models.shop import RetryPolicy
+
+        policy = RetryPolicy(backoff_base=1, backoff_max=5, jitter=False)
+        assert [policy.get_backoff(n) for n in range(1, 5)] == [1, 2, 4, 5]
+
+        jittered = RetryPolicy(backoff_base=1, jitter=True)
+        assert all(0 <= jittered.get_backoff(3) <= 4 for _ in range(20))
+
+    def test_멱등성_없는_메서드는_재시도_안함(self):
+        """POST 등 멱등하지 않은 메서드는 재시도 대상이 아님"""
+        from src.models.shop import RetryPolicy
+
+        policy = RetryPolicy()
+        assert policy.is_retryable_status("GET", 503)
+        assert not policy.is_retryable_status("POST", 503)
+        assert not policy.is_retryable_status("GET", 404)
+
+    @responses.activate
+    def test_상점별_재시도_정책_적용(self):
+        """HtmlCrawler는 상점의 재시도 정책을 사용"""
+        from src.crawlers.html_crawler import CrawlError, HtmlCrawler
+        from src.models.shop import RetryPolicy, Shop, ShopSelectors
+        from src.utils.http_client import HttpClient
+
+        responses.add(responses.GET, "https://example.com/search", status=503)
+
+        shop = Shop(
+            name="테스트",
+            base_url="https://example.com",
+            search_url_template="https://example.com/search?q={keyword}",
+            selectors=ShopSelectors(
+                product_container=".product",
+                product_name=".name",
+                product_price=".price",
+            ),
+            retry_policy=RetryPolicy(max_attempts=1),
+        )
+
+        with pytest.raises(CrawlError):
+            HtmlCrawler(shop, http_client=HttpClient()).search("마우스")
+
+        assert len(responses.calls) == 1
+
+
+class TestStreamHtml:
+    """HttpClient.stream_html 테스트"""
+
+    @responses.activate
+    def test_조각_단위_수신(self):
+        """조각을 이어 붙이면 전체 본문"""
+        from src.utils.http_client import HttpClient
+
+        url = "https://example.com/search"
+        body = "<html><body>" + "<p>상품</p>" * 100 + "</body></html>"
+        responses.add(
+            responses.GET, url, body=body.encode("euc-kr"), status=200,
+            content_type="text/html; charset=euc-kr",
+        )
+
+        stream = HttpClient().stream_html(url, chunk_size=10)
+        chunks = list(stream.chunks)
+
+        assert len(chunks) > 1
+        assert stream.encoding == "cp949"
+        assert b"".join(chunks).decode(stream.encoding) == body
+
+    @responses.activate
+    def test_선언이_없는_UTF8은_추정하지_않음(self):
+        """올바른 UTF-8 첫 조각은 chardet 없이 UTF-8로 판별하고 바이트를 그대로 반환"""
+        from unittest.mock import patch
+        from src.utils.http_client import HttpClient
+
+        url = "https://example.com/search"
+        body = ("<html><body>" + "<p>상품</p>" * 100 + "</body></html>").encode("utf-8")
+        responses.add(responses.GET, url, body=body, status=200, content_type="text/html")
+
+        with patch("src.utils.http_client.chardet.detect") as mock_detect:
+            stream = HttpClient().stream_html(url, chunk_size=10)
+            content = b"".join(stream.chunks)
+
+        mock_detect.assert_not_called()
+        assert stream.encoding == "utf-8"
+        assert content == body
+
+    @responses.activate
+    def test_끝까지_받은_응답만_캐시(self, tmp_path):
+        """중간에 닫은 응답은 저장하지 않고, 끝까지 받으면 저장 후 digest 설정"""
+        from src.utils.http_cache import HttpCache
+        from src.utils.http_client import HttpClient
+
+        url = "https://example.com/search"
+        responses.add(responses.GET, url, body="<html>" + "x" * 100 + "</html>", status=200)
+
+        cache = HttpCache(tmp_path)
+        client = HttpClient(cache=cache)
+
+        stream = client.stream_html(url, chunk_size=10)
+        next(stream.chunks)
+        stream.close()
+        assert cache.get(url) is None
+
+        stream = client.stream_html(url, chunk_size=10)
+        content = b"".join(stream.chunks)
+        assert stream.digest == cache.get(url).digest
+
+        cached = client.stream_html(url)
+        assert cached.from_cache is True
+        assert cached.encoding == stream.encoding
+        assert b"".join(cached.chunks) == content
+        assert len(responses.calls) == 2
+
+
+class TestBytesPath:
+    """바이트 본문과 인코딩 판별 테스트"""
+
+    # 조이하비 형식의 EUC-KR 페이지 ("똠"은 EUC-KR에 없는 CP949 확장 글자)
+    JOYHOBBY_HTML = (
+        '<html><head><meta http-equiv="Content-Type" content="text/html; charset=euc-kr"></head>'
+        "<body><table><tr>"
+        "<td width='240px' valign='top'><a href='/mall/view.asp?id=1'>똠양 건담 RG</a><b>33,000원</b></td>"
+        "<td width='240px' valign='top'><a href='/mall/view.asp?id=2'>HG 자쿠</a><b>15,000원</b></td>"
+        "</tr></table></body></html>"
+    )
+
+    @responses.activate
+    def test_get_bytes_meta_인코딩(self):
+        """헤더에 charset이 없으면 <meta> 선언으로 판별하고 본문은 그대로 반환"""
+        from src.utils.http_client import HttpClient
+
+        url = "https://www.joyhobby.co.kr/mall/search_new.asp"
+        body = self.JOYHOBBY_HTML.encode("cp949")
+        responses.add(responses.GET, url, body=body, status=200, content_type="text/html")
+
+        content, encoding = HttpClient().get_bytes(url)
+
+        assert content == body
+        assert encoding == "cp949"
+
+    @responses.activate
+    def test_euc_kr_상점_검색(self):
+        """EUC-KR 선언 페이지의 확장 완성형 글자도 깨지지 않음"""
+        from src.crawlers.html_crawler import HtmlCrawler
+        from src.crawlers.parser_backends import BeautifulSoupBackend, LxmlBackend, cssselect
+        from src.models.shop import Shop, ShopSelectors
+        from src.utils.http_client import HttpClient
+
+        shop = Shop(
+            name="조이하비",
+            base_url="https://www.joyhobby.co.kr",
+            search_url_template="https://www.joyhobby.co.kr/mall/search_new.asp?keyword={keyword}",
+            selectors=ShopSelectors(
+                product_container="td[width='240px'][valign='top']",
+                product_name="a",
+                product_price="b",
+                product_link="a",
+            ),
+            keyword_encoding="euc-kr",
+        )
+        responses.add(
+            responses.GET,
+            shop.get_search_url("건담"),
+            body=self.JOYHOBBY_HTML.encode("cp949"),
+            status=200,
+            content_type="text/html",
+        )
+
+        backends = [BeautifulSoupBackend()]
+        if cssselect is not None:
+            backends.append(LxmlBackend())
+        for backend in backends:
+            results = HtmlCrawler(shop, http_client=HttpClient(), backend=backend).search("건담")
+
+            assert [(r.product_name, r.price) for r in results] == [
+                ("똠양 건담 RG", 33000),
+                ("HG 자쿠", 15000),
+            ]
+
+    @responses.activate
+    def test_선언이_없으면_본문으로_추정(self):
+        """인코딩 선언이 없으면 문자열 변환 시 본문으로 추정"""
+        from src.utils.http_client import HttpClient
+
+        url = "https://example.com/plain"
+        responses.add(
+            responses.GET, url, body="<p>한글 상품명입니다</p>".encode("utf-8"),
+            status=200, content_type="text/html",
+        )
+
+        page = HttpClient().fetch_html(url)
+
+        assert page.encoding is None
+        assert page.text == "<p>한글 상품명입니다</p>"
@@ -274,6 +274,36 @@ class TestShop:
         assert restored.name == shop.name
         assert restored.id == shop.id
 
+    def test_shop_속도_제한_설정(self):
+        """속도 제한 기본값과 유효성 검사"""
+        from src.models.shop import Shop, ShopSelectors
+        from pydantic import ValidationError
+
+        selectors = ShopSelectors(
+            product_container=".product",
+            product_name=".title",
+            product_price=".price",
+        )
+
+        shop = Shop(
+            name="테스트",
+            base_url="https://example.com",
+            search_url_template="https://www.example.com/search?q={keyword}",
+            selectors=selectors,
+        )
+        assert shop.rate_limit is None
+        assert shop.rate_burst == 1
+        assert shop.get_search_host() == "www.example.com"
+
+        with pytest.raises(ValidationError):
+            Shop(
+                name="테스트",
+                base_url="https://example.com",
+                search_url_template="https://example.com/search?q={keyword}",
+                selectors=selectors,
+                rate_limit=0,
+            )
+
 
 class TestStockStatus:
     """StockStatus Enum 테스트"""
@@ -286,6 +316,15 @@ class TestStockStatus:
         assert StockStatus.OUT_OF_STOCK.value == "OUT_OF_STOCK"
         assert StockStatus.UNKNOWN.value == "UNKNOWN"
 
+    def test_stock_status_코드(self):
+        """재고 코드는 1바이트 정수이며 재고 상태로 되돌릴 수 있음"""
+        from src.models.search import StockStatus
+
+        codes = [status.code for status in StockStatus]
+
+        assert codes == list(range(len(StockStatus)))
+        assert all(StockStatus.from_code(status.code) is status for status in StockStatus)
+
 
 class TestSearchResult:
     """SearchResult 모델 테스트"""
@@ -365,6 +404,32 @@ class TestSearchResult:
         assert result.crawled_at is not None
         assert isinstance(result.crawled_at, datetime)
 
+    def test_search_result_from_trusted(self):
+        """검증 없이 생성한 결과는 검증 생성 결과와 같음"""
+        from src.models.search import SearchResult, StockStatus
+
+        crawled_at = datetime(2026, 1, 1, 12, 0)
+        values = {
+            "shop_id": "test-shop-id",
+            "shop_name": "테스트 상점",
+            "product_name": "테스트 상품",
+            "price": 25000,
+            "price_text": "25,000원",
+            "stock_status": StockStatus.IN_STOCK,
+            "product_url": "https://example.com/p/1",
+            "crawled_at": crawled_at,
+        }
+
+        trusted = SearchResult.from_trusted(**values)
+
+        assert trusted == SearchResult(**values)
+        assert trusted.model_dump() == SearchResult(**values).model_dump()
+        assert trusted.model_fields_set == set(values)
+
+        copied = trusted.model_copy(update={"price": 20000})
+        assert copied.price == 20000
+        assert trusted.price == 25000
+
 
 class TestSearchQuery:
     """SearchQuery 모델 테스트"""
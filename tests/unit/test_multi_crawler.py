@@ -103,7 +103,7 @@ class TestMultiShopCrawler:
 
         call_count = 0
 
-        def mock_search(keyword):
+        def mock_search(keyword, **kwargs):
             nonlocal call_count
             call_count += 1
             if call_count == 2:
@@ -162,3 +162,355 @@ class TestMultiShopCrawler:
         # 가격 오름차순 정렬 확인
         prices = [r.price for r in results if r.price is not None]
         assert prices == sorted(prices)
+
+
+class TestMultiShopCrawlerConcurrency:
+    """MultiShopCrawler 동시 실행 테스트"""
+
+    @pytest.fixture
+    def sample_shops(self):
+        """테스트용 상점 목록"""
+        from src.models.shop import Shop, ShopSelectors
+
+        return [
+            Shop(
+                id=f"shop-{i+1}",
+                name=f"상점{i+1}",
+                base_url=f"https://shop{i+1}.example.com",
+                search_url_template=f"https://shop{i+1}.example.com/search?q={{keyword}}",
+                selectors=ShopSelectors(
+                    product_container=".product",
+                    product_name=".name",
+                    product_price=".price",
+                ),
+            )
+            for i in range(4)
+        ]
+
+    @staticmethod
+    def _make_result(shop):
+        from src.models.search import SearchResult, StockStatus
+
+        return SearchResult(
+            shop_id=shop.id,
+            shop_name=shop.name,
+            product_name="테스트 상품",
+            price=10000,
+            stock_status=StockStatus.IN_STOCK,
+        )
+
+    def test_max_workers_기본값(self, sample_shops):
+        """max_workers 미지정 시 기본값 사용"""
+        from src.crawlers.multi_crawler import MultiShopCrawler
+
+        crawler = MultiShopCrawler(sample_shops)
+        assert crawler.max_workers == MultiShopCrawler.DEFAULT_MAX_WORKERS
+
+    def test_max_workers_유효성_검사(self, sample_shops):
+        """max_workers가 1 미만이면 오류"""
+        from src.crawlers.multi_crawler import MultiShopCrawler
+
+        with pytest.raises(ValueError):
+            MultiShopCrawler(sample_shops, max_workers=0)
+
+    def test_max_results_전달(self, sample_shops):
+        """상점당 최대 결과 수를 상점 검색에 전달"""
+        from src.crawlers.multi_crawler import MultiShopCrawler
+
+        with patch("src.crawlers.multi_crawler.HtmlCrawler") as MockHtmlCrawler:
+            mock_crawler = MagicMock()
+            mock_crawler.search.return_value = []
+            MockHtmlCrawler.return_value = mock_crawler
+
+            MultiShopCrawler(sample_shops, max_results=5).search("마우스")
+
+        assert mock_crawler.search.call_count == len(sample_shops)
+        for call in mock_crawler.search.call_args_list:
+            assert call.kwargs["max_results"] == 5
+
+        with pytest.raises(ValueError):
+            MultiShopCrawler(sample_shops, max_results=0)
+
+    def test_동시_실행(self, sample_shops):
+        """상점 검색이 병렬로 실행됨"""
+        import threading
+        from src.crawlers.multi_crawler import MultiShopCrawler
+
+        # 모든 상점이 동시에 진입해야 통과하는 배리어
+        barrier = threading.Barrier(len(sample_shops), timeout=5)
+
+        def create_mock_crawler(shop):
+            mock = MagicMock()
+
+            def mock_search(keyword, **kwargs):
+                barrier.wait()
+                return [self._make_result(shop)]
+
+            mock.search.side_effect = mock_search
+            return mock
+
+        with patch("src.crawlers.multi_crawler.HtmlCrawler") as MockHtmlCrawler:
+            MockHtmlCrawler.side_effect = create_mock_crawler
+
+            crawler = MultiShopCrawler(sample_shops, max_workers=len(sample_shops))
+            results, errors = crawler.search_with_errors("마우스")
+
+        assert errors == []
+        assert len(results) == len(sample_shops)
+
+    def test_결과_상점_순서_유지(self, sample_shops):
+        """완료 순서와 무관하게 결과/오류가 상점 순서대로 정렬됨"""
+        import time
+        from src.crawlers.multi_crawler import MultiShopCrawler
+        from src.crawlers.html_crawler import CrawlError
+
+        # 앞 상점일수록 늦게 끝나도록 지연
+        delays = {"shop-1": 0.08, "shop-2": 0.06, "shop-3": 0.04, "shop-4": 0.0}
+
+        def create_mock_crawler(shop):
+            mock = MagicMock()
+
+            def mock_search(keyword, **kwargs):
+                time.sleep(delays[shop.id])
+                if shop.id in ("shop-1", "shop-3"):
+                    raise CrawlError(f"{shop.name} 실패")
+                return [self._make_result(shop)]
+
+            mock.search.side_effect = mock_search
+            return mock
+
+        with patch("src.crawlers.multi_crawler.HtmlCrawler") as MockHtmlCrawler:
+            MockHtmlCrawler.side_effect = create_mock_crawler
+
+            crawler = MultiShopCrawler(sample_shops, max_workers=4)
+            results, errors = crawler.search_with_errors("마우스")
+
+        assert [r.shop_id for r in results] == ["shop-2", "shop-4"]
+        assert [str(e) for e in errors] == ["상점1 실패", "상점3 실패"]
+
+    def test_예상치_못한_예외_격리(self, sample_shops):
+        """CrawlError가 아닌 예외도 해당 상점 오류로 격리됨"""
+        from src.crawlers.multi_crawler import MultiShopCrawler
+
+        def create_mock_crawler(shop):
+            mock = MagicMock()
+            if shop.id == "shop-2":
+                mock.search.side_effect = RuntimeError("파싱 실패")
+            else:
+                mock.search.return_value = [self._make_result(shop)]
+            return mock
+
+        with patch("src.crawlers.multi_crawler.HtmlCrawler") as MockHtmlCrawler:
+            MockHtmlCrawler.side_effect = create_mock_crawler
+
+            crawler = MultiShopCrawler(sample_shops)
+            results, errors = crawler.search_with_errors("마우스")
+
+        assert len(results) == 3
+        assert len(errors) == 1
+        assert "상점2" in str(errors[0])
+
+    def test_순차_실행_모드(self, sample_shops):
+        """max_workers=1이면 상점 순서대로 순차 실행"""
+        from src.crawlers.multi_crawler import MultiShopCrawler
+
+        call_order = []
+
+        def create_mock_crawler(shop):
+            mock = MagicMock()
+
+            def mock_search(keyword, **kwargs):
+                call_order.append(shop.id)
+                return [self._make_result(shop)]
+
+            mock.search.side_effect = mock_search
+            return mock
+
+        with patch("src.crawlers.multi_crawler.HtmlCrawler") as MockHtmlCrawler:
+            MockHtmlCrawler.side_effect = create_mock_crawler
+
+            crawler = MultiShopCrawler(sample_shops, max_workers=1)
+            crawler.search_with_errors("마우스")
+
+        assert call_order == [shop.id for shop in sample_shops]
+
+
+class TestMultiShopCrawlerStreaming:
+    """MultiShopCrawler 스트리밍 검색 (iter_search / aiter_search) 테스트"""
+
+    @pytest.fixture
+    def sample_shops(self):
+        """테스트용 상점 목록"""
+        from src.models.shop import Shop, ShopSelectors
+
+        return [
+            Shop(
+                id=f"shop-{i+1}",
+                name=f"상점{i+1}",
+                base_url=f"https://shop{i+1}.example.com",
+                search_url_template=f"https://shop{i+1}.example.com/search?q={{keyword}}",
+                selectors=ShopSelectors(
+                    product_container=".product",
+                    product_name=".name",
+                    product_price=".price",
+                ),
+            )
+            for i in range(3)
+        ]
+
+    @pytest.fixture
+    def delayed_crawler_factory(self):
+        """상점별로 지연 시간이 다른 HtmlCrawler mock 생성기"""
+        import threading
+        import time
+        from src.crawlers.html_crawler import CrawlError
+        from src.models.search import SearchResult, StockStatus
+
+        # 뒤 상점일수록 빨리 끝남: 각 상점은 다음 상점이 끝난 뒤에 완료
+        done = {shop_id: threading.Event() for shop_id in ("shop-1", "shop-2", "shop-3")}
+        waits_for = {"shop-1": "shop-2", "shop-2": "shop-3"}
+
+        def create_mock_crawler(shop):
+            mock = MagicMock()
+
+            def mock_search(keyword, **kwargs):
+                if shop.id in waits_for:
+                    done[waits_for[shop.id]].wait(timeout=5)
+                    time.sleep(0.05)
+                done[shop.id].set()
+                if shop.id == "shop-2":
+                    raise CrawlError(f"{shop.name} 실패")
+                return [
+                    SearchResult(
+                        shop_id=shop.id,
+                        shop_name=shop.name,
+                        product_name="테스트 상품",
+                        price=10000,
+                        stock_status=StockStatus.IN_STOCK,
+                    )
+                ]
+
+            mock.search.side_effect = mock_search
+            return mock
+
+        return create_mock_crawler
+
+    def test_iter_search_완료_순서대로_반환(self, sample_shops, delayed_crawler_factory):
+        """가장 빨리 끝난 상점부터 결과가 반환됨"""
+        from src.crawlers.multi_crawler import MultiShopCrawler
+        from src.crawlers.html_crawler import CrawlError
+
+        with patch("src.crawlers.multi_crawler.HtmlCrawler") as MockHtmlCrawler:
+            MockHtmlCrawler.side_effect = delayed_crawler_factory
+
+            crawler = MultiShopCrawler(sample_shops, max_workers=3)
+            outcomes = list(crawler.iter_search("마우스"))
+
+        assert [shop.id for shop, _, _ in outcomes] == ["shop-3", "shop-2", "shop-1"]
+
+        _, first_results, first_elapsed = outcomes[0]
+        assert len(first_results) == 1
+        assert first_elapsed >= 0
+
+        _, error, _ = outcomes[1]
+        assert isinstance(error, CrawlError)
+
+        _, _, last_elapsed = outcomes[2]
+        assert last_elapsed >= 0.1 - 0.01
+
+    def test_iter_search_빈_상점_목록(self):
+        """상점이 없으면 아무것도 반환하지 않음"""
+        from src.crawlers.multi_crawler import MultiShopCrawler
+
+        assert list(MultiShopCrawler([]).iter_search("마우스")) == []
+
+    def test_iter_search_중단_시_대기_작업_취소(self, sample_shops):
+        """순회를 중단하면 시작하지 않은 상점 검색은 실행되지 않음"""
+        from src.crawlers.multi_crawler import MultiShopCrawler
+
+        searched = []
+
+        def create_mock_crawler(shop):
+            mock = MagicMock()
+
+            def mock_search(keyword, **kwargs):
+                searched.append(shop.id)
+                return []
+
+            mock.search.side_effect = mock_search
+            return mock
+
+        with patch("src.crawlers.multi_crawler.HtmlCrawler") as MockHtmlCrawler:
+            MockHtmlCrawler.side_effect = create_mock_crawler
+
+            crawler = MultiShopCrawler(sample_shops, max_workers=1)
+            for _ in crawler.iter_search("마우스"):
+                break
+
+        assert searched == ["shop-1"]
+
+    def test_aiter_search_완료_순서대로_반환(self, sample_shops, delayed_crawler_factory):
+        """비동기 버전도 완료 순서대로 결과 반환"""
+        import asyncio
+        from src.crawlers.multi_crawler import MultiShopCrawler
+
+        async def collect(crawler):
+            return [shop.id async for shop, _, _ in crawler.aiter_search("마우스")]
+
+        with patch("src.crawlers.multi_crawler.HtmlCrawler") as MockHtmlCrawler:
+            MockHtmlCrawler.side_effect = delayed_crawler_factory
+
+            crawler = MultiShopCrawler(sample_shops, max_workers=3)
+            shop_ids = asyncio.run(collect(crawler))
+
+        assert shop_ids == ["shop-3", "shop-2", "shop-1"]
+
+
+class TestMultiShopCrawlerDeadline:
+    """MultiShopCrawler 검색 제한 시간 테스트"""
+
+    @pytest.fixture
+    def sample_shop(self):
+        """테스트용 상점"""
+        from src.models.shop import Shop, ShopSelectors
+
+        return Shop(
+            id="shop-1",
+            name="상점1",
+            base_url="https://shop1.example.com",
+            search_url_template="https://shop1.example.com/search?q={keyword}",
+            selectors=ShopSelectors(
+                product_container=".product",
+                product_name=".name",
+                product_price=".price",
+            ),
+        )
+
+    def test_상점_검색에_마감_시각_전달(self, sample_shop):
+        """모든 상점 검색이 같은 마감 시각을 공유"""
+        import time
+        from src.crawlers.multi_crawler import MultiShopCrawler
+
+        with patch("src.crawlers.multi_crawler.HtmlCrawler") as MockHtmlCrawler:
+            mock_crawler = MagicMock()
+            mock_crawler.search.return_value = []
+            MockHtmlCrawler.return_value = mock_crawler
+
+            started = time.monotonic()
+            MultiShopCrawler([sample_shop], search_timeout=10).search("마우스")
+
+        deadline = mock_crawler.search.call_args.kwargs["deadline"]
+        assert started + 10 <= deadline <= time.monotonic() + 10
+
+    def test_제한_시간_없음(self, sample_shop):
+        """search_timeout=None이면 마감 시각 없이 검색"""
+        from src.crawlers.multi_crawler import MultiShopCrawler
+
+        with patch("src.crawlers.multi_crawler.HtmlCrawler") as MockHtmlCrawler:
+            mock_crawler = MagicMock()
+            mock_crawler.search.return_value = []
+            MockHtmlCrawler.return_value = mock_crawler
+
+            MultiShopCrawler([sample_shop], search_timeout=None).search("마우스")
+
+        mock_crawler.search.assert_called_once_with("마우스", deadline=None, max_results=None)
@@ -0,0 +1,343 @@
+"""
+테스트: 파서 백엔드 (BeautifulSoupBackend, LxmlBackend)
+
+두 백엔드가 같은 선택자에 대해 같은 결과를 내는지 확인합니다.
+"""
+
+import pytest
+from pathlib import Path
+
+pytest.importorskip("cssselect")
+
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "sample_html"
+
+CAFE24_HTML = """
+<html><head><meta charset="euc-kr"><script>var html = '<li>';</script></head><body>
+<ul class="prdList"><li>메뉴</li></ul>
+<ul class="prdList grid4">
+  <li class="xans-record-">
+    <div class="thumbnail"><img src="/img/soldout_icon.gif" alt=""></div>
+    <div class="description">
+      <strong class="name"><a href="/product/1"><span class="title">상품명</span> :<span> HG <b>에어리얼</b> <!-- 주석 --> &nbsp;</span></a></strong>
+      <ul class="spec"><li>25,000원</li><li><span>소비자가</span><span>30,000원</span></li></ul>
+    </div>
+  </li>
+  <li class="xans-record-">
+    <div class="description">
+      <strong class="name"><a href="/product/2"><span class="title">상품명</span> :<span>MG 자쿠 (예약)<script>track()</script></span></a></strong>
+      <ul class="spec"><li>48,000원</li><li><span>소비자가</span><span>52,000원</span></li></ul>
+    </div>
+  </li>
+</ul>
+</body></html>
+"""
+
+TABLE_HTML = """
+<html><body><table>
+  <tr><td><a href="poprec/detail.php?id=1">RG 뉴건담<br>한정판</a></td><td>a</td><!-- c --><td>b</td><td>c</td><td><b>33,000원</b></td></tr>
+  <tr><td><a href="poprec/detail.php?id=2">PG 유니콘</a></td><td>a</td><td>b</td><td>c</td><td><b>품절</b></td></tr>
+</table></body></html>
+"""
+
+
+def make_shop(**selectors):
+    """테스트용 상점"""
+    from src.models.shop import Shop, ShopSelectors
+
+    return Shop(
+        id="shop-1",
+        name="테스트",
+        base_url="https://example.com",
+        search_url_template="https://example.com/search?q={keyword}",
+        selectors=ShopSelectors(**selectors),
+    )
+
+
+def parse_with_both(shop, html):
+    """두 백엔드로 파싱한 결과 (크롤링 시각 제외)"""
+    from src.crawlers.html_crawler import HtmlCrawler
+    from src.crawlers.parser_backends import BeautifulSoupBackend, LxmlBackend
+
+    outcomes = []
+    for backend in (BeautifulSoupBackend(), LxmlBackend()):
+        results = HtmlCrawler(shop, backend=backend).parse_html(html)
+        outcomes.append([r.model_dump(exclude={"crawled_at"}) for r in results])
+    return outcomes
+
+
+class TestLxmlBackendEquivalence:
+    """LxmlBackend와 BeautifulSoupBackend 결과 비교"""
+
+    @pytest.mark.parametrize(
+        "selectors",
+        [
+            {
+                "product_container": "ul.prdList li.xans-record-",
+                "product_name": ".description .name a",
+                "product_price": ".description ul li:first-child",
+                "product_link": ".description .name a",
+            },
+            {
+                "product_container": "ul.prdList li.xans-record-",
+                "product_name": ".name a span:nth-child(2)",
+                "product_price": ".description ul li:nth-child(2) span:nth-child(2)",
+                "product_link": ".name a",
+            },
+        ],
+    )
+    def test_cafe24_페이지(self, selectors):
+        """중첩 선택자, nth-child, 주석/스크립트가 섞인 상품명"""
+        bs4_results, lxml_results = parse_with_both(make_shop(**selectors), CAFE24_HTML)
+
+        assert len(bs4_results) == 2
+        assert lxml_results == bs4_results
+
+    def test_형제_선택자와_자기_자신_선택자(self):
+        """'.' 선택자와 '+ td' 형제 가격 선택자"""
+        shop = make_shop(
+            product_container="a[href*='poprec/detail.php']",
+            product_name=".",
+            product_price="+ td + td + td + td",
+            product_link=".",
+        )
+
+        bs4_results, lxml_results = parse_with_both(shop, TABLE_HTML)
+
+        assert [r["price"] for r in bs4_results] == [33000, None]
+        assert lxml_results == bs4_results
+
+    def test_픽스처_페이지(self):
+        """기존 테스트 픽스처 페이지"""
+        shop = make_shop(
+            product_container=".product-item",
+            product_name=".product-title",
+            product_price=".product-price",
+            product_link=".product-link",
+            stock_status=".stock-status",
+        )
+        html = (FIXTURES_DIR / "search_results.html").read_text(encoding="utf-8")
+
+        bs4_results, lxml_results = parse_with_both(shop, html)
+
+        assert len(bs4_results) == 3
+        assert lxml_results == bs4_results
+
+    def test_컨테이너_밖_상위_요소를_포함하는_선택자(self):
+        """조합자 왼쪽이 컨테이너의 상위 요소와 일치해도 soupsieve와 같은 결과"""
+        from src.crawlers.parser_backends import BeautifulSoupBackend, LxmlBackend
+
+        html = '<div class="list"><p class="item"><span class="name">A</span></p></div>'
+        for backend in (BeautifulSoupBackend(), LxmlBackend()):
+            container = backend.select_one(backend.parse(html), "p.item")
+            names = backend.select(container, ".list .name")
+            assert [backend.get_text(elem) for elem in names] == ["A"]
+            assert backend.select(container, ".list > .name") == []
+
+    def test_텍스트_추출_규칙(self):
+        """주석과 script/style/rt 문자열 제외, 공백 제거"""
+        from src.crawlers.parser_backends import BeautifulSoupBackend, LxmlBackend
+
+        html = (
+            "<div> a <!--c--> b<script>x=1</script><style>s</style>"
+            "<ruby>漢<rt>한</rt></ruby>&nbsp;z </div>"
+        )
+        for backend in (BeautifulSoupBackend(), LxmlBackend()):
+            document = backend.parse(html)
+            assert backend.get_text(backend.select_one(document, "div")) == "ab漢z"
+            assert backend.get_text(backend.select_one(document, "script")) == "x=1"
+
+    def test_빈_문서(self):
+        """빈 문자열은 결과 없음"""
+        shop = make_shop(product_container=".p", product_name=".n", product_price=".c")
+
+        assert parse_with_both(shop, "") == [[], []]
+
+
+class TestParserBackendSelection:
+    """파서 백엔드 자동 선택 테스트"""
+
+    def test_기본은_lxml(self):
+        """cssselect로 변환 가능한 선택자는 lxml 백엔드 사용"""
+        from src.crawlers.html_crawler import HtmlCrawler
+
+        shop = make_shop(product_container=".p", product_name=".n", product_price=".c")
+
+        assert HtmlCrawler(shop).backend.name == "lxml"
+
+    def test_지원하지_않는_선택자는_bs4로_폴백(self):
+        """soupsieve 전용 선택자는 BeautifulSoup 백엔드 사용"""
+        from src.crawlers.html_crawler import HtmlCrawler
+
+        shop = make_shop(
+            product_container=".p",
+            product_name=".n:-soup-contains('건담')",
+            product_price=".c",
+        )
+
+        assert HtmlCrawler(shop).backend.name == "bs4"
+
+
+class TestStreamingParse:
+    """LxmlBackend 스트리밍 파싱 테스트"""
+
+    def test_조각_단위_파싱_결과_동일(self):
+        """조각 크기와 무관하게 전체 파싱과 같은 컨테이너와 텍스트"""
+        from src.crawlers.parser_backends import LxmlBackend
+
+        backend = LxmlBackend()
+        selector = "ul.prdList li.xans-record-"
+        expected = [
+            backend.get_text(elem)
+            for elem in backend.select(backend.parse(CAFE24_HTML), selector)
+        ]
+        matcher = backend.compile_matcher(selector)
+
+        # 조각 경계에서 잘린 글자도 이어서 디코딩
+        for encoding in ("utf-8", "cp949"):
+            content = CAFE24_HTML.encode(encoding)
+            for size in (1, 7, 64, len(content)):
+                chunks = [content[i:i + size] for i in range(0, len(content), size)]
+                streamed = [
+                    backend.get_text(elem)
+                    for elem in backend.iter_parse(chunks, matcher, encoding)
+                ]
+                assert streamed == expected
+
+    def test_잘못된_바이트_이후도_파싱(self):
+        """CP949 본문의 잘못된 바이트는 대체 문자로 바꾸고 뒤의 컨테이너도 반환"""
+        from src.crawlers.parser_backends import LxmlBackend
+
+        backend = LxmlBackend()
+        content = "<ul><li>똠양</li><li>".encode("cp949") + b"\xff" + "</li><li>자쿠</li></ul>".encode("cp949")
+
+        texts = [
+            backend.get_text(elem)
+            for elem in backend.iter_parse([content], backend.compile_matcher("li"), "cp949")
+        ]
+
+        assert texts == ["똠양", "\ufffd", "자쿠"]
+
+    def test_뒤따르는_형제가_필요한_선택자는_스트리밍_불가(self):
+        """:last-child 등은 닫히는 시점에 판별할 수 없음"""
+        from src.crawlers.parser_backends import BeautifulSoupBackend, LxmlBackend
+
+        backend = LxmlBackend()
+
+        assert backend.compile_matcher("ul li:last-child") is None
+        assert backend.compile_matcher("li:nth-last-child(2)") is None
+        assert backend.compile_matcher("li:first-child") is not None
+        assert BeautifulSoupBackend().compile_matcher("li") is None
+
+    def test_빈_문서(self):
+        """빈 입력은 결과 없음"""
+        from src.crawlers.parser_backends import LxmlBackend
+
+        backend = LxmlBackend()
+
+        assert list(backend.iter_parse([], backend.compile_matcher("li"))) == []
+
+    def test_최대_결과_수_채우면_수신_중단(self):
+        """max_results만큼 찾으면 남은 본문을 읽지 않음"""
+        from unittest.mock import MagicMock
+        from src.crawlers.html_crawler import HtmlCrawler
+        from src.utils.http_client import HtmlStream
+
+        shop = make_shop(
+            product_container="ul.prdList li.xans-record-",
+            product_name=".description .name a",
+            product_price=".description ul li:first-child",
+        )
+        read = []
+
+        def chunks():
+            for i in range(0, len(content), 16):
+                read.append(i)
+                yield content[i:i + 16]
+
+        content = CAFE24_HTML.encode("utf-8")
+        http_client = MagicMock()
+        http_client.stream_html.side_effect = lambda *args, **kwargs: HtmlStream(
+            chunks(), encoding="utf-8"
+        )
+        crawler = HtmlCrawler(shop, http_client=http_client)
+
+        first = list(crawler.iter_search("건담", max_results=1))
+        read_until_first = len(read)
+        read.clear()
+        everything = crawler.search("건담")
+
+        assert [r.price for r in first] == [25000]
+        assert [r.price for r in everything] == [25000, 48000]
+        assert read_until_first < len(read)
+
+
+class TestLxmlPartialParse:
+    """LxmlBackend 부분 파싱 테스트"""
+
+    SELECTORS = {
+        "product_container": "ul.prdList li.xans-record-",
+        "product_name": ".description .name a",
+        "product_price": ".description ul li:first-child",
+        "product_link": ".description .name a",
+    }
+
+    # 상품 목록 앞뒤에 큰 내비게이션/푸터가 있는 페이지
+    PAGE_HTML = CAFE24_HTML.replace(
+        "<body>",
+        "<body><nav>" + "<div><a href='/c'>분류</a></div>" * 500 + "</nav>",
+    ).replace("</body>", "<footer>" + "<p>회사 정보</p>" * 500 + "</footer></body>")
+
+    def test_조건_밖의_요소를_제거한_트리(self):
+        """부분 파싱한 트리는 컨테이너 주변만 남고 상품 결과는 동일"""
+        from src.crawlers.html_crawler import HtmlCrawler
+        from src.crawlers.parser_backends import LxmlBackend
+
+        backend = LxmlBackend()
+        full = HtmlCrawler(make_shop(**self.SELECTORS), backend=backend)
+        partial = HtmlCrawler(
+            make_shop(**self.SELECTORS).model_copy(update={"partial_parse": True}),
+            backend=backend,
+        )
+
+        assert partial.plan.strainer is not None
+        full_tree = backend.parse(self.PAGE_HTML)
+        for tree in (
+            backend.parse(self.PAGE_HTML, parse_only=partial.plan.strainer),
+            backend.parse_bytes(self.PAGE_HTML.encode("utf-8"), "utf-8", partial.plan.strainer),
+        ):
+            assert tree.find(".//nav") is None
+            assert tree.find(".//footer") is None
+            assert tree.find(".//head") is None
+            assert len(list(tree.iter())) * 10 < len(list(full_tree.iter()))
+
+        assert [r.model_dump(exclude={"crawled_at"}) for r in partial.parse_html(self.PAGE_HTML)] == \
+            [r.model_dump(exclude={"crawled_at"}) for r in full.parse_html(self.PAGE_HTML)]
+
+    def test_스트리밍_파싱도_제거(self):
+        """iter_parse에 조건을 전달하면 받는 동안 조건 밖의 요소를 제거"""
+        from src.crawlers.parser_backends import LxmlBackend
+
+        backend = LxmlBackend()
+        strainer = backend.build_strainer(self.SELECTORS["product_container"])
+        content = self.PAGE_HTML.encode("utf-8")
+        chunks = [content[i:i + 256] for i in range(0, len(content), 256)]
+        matcher = backend.compile_matcher(self.SELECTORS["product_container"])
+
+        containers = list(backend.iter_parse(chunks, matcher, "utf-8", strainer))
+        tree = containers[0].getroottree()
+
+        assert len(containers) == 2
+        assert tree.find(".//nav") is None
+        assert tree.find(".//footer") is None
+        assert len(list(tree.iter())) < 50
+
+    def test_부분_파싱_불가_선택자(self):
+        """그룹/형제 조합자 선택자는 조건 없음 (전체 파싱)"""
+        from src.crawlers.parser_backends import LxmlBackend
+
+        backend = LxmlBackend()
+
+        assert backend.build_strainer(".a, .b") is None
+        assert backend.build_strainer("div + .item") is None
+        assert backend.build_strainer("li.item") is not None
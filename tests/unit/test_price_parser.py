@@ -0,0 +1,91 @@
+"""
+테스트: 가격 일괄 변환 (parse_prices)
+"""
+
+import pytest
+
+
+class TestParsePrice:
+    """가격 문자열 하나 변환 테스트"""
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("₩25,000", 25000),
+            ("15,000원", 15000),
+            ("₩ 30,000", 30000),
+            ("10000", 10000),
+            ("25,000.50원", 25001),
+            ("12,345.4원", 12345),
+            ("10,000~15,000원", 10000),
+            ("1.2만원", 12000),
+            ("3만원", 30000),
+            ("3만 5,000원", 35000),
+            ("정가 32,000원 → 할인가 28,800원", 32000),
+        ],
+    )
+    def test_가격_형식(self, text, expected):
+        """통화 기호, 소수점, 범위, 만 단위 표기"""
+        from src.crawlers.price_parser import parse_price
+
+        assert parse_price(text) == expected
+
+    @pytest.mark.parametrize("text", ["", "가격문의", "품절", ",,,", "만원"])
+    def test_가격_없음(self, text):
+        """숫자가 없으면 None"""
+        from src.crawlers.price_parser import parse_price
+
+        assert parse_price(text) is None
+
+
+class TestParsePrices:
+    """가격 일괄 변환 테스트"""
+
+    def test_개별_변환과_같음(self):
+        """일괄 변환 결과가 문자열별 변환과 같음"""
+        from src.crawlers.price_parser import parse_price, parse_prices
+
+        texts = ["₩25,000", "가격문의", "", "1.5만원", "9,900~12,000원", "품절", "3만 5천원"]
+        batch = parse_prices(texts)
+
+        assert len(batch) == len(texts)
+        assert batch.to_list() == [parse_price(text) for text in texts]
+        assert batch.to_list() == [25000, None, None, 15000, 9900, None, 30000]
+
+    def test_null_mask(self):
+        """가격이 없는 위치는 mask가 1이고 값은 0"""
+        from src.crawlers.price_parser import parse_prices
+
+        batch = parse_prices(["1,000원", "문의", "2,000원"])
+
+        assert list(batch.mask) == [0, 1, 0]
+        assert list(batch.values) == [1000, 0, 2000]
+        assert batch.get(1) is None
+
+    def test_빈_입력(self):
+        """빈 목록은 빈 결과"""
+        from src.crawlers.price_parser import parse_prices
+
+        batch = parse_prices([])
+
+        assert len(batch) == 0
+        assert batch.to_list() == []
+        assert batch.find_last() == -1
+
+    def test_구분자_문자가_포함된_문자열(self):
+        """문자열 안의 구분자 문자가 다른 문자열의 위치를 밀지 않음"""
+        from src.crawlers.price_parser import parse_prices
+
+        batch = parse_prices(["가격\x00문의", "\x00", "5,000원"])
+
+        assert batch.to_list() == [None, None, 5000]
+
+    def test_find_last(self):
+        """범위 안의 마지막 가격 위치 (할인가 선택)"""
+        from src.crawlers.price_parser import parse_prices
+
+        batch = parse_prices(["30,000원", "27,000원", "문의", "문의", "10,000원"])
+
+        assert batch.find_last(0, 3) == 1
+        assert batch.find_last(2, 4) == -1
+        assert batch.find_last(2) == 4
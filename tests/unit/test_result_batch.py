@@ -0,0 +1,179 @@
+"""
+테스트: 열 단위 검색 결과 묶음 (ResultBatch)
+"""
+
+from datetime import datetime
+
+import pytest
+
+
+def make_results():
+    """상점 2곳, 가격 없음/품절/예약상품이 섞인 결과"""
+    from src.models.search import SearchResult, StockStatus
+
+    rows = [
+        ("shop-a", "상점A", "상품1", 3000, StockStatus.IN_STOCK),
+        ("shop-a", "상점A", "상품2", None, StockStatus.UNKNOWN),
+        ("shop-b", "상점B", "상품3", 1000, StockStatus.OUT_OF_STOCK),
+        ("shop-b", "상점B", "상품4", 2000, StockStatus.PRE_ORDER),
+        ("shop-a", "상점A", "상품5", 2000, StockStatus.IN_STOCK),
+        ("shop-b", "상점B", "상품6", None, StockStatus.IN_STOCK),
+    ]
+    crawled_at = datetime(2026, 1, 1, 12, 0)
+    return [
+        SearchResult(
+            shop_id=shop_id,
+            shop_name=shop_name,
+            product_name=name,
+            price=price,
+            price_text=f"{price:,}원" if price is not None else None,
+            stock_status=status,
+            product_url=f"https://example.com/{name}",
+            crawled_at=crawled_at,
+        )
+        for shop_id, shop_name, name, price, status in rows
+    ]
+
+
+def names(batch):
+    return [result.product_name for result in batch]
+
+
+class TestResultBatch:
+    """ResultBatch 연산 테스트"""
+
+    @pytest.fixture(params=[True, False], ids=["keep_rows", "columns"])
+    def batch(self, request):
+        from src.models.result_batch import ResultBatch
+
+        return ResultBatch.from_results(make_results(), keep_rows=request.param)
+
+    def test_행_변환(self, batch):
+        """행은 원래 결과와 같은 값"""
+        expected = [result.model_dump() for result in make_results()]
+
+        assert len(batch) == 6
+        assert [result.model_dump() for result in batch.to_list()] == expected
+        assert batch.get_price(1) is None
+        assert batch.get_shop_id(2) == "shop-b"
+
+    def test_보관한_객체_재사용(self):
+        """keep_rows면 같은 객체를 반환"""
+        from src.models.result_batch import ResultBatch
+
+        results = make_results()
+
+        sorted_batch = ResultBatch.from_results(results).sort_by_price()
+
+        assert sorted_batch.row(0) is results[2]
+
+    def test_열만_보관하면_꺼낸_행만_생성(self):
+        """keep_rows=False면 객체를 보관하지 않고 꺼낼 때마다 생성"""
+        from src.models.result_batch import ResultBatch
+        from src.models.search import StockStatus
+
+        batch = ResultBatch.from_results(make_results(), keep_rows=False)
+        top = batch.top_k(1)
+
+        assert not batch.keeps_rows
+        assert not top.keeps_rows
+        assert top.row(0).product_name == "상품3"
+        assert top.row(0) is not top.row(0)
+        assert top.get_shop_name(0) == "상점B"
+        assert top.get_stock_status(0) == StockStatus.OUT_OF_STOCK
+
+    def test_가격순_정렬(self, batch):
+        """가격순, 같은 가격은 원래 순서, 가격 없음은 맨 뒤"""
+        assert names(batch.sort_by_price()) == ["상품3", "상품4", "상품5", "상품1", "상품2", "상품6"]
+
+    def test_필터(self, batch):
+        """재고 상태와 가격 유무로 필터 (순서 유지)"""
+        from src.models.search import StockStatus
+
+        assert names(batch.filter([StockStatus.IN_STOCK])) == ["상품1", "상품5", "상품6"]
+        assert names(batch.filter([StockStatus.IN_STOCK], has_price=True)) == ["상품1", "상품5"]
+        assert names(batch.filter(has_price=True)) == ["상품1", "상품3", "상품4", "상품5"]
+
+    def test_최저가(self, batch):
+        """최저가 행 (같은 가격이면 먼저 나온 행)"""
+        from src.models.search import StockStatus
+
+        assert batch.find_lowest() == 2
+        assert batch.find_lowest([StockStatus.IN_STOCK, StockStatus.PRE_ORDER]) == 3
+        assert batch.find_lowest([StockStatus.UNKNOWN]) == -1
+
+    def test_상점별_최저가(self, batch):
+        """상점별 최저가 행 위치"""
+        from src.models.search import StockStatus
+
+        assert batch.find_lowest_by_shop() == {"shop-a": 4, "shop-b": 2}
+        assert batch.find_lowest_by_shop([StockStatus.IN_STOCK]) == {"shop-a": 4}
+
+    def test_상위_k개(self, batch):
+        """가격이 있는 행 중 낮은 k개"""
+        assert names(batch.top_k(3)) == ["상품3", "상품4", "상품5"]
+        assert names(batch.top_k(10)) == ["상품3", "상품4", "상품5", "상품1"]
+
+    def test_상점당_개수_제한(self, batch):
+        """상점마다 앞에서부터 n개"""
+        assert names(batch.limit_per_shop(1)) == ["상품1", "상품3"]
+        assert names(batch.limit_per_shop(2)) == ["상품1", "상품2", "상품3", "상품4"]
+
+    def test_행_선택(self, batch):
+        """take는 지정한 순서대로, 0개/1개도 처리"""
+        assert names(batch.take([5, 0])) == ["상품6", "상품1"]
+        assert names(batch.take([3])) == ["상품4"]
+        assert len(batch.take([])) == 0
+        assert batch.take([3]).get_price(0) == 2000
+
+    def test_빈_묶음(self):
+        """결과가 없으면 빈 묶음"""
+        from src.models.result_batch import ResultBatch
+
+        batch = ResultBatch.from_results([])
+
+        assert len(batch) == 0
+        assert batch.find_lowest() == -1
+        assert batch.sort_by_price().to_list() == []
+
+
+class TestShopTable:
+    """상점 핸들 표 테스트"""
+
+    def test_핸들_부여(self):
+        """처음 나온 상점 순서대로 0부터 핸들 부여"""
+        from src.models.result_batch import ShopTable
+
+        table = ShopTable([("shop-a", "상점A")])
+
+        assert table.get_handle("shop-b", "상점B") == 1
+        assert table.get_handle("shop-a", "다른 이름") == 0
+        assert table[0] == ("shop-a", "상점A")
+        assert table.find("shop-c") is None
+        assert len(table) == 2
+
+    def test_이름_변경(self):
+        """rename은 등록된 상점만 변경"""
+        from src.models.result_batch import ShopTable
+
+        table = ShopTable([("shop-a", "상점A")])
+        table.rename("shop-a", "새 상점A")
+        table.rename("shop-x", "없는 상점")
+
+        assert table[0] == ("shop-a", "새 상점A")
+        assert len(table) == 1
+
+    def test_묶음끼리_표_공유(self):
+        """같은 표를 쓰는 묶음은 같은 핸들을 사용"""
+        from src.models.result_batch import ResultBatch, ShopTable
+
+        table = ShopTable([("shop-b", "상점B")])
+        results = make_results()
+
+        first = ResultBatch.from_results(results[:2], keep_rows=False, shops=table)
+        second = ResultBatch.from_results(results[2:], keep_rows=False, shops=table)
+
+        assert list(first.shop_index) == [1, 1]
+        assert list(second.shop_index) == [0, 0, 1, 0]
+        assert len(table) == 2
+        assert second.row(2).shop_name == "상점A"
@@ -0,0 +1,261 @@
+"""
+테스트: 검색 결과 메모리 캐시 (ResultCache)
+"""
+
+import threading
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+
+class FakeClock:
+    """수동으로 진행하는 시계"""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def sample_shop():
+    """테스트용 상점"""
+    from src.models.shop import Shop, ShopSelectors
+
+    return Shop(
+        id="shop-1",
+        name="상점1",
+        base_url="https://shop1.example.com",
+        search_url_template="https://shop1.example.com/search?q={keyword}",
+        selectors=ShopSelectors(
+            product_container=".product",
+            product_name=".name",
+            product_price=".price",
+        ),
+    )
+
+
+def make_result(name: str = "무선 마우스", price: int = 20000):
+    """테스트용 검색 결과"""
+    from src.models.search import SearchResult, StockStatus
+
+    return SearchResult(
+        shop_id="shop-1",
+        shop_name="상점1",
+        product_name=name,
+        price=price,
+        stock_status=StockStatus.IN_STOCK,
+    )
+
+
+class TestResultCache:
+    """ResultCache 테스트"""
+
+    def test_저장_후_조회(self, sample_shop):
+        """TTL 이내 조회는 적중"""
+        from src.crawlers.result_cache import ResultCache
+
+        cache = ResultCache()
+        results = [make_result()]
+        cache.put(sample_shop, "마우스", results)
+
+        assert cache.get(sample_shop, "마우스") == results
+        stats = cache.get_stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 0, 1)
+
+    def test_미스_집계(self, sample_shop):
+        """없는 키는 None이며 미스로 집계"""
+        from src.crawlers.result_cache import ResultCache
+
+        cache = ResultCache()
+
+        assert cache.get(sample_shop, "키보드") is None
+        assert cache.get_stats().misses == 1
+
+    def test_stale_ttl_경과_시_만료(self, sample_shop):
+        """ttl + stale_ttl이 지나면 미스"""
+        from src.crawlers.result_cache import ResultCache
+
+        clock = FakeClock()
+        cache = ResultCache(ttl=10, stale_ttl=20, clock=clock)
+        cache.put(sample_shop, "마우스", [make_result()])
+
+        clock.now += 30
+
+        assert cache.get(sample_shop, "마우스") is None
+        assert cache.get_stats().size == 0
+
+    def test_상점_수정_시_무효화(self, sample_shop):
+        """상점 설정이 수정되면 캐시를 사용하지 않음"""
+        from datetime import timedelta
+        from src.crawlers.result_cache import ResultCache
+
+        cache = ResultCache()
+        cache.put(sample_shop, "마우스", [make_result()])
+
+        sample_shop.updated_at += timedelta(seconds=1)
+
+        assert cache.get(sample_shop, "마우스") is None
+
+    def test_lru_삭제(self, sample_shop):
+        """최대 항목 수를 넘으면 가장 오래 사용하지 않은 항목 삭제"""
+        from src.crawlers.result_cache import ResultCache
+
+        cache = ResultCache(max_entries=2)
+        cache.put(sample_shop, "a", [])
+        cache.put(sample_shop, "b", [])
+        cache.get(sample_shop, "a")
+        cache.put(sample_shop, "c", [])
+
+        assert cache.get(sample_shop, "b") is None
+        assert cache.get(sample_shop, "a") == []
+        assert cache.get(sample_shop, "c") == []
+
+    def test_stale_while_revalidate(self, sample_shop):
+        """신선도가 지난 결과는 즉시 반환하고 백그라운드에서 한 번만 갱신"""
+        from src.crawlers.result_cache import ResultCache
+
+        clock = FakeClock()
+        cache = ResultCache(ttl=10, stale_ttl=100, clock=clock)
+        old = [make_result(price=20000)]
+        new = [make_result(price=18000)]
+        cache.put(sample_shop, "마우스", old)
+        clock.now += 15
+
+        release = threading.Event()
+        refresh = MagicMock(side_effect=lambda: release.wait(5) and new)
+
+        assert cache.get(sample_shop, "마우스", refresh=refresh) == old
+        assert cache.get(sample_shop, "마우스", refresh=refresh) == old
+
+        release.set()
+        cache.close()
+        for _ in range(100):
+            if cache.get_stats().refreshes:
+                break
+            threading.Event().wait(0.01)
+
+        assert refresh.call_count == 1
+        assert cache.get(sample_shop, "마우스") == new
+        assert cache.get_stats().stale_hits == 2
+
+    def test_갱신_실패_시_기존_결과_유지(self, sample_shop):
+        """백그라운드 갱신이 실패해도 기존 결과 유지"""
+        from src.crawlers.result_cache import ResultCache
+
+        clock = FakeClock()
+        cache = ResultCache(ttl=10, stale_ttl=100, clock=clock)
+        old = [make_result()]
+        cache.put(sample_shop, "마우스", old)
+        clock.now += 15
+
+        done = threading.Event()
+
+        def failing_refresh():
+            done.set()
+            raise RuntimeError("연결 오류")
+
+        cache.get(sample_shop, "마우스", refresh=failing_refresh)
+        assert done.wait(5)
+        cache.close()
+
+        assert cache.get(sample_shop, "마우스") == old
+        assert cache.get_stats().refreshes == 0
+
+
+    def test_종료_후_조회는_갱신하지_않음(self, sample_shop):
+        """close 이후 신선도가 지난 조회는 결과만 반환하고 갱신을 예약하지 않음"""
+        from src.crawlers.result_cache import ResultCache
+
+        clock = FakeClock()
+        cache = ResultCache(ttl=10, stale_ttl=100, clock=clock)
+        old = [make_result()]
+        cache.put(sample_shop, "마우스", old)
+        clock.now += 15
+        refresh = MagicMock(return_value=[])
+
+        cache.close()
+
+        assert cache.get(sample_shop, "마우스", refresh=refresh) == old
+        refresh.assert_not_called()
+
+    def test_종료_시_취소된_갱신_정리(self, sample_shop):
+        """대기 중에 취소된 갱신도 진행 중 표시가 남지 않음"""
+        from src.crawlers.result_cache import ResultCache
+
+        clock = FakeClock()
+        cache = ResultCache(ttl=10, stale_ttl=100, clock=clock)
+        cache.REFRESH_WORKERS = 1
+        release = threading.Event()
+        for keyword in ("마우스", "키보드"):
+            cache.put(sample_shop, keyword, [make_result()])
+        clock.now += 15
+
+        cache.get(sample_shop, "마우스", refresh=lambda: release.wait(5) and [])
+        cache.get(sample_shop, "키보드", refresh=lambda: [])
+        cache.close()
+        release.set()
+
+        assert cache._refreshing == set()
+
+
+class TestMultiShopCrawlerResultCache:
+    """MultiShopCrawler 결과 캐시 연동 테스트"""
+
+    def test_캐시_적중_시_크롤링_생략(self, sample_shop):
+        """같은 검색을 반복하면 두 번째는 크롤러를 호출하지 않음"""
+        from src.crawlers.multi_crawler import MultiShopCrawler
+        from src.crawlers.result_cache import ResultCache
+
+        cache = ResultCache()
+
+        with patch("src.crawlers.multi_crawler.HtmlCrawler") as MockHtmlCrawler:
+            mock_crawler = MagicMock()
+            mock_crawler.search.return_value = [make_result()]
+            MockHtmlCrawler.return_value = mock_crawler
+
+            crawler = MultiShopCrawler([sample_shop], result_cache=cache)
+            first = crawler.search("마우스")
+            second = crawler.search("마우스")
+
+        assert mock_crawler.search.call_count == 1
+        assert second == first
+
+    def test_오류는_캐시하지_않음(self, sample_shop):
+        """실패한 검색은 저장하지 않고 다음에 다시 시도"""
+        from src.crawlers.html_crawler import CrawlError
+        from src.crawlers.multi_crawler import MultiShopCrawler
+        from src.crawlers.result_cache import ResultCache
+
+        cache = ResultCache()
+
+        with patch("src.crawlers.multi_crawler.HtmlCrawler") as MockHtmlCrawler:
+            mock_crawler = MagicMock()
+            mock_crawler.search.side_effect = CrawlError("연결 오류")
+            MockHtmlCrawler.return_value = mock_crawler
+
+            crawler = MultiShopCrawler([sample_shop], result_cache=cache)
+            crawler.search("마우스")
+            crawler.search("마우스")
+
+        assert mock_crawler.search.call_count == 2
+        assert cache.get_stats().size == 0
+
+    def test_결과_수_제한이_다르면_재사용하지_않음(self, sample_shop):
+        """상점당 결과 수를 제한한 검색 결과는 제한이 다른 검색에 사용하지 않음"""
+        from src.crawlers.multi_crawler import MultiShopCrawler
+        from src.crawlers.result_cache import ResultCache
+
+        cache = ResultCache()
+
+        with patch("src.crawlers.multi_crawler.HtmlCrawler") as MockHtmlCrawler:
+            mock_crawler = MagicMock()
+            mock_crawler.search.return_value = [make_result()]
+            MockHtmlCrawler.return_value = mock_crawler
+
+            MultiShopCrawler([sample_shop], result_cache=cache, max_results=1).search("마우스")
+            MultiShopCrawler([sample_shop], result_cache=cache).search("마우스")
+            MultiShopCrawler([sample_shop], result_cache=cache, max_results=1).search("마우스")
+
+        assert mock_crawler.search.call_count == 2
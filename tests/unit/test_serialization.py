@@ -0,0 +1,203 @@
+"""
+테스트: 직렬화 (JSON 라이브러리 선택, ResultBatch 바이너리 형식)
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+
+def make_results():
+    """상점 2곳, 가격 없음/품절이 섞인 결과"""
+    from src.models.search import SearchResult, StockStatus
+
+    rows = [
+        ("shop-a", "상점A", "상품1", 3000, StockStatus.IN_STOCK),
+        ("shop-a", "상점A", "상품2", None, StockStatus.UNKNOWN),
+        ("shop-b", "상점B", "상품3", 1000, StockStatus.OUT_OF_STOCK),
+        ("shop-b", "상점B", "상품4", 2000, StockStatus.PRE_ORDER),
+        ("shop-a", "상점A", "상품5", 2000, StockStatus.IN_STOCK),
+        ("shop-b", "상점B", "상품6", None, StockStatus.IN_STOCK),
+    ]
+    return [
+        SearchResult(
+            shop_id=shop_id,
+            shop_name=shop_name,
+            product_name=name,
+            price=price,
+            price_text=f"{price:,}원" if price is not None else None,
+            stock_status=status,
+            product_url=None if price is None else f"https://example.com/{name}",
+            crawled_at=datetime(2026, 1, 1, 12, index),
+        )
+        for index, (shop_id, shop_name, name, price, status) in enumerate(rows)
+    ]
+
+
+@pytest.fixture(params=["json", "fast"])
+def backend(request, monkeypatch):
+    """표준 json과 설치된 빠른 라이브러리 모두에서 실행"""
+    from src.storage import serialization
+
+    if request.param == "json":
+        monkeypatch.setattr(serialization, "JSON_BACKEND", "json")
+    elif serialization.JSON_BACKEND == "json":
+        pytest.skip("orjson/msgspec이 설치되지 않음")
+    return serialization.JSON_BACKEND
+
+
+class TestJson:
+    """JSON 입출력 테스트"""
+
+    def test_왕복(self, backend):
+        """datetime은 ISO 문자열, Enum은 값, 한글은 그대로"""
+        from src.models.search import StockStatus
+        from src.storage import serialization
+
+        data = {
+            "name": "건프라",
+            "status": StockStatus.IN_STOCK,
+            "at": datetime(2026, 1, 1, 12, 30),
+            "price": None,
+        }
+
+        encoded = serialization.dumps(data)
+
+        assert "건프라".encode("utf-8") in encoded
+        assert serialization.loads(encoded) == {
+            "name": "건프라",
+            "status": "IN_STOCK",
+            "at": "2026-01-01T12:30:00",
+            "price": None,
+        }
+
+    def test_들여쓰기_표준_json과_같음(self, backend):
+        """indent=True 출력은 json.dumps(ensure_ascii=False, indent=2)와 같음"""
+        from src.storage import serialization
+
+        data = {"shops": [{"id": "a", "name": "상점", "enabled": True, "rate": 1.5}], "empty": []}
+
+        expected = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+        assert serialization.dumps(data, indent=True) == expected
+
+    def test_변환할_수_없는_값(self, backend):
+        """JSON으로 표현할 수 없는 값은 TypeError"""
+        from src.storage import serialization
+
+        with pytest.raises(TypeError):
+            serialization.dumps({"value": object()})
+
+    def test_잘못된_json(self, backend):
+        """잘못된 JSON은 ValueError"""
+        from src.storage import serialization
+
+        with pytest.raises(ValueError):
+            serialization.loads(b"{not json")
+
+
+class TestResultBatchJson:
+    """ResultBatch JSON 출력 테스트"""
+
+    def test_행_딕셔너리와_같은_출력(self, backend):
+        """열로 만든 출력이 행마다 딕셔너리를 만든 dumps(indent=True)와 같음"""
+        from src.models.result_batch import ResultBatch
+        from src.storage import serialization
+
+        results = make_results()
+        results[0].product_name = '따옴표 " 역슬래시 \\ 줄바꿈\n'
+        for batch in (
+            ResultBatch.from_results(results).sort_by_price(),
+            ResultBatch.from_results(results, keep_rows=False).sort_by_price(),
+        ):
+            rows = [
+                {
+                    "shop_id": r.shop_id,
+                    "shop_name": r.shop_name,
+                    "product_name": r.product_name,
+                    "price": r.price,
+                    "stock_status": r.stock_status.value,
+                    "product_url": r.product_url,
+                }
+                for r in batch
+            ]
+            assert serialization.dumps_result_batch(batch) == serialization.dumps(rows, indent=True)
+
+    def test_행을_만들지_않음(self):
+        """객체를 보관하지 않는 묶음에서 SearchResult를 만들지 않음"""
+        from unittest.mock import patch
+        from src.models.result_batch import ResultBatch
+        from src.storage import serialization
+
+        batch = ResultBatch.from_results(make_results(), keep_rows=False)
+
+        with patch.object(ResultBatch, "row", side_effect=AssertionError):
+            data = serialization.dumps_result_batch(batch)
+
+        assert [row["product_name"] for row in serialization.loads(data)] == [
+            r.product_name for r in make_results()
+        ]
+
+    def test_빈_묶음(self):
+        """결과가 없으면 빈 배열"""
+        from src.models.result_batch import ResultBatch
+        from src.storage import serialization
+
+        assert serialization.dumps_result_batch(ResultBatch.from_results([])) == b"[]"
+
+
+class TestResultBatchBinary:
+    """ResultBatch 바이너리 형식 테스트"""
+
+    def test_왕복(self, backend):
+        """모든 행이 원래 결과와 같음 (객체를 보관하는 묶음도 변환)"""
+        from src.models.result_batch import ResultBatch
+        from src.storage.serialization import decode_result_batch, encode_result_batch
+
+        results = make_results()
+
+        batch = decode_result_batch(encode_result_batch(ResultBatch.from_results(results)))
+
+        assert not batch.keeps_rows
+        assert [r.model_dump() for r in batch] == [r.model_dump() for r in results]
+        assert batch.sort_by_price().get_price(0) == 1000
+
+    def test_상점_핸들_표에_등록(self):
+        """읽을 때 전달한 표의 핸들로 상점 번호를 바꿈"""
+        from src.models.result_batch import ResultBatch, ShopTable
+        from src.storage.serialization import decode_result_batch, encode_result_batch
+
+        data = encode_result_batch(ResultBatch.from_results(make_results(), keep_rows=False))
+        table = ShopTable([("shop-x", "상점X"), ("shop-b", "상점B")])
+
+        batch = decode_result_batch(data, shops=table)
+
+        assert batch.shops is table
+        assert list(batch.shop_index) == [2, 2, 1, 1, 2, 1]
+        assert batch.get_shop_id(0) == "shop-a"
+        assert len(table) == 3
+
+    def test_빈_묶음(self):
+        """결과가 없는 묶음도 왕복"""
+        from src.models.result_batch import ResultBatch
+        from src.storage.serialization import decode_result_batch, encode_result_batch
+
+        batch = decode_result_batch(encode_result_batch(ResultBatch.from_results([])))
+
+        assert len(batch) == 0
+        assert batch.to_list() == []
+
+    def test_잘못된_데이터(self):
+        """형식이 다르거나 잘린 데이터는 SerializationError"""
+        from src.models.result_batch import ResultBatch
+        from src.storage.serialization import (
+            SerializationError,
+            decode_result_batch,
+            encode_result_batch,
+        )
+
+        data = encode_result_batch(ResultBatch.from_results(make_results()))
+
+        for broken in (b"", b"XXXX" + data[4:], data[:-1], data[:4] + b"\x09" + data[5:]):
+            with pytest.raises(SerializationError):
+                decode_result_batch(broken)
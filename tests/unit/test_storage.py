@@ -240,3 +240,198 @@ class TestShopStore:
 
         shop = store.get(sample_shop_data.id)
         assert shop.name == "수정된 상점"
+
+    def test_원자적_저장(self, temp_dir, sample_shop_data, mocker):
+        """쓰는 도중 실패하면 이전 파일과 내용이 그대로 남음"""
+        from src.storage.shop_store import ShopStore
+
+        store = ShopStore(config_dir=temp_dir)
+        store.add(sample_shop_data)
+        before = (temp_dir / "shops.json").read_bytes()
+
+        mocker.patch("src.storage.shop_store.os.replace", side_effect=OSError("disk full"))
+        with pytest.raises(OSError):
+            store.set_enabled(sample_shop_data.id, False)
+
+        assert (temp_dir / "shops.json").read_bytes() == before
+        assert [path.name for path in temp_dir.iterdir()] == ["shops.json"]
+
+    def test_손상된_파일_보존(self, temp_dir, sample_shop_data):
+        """읽을 수 없는 파일은 옮겨 두고 경고한 뒤 빈 상태로 시작"""
+        from src.storage.shop_store import ShopStore
+
+        (temp_dir / "shops.json").write_text("{broken", encoding="utf-8")
+
+        with pytest.warns(UserWarning, match="손상"):
+            store = ShopStore(config_dir=temp_dir)
+        store.add(sample_shop_data)
+
+        assert len(store.list_all()) == 1
+        assert store.corrupt_file.name.startswith("shops.json.corrupt")
+        assert store.corrupt_file.read_text(encoding="utf-8") == "{broken"
+
+    def test_손상된_파일_백업은_덮어쓰지_않음(self, temp_dir, sample_shop_data):
+        """두 번째로 손상된 파일도 이전 백업과 다른 이름으로 옮김"""
+        from src.storage.shop_store import ShopStore
+
+        backups = []
+        for content in ("{broken", '{"shops": [{"id": 1}]}'):
+            (temp_dir / "shops.json").write_text(content, encoding="utf-8")
+            with pytest.warns(UserWarning):
+                store = ShopStore(config_dir=temp_dir)
+            backups.append(store.corrupt_file)
+
+        assert backups[0] != backups[1]
+        assert backups[0].read_text(encoding="utf-8") == "{broken"
+        assert backups[1].read_text(encoding="utf-8") == '{"shops": [{"id": 1}]}'
+
+    def test_손상된_파일은_핸들_표도_초기화(self, temp_dir, sample_shop_data):
+        """일부 상점을 등록한 뒤 실패해도 핸들 표에 남기지 않음"""
+        from src.storage.shop_store import ShopStore
+
+        shops = [sample_shop_data.model_dump(mode="json"), {"id": "broken"}]
+        (temp_dir / "shops.json").write_text(json.dumps({"shops": shops}), encoding="utf-8")
+
+        with pytest.warns(UserWarning):
+            store = ShopStore(config_dir=temp_dir)
+
+        assert store.list_all() == []
+        assert len(store.shop_table) == 0
+
+    def test_읽기_실패는_옮기지_않음(self, temp_dir, mocker):
+        """파일을 읽지 못하면 손상으로 보지 않고 오류 발생"""
+        from src.storage.shop_store import ShopStore, ShopStoreError
+
+        (temp_dir / "shops.json").write_text("{}", encoding="utf-8")
+        mocker.patch.object(Path, "read_bytes", side_effect=PermissionError("denied"))
+
+        with pytest.raises(ShopStoreError):
+            ShopStore(config_dir=temp_dir)
+
+        assert [path.name for path in temp_dir.iterdir()] == ["shops.json"]
+
+    def test_지연_저장(self, temp_dir, sample_shop_data, mocker):
+        """save_delay 동안의 변경은 한 번에 저장"""
+        from src.storage.shop_store import ShopStore
+
+        store = ShopStore(config_dir=temp_dir, save_delay=60)
+        write = mocker.spy(store, "_write_atomic")
+
+        store.add(sample_shop_data)
+        for enabled in (False, True, False):
+            store.set_enabled(sample_shop_data.id, enabled)
+        assert write.call_count == 0
+
+        store.close()
+        assert write.call_count == 1
+        store.flush()
+        assert write.call_count == 1
+
+        reloaded = ShopStore(config_dir=temp_dir)
+        assert reloaded.get(sample_shop_data.id).enabled is False
+
+    def test_지연_저장_타이머(self, temp_dir, sample_shop_data):
+        """save_delay가 지나면 저장"""
+        import time
+
+        from src.storage.shop_store import ShopStore
+
+        store = ShopStore(config_dir=temp_dir, save_delay=0.01)
+        store.add(sample_shop_data)
+
+        deadline = time.monotonic() + 5
+        while not (temp_dir / "shops.json").exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert ShopStore(config_dir=temp_dir).get(sample_shop_data.id) is not None
+
+    def test_트랜잭션(self, temp_dir, sample_shop_data, mocker):
+        """transaction 안의 변경은 가장 바깥 블록이 끝날 때 한 번 저장"""
+        from src.storage.shop_store import ShopStore
+
+        store = ShopStore(config_dir=temp_dir)
+        write = mocker.spy(store, "_write_atomic")
+
+        with store.transaction():
+            store.add(sample_shop_data)
+            with store.transaction():
+                store.set_enabled(sample_shop_data.id, False)
+            assert write.call_count == 0
+
+        assert write.call_count == 1
+        assert ShopStore(config_dir=temp_dir).get(sample_shop_data.id).enabled is False
+
+    def test_트랜잭션_롤백(self, temp_dir, sample_shop_data, mocker):
+        """예외가 발생하면 변경을 되돌리고 저장하지 않음"""
+        from src.storage.shop_store import ShopStore
+
+        store = ShopStore(config_dir=temp_dir)
+        store.add(sample_shop_data)
+        write = mocker.spy(store, "_write_atomic")
+
+        with pytest.raises(RuntimeError):
+            with store.transaction():
+                store.set_enabled(sample_shop_data.id, False)
+                store.remove(sample_shop_data.id)
+                raise RuntimeError("중단")
+
+        assert write.call_count == 0
+        assert store.get(sample_shop_data.id).enabled is True
+
+    def test_트랜잭션_롤백_같은_객체(self, temp_dir, sample_shop_data):
+        """되돌린 값은 이미 가져간 상점 객체에도 반영"""
+        from src.storage.shop_store import ShopStore
+
+        store = ShopStore(config_dir=temp_dir)
+        store.add(sample_shop_data)
+        shop = store.get(sample_shop_data.id)
+        shops = store.list_all()
+        name = shop.name
+
+        with pytest.raises(RuntimeError):
+            with store.transaction():
+                store.set_enabled(sample_shop_data.id, False)
+                shop.name = "변경된 이름"
+                raise RuntimeError("중단")
+
+        assert store.get(sample_shop_data.id) is shop
+        assert shops[0] is shop
+        assert shop.enabled is True
+        assert shop.name == name
+
+    def test_지연_저장_타이머는_데몬(self, temp_dir, sample_shop_data):
+        """예약된 저장은 종료를 막지 않고 close에서 저장"""
+        from src.storage.shop_store import ShopStore
+
+        store = ShopStore(config_dir=temp_dir, save_delay=60)
+        store.add(sample_shop_data)
+        timer = store._flush_timer
+
+        assert timer.daemon is True
+        store.close()
+        assert store._flush_timer is None
+        assert timer.finished.is_set()
+        assert ShopStore(config_dir=temp_dir).get(sample_shop_data.id) is not None
+
+    def test_상점_핸들(self, temp_dir, sample_shop_data):
+        """상점 핸들은 저장소에서 상점으로 되돌릴 수 있고 이름 변경을 반영"""
+        from src.storage.shop_store import ShopStore, ShopStoreError
+
+        store = ShopStore(config_dir=temp_dir)
+        store.add(sample_shop_data)
+
+        handle = store.get_handle(sample_shop_data.id)
+        assert store.resolve_handle(handle) is sample_shop_data
+        assert store.resolve_handle(handle + 1) is None
+
+        sample_shop_data.name = "수정된 상점"
+        store.update(sample_shop_data)
+        assert store.shop_table[handle] == (sample_shop_data.id, "수정된 상점")
+
+        # 다시 로드해도 핸들은 유지되고, 삭제한 상점의 핸들은 재사용하지 않음
+        store.load()
+        assert store.get_handle(sample_shop_data.id) == handle
+        store.remove(sample_shop_data.id)
+        assert store.resolve_handle(handle) is None
+        with pytest.raises(ShopStoreError):
+            store.get_handle(sample_shop_data.id)
@@ -0,0 +1,211 @@
+"""
+테스트: JSON-LD 구조화 데이터 추출
+"""
+
+import pytest
+
+
+def make_shop(**overrides):
+    """구조화 데이터 방식 테스트용 상점"""
+    from src.models.shop import ExtractionStrategy, Shop, ShopSelectors
+
+    return Shop(
+        name="테스트",
+        base_url="https://example.com",
+        search_url_template="https://example.com/search?q={keyword}",
+        selectors=ShopSelectors(
+            product_container=".product",
+            product_name=".name",
+            product_price=".price",
+            product_link="a",
+        ),
+        extraction_strategy=overrides.pop("extraction_strategy", ExtractionStrategy.STRUCTURED_DATA),
+        **overrides,
+    )
+
+
+ITEM_LIST_HTML = """
+<html><head>
+<script type="application/ld+json">
+{"@context": "https://schema.org", "@type": "ItemList", "itemListElement": [
+  {"@type": "ListItem", "position": 1, "item": {
+    "@type": "Product", "name": "MG 건담 &amp; 베이스", "url": "/p/1",
+    "offers": {"@type": "Offer", "price": "45000", "priceCurrency": "KRW",
+               "availability": "https://schema.org/InStock"}}},
+  {"@type": "ListItem", "position": 2, "item": {
+    "@type": "Product", "name": "RG 자쿠",
+    "offers": {"@type": "Offer", "price": 32000.5, "url": "https://example.com/p/2",
+               "availability": "http://schema.org/OutOfStock"}}}
+]}
+</script>
+</head><body>
+<div class="product"><a href="/p/9"><span class="name">선택자 상품</span></a><span class="price">9,000원</span></div>
+</body></html>
+"""
+
+SELECTOR_HTML = """
+<div class="product"><a href="/p/1"><span class="name">상품1</span></a><span class="price">1,000원</span></div>
+<div class="product"><a href="/p/2"><span class="name">상품2</span></a><span class="price">2,000원</span></div>
+"""
+
+
+class TestExtractJsonLd:
+    """extract_json_ld_products 테스트"""
+
+    def test_item_list(self):
+        """ItemList의 ListItem.item 상품을 순서대로 추출"""
+        from src.crawlers.structured_data import extract_json_ld_products
+        from src.models.search import StockStatus
+
+        products = extract_json_ld_products(ITEM_LIST_HTML)
+
+        assert [p.name for p in products] == ["MG 건담 & 베이스", "RG 자쿠"]
+        assert products[0].price == 45000
+        assert products[0].stock_status == StockStatus.IN_STOCK
+        assert products[0].url == "/p/1"
+        assert products[1].price == 32001
+        assert products[1].stock_status == StockStatus.OUT_OF_STOCK
+        assert products[1].url == "https://example.com/p/2"
+
+    def test_graph와_aggregate_offer(self):
+        """@graph 안의 Product와 AggregateOffer 최저가"""
+        from src.crawlers.structured_data import extract_json_ld_products
+
+        page = """<script type='application/ld+json'>
+        {"@graph": [{"@type": "WebPage"},
+                    {"@type": ["Product", "Thing"], "name": "HG 짐",
+                     "offers": {"@type": "AggregateOffer", "lowPrice": "15,000", "highPrice": "18,000"}}]}
+        </script>"""
+
+        products = extract_json_ld_products(page)
+
+        assert len(products) == 1
+        assert products[0].name == "HG 짐"
+        assert products[0].price == 15000
+        assert products[0].stock_status is None
+
+    def test_잘못된_블록은_건너뜀(self):
+        """잘못된 JSON과 이름 없는 상품은 제외하고 주석으로 감싼 블록은 읽음"""
+        from src.crawlers.structured_data import extract_json_ld_products
+
+        page = """
+        <script type="application/ld+json">{"@type": "Product", "name": </script>
+        <script type="application/ld+json">{"@type": "Product", "offers": {"price": 1000}}</script>
+        <script type="application/ld+json"><!-- {"@type": "Product", "name": "PG 유니콘"} --></script>
+        <script type="text/javascript">{"@type": "Product", "name": "무시"}</script>
+        """
+
+        products = extract_json_ld_products(page)
+
+        assert [p.name for p in products] == ["PG 유니콘"]
+        assert products[0].price is None
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("1.5E4", 15000),
+            ("15000", 15000),
+            ("12000.5", 12001),
+            ("0.5", 1),
+            ("2.675", 3),
+            ("-100", None),
+            ("NaN", None),
+            ("Infinity", None),
+            ("9223372036854775807", 2**63 - 1),
+            ("9223372036854775808", None),
+            ("1e20", None),
+        ],
+    )
+    def test_숫자_가격(self, value, expected):
+        """JSON 숫자 가격은 문자열 파싱 없이 반올림 (지수 표기 포함)"""
+        from src.crawlers.structured_data import extract_json_ld_products
+
+        page = (
+            '<script type="application/ld+json">'
+            f'{{"@type": "Product", "name": "HG 짐", "offers": {{"price": {value}}}}}'
+            "</script>"
+        )
+
+        assert extract_json_ld_products(page)[0].price == expected
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("https://schema.org/InStock", "IN_STOCK"),
+            ("LimitedAvailability", "IN_STOCK"),
+            ("http://schema.org/SoldOut", "OUT_OF_STOCK"),
+            ("https://schema.org/PreOrder", "PRE_ORDER"),
+            ("https://schema.org/Unknown", None),
+            (None, None),
+        ],
+    )
+    def test_availability(self, value, expected):
+        """schema.org ItemAvailability 변환"""
+        from src.crawlers.structured_data import parse_availability
+
+        status = parse_availability(value)
+
+        assert (status.value if status else None) == expected
+
+
+class TestStructuredDataCrawler:
+    """구조화 데이터 방식 크롤러 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def clear_plans(self):
+        from src.crawlers.extraction_plan import clear_extraction_plans
+
+        clear_extraction_plans()
+        yield
+        clear_extraction_plans()
+
+    @pytest.mark.parametrize("backend", ["bs4", "lxml"])
+    def test_구조화_데이터_우선(self, backend):
+        """JSON-LD가 있으면 선택자 대신 사용"""
+        from src.crawlers.html_crawler import HtmlCrawler
+        from src.models.search import StockStatus
+
+        results = HtmlCrawler(make_shop(parser_backend=backend)).parse_html(ITEM_LIST_HTML)
+
+        assert [r.product_name for r in results] == ["MG 건담 & 베이스", "RG 자쿠"]
+        assert results[0].product_url == "https://example.com/p/1"
+        assert results[0].price_text == "45000"
+        assert results[1].stock_status == StockStatus.OUT_OF_STOCK
+
+    def test_구조화_데이터_없으면_선택자(self):
+        """JSON-LD가 없으면 선택자로 추출"""
+        from src.crawlers.html_crawler import HtmlCrawler
+
+        results = HtmlCrawler(make_shop()).parse_html(SELECTOR_HTML)
+
+        assert [r.product_name for r in results] == ["상품1", "상품2"]
+        assert [r.price for r in results] == [1000, 2000]
+
+    def test_최대_결과_수(self):
+        """max_results만큼만 반환"""
+        from src.crawlers.html_crawler import HtmlCrawler
+
+        results = HtmlCrawler(make_shop()).parse_html(ITEM_LIST_HTML, max_results=1)
+
+        assert [r.product_name for r in results] == ["MG 건담 & 베이스"]
+
+    def test_선택자_방식은_구조화_데이터_무시(self):
+        """기본 방식은 JSON-LD를 읽지 않음"""
+        from src.crawlers.html_crawler import HtmlCrawler
+        from src.models.shop import ExtractionStrategy
+
+        shop = make_shop(extraction_strategy=ExtractionStrategy.SELECTORS)
+
+        results = HtmlCrawler(shop).parse_html(ITEM_LIST_HTML)
+
+        assert [r.product_name for r in results] == ["선택자 상품"]
+
+    def test_부분_스트리밍_파싱_비활성화(self):
+        """본문 전체의 스크립트를 읽어야 하므로 부분/스트리밍 파싱하지 않음"""
+        from src.crawlers.extraction_plan import get_extraction_plan
+
+        plan = get_extraction_plan(make_shop(parser_backend="lxml", partial_parse=True))
+
+        assert plan.structured_data is True
+        assert plan.strainer is None
+        assert plan.container_matcher is None